@@ -24,6 +24,22 @@ namespace pyclustering {
 
 namespace clst {
 
+
+/*!
+
+@brief  Defines algorithms that are used by K-Means to assign points to clusters.
+@details Accelerated algorithms use triangle inequality to skip distance calculations for points that cannot change
+          their clusters, they produce the same results as standard algorithm, but they are applicable only for
+          Euclidean and square Euclidean metrics.
+
+*/
+enum class kmeans_algorithm {
+    LLOYD = 0,      /**< Standard algorithm that calculates distance from each point to each center on each iteration. */
+    ELKAN = 1,      /**< Elkan's algorithm that keeps upper bound and lower bound to each center for each point (N x K memory). */
+    HAMERLY = 2     /**< Hamerly's algorithm that keeps upper bound and one lower bound to the second closest center for each point. */
+};
+
+
 /*!
 
 @class    kmeans kmeans.hpp pyclustering/cluster/kmeans.hpp
@@ -53,6 +69,14 @@ private:
 
     distance_metric<point>  m_metric;
 
+    kmeans_algorithm        m_algorithm             = kmeans_algorithm::LLOYD;
+
+    index_sequence          m_labels                = { };    /* used only by accelerated algorithms: center index of each point */
+
+    std::vector<double>     m_upper_bounds          = { };    /* used only by accelerated algorithms: upper bound of distance to assigned center */
+
+    std::vector<double>     m_lower_bounds          = { };    /* used only by accelerated algorithms: lower bounds of distance to other centers */
+
 public:
     /*!
     
@@ -71,12 +95,15 @@ public:
                 cluster centers is less than tolerance than algorithm will stop processing.
     @param[in] p_itermax: maximum number of iterations (by default kmeans::DEFAULT_ITERMAX).
     @param[in] p_metric: distance metric calculator for two points.
+    @param[in] p_algorithm: algorithm that is used to assign points to clusters, accelerated algorithms
+                (Elkan's and Hamerly's) are applicable only for Euclidean and square Euclidean metrics.
     
     */
     kmeans(const dataset & p_initial_centers, 
            const double p_tolerance = DEFAULT_TOLERANCE,
            const std::size_t p_itermax = DEFAULT_ITERMAX,
-           const distance_metric<point> & p_metric = distance_metric_factory<point>::euclidean_square());
+           const distance_metric<point> & p_metric = distance_metric_factory<point>::euclidean_square(),
+           const kmeans_algorithm p_algorithm = kmeans_algorithm::LLOYD);
 
     /*!
     
@@ -118,6 +145,67 @@ private:
 
     void assign_point_to_cluster(const std::size_t p_index_point, const dataset & p_centers, index_sequence & p_clusters);
 
+    /*!
+
+    @brief    Assigns points to clusters using bounds of distances (Elkan's or Hamerly's algorithm).
+
+    @param[in] p_centers: current centers of clusters.
+    @param[out] p_clusters: clusters that are allocated in line with the centers.
+
+    */
+    void update_clusters_bounded(const dataset & p_centers, cluster_sequence & p_clusters);
+
+    /*!
+
+    @brief    Assigns point to the nearest center by calculation distances to all centers and resets its bounds.
+
+    @param[in] p_index_point: index of point that should be assigned.
+    @param[in] p_centers: current centers of clusters.
+
+    */
+    void assign_point_bounded(const std::size_t p_index_point, const dataset & p_centers);
+
+    /*!
+
+    @brief    Updates the nearest center of the point using Elkan's bounds.
+
+    @param[in] p_index_point: index of point that should be assigned.
+    @param[in] p_centers: current centers of clusters.
+    @param[in] p_half_distances: half distances between each pair of centers (K x K).
+    @param[in] p_half_separations: half distance from each center to its closest center.
+
+    */
+    void update_point_elkan(const std::size_t p_index_point, const dataset & p_centers, const std::vector<double> & p_half_distances, const std::vector<double> & p_half_separations);
+
+    /*!
+
+    @brief    Updates the nearest center of the point using Hamerly's bounds.
+
+    @param[in] p_index_point: index of point that should be assigned.
+    @param[in] p_centers: current centers of clusters.
+    @param[in] p_half_separations: half distance from each center to its closest center.
+
+    */
+    void update_point_hamerly(const std::size_t p_index_point, const dataset & p_centers, const std::vector<double> & p_half_separations);
+
+    /*!
+
+    @brief    Updates bounds of distances in line with movement of centers, bounds that are related to clusters
+               without points are removed.
+
+    @param[in] p_previous_centers: centers that were used to allocate clusters.
+    @param[in] p_centers: updated centers of non-empty clusters.
+
+    */
+    void update_bounds(const dataset & p_previous_centers, const dataset & p_centers);
+
+    /*!
+
+    @brief    Returns indexes of points that are processed by the algorithm.
+
+    */
+    index_sequence get_processed_points() const;
+
     /*!
     
     @brief    Calculate new center for specified cluster.
@@ -25,6 +25,22 @@ namespace pyclustering {
 namespace clst {
 
 
+/*!
+
+@brief  Defines strategies that are used by K-Medoids to swap medoids with non-medoid objects.
+@details FastPAM1 performs the same swaps as PAM, but calculates costs of removal of all medoids in one pass for each
+          candidate. FasterPAM swaps each candidate eagerly with the best medoid as soon as the swap reduces total
+          deviation, it needs less iterations, but results might differ from PAM. Both strategies are based on paper
+          @cite article::cluster::kmedoids::fasterpam.
+
+*/
+enum class kmedoids_swap_type {
+    PAM = 0,        /**< Original swap phase where cost of each pair (medoid, candidate) is calculated separately. */
+    FASTPAM1 = 1,   /**< The best swap is found calculating removal costs of all medoids in one pass for each candidate. */
+    FASTERPAM = 2   /**< Each candidate is swapped eagerly with the best medoid if the swap reduces total deviation. */
+};
+
+
 /*!
 
 @brief    Represents K-Medoids clustering algorithm (PAM algorithm) for cluster analysis.
@@ -83,6 +99,8 @@ private:
 
     distance_calculator             m_calculator;
 
+    kmedoids_swap_type              m_swap            = kmedoids_swap_type::FASTPAM1;
+
 public:
     /*!
     
@@ -101,12 +119,14 @@ public:
                 medoids of clusters is less than tolerance than algorithm will stop processing.
     @param[in] p_itermax: maximum amount of iterations (by default kmedoids::DEFAULT_ITERMAX).
     @param[in] p_metric: distance metric calculator for two points.
+    @param[in] p_swap: strategy that is used to swap medoids (by default kmedoids_swap_type::FASTPAM1).
     
     */
     kmedoids(const medoid_sequence & p_initial_medoids,
              const double p_tolerance = DEFAULT_TOLERANCE,
              const std::size_t p_itermax = DEFAULT_ITERMAX,
-             const distance_metric<point> & p_metric = distance_metric_factory<point>::euclidean_square());
+             const distance_metric<point> & p_metric = distance_metric_factory<point>::euclidean_square(),
+             const kmedoids_swap_type p_swap = kmedoids_swap_type::FASTPAM1);
 
     /*!
     
@@ -173,13 +193,54 @@ private:
     
     @brief  Swap existed medoid with non-medoid points in order to find the most optimal medoid.
 
-    @return Cost that is needed to swap medoid and non-medoid point.
+    @return Cost that is needed to swap medoid and non-medoid point, NOTHING_TO_SWAP if there is no swap that reduces
+             total deviation.
     
     */
     double swap_medoids();
 
     /*!
     
+    @brief  Finds the best pair (medoid, candidate) calculating cost of each pair separately and applies the swap.
+
+    @return Cost that is needed to swap medoid and non-medoid point.
+    
+    */
+    double swap_medoids_pam();
+
+    /*!
+    
+    @brief  Finds the best pair (medoid, candidate) calculating costs of removal of all medoids in one pass for each
+             candidate and applies the swap.
+
+    @return Cost that is needed to swap medoid and non-medoid point.
+    
+    */
+    double swap_medoids_fastpam1();
+
+    /*!
+    
+    @brief  Passes through all candidates and swaps each of them with the best medoid if the swap reduces total
+             deviation.
+
+    @return Total cost of applied swaps, NOTHING_TO_SWAP if nothing has been swapped.
+    
+    */
+    double swap_medoids_eager();
+
+    /*!
+    
+    @brief  Checks whether the point can be considered as a medoid candidate.
+
+    @param[in] p_index_point: index of point that is checked.
+
+    @return `true` if the point is not a medoid and it is not totally similar to its medoid.
+    
+    */
+    bool is_swap_candidate(const std::size_t p_index_point) const;
+
+    /*!
+    
     @brief  Calculates cost to swap `p_index_candidate` with the current medoid `p_index_cluster`.
 
     @param[in] p_index_candidate: index point that is considered as a medoid candidate.
@@ -190,6 +251,18 @@ private:
     */
     double calculate_swap_cost(const std::size_t p_index_candidate, const std::size_t p_index_cluster) const;
 
+    /*!
+    
+    @brief  Calculates costs to swap `p_index_candidate` with each current medoid in one pass over points.
+    @details Change of total deviation that is caused by adding of the candidate is shared by all medoids, therefore
+              only removal loss is accumulated separately for each cluster.
+
+    @param[in] p_index_candidate: index point that is considered as a medoid candidate.
+    @param[out] p_costs: costs that are needed to swap the candidate with medoid of each cluster.
+    
+    */
+    void calculate_swap_costs(const std::size_t p_index_candidate, std::vector<double> & p_costs) const;
+
     /*!
 
     @brief      Erase empty clusters and their medoids.
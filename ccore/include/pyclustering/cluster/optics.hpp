@@ -18,6 +18,7 @@
 #include <pyclustering/cluster/data_type.hpp>
 #include <pyclustering/cluster/optics_data.hpp>
 #include <pyclustering/cluster/optics_descriptor.hpp>
+#include <pyclustering/cluster/optics_order_seed.hpp>
 
 
 namespace pyclustering {
@@ -79,6 +80,8 @@ private:
 
     optics_object_sequence *        m_optics_objects    = nullptr;
 
+    optics_order_seed               m_order_seed        = optics_order_seed();
+
     std::list<optics_descriptor *>  m_ordered_database  = { };
 
 public:
@@ -175,7 +178,7 @@ private:
 
     double get_core_distance(const neighbors_collection & p_neighbors) const;
 
-    void update_order_seed(const optics_descriptor & p_object, const neighbors_collection & p_neighbors, std::multiset<optics_descriptor *, optics_pointer_descriptor_less> & order_seed);
+    void update_order_seed(const optics_descriptor & p_object, const neighbors_collection & p_neighbors);
 
     void calculate_ordering();
 
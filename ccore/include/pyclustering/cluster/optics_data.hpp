@@ -49,6 +49,8 @@ private:
     double                  m_radius   = 0;
     optics_object_sequence  m_optics_objects = { };
 
+    std::vector<std::size_t>    m_ordered_indexes = { };
+
 public:
     /*!
     
@@ -119,6 +121,26 @@ public:
     */
     const optics_object_sequence & optics_objects() const { return m_optics_objects; }
 
+    /*!
+
+    @brief    Returns reference to indexes of objects in order of their traverse by the algorithm.
+    @details  Using traverse order, core and reachability distances of objects clusters can be extracted for any
+               connectivity radius that is less or equal to the radius that was used for processing.
+
+    @return   Reference to indexes of objects in traverse order.
+
+    */
+    std::vector<std::size_t> & ordered_indexes() { return m_ordered_indexes; }
+
+    /*!
+
+    @brief    Returns const reference to indexes of objects in order of their traverse by the algorithm.
+
+    @return   Const reference to indexes of objects in traverse order.
+
+    */
+    const std::vector<std::size_t> & ordered_indexes() const { return m_ordered_indexes; }
+
     /*!
     
     @brief    Returns connectivity radius that can be differ from input parameter.
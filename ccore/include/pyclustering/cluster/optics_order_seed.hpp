@@ -0,0 +1,139 @@
+/*!
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2020
+@copyright BSD-3-Clause
+
+*/
+
+#pragma once
+
+
+#include <cstddef>
+#include <vector>
+
+#include <pyclustering/cluster/optics_descriptor.hpp>
+
+
+namespace pyclustering {
+
+namespace clst {
+
+
+/*!
+
+@class   optics_order_seed optics_order_seed.hpp pyclustering/cluster/optics_order_seed.hpp
+
+@brief   Order seed of OPTICS algorithm that is implemented as an indexed binary heap with decrease-key operation.
+@details Objects are ordered by reachability distance, objects with the same reachability distance are ordered in line
+          with time when they were inserted or when their reachability distance was decreased. Position of each object
+          in the heap is stored by its index, therefore insertion, extraction and decrease-key take O(log n).
+
+*/
+class optics_order_seed {
+private:
+    struct seed_entry {
+    public:
+        optics_descriptor * m_object    = nullptr;
+        std::size_t         m_sequence  = 0;
+    };
+
+private:
+    static const std::size_t INVALID_POSITION;
+
+private:
+    std::vector<seed_entry>     m_heap;
+    std::vector<std::size_t>    m_positions;
+    std::size_t                 m_sequence  = 0;
+
+public:
+    /**
+     *
+     * @brief Default constructor to create empty order seed.
+     *
+     */
+    optics_order_seed() = default;
+
+    /**
+     *
+     * @brief Creates empty order seed for objects whose indexes are less than specified capacity.
+     *
+     * @param[in] p_capacity: amount of objects in the dataset.
+     *
+     */
+    explicit optics_order_seed(const std::size_t p_capacity);
+
+    /**
+     *
+     * @brief Default destructor to destroy order seed.
+     *
+     */
+    ~optics_order_seed() = default;
+
+public:
+    /**
+     *
+     * @brief Inserts object to the order seed using its current reachability distance.
+     *
+     * @param[in] p_object: object that should be inserted, it should not be in the order seed.
+     *
+     */
+    void push(optics_descriptor * p_object);
+
+    /**
+     *
+     * @brief Restores order of the seed after reachability distance of the object has been decreased.
+     *
+     * @param[in] p_object: object from the order seed whose reachability distance has been decreased.
+     *
+     */
+    void decrease(optics_descriptor * p_object);
+
+    /**
+     *
+     * @brief Extracts object with the smallest reachability distance from the order seed.
+     *
+     * @return Object with the smallest reachability distance.
+     *
+     */
+    optics_descriptor * pop();
+
+    /**
+     *
+     * @brief Returns `true` if the object is in the order seed.
+     *
+     * @param[in] p_object: object that should be checked.
+     *
+     */
+    bool contains(const optics_descriptor * p_object) const;
+
+    /**
+     *
+     * @brief Returns `true` if the order seed does not contain objects.
+     *
+     */
+    bool empty() const;
+
+    /**
+     *
+     * @brief Returns amount of objects in the order seed.
+     *
+     */
+    std::size_t size() const;
+
+private:
+    bool less(const seed_entry & p_entry1, const seed_entry & p_entry2) const;
+
+    void place(const std::size_t p_position, const seed_entry & p_entry);
+
+    void sift_up(std::size_t p_position);
+
+    void sift_down(std::size_t p_position);
+
+    std::size_t & position(const optics_descriptor * p_object);
+};
+
+
+}
+
+}
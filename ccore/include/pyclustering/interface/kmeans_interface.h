@@ -30,6 +30,21 @@ enum kmeans_package_indexer {
 };
 
 
+/**
+ *
+ * @brief   K-Means with several restarts returns result of the best restart by pyclustering_package that consist
+ *           sub-packages and this enumerator provides named indexes for sub-packages.
+ *
+ */
+enum kmeans_restarts_package_indexer {
+    KMEANS_RESTARTS_PACKAGE_INDEX_CLUSTERS = 0,
+    KMEANS_RESTARTS_PACKAGE_INDEX_CENTERS,
+    KMEANS_RESTARTS_PACKAGE_INDEX_WCE,
+    KMEANS_RESTARTS_PACKAGE_INDEX_RESTARTS_WCE,
+    KMEANS_RESTARTS_PACKAGE_SIZE
+};
+
+
 /**
  *
  * @brief   Clustering algorithm K-Means returns allocated clusters.
@@ -41,6 +56,7 @@ enum kmeans_package_indexer {
  * @param[in] p_itermax: maximum number of iterations for cluster analysis.
  * @param[in] p_observe: if 'true' then evolution of cluster and center changes are collected to result.
  * @param[in] p_metric: pointer to distance metric 'distance_metric' that is used for distance calculation between two points.
+ * @param[in] p_algorithm: algorithm that is used to assign points to clusters (see 'kmeans_algorithm').
  *
  * @return  Returns result of clustering - array of allocated clusters, if 'p_observe' is 'true' then package contains
  *           evolution of cluster and center changes.
@@ -51,4 +67,31 @@ extern "C" DECLARATION pyclustering_package * kmeans_algorithm(const pyclusterin
                                                                const double p_tolerance,
                                                                const std::size_t p_itermax,
                                                                const bool p_observe,
-                                                               const void * const p_metric);
+                                                               const void * const p_metric,
+                                                               const std::size_t p_algorithm);
+
+
+/**
+ *
+ * @brief   Clustering algorithm K-Means that is performed several times using different initial centers, result
+ *           with the smallest total within-cluster errors is returned.
+ * @details Input data is extracted once and it is shared by all restarts that are processed in parallel.
+ *           Caller should destroy returned result in 'pyclustering_package'.
+ *
+ * @param[in] p_sample: input data for clustering.
+ * @param[in] p_initial_centers: list of initial cluster centers, one set of centers for each restart.
+ * @param[in] p_tolerance: stop condition - when changes of medians are less then tolerance value.
+ * @param[in] p_itermax: maximum number of iterations for cluster analysis.
+ * @param[in] p_metric: pointer to distance metric 'distance_metric' that is used for distance calculation between two points.
+ * @param[in] p_algorithm: algorithm that is used to assign points to clusters (see 'kmeans_algorithm').
+ *
+ * @return  Returns result of the best restart - allocated clusters, centers, total within-cluster errors and total
+ *           within-cluster errors of each restart (see 'kmeans_restarts_package_indexer').
+ *
+ */
+extern "C" DECLARATION pyclustering_package * kmeans_restarts_algorithm(const pyclustering_package * const p_sample,
+                                                                        const pyclustering_package * const p_initial_centers,
+                                                                        const double p_tolerance,
+                                                                        const std::size_t p_itermax,
+                                                                        const void * const p_metric,
+                                                                        const std::size_t p_algorithm);
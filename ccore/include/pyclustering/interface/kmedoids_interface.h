@@ -40,6 +40,7 @@ enum kmedoids_package_indexer {
  * @param[in] p_itermax: maximum number of iterations for cluster analysis.
  * @param[in] p_metric: pointer to distance metric 'distance_metric' that is used for distance calculation between two points.
  * @param[in] p_type: representation of data type ('0' - points, '1' - distance matrix).
+ * @param[in] p_swap: strategy that is used to swap medoids (see 'kmedoids_swap_type').
  *
  * @return  Returns result of clustering - array of allocated clusters in pyclustering package.
  *
@@ -49,4 +50,5 @@ extern "C" DECLARATION pyclustering_package * kmedoids_algorithm(const pycluster
                                                                  const double p_tolerance,
                                                                  const std::size_t p_itermax,
                                                                  const void * const p_metric,
-                                                                 const std::size_t p_type);
+                                                                 const std::size_t p_type,
+                                                                 const std::size_t p_swap);
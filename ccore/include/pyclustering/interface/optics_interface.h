@@ -29,6 +29,7 @@ enum optics_package_indexer {
     OPTICS_PACKAGE_INDEX_OPTICS_OBJECTS_INDEX,
     OPTICS_PACKAGE_INDEX_OPTICS_OBJECTS_CORE_DISTANCE,
     OPTICS_PACKAGE_INDEX_OPTICS_OBJECTS_REACHABILITY_DISTANCE,
+    OPTICS_PACKAGE_INDEX_ORDERED_INDEXES,
     OPTICS_PACKAGE_SIZE
 };
 
@@ -12,6 +12,7 @@
 
 #include <algorithm>
 #include <limits>
+#include <numeric>
 #include <unordered_map>
 
 #include <pyclustering/utils/metric.hpp>
@@ -31,13 +32,14 @@ const double             kmeans::DEFAULT_TOLERANCE                       = 0.001
 const std::size_t        kmeans::DEFAULT_ITERMAX                         = 100;
 
 
-kmeans::kmeans(const dataset & p_initial_centers, const double p_tolerance, const std::size_t p_itermax, const distance_metric<point> & p_metric) :
+kmeans::kmeans(const dataset & p_initial_centers, const double p_tolerance, const std::size_t p_itermax, const distance_metric<point> & p_metric, const kmeans_algorithm p_algorithm) :
     m_tolerance(p_tolerance),
     m_itermax(p_itermax),
     m_initial_centers(p_initial_centers),
     m_ptr_result(nullptr),
     m_ptr_data(nullptr),
-    m_metric(p_metric)
+    m_metric(p_metric),
+    m_algorithm(p_algorithm)
 { }
 
 
@@ -58,6 +60,10 @@ void kmeans::process(const dataset & p_data, const index_sequence & p_indexes, k
 
     m_ptr_result->centers().assign(m_initial_centers.begin(), m_initial_centers.end());
 
+    m_labels.clear();
+    m_upper_bounds.clear();
+    m_lower_bounds.clear();
+
     if (m_ptr_result->is_observed()) {
         cluster_sequence sequence;
         update_clusters(m_initial_centers, sequence);
@@ -70,7 +76,15 @@ void kmeans::process(const dataset & p_data, const index_sequence & p_indexes, k
 
     for(std::size_t iteration = 0; iteration < m_itermax && current_change > m_tolerance; iteration++) {
         update_clusters(m_ptr_result->centers(), m_ptr_result->clusters());
-        current_change = update_centers(m_ptr_result->clusters(), m_ptr_result->centers());
+
+        if (m_algorithm == kmeans_algorithm::LLOYD) {
+            current_change = update_centers(m_ptr_result->clusters(), m_ptr_result->centers());
+        }
+        else {
+            const dataset previous_centers = m_ptr_result->centers();
+            current_change = update_centers(m_ptr_result->clusters(), m_ptr_result->centers());
+            update_bounds(previous_centers, m_ptr_result->centers());
+        }
 
         if (m_ptr_result->is_observed()) {
             m_ptr_result->evolution_centers().push_back(m_ptr_result->centers());
@@ -83,6 +97,11 @@ void kmeans::process(const dataset & p_data, const index_sequence & p_indexes, k
 
 
 void kmeans::update_clusters(const dataset & p_centers, cluster_sequence & p_clusters) {
+    if (m_algorithm != kmeans_algorithm::LLOYD) {
+        update_clusters_bounded(p_centers, p_clusters);
+        return;
+    }
+
     const dataset & data = *m_ptr_data;
 
     p_clusters.clear();
@@ -136,6 +155,233 @@ void kmeans::assign_point_to_cluster(const std::size_t p_index_point, const data
 }
 
 
+void kmeans::update_clusters_bounded(const dataset & p_centers, cluster_sequence & p_clusters) {
+    const index_sequence points = get_processed_points();
+
+    if (m_labels.empty()) {
+        const std::size_t amount_points = m_ptr_data->size();
+
+        m_labels.assign(amount_points, 0);
+        m_upper_bounds.assign(amount_points, 0.0);
+        m_lower_bounds.assign((m_algorithm == kmeans_algorithm::ELKAN) ? amount_points * p_centers.size() : amount_points, 0.0);
+
+        parallel_for_each(points, [this, &p_centers](const std::size_t p_index) {
+            assign_point_bounded(p_index, p_centers);
+        });
+    }
+    else {
+        const std::size_t amount_centers = p_centers.size();
+
+        std::vector<double> half_distances(amount_centers * amount_centers, 0.0);
+        std::vector<double> half_separations(amount_centers, std::numeric_limits<double>::max());
+
+        for (std::size_t i = 0; i < amount_centers; i++) {
+            for (std::size_t j = i + 1; j < amount_centers; j++) {
+                const double half_distance = 0.5 * euclidean_distance(p_centers[i], p_centers[j]);
+
+                half_distances[i * amount_centers + j] = half_distance;
+                half_distances[j * amount_centers + i] = half_distance;
+
+                half_separations[i] = std::min(half_separations[i], half_distance);
+                half_separations[j] = std::min(half_separations[j], half_distance);
+            }
+        }
+
+        if (m_algorithm == kmeans_algorithm::ELKAN) {
+            parallel_for_each(points, [this, &p_centers, &half_distances, &half_separations](const std::size_t p_index) {
+                update_point_elkan(p_index, p_centers, half_distances, half_separations);
+            });
+        }
+        else {
+            parallel_for_each(points, [this, &p_centers, &half_separations](const std::size_t p_index) {
+                update_point_hamerly(p_index, p_centers, half_separations);
+            });
+        }
+    }
+
+    p_clusters.clear();
+    p_clusters.resize(p_centers.size());
+
+    for (const std::size_t index_point : points) {
+        p_clusters[m_labels[index_point]].push_back(index_point);
+    }
+
+    erase_empty_clusters(p_clusters);
+}
+
+
+void kmeans::assign_point_bounded(const std::size_t p_index_point, const dataset & p_centers) {
+    const point & current_point = (*m_ptr_data)[p_index_point];
+
+    double nearest_distance = std::numeric_limits<double>::max();
+    double second_distance = std::numeric_limits<double>::max();
+    std::size_t nearest_index = 0;
+
+    for (std::size_t index_center = 0; index_center < p_centers.size(); index_center++) {
+        const double distance = euclidean_distance(current_point, p_centers[index_center]);
+
+        if (m_algorithm == kmeans_algorithm::ELKAN) {
+            m_lower_bounds[p_index_point * p_centers.size() + index_center] = distance;
+        }
+
+        if (distance < nearest_distance) {
+            second_distance = nearest_distance;
+            nearest_distance = distance;
+            nearest_index = index_center;
+        }
+        else if (distance < second_distance) {
+            second_distance = distance;
+        }
+    }
+
+    m_labels[p_index_point] = nearest_index;
+    m_upper_bounds[p_index_point] = nearest_distance;
+
+    if (m_algorithm == kmeans_algorithm::HAMERLY) {
+        m_lower_bounds[p_index_point] = second_distance;
+    }
+}
+
+
+void kmeans::update_point_elkan(const std::size_t p_index_point, const dataset & p_centers, const std::vector<double> & p_half_distances, const std::vector<double> & p_half_separations) {
+    const std::size_t amount_centers = p_centers.size();
+    std::size_t nearest_index = m_labels[p_index_point];
+
+    double & upper_bound = m_upper_bounds[p_index_point];
+    if (upper_bound <= p_half_separations[nearest_index]) {
+        return;
+    }
+
+    double * lower_bounds = m_lower_bounds.data() + p_index_point * amount_centers;
+    bool tight = false;
+
+    for (std::size_t index_center = 0; index_center < amount_centers; index_center++) {
+        if (index_center == nearest_index) {
+            continue;
+        }
+
+        const double bound = std::max(lower_bounds[index_center], p_half_distances[nearest_index * amount_centers + index_center]);
+        if (upper_bound <= bound) {
+            continue;
+        }
+
+        if (!tight) {
+            /* upper bound is tightened by exact distance to the assigned center */
+            upper_bound = euclidean_distance((*m_ptr_data)[p_index_point], p_centers[nearest_index]);
+            lower_bounds[nearest_index] = upper_bound;
+            tight = true;
+
+            if (upper_bound <= bound) {
+                continue;
+            }
+        }
+
+        const double distance = euclidean_distance((*m_ptr_data)[p_index_point], p_centers[index_center]);
+        lower_bounds[index_center] = distance;
+
+        if (distance < upper_bound) {
+            upper_bound = distance;
+            nearest_index = index_center;
+        }
+    }
+
+    m_labels[p_index_point] = nearest_index;
+}
+
+
+void kmeans::update_point_hamerly(const std::size_t p_index_point, const dataset & p_centers, const std::vector<double> & p_half_separations) {
+    const double threshold = std::max(p_half_separations[m_labels[p_index_point]], m_lower_bounds[p_index_point]);
+    if (m_upper_bounds[p_index_point] <= threshold) {
+        return;
+    }
+
+    /* upper bound is tightened by exact distance to the assigned center */
+    m_upper_bounds[p_index_point] = euclidean_distance((*m_ptr_data)[p_index_point], p_centers[m_labels[p_index_point]]);
+    if (m_upper_bounds[p_index_point] <= threshold) {
+        return;
+    }
+
+    assign_point_bounded(p_index_point, p_centers);
+}
+
+
+void kmeans::update_bounds(const dataset & p_previous_centers, const dataset & p_centers) {
+    const index_sequence points = get_processed_points();
+
+    std::vector<std::size_t> cluster_sizes(p_previous_centers.size(), 0);
+    for (const std::size_t index_point : points) {
+        cluster_sizes[m_labels[index_point]]++;
+    }
+
+    /* centers of empty clusters have been removed, therefore indexes are shifted */
+    index_sequence center_indexes(p_previous_centers.size(), 0);
+    index_sequence previous_indexes;
+    for (std::size_t index_center = 0; index_center < p_previous_centers.size(); index_center++) {
+        center_indexes[index_center] = previous_indexes.size();
+        if (cluster_sizes[index_center] > 0) {
+            previous_indexes.push_back(index_center);
+        }
+    }
+
+    std::vector<double> movements(p_centers.size(), 0.0);
+    std::size_t largest_index = 0;
+    double largest_movement = 0.0, second_movement = 0.0;
+
+    for (std::size_t index_center = 0; index_center < p_centers.size(); index_center++) {
+        movements[index_center] = euclidean_distance(p_previous_centers[previous_indexes[index_center]], p_centers[index_center]);
+
+        if (movements[index_center] > largest_movement) {
+            second_movement = largest_movement;
+            largest_movement = movements[index_center];
+            largest_index = index_center;
+        }
+        else if (movements[index_center] > second_movement) {
+            second_movement = movements[index_center];
+        }
+    }
+
+    const std::size_t previous_amount = p_previous_centers.size();
+    const std::size_t amount = p_centers.size();
+
+    std::vector<double> lower_bounds;
+    if (m_algorithm == kmeans_algorithm::ELKAN) {
+        lower_bounds.assign(m_ptr_data->size() * amount, 0.0);
+    }
+
+    parallel_for_each(points, [&](const std::size_t p_index) {
+        const std::size_t label = center_indexes[m_labels[p_index]];
+
+        m_labels[p_index] = label;
+        m_upper_bounds[p_index] += movements[label];
+
+        if (m_algorithm == kmeans_algorithm::ELKAN) {
+            for (std::size_t index_center = 0; index_center < amount; index_center++) {
+                const double bound = m_lower_bounds[p_index * previous_amount + previous_indexes[index_center]];
+                lower_bounds[p_index * amount + index_center] = std::max(bound - movements[index_center], 0.0);
+            }
+        }
+        else {
+            m_lower_bounds[p_index] -= (label == largest_index) ? second_movement : largest_movement;
+        }
+    });
+
+    if (m_algorithm == kmeans_algorithm::ELKAN) {
+        m_lower_bounds = std::move(lower_bounds);
+    }
+}
+
+
+index_sequence kmeans::get_processed_points() const {
+    if (!m_ptr_indexes->empty()) {
+        return *m_ptr_indexes;
+    }
+
+    index_sequence points(m_ptr_data->size());
+    std::iota(points.begin(), points.end(), 0);
+    return points;
+}
+
+
 void kmeans::erase_empty_clusters(cluster_sequence & p_clusters) {
     for (size_t index_cluster = p_clusters.size() - 1; index_cluster != (size_t) -1; index_cluster--) {
         if (p_clusters[index_cluster].empty()) {
@@ -44,13 +44,15 @@ kmedoids::appropriate_cluster::appropriate_cluster(const std::size_t p_index, co
 kmedoids::kmedoids(const medoid_sequence & p_initial_medoids,
                    const double p_tolerance,
                    const std::size_t p_itermax,
-                   const distance_metric<point> & p_metric) :
+                   const distance_metric<point> & p_metric,
+                   const kmedoids_swap_type p_swap) :
     m_data_ptr(nullptr),
     m_result_ptr(nullptr),
     m_initial_medoids(p_initial_medoids),
     m_tolerance(p_tolerance),
     m_itermax(p_itermax),
-    m_metric(p_metric)
+    m_metric(p_metric),
+    m_swap(p_swap)
 { }
 
 
@@ -174,6 +176,20 @@ kmedoids::appropriate_cluster kmedoids::find_appropriate_cluster(const std::size
 
 
 double kmedoids::swap_medoids() {
+    switch (m_swap) {
+    case kmedoids_swap_type::PAM:
+        return swap_medoids_pam();
+    case kmedoids_swap_type::FASTPAM1:
+        return swap_medoids_fastpam1();
+    case kmedoids_swap_type::FASTERPAM:
+        return swap_medoids_eager();
+    default:
+        throw std::invalid_argument("Unknown swap strategy is specified (swap code: '" + std::to_string(static_cast<std::size_t>(m_swap)) + "').");
+    }
+}
+
+
+double kmedoids::swap_medoids_pam() {
     double optimal_swap_cost = std::numeric_limits<double>::max();
     std::size_t optimal_index_cluster = INVALID_INDEX;
     std::size_t optimal_index_medoid = INVALID_INDEX;
@@ -186,12 +202,11 @@ double kmedoids::swap_medoids() {
     };
 
     std::vector<optimal_chunk> cluster_chunks(m_result_ptr->clusters().size());
-    pyclustering::parallel::parallel_for(std::size_t(0), cluster_chunks.size(), [this, &cluster_chunks, &medoids](std::size_t index_cluster) {
+    pyclustering::parallel::parallel_for(std::size_t(0), cluster_chunks.size(), [this, &cluster_chunks](std::size_t index_cluster) {
         optimal_chunk & chunk = cluster_chunks[index_cluster];
 
         for (std::size_t candidate_medoid_index = 0; candidate_medoid_index < m_data_ptr->size(); candidate_medoid_index++) {
-            const bool is_already_medoid = std::find(medoids.cbegin(), medoids.cend(), candidate_medoid_index) != medoids.cend();
-            if (is_already_medoid || (m_distance_first_medoid[candidate_medoid_index] == 0.0)) {
+            if (!is_swap_candidate(candidate_medoid_index)) {
                 continue;
             }
 
@@ -212,14 +227,130 @@ double kmedoids::swap_medoids() {
         }
     }
 
-    if (optimal_index_cluster != INVALID_INDEX) {
-        medoids[optimal_index_cluster] = optimal_index_medoid;
+    if (optimal_swap_cost >= 0.0) {
+        return NOTHING_TO_SWAP;
     }
 
+    medoids[optimal_index_cluster] = optimal_index_medoid;
     return optimal_swap_cost;
 }
 
 
+double kmedoids::swap_medoids_fastpam1() {
+    struct optimal_candidate {
+        double cost = std::numeric_limits<double>::max();
+        std::size_t index_cluster = INVALID_INDEX;
+    };
+
+    auto & medoids = m_result_ptr->medoids();
+
+    std::vector<optimal_candidate> candidates(m_data_ptr->size());
+    parallel_for(std::size_t(0), m_data_ptr->size(), [this, &candidates, &medoids](const std::size_t p_index_candidate) {
+        if (!is_swap_candidate(p_index_candidate)) {
+            return;
+        }
+
+        std::vector<double> costs(medoids.size(), 0.0);
+        calculate_swap_costs(p_index_candidate, costs);
+
+        /* the first cluster with the smallest cost is chosen as it is done by PAM */
+        optimal_candidate & candidate = candidates[p_index_candidate];
+        for (std::size_t index_cluster = 0; index_cluster < costs.size(); index_cluster++) {
+            if (costs[index_cluster] < candidate.cost) {
+                candidate.cost = costs[index_cluster];
+                candidate.index_cluster = index_cluster;
+            }
+        }
+    });
+
+    double optimal_swap_cost = std::numeric_limits<double>::max();
+    std::size_t optimal_index_cluster = INVALID_INDEX;
+    std::size_t optimal_index_medoid = INVALID_INDEX;
+
+    for (std::size_t index_candidate = 0; index_candidate < candidates.size(); index_candidate++) {
+        const optimal_candidate & candidate = candidates[index_candidate];
+        if (candidate.index_cluster == INVALID_INDEX) {
+            continue;
+        }
+
+        const bool is_better_cluster = (candidate.cost == optimal_swap_cost) && (candidate.index_cluster < optimal_index_cluster);
+        if ((candidate.cost < optimal_swap_cost) || is_better_cluster) {
+            optimal_swap_cost = candidate.cost;
+            optimal_index_cluster = candidate.index_cluster;
+            optimal_index_medoid = index_candidate;
+        }
+    }
+
+    if (optimal_swap_cost >= 0.0) {
+        return NOTHING_TO_SWAP;
+    }
+
+    medoids[optimal_index_cluster] = optimal_index_medoid;
+    return optimal_swap_cost;
+}
+
+
+double kmedoids::swap_medoids_eager() {
+    auto & medoids = m_result_ptr->medoids();
+
+    double total_swap_cost = 0.0;
+    bool swapped = false;
+
+    std::vector<double> costs(medoids.size(), 0.0);
+    for (std::size_t index_candidate = 0; index_candidate < m_data_ptr->size(); index_candidate++) {
+        if (!is_swap_candidate(index_candidate)) {
+            continue;
+        }
+
+        calculate_swap_costs(index_candidate, costs);
+
+        const auto iter_optimal = std::min_element(costs.cbegin(), costs.cend());
+        if (*iter_optimal < 0.0) {
+            medoids[std::distance(costs.cbegin(), iter_optimal)] = index_candidate;
+            total_swap_cost += *iter_optimal;
+            swapped = true;
+
+            update_clusters();
+        }
+    }
+
+    return swapped ? total_swap_cost : NOTHING_TO_SWAP;
+}
+
+
+bool kmedoids::is_swap_candidate(const std::size_t p_index_point) const {
+    const auto & medoids = m_result_ptr->medoids();
+
+    const bool is_already_medoid = std::find(medoids.cbegin(), medoids.cend(), p_index_point) != medoids.cend();
+    return !is_already_medoid && (m_distance_first_medoid[p_index_point] != 0.0);
+}
+
+
+void kmedoids::calculate_swap_costs(const std::size_t p_index_candidate, std::vector<double> & p_costs) const {
+    std::fill(p_costs.begin(), p_costs.end(), 0.0);
+
+    double shared_cost = 0.0;
+    for (std::size_t index_point = 0; index_point < m_data_ptr->size(); ++index_point) {
+        if (index_point == p_index_candidate) {
+            continue;
+        }
+
+        const double candidate_distance = m_calculator(index_point, p_index_candidate);
+        const double distance_first = m_distance_first_medoid[index_point];
+
+        const double gain = std::min(candidate_distance - distance_first, 0.0);
+        shared_cost += gain;
+
+        p_costs[m_labels[index_point]] += std::min(candidate_distance, m_distance_second_medoid[index_point]) - distance_first - gain;
+    }
+
+    shared_cost -= m_distance_first_medoid[p_index_candidate];
+    for (auto & cost : p_costs) {
+        cost += shared_cost;
+    }
+}
+
+
 double kmedoids::calculate_swap_cost(const std::size_t p_index_candidate, const std::size_t p_index_cluster) const {
 #if PARALLEL_KMEDOIDS_CALCULATE_SWAP_COST
     std::vector<double> point_cost(m_data_ptr->size(), 0);
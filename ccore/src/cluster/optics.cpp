@@ -94,6 +94,8 @@ void optics::initialize() {
     }
 
 
+    m_order_seed = optics_order_seed(m_data_ptr->size());
+
     m_ordered_database.clear();
 
     m_result_ptr->clusters().clear();
@@ -123,12 +125,10 @@ void optics::expand_cluster_order(optics_descriptor & p_object) {
     if (neighbors.size() >= m_neighbors) {
         p_object.m_core_distance = get_core_distance(neighbors);
 
-        std::multiset<optics_descriptor *, optics_pointer_descriptor_less> order_seed;
-        update_order_seed(p_object, neighbors, order_seed);
+        update_order_seed(p_object, neighbors);
 
-        while(!order_seed.empty()) {
-            optics_descriptor * descriptor = *(order_seed.begin());
-            order_seed.erase(order_seed.begin());
+        while(!m_order_seed.empty()) {
+            optics_descriptor * descriptor = m_order_seed.pop();
 
             get_neighbors(descriptor->m_index, neighbors);
             descriptor->m_processed = true;
@@ -137,7 +137,7 @@ void optics::expand_cluster_order(optics_descriptor & p_object) {
 
             if (neighbors.size() >= m_neighbors) {
                 descriptor->m_core_distance = get_core_distance(neighbors);
-                update_order_seed(*descriptor, neighbors, order_seed);
+                update_order_seed(*descriptor, neighbors);
             }
             else {
                 descriptor->m_core_distance = optics::NONE_DISTANCE;
@@ -150,7 +150,7 @@ void optics::expand_cluster_order(optics_descriptor & p_object) {
 }
 
 
-void optics::update_order_seed(const optics_descriptor & p_object, const neighbors_collection & p_neighbors, std::multiset<optics_descriptor *, optics_pointer_descriptor_less> & order_seed) {
+void optics::update_order_seed(const optics_descriptor & p_object, const neighbors_collection & p_neighbors) {
     for (auto & descriptor : p_neighbors) {
         std::size_t index_neighbor = descriptor.m_index;
         double current_reachability_distance = descriptor.m_reachability_distance;
@@ -161,18 +161,12 @@ void optics::update_order_seed(const optics_descriptor & p_object, const neighbo
 
             if (optics_object.m_reachability_distance == optics::NONE_DISTANCE) {
                 optics_object.m_reachability_distance = reachable_distance;
-                order_seed.insert(&optics_object);
+                m_order_seed.push(&optics_object);
             }
             else {
                 if (reachable_distance < optics_object.m_reachability_distance) {
                     optics_object.m_reachability_distance = reachable_distance;
-
-                    auto object_iterator = std::find_if(order_seed.begin(), order_seed.end(), [&optics_object](optics_descriptor * obj) {
-                        return obj->m_index == optics_object.m_index;
-                    });
-
-                    order_seed.erase(object_iterator);
-                    order_seed.insert(&optics_object);
+                    m_order_seed.decrease(&optics_object);
                 }
             }
         }
@@ -186,7 +180,13 @@ void optics::extract_clusters() {
 
     cluster * current_cluster = (cluster *) &noise;
 
+    std::vector<std::size_t> & ordered_indexes = m_result_ptr->ordered_indexes();
+    ordered_indexes.clear();
+    ordered_indexes.reserve(m_ordered_database.size());
+
     for (auto optics_object : m_ordered_database) {
+        ordered_indexes.push_back(optics_object->m_index);
+
         if ( (optics_object->m_reachability_distance == optics::NONE_DISTANCE) || (optics_object->m_reachability_distance > m_radius) ) {
             if ( (optics_object->m_core_distance != optics::NONE_DISTANCE) && (optics_object->m_core_distance <= m_radius) ) {
                 clusters.push_back({ optics_object->m_index });
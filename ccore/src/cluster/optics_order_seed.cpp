@@ -0,0 +1,148 @@
+/*!
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2020
+@copyright BSD-3-Clause
+
+*/
+
+
+#include <pyclustering/cluster/optics_order_seed.hpp>
+
+#include <limits>
+
+
+namespace pyclustering {
+
+namespace clst {
+
+
+const std::size_t optics_order_seed::INVALID_POSITION = std::numeric_limits<std::size_t>::max();
+
+
+optics_order_seed::optics_order_seed(const std::size_t p_capacity) :
+    m_positions(p_capacity, INVALID_POSITION)
+{
+    m_heap.reserve(p_capacity);
+}
+
+
+void optics_order_seed::push(optics_descriptor * p_object) {
+    m_heap.push_back({ p_object, m_sequence++ });
+    position(p_object) = m_heap.size() - 1;
+
+    sift_up(m_heap.size() - 1);
+}
+
+
+void optics_order_seed::decrease(optics_descriptor * p_object) {
+    const std::size_t index_position = position(p_object);
+
+    m_heap[index_position].m_sequence = m_sequence++;
+    sift_up(index_position);
+}
+
+
+optics_descriptor * optics_order_seed::pop() {
+    optics_descriptor * result = m_heap.front().m_object;
+    position(result) = INVALID_POSITION;
+
+    const seed_entry last = m_heap.back();
+    m_heap.pop_back();
+
+    if (!m_heap.empty()) {
+        place(0, last);
+        sift_down(0);
+    }
+
+    return result;
+}
+
+
+bool optics_order_seed::contains(const optics_descriptor * p_object) const {
+    return (p_object->m_index < m_positions.size()) && (m_positions[p_object->m_index] != INVALID_POSITION);
+}
+
+
+bool optics_order_seed::empty() const {
+    return m_heap.empty();
+}
+
+
+std::size_t optics_order_seed::size() const {
+    return m_heap.size();
+}
+
+
+bool optics_order_seed::less(const seed_entry & p_entry1, const seed_entry & p_entry2) const {
+    const double distance1 = p_entry1.m_object->m_reachability_distance;
+    const double distance2 = p_entry2.m_object->m_reachability_distance;
+
+    if (distance1 != distance2) {
+        return distance1 < distance2;
+    }
+
+    return p_entry1.m_sequence < p_entry2.m_sequence;
+}
+
+
+void optics_order_seed::place(const std::size_t p_position, const seed_entry & p_entry) {
+    m_heap[p_position] = p_entry;
+    position(p_entry.m_object) = p_position;
+}
+
+
+void optics_order_seed::sift_up(std::size_t p_position) {
+    const seed_entry entry = m_heap[p_position];
+
+    while (p_position > 0) {
+        const std::size_t parent = (p_position - 1) / 2;
+        if (!less(entry, m_heap[parent])) {
+            break;
+        }
+
+        place(p_position, m_heap[parent]);
+        p_position = parent;
+    }
+
+    place(p_position, entry);
+}
+
+
+void optics_order_seed::sift_down(std::size_t p_position) {
+    const seed_entry entry = m_heap[p_position];
+
+    while (true) {
+        std::size_t child = 2 * p_position + 1;
+        if (child >= m_heap.size()) {
+            break;
+        }
+
+        if ((child + 1 < m_heap.size()) && less(m_heap[child + 1], m_heap[child])) {
+            child++;
+        }
+
+        if (!less(m_heap[child], entry)) {
+            break;
+        }
+
+        place(p_position, m_heap[child]);
+        p_position = child;
+    }
+
+    place(p_position, entry);
+}
+
+
+std::size_t & optics_order_seed::position(const optics_descriptor * p_object) {
+    if (p_object->m_index >= m_positions.size()) {
+        m_positions.resize(p_object->m_index + 1, INVALID_POSITION);
+    }
+
+    return m_positions[p_object->m_index];
+}
+
+
+}
+
+}
@@ -30,12 +30,12 @@ void silhouette::process(const dataset & p_data, const cluster_sequence & p_clus
     m_result    = &p_result;
     m_type      = p_type;
 
-    m_result->get_score().reserve(m_data->size());
+    m_result->get_score().assign(m_data->size(), 0.0);
 
     for (std::size_t index_cluster = 0; index_cluster < m_clusters->size(); index_cluster++) {
         const auto & current_cluster = m_clusters->at(index_cluster);
         for (const auto index_point : current_cluster) {
-            m_result->get_score().push_back(calculate_score(index_point, index_cluster));
+            m_result->get_score()[index_point] = calculate_score(index_point, index_cluster);
         }
     }
 }
@@ -10,8 +10,12 @@
 
 #include <pyclustering/cluster/kmeans.hpp>
 
+#include <pyclustering/parallel/parallel.hpp>
+
 #include <pyclustering/utils/metric.hpp>
 
+#include <algorithm>
+
 
 using namespace pyclustering::utils::metric;
 
@@ -21,7 +25,8 @@ pyclustering_package * kmeans_algorithm(const pyclustering_package * const p_sam
                                         const double p_tolerance, 
                                         const std::size_t p_itermax,
                                         const bool p_observe,
-                                        const void * const p_metric)
+                                        const void * const p_metric,
+                                        const std::size_t p_algorithm)
 {
     pyclustering::dataset data, centers;
 
@@ -35,7 +40,7 @@ pyclustering_package * kmeans_algorithm(const pyclustering_package * const p_sam
         metric = &default_metric;
     }
 
-    pyclustering::clst::kmeans algorithm(centers, p_tolerance, p_itermax, *metric);
+    pyclustering::clst::kmeans algorithm(centers, p_tolerance, p_itermax, *metric, static_cast<pyclustering::clst::kmeans_algorithm>(p_algorithm));
 
     pyclustering::clst::kmeans_data output_result(p_observe);
     algorithm.process(data, output_result);
@@ -51,3 +56,52 @@ pyclustering_package * kmeans_algorithm(const pyclustering_package * const p_sam
 
     return package;
 }
+
+
+pyclustering_package * kmeans_restarts_algorithm(const pyclustering_package * const p_sample,
+                                                 const pyclustering_package * const p_initial_centers,
+                                                 const double p_tolerance,
+                                                 const std::size_t p_itermax,
+                                                 const void * const p_metric,
+                                                 const std::size_t p_algorithm)
+{
+    pyclustering::dataset data;
+    p_sample->extract(data);
+
+    std::vector<pyclustering::dataset> initial_centers(p_initial_centers->size);
+    for (std::size_t index_restart = 0; index_restart < initial_centers.size(); index_restart++) {
+        p_initial_centers->at<pyclustering_package *>(index_restart)->extract(initial_centers[index_restart]);
+    }
+
+    distance_metric<pyclustering::point> * metric = ((distance_metric<pyclustering::point> *) p_metric);
+    distance_metric<pyclustering::point> default_metric = distance_metric_factory<pyclustering::point>::euclidean_square();
+
+    if (!metric) {
+        metric = &default_metric;
+    }
+
+    std::vector<pyclustering::clst::kmeans_data> results(initial_centers.size(), pyclustering::clst::kmeans_data(false));
+
+    pyclustering::parallel::parallel_for(std::size_t(0), initial_centers.size(), [&](const std::size_t p_index) {
+        pyclustering::clst::kmeans algorithm(initial_centers[p_index], p_tolerance, p_itermax, *metric, static_cast<pyclustering::clst::kmeans_algorithm>(p_algorithm));
+        algorithm.process(data, results[p_index]);
+    });
+
+    std::vector<double> restarts_wce(results.size());
+    std::transform(results.begin(), results.end(), restarts_wce.begin(), [](const pyclustering::clst::kmeans_data & p_result) {
+        return p_result.wce();
+    });
+
+    const std::size_t index_best = std::distance(restarts_wce.begin(), std::min_element(restarts_wce.begin(), restarts_wce.end()));
+    pyclustering::clst::kmeans_data & best_result = results[index_best];
+
+    pyclustering_package * package = create_package_container(KMEANS_RESTARTS_PACKAGE_SIZE);
+    ((pyclustering_package **) package->data)[KMEANS_RESTARTS_PACKAGE_INDEX_CLUSTERS] = create_package(&best_result.clusters());
+    ((pyclustering_package **) package->data)[KMEANS_RESTARTS_PACKAGE_INDEX_CENTERS] = create_package(&best_result.centers());
+
+    std::vector<double> wce_storage(1, best_result.wce());
+    ((pyclustering_package **) package->data)[KMEANS_RESTARTS_PACKAGE_INDEX_WCE] = create_package(&wce_storage);
+    ((pyclustering_package **) package->data)[KMEANS_RESTARTS_PACKAGE_INDEX_RESTARTS_WCE] = create_package(&restarts_wce);
+
+    return package;
+}
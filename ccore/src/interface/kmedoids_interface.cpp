@@ -21,7 +21,8 @@ pyclustering_package * kmedoids_algorithm(const pyclustering_package * const p_s
                                           const double p_tolerance,
                                           const std::size_t p_itermax,
                                           const void * const p_metric,
-                                          const std::size_t p_type)
+                                          const std::size_t p_type,
+                                          const std::size_t p_swap)
 try 
 {
     pyclustering::clst::medoid_sequence medoids;
@@ -34,7 +35,7 @@ try
         metric = &default_metric;
     }
 
-    pyclustering::clst::kmedoids algorithm(medoids, p_tolerance, p_itermax, *metric);
+    pyclustering::clst::kmedoids algorithm(medoids, p_tolerance, p_itermax, *metric, static_cast<pyclustering::clst::kmedoids_swap_type>(p_swap));
 
     pyclustering::dataset input_dataset;
     p_sample->extract(input_dataset);
@@ -54,6 +55,6 @@ try
 
     return package;
 }
-catch (std::exception & p_exception) {
-    return create_package(p_exception.what());
+catch (std::exception & p_exception) {
+    return create_package(p_exception.what());
 }
@@ -54,6 +54,7 @@ pyclustering_package * optics_algorithm(const pyclustering_package * const p_sam
     ((pyclustering_package **) package->data)[OPTICS_PACKAGE_INDEX_OPTICS_OBJECTS_INDEX] = package_object_indexes;
     ((pyclustering_package **) package->data)[OPTICS_PACKAGE_INDEX_OPTICS_OBJECTS_CORE_DISTANCE] = package_core_distance;
     ((pyclustering_package **) package->data)[OPTICS_PACKAGE_INDEX_OPTICS_OBJECTS_REACHABILITY_DISTANCE] = package_reachability_distance;
+    ((pyclustering_package **) package->data)[OPTICS_PACKAGE_INDEX_ORDERED_INDEXES] = create_package(&output_result.ordered_indexes());
 
     return package;
 }
\ No newline at end of file
@@ -28,14 +28,55 @@ TEST(utest_interface_kmeans, kmeans_api) {
 
     distance_metric<point> metric = distance_metric_factory<point>::euclidean_square();
 
-    pyclustering_package * kmeans_result = kmeans_algorithm(sample.get(), centers.get(), 0.001, 200, false, &metric);
+    pyclustering_package * kmeans_result = kmeans_algorithm(sample.get(), centers.get(), 0.001, 200, false, &metric, 0);
     ASSERT_NE(nullptr, kmeans_result);
 
     delete kmeans_result;
     kmeans_result = nullptr;
 
-    kmeans_result = kmeans_algorithm(sample.get(), centers.get(), 0.1, 100, true, &metric);
+    kmeans_result = kmeans_algorithm(sample.get(), centers.get(), 0.1, 100, true, &metric, 0);
     ASSERT_NE(nullptr, kmeans_result);
 
     delete kmeans_result;
+    kmeans_result = nullptr;
+
+    kmeans_result = kmeans_algorithm(sample.get(), centers.get(), 0.001, 200, false, &metric, 1);
+    ASSERT_NE(nullptr, kmeans_result);
+
+    delete kmeans_result;
+    kmeans_result = nullptr;
+
+    kmeans_result = kmeans_algorithm(sample.get(), centers.get(), 0.001, 200, true, &metric, 2);
+    ASSERT_NE(nullptr, kmeans_result);
+
+    delete kmeans_result;
+}
+
+
+TEST(utest_interface_kmeans, kmeans_restarts_api) {
+    std::shared_ptr<pyclustering_package> sample = pack(dataset({ { 1 }, { 2 }, { 3 }, { 10 }, { 11 }, { 12 } }));
+
+    std::vector<dataset> initial_centers = { { { 1 }, { 10 } }, { { 1 }, { 2 } }, { { 11 }, { 12 } } };
+
+    pyclustering_package * centers = create_package_container(initial_centers.size());
+    for (std::size_t i = 0; i < initial_centers.size(); i++) {
+        ((pyclustering_package **) centers->data)[i] = create_package(&initial_centers[i]);
+    }
+
+    distance_metric<point> metric = distance_metric_factory<point>::euclidean_square();
+
+    pyclustering_package * kmeans_result = kmeans_restarts_algorithm(sample.get(), centers, 0.001, 200, &metric, 0);
+    ASSERT_NE(nullptr, kmeans_result);
+    ASSERT_EQ((std::size_t) KMEANS_RESTARTS_PACKAGE_SIZE, kmeans_result->size);
+
+    pyclustering_package * restarts_wce = ((pyclustering_package **) kmeans_result->data)[KMEANS_RESTARTS_PACKAGE_INDEX_RESTARTS_WCE];
+    ASSERT_EQ(3U, restarts_wce->size);
+
+    pyclustering_package * wce = ((pyclustering_package **) kmeans_result->data)[KMEANS_RESTARTS_PACKAGE_INDEX_WCE];
+    for (std::size_t i = 0; i < restarts_wce->size; i++) {
+        ASSERT_LE(wce->at<double>(0), restarts_wce->at<double>(i));
+    }
+
+    delete kmeans_result;
+    delete centers;
 }
\ No newline at end of file
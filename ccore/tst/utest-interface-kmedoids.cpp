@@ -31,7 +31,7 @@ TEST(utest_interface_kmedoids, kmedoids_api) {
 
     distance_metric<point> metric = distance_metric_factory<point>::euclidean_square();
 
-    pyclustering_package * kmedoids_result = kmedoids_algorithm(sample.get(), medoids.get(), 0.001, 100, &metric, 0);
+    pyclustering_package * kmedoids_result = kmedoids_algorithm(sample.get(), medoids.get(), 0.001, 100, &metric, 0, 1);
 
     ASSERT_NE(nullptr, kmedoids_result);
     ASSERT_GT(((std::size_t *)((pyclustering_package **)kmedoids_result->data)[KMEDOIDS_PACKAGE_INDEX_ITERATIONS])[0], std::size_t(0));
@@ -45,8 +45,22 @@ TEST(utest_interface_kmedoids, kmedoids_api_null_metric) {
     std::shared_ptr<pyclustering_package> sample = pack(dataset({ { 1 }, { 2 }, { 3 }, { 10 }, { 11 }, { 12 } }));
     std::shared_ptr<pyclustering_package> medoids = pack(medoid_sequence({ 2, 4 }));
 
-    pyclustering_package * kmedoids_result = kmedoids_algorithm(sample.get(), medoids.get(), 0.001, 100, nullptr, 0);
+    pyclustering_package * kmedoids_result = kmedoids_algorithm(sample.get(), medoids.get(), 0.001, 100, nullptr, 0, 1);
     ASSERT_NE(nullptr, kmedoids_result);
 
     delete kmedoids_result;
 }
+
+
+TEST(utest_interface_kmedoids, kmedoids_api_swap_strategies) {
+    std::shared_ptr<pyclustering_package> sample = pack(dataset({ { 1 }, { 2 }, { 3 }, { 10 }, { 11 }, { 12 } }));
+    std::shared_ptr<pyclustering_package> medoids = pack(medoid_sequence({ 0, 1 }));
+
+    for (std::size_t swap : { 0, 1, 2 }) {
+        pyclustering_package * kmedoids_result = kmedoids_algorithm(sample.get(), medoids.get(), 0.001, 100, nullptr, 0, swap);
+        ASSERT_NE(nullptr, kmedoids_result);
+        ASSERT_EQ(4.0, ((double *)((pyclustering_package **)kmedoids_result->data)[KMEDOIDS_PACKAGE_INDEX_TOTAL_DEVIATION]->data)[0]);
+
+        delete kmedoids_result;
+    }
+}
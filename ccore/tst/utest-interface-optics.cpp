@@ -25,5 +25,8 @@ TEST(utest_interface_optics, optics_algorithm) {
     pyclustering_package * result = optics_algorithm(sample.get(), 4, 2, 2, 0);
     ASSERT_EQ((std::size_t) OPTICS_PACKAGE_SIZE, result->size);
 
+    pyclustering_package * ordered_indexes = ((pyclustering_package **) result->data)[OPTICS_PACKAGE_INDEX_ORDERED_INDEXES];
+    ASSERT_EQ((std::size_t) 6, ordered_indexes->size);
+
     delete result;
 }
\ No newline at end of file
@@ -31,10 +31,11 @@ template_kmeans_length_process_data_common(
     const index_sequence & p_indexes,
     const bool p_observe,
     const std::size_t p_itermax = kmeans::DEFAULT_ITERMAX,
-    const distance_metric<point> & p_metric = distance_metric_factory<point>::euclidean_square())
+    const distance_metric<point> & p_metric = distance_metric_factory<point>::euclidean_square(),
+    const kmeans_algorithm p_algorithm = kmeans_algorithm::LLOYD)
 {
     kmeans_data output_result(p_observe);
-    kmeans solver(p_start_centers, 0.0001, p_itermax, p_metric);
+    kmeans solver(p_start_centers, 0.0001, p_itermax, p_metric, p_algorithm);
 
     if (p_indexes.empty()) {
         solver.process(*p_data, output_result);
@@ -130,6 +131,35 @@ template_kmeans_itermax(
 }
 
 
+static void
+template_kmeans_algorithm(
+    const dataset_ptr & p_data,
+    const dataset & p_start_centers,
+    const std::vector<size_t> & p_expected_cluster_length,
+    const index_sequence & p_indexes,
+    const kmeans_algorithm p_algorithm)
+{
+    template_kmeans_length_process_data_common(p_data, p_start_centers, p_expected_cluster_length, p_indexes, false,
+        kmeans::DEFAULT_ITERMAX, distance_metric_factory<point>::euclidean_square(), p_algorithm);
+
+    kmeans_data expected_result(false), actual_result(false);
+    kmeans expected_solver(p_start_centers, 0.0001, kmeans::DEFAULT_ITERMAX, distance_metric_factory<point>::euclidean_square(), kmeans_algorithm::LLOYD);
+    kmeans actual_solver(p_start_centers, 0.0001, kmeans::DEFAULT_ITERMAX, distance_metric_factory<point>::euclidean_square(), p_algorithm);
+
+    if (p_indexes.empty()) {
+        expected_solver.process(*p_data, expected_result);
+        actual_solver.process(*p_data, actual_result);
+    }
+    else {
+        expected_solver.process(*p_data, p_indexes, expected_result);
+        actual_solver.process(*p_data, p_indexes, actual_result);
+    }
+
+    ASSERT_EQ(expected_result.clusters(), actual_result.clusters());
+    ASSERT_EQ(expected_result.centers().size(), actual_result.centers().size());
+}
+
+
 
 TEST(utest_kmeans, allocation_sample_simple_01) {
     dataset start_centers = { { 3.7, 5.5 },{ 6.7, 7.5 } };
@@ -318,6 +348,67 @@ TEST(utest_kmeans, itermax_10_simple02) {
 }
 
 
+TEST(utest_kmeans, elkan_simple01) {
+    dataset start_centers = { { 3.7, 5.5 },{ 6.7, 7.5 } };
+    std::vector<size_t> expected_clusters_length = { 5, 5 };
+    template_kmeans_algorithm(simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_01), start_centers, expected_clusters_length, { }, kmeans_algorithm::ELKAN);
+}
+
+TEST(utest_kmeans, elkan_simple02) {
+    dataset start_centers = { { 3.5, 4.8 },{ 6.9, 7.0 },{ 7.5, 0.5 } };
+    std::vector<size_t> expected_clusters_length = { 10, 5, 8 };
+    template_kmeans_algorithm(simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_02), start_centers, expected_clusters_length, { }, kmeans_algorithm::ELKAN);
+}
+
+TEST(utest_kmeans, elkan_simple03) {
+    dataset start_centers = { { 0.2, 0.1 },{ 4.0, 1.0 },{ 2.0, 2.0 },{ 2.3, 3.9 } };
+    std::vector<size_t> expected_clusters_length = { 10, 10, 10, 30 };
+    template_kmeans_algorithm(simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_03), start_centers, expected_clusters_length, { }, kmeans_algorithm::ELKAN);
+}
+
+TEST(utest_kmeans, elkan_simple02_range) {
+    dataset start_centers = { { 3.5, 4.8 },{ 6.9, 7.0 },{ 7.5, 0.5 } };
+    std::vector<size_t> expected_clusters_length = { 5, 3, 4 };
+    index_sequence range = { 0, 1, 2, 3, 4, 10, 11, 12, 15, 16, 17, 18 };
+    template_kmeans_algorithm(simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_02), start_centers, expected_clusters_length, range, kmeans_algorithm::ELKAN);
+}
+
+TEST(utest_kmeans, elkan_large_number_centers) {
+    dataset start_centers = { { 0.0, 0.0 },{ 1.0, 1.0 },{ 2.0, 2.0 },{ 3.0, 3.0 },{ 4.0, 4.0 },{ 5.0, 5.0 },{ 6.0, 6.0 },{ 7.0, 7.0 },{ 8.0, 8.0 } };
+    template_kmeans_algorithm(simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_03), start_centers, { }, { }, kmeans_algorithm::ELKAN);
+}
+
+TEST(utest_kmeans, hamerly_simple01) {
+    dataset start_centers = { { 3.7, 5.5 },{ 6.7, 7.5 } };
+    std::vector<size_t> expected_clusters_length = { 5, 5 };
+    template_kmeans_algorithm(simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_01), start_centers, expected_clusters_length, { }, kmeans_algorithm::HAMERLY);
+}
+
+TEST(utest_kmeans, hamerly_simple02) {
+    dataset start_centers = { { 3.5, 4.8 },{ 6.9, 7.0 },{ 7.5, 0.5 } };
+    std::vector<size_t> expected_clusters_length = { 10, 5, 8 };
+    template_kmeans_algorithm(simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_02), start_centers, expected_clusters_length, { }, kmeans_algorithm::HAMERLY);
+}
+
+TEST(utest_kmeans, hamerly_simple03) {
+    dataset start_centers = { { 0.2, 0.1 },{ 4.0, 1.0 },{ 2.0, 2.0 },{ 2.3, 3.9 } };
+    std::vector<size_t> expected_clusters_length = { 10, 10, 10, 30 };
+    template_kmeans_algorithm(simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_03), start_centers, expected_clusters_length, { }, kmeans_algorithm::HAMERLY);
+}
+
+TEST(utest_kmeans, hamerly_simple02_range) {
+    dataset start_centers = { { 3.5, 4.8 },{ 6.9, 7.0 },{ 7.5, 0.5 } };
+    std::vector<size_t> expected_clusters_length = { 5, 3, 4 };
+    index_sequence range = { 0, 1, 2, 3, 4, 10, 11, 12, 15, 16, 17, 18 };
+    template_kmeans_algorithm(simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_02), start_centers, expected_clusters_length, range, kmeans_algorithm::HAMERLY);
+}
+
+TEST(utest_kmeans, hamerly_large_number_centers) {
+    dataset start_centers = { { 0.0, 0.0 },{ 1.0, 1.0 },{ 2.0, 2.0 },{ 3.0, 3.0 },{ 4.0, 4.0 },{ 5.0, 5.0 },{ 6.0, 6.0 },{ 7.0, 7.0 },{ 8.0, 8.0 } };
+    template_kmeans_algorithm(simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_03), start_centers, { }, { }, kmeans_algorithm::HAMERLY);
+}
+
+
 #ifdef UT_PERFORMANCE_SESSION
 TEST(performance_kmeans, big_data) {
     auto points = simple_sample_factory::create_random_sample(100000, 10);
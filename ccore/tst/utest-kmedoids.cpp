@@ -25,10 +25,11 @@ template_kmedoids_length_process_data(const dataset_ptr p_data,
         const medoid_sequence & p_start_medoids,
         const std::vector<size_t> & p_expected_cluster_length,
         const std::size_t p_itermax = kmedoids::DEFAULT_ITERMAX,
-        const distance_metric<point> & p_metric = distance_metric_factory<point>::euclidean_square()) {
+        const distance_metric<point> & p_metric = distance_metric_factory<point>::euclidean_square(),
+        const kmedoids_swap_type p_swap = kmedoids_swap_type::FASTPAM1) {
 
     kmedoids_data output_result;
-    kmedoids solver(p_start_medoids, kmedoids::DEFAULT_TOLERANCE, p_itermax, p_metric);
+    kmedoids solver(p_start_medoids, kmedoids::DEFAULT_TOLERANCE, p_itermax, p_metric, p_swap);
     solver.process(*p_data, output_result);
 
     const dataset & data = *p_data;
@@ -70,13 +71,14 @@ template_kmedoids_length_process_distance_matrix(const dataset_ptr p_data,
         const medoid_sequence & p_start_medoids,
         const std::vector<size_t> & p_expected_cluster_length,
         const std::size_t p_itermax = kmedoids::DEFAULT_ITERMAX,
-        const distance_metric<point> & p_metric = distance_metric_factory<point>::euclidean_square()) {
+        const distance_metric<point> & p_metric = distance_metric_factory<point>::euclidean_square(),
+        const kmedoids_swap_type p_swap = kmedoids_swap_type::FASTPAM1) {
 
     dataset matrix;
     distance_matrix(*p_data, p_metric, matrix);
 
     kmedoids_data output_result;
-    kmedoids solver(p_start_medoids, kmedoids::DEFAULT_TOLERANCE, p_itermax, p_metric);
+    kmedoids solver(p_start_medoids, kmedoids::DEFAULT_TOLERANCE, p_itermax, p_metric, p_swap);
     solver.process(matrix, data_t::DISTANCE_MATRIX, output_result);
 
     const dataset & data = *p_data;
@@ -416,6 +418,71 @@ TEST(utest_kmedoids, itermax_10_simple02) {
 }
 
 
+static void
+template_kmedoids_swap_strategies(const dataset_ptr p_data, const medoid_sequence & p_start_medoids, const data_t p_type = data_t::POINTS) {
+    dataset input_data = *p_data;
+    if (p_type == data_t::DISTANCE_MATRIX) {
+        distance_matrix(*p_data, distance_metric_factory<point>::euclidean_square(), input_data);
+    }
+
+    kmedoids_data pam_result, fastpam1_result, fasterpam_result;
+    kmedoids(p_start_medoids, kmedoids::DEFAULT_TOLERANCE, kmedoids::DEFAULT_ITERMAX, distance_metric_factory<point>::euclidean_square(), kmedoids_swap_type::PAM).process(input_data, p_type, pam_result);
+    kmedoids(p_start_medoids, kmedoids::DEFAULT_TOLERANCE, kmedoids::DEFAULT_ITERMAX, distance_metric_factory<point>::euclidean_square(), kmedoids_swap_type::FASTPAM1).process(input_data, p_type, fastpam1_result);
+    kmedoids(p_start_medoids, kmedoids::DEFAULT_TOLERANCE, kmedoids::DEFAULT_ITERMAX, distance_metric_factory<point>::euclidean_square(), kmedoids_swap_type::FASTERPAM).process(input_data, p_type, fasterpam_result);
+
+    /* FastPAM1 performs exactly the same swaps as PAM */
+    ASSERT_EQ(pam_result.medoids(), fastpam1_result.medoids());
+    ASSERT_EQ(pam_result.clusters(), fastpam1_result.clusters());
+    ASSERT_EQ(pam_result.iterations(), fastpam1_result.iterations());
+    ASSERT_NEAR(pam_result.total_deviation(), fastpam1_result.total_deviation(), 0.000001);
+
+    /* FasterPAM swaps eagerly, therefore it needs less iterations and might converge to another local optimum */
+    ASSERT_EQ(p_start_medoids.size(), fasterpam_result.medoids().size());
+    ASSERT_LE(fasterpam_result.iterations(), pam_result.iterations());
+    ASSERT_LE(fasterpam_result.total_deviation(), pam_result.total_deviation() * 1.1 + 0.000001);
+}
+
+
+TEST(utest_kmedoids, swap_strategies_sample_simple_01) {
+    template_kmedoids_swap_strategies(simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_01), { 1, 5 });
+}
+
+TEST(utest_kmedoids, swap_strategies_sample_simple_03) {
+    template_kmedoids_swap_strategies(simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_03), { 4, 7, 12, 20 });
+}
+
+TEST(utest_kmedoids, swap_strategies_sample_simple_03_distance_matrix) {
+    template_kmedoids_swap_strategies(simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_03), { 4, 7, 12, 20 }, data_t::DISTANCE_MATRIX);
+}
+
+TEST(utest_kmedoids, swap_strategies_sample_hepta) {
+    template_kmedoids_swap_strategies(fcps_sample_factory::create_sample(FCPS_SAMPLE::HEPTA), { 0, 35, 16, 13, 15, 11, 24 });
+}
+
+TEST(utest_kmedoids, swap_strategies_sample_tetra) {
+    template_kmedoids_swap_strategies(fcps_sample_factory::create_sample(FCPS_SAMPLE::TETRA), { 0, 1, 2, 3 });
+}
+
+
+TEST(utest_kmedoids, allocation_sample_hepta_pam) {
+    const medoid_sequence start_medoids = { 0, 35, 16, 13, 15, 11, 24 };
+    const std::vector<size_t> expected_clusters_length = { 30, 30, 30, 30, 30, 30, 32 };
+    template_kmedoids_length_process_data(fcps_sample_factory::create_sample(FCPS_SAMPLE::HEPTA), start_medoids, expected_clusters_length, kmedoids::DEFAULT_ITERMAX, distance_metric_factory<point>::euclidean_square(), kmedoids_swap_type::PAM);
+}
+
+TEST(utest_kmedoids, allocation_sample_hepta_fasterpam) {
+    const medoid_sequence start_medoids = { 0, 35, 16, 13, 15, 11, 24 };
+    const std::vector<size_t> expected_clusters_length = { 30, 30, 30, 30, 30, 30, 32 };
+    template_kmedoids_length_process_data(fcps_sample_factory::create_sample(FCPS_SAMPLE::HEPTA), start_medoids, expected_clusters_length, kmedoids::DEFAULT_ITERMAX, distance_metric_factory<point>::euclidean_square(), kmedoids_swap_type::FASTERPAM);
+}
+
+TEST(utest_kmedoids, allocation_sample_tetra_fasterpam_distance_matrix) {
+    const medoid_sequence start_medoids = { 0, 1, 2, 3 };
+    const std::vector<size_t> expected_clusters_length = { 100, 100, 100, 100 };
+    template_kmedoids_length_process_distance_matrix(fcps_sample_factory::create_sample(FCPS_SAMPLE::TETRA), start_medoids, expected_clusters_length, kmedoids::DEFAULT_ITERMAX, distance_metric_factory<point>::euclidean_square(), kmedoids_swap_type::FASTERPAM);
+}
+
+
 //#define UT_PERFORMANCE_SESSION
 #ifdef UT_PERFORMANCE_SESSION
 
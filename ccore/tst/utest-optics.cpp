@@ -10,6 +10,7 @@
 #include <gtest/gtest.h>
 
 #include <pyclustering/cluster/optics.hpp>
+#include <pyclustering/cluster/optics_order_seed.hpp>
 #include <pyclustering/cluster/ordering_analyser.hpp>
 
 #include <pyclustering/utils/metric.hpp>
@@ -50,6 +51,18 @@ template_optics_length_process_data(const std::shared_ptr<dataset> & p_data,
         EXPECT_TRUE(object.m_processed);
     }
 
+    const std::vector<std::size_t> & ordered_indexes = ptr_output_result->ordered_indexes();
+    EXPECT_EQ(p_data->size(), ordered_indexes.size());
+
+    std::vector<bool> traversed(p_data->size(), false);
+    for (const auto index : ordered_indexes) {
+        EXPECT_LT(index, traversed.size());
+        if (index < traversed.size()) {
+            EXPECT_FALSE(traversed[index]);
+            traversed[index] = true;
+        }
+    }
+
     return ptr_output_result;
 }
 
@@ -311,6 +324,77 @@ TEST(utest_optics, noise_cluster_allocation_sample_simple_02_distance_matrix) {
 }
 
 
+TEST(utest_optics, order_seed_extraction_order) {
+    std::vector<optics_descriptor> objects = { { 0, 0.0, 3.0 }, { 1, 0.0, 1.0 }, { 2, 0.0, 2.0 }, { 3, 0.0, 1.0 }, { 4, 0.0, 0.5 } };
+
+    optics_order_seed order_seed(objects.size());
+    for (auto & object : objects) {
+        order_seed.push(&object);
+    }
+
+    ASSERT_EQ(objects.size(), order_seed.size());
+    ASSERT_TRUE(order_seed.contains(&objects[2]));
+
+    const std::vector<std::size_t> expected_order = { 4, 1, 3, 2, 0 };
+    for (const auto expected_index : expected_order) {
+        ASSERT_EQ(expected_index, order_seed.pop()->m_index);
+    }
+
+    ASSERT_TRUE(order_seed.empty());
+    ASSERT_FALSE(order_seed.contains(&objects[2]));
+}
+
+
+TEST(utest_optics, order_seed_decrease) {
+    std::vector<optics_descriptor> objects = { { 0, 0.0, 3.0 }, { 1, 0.0, 1.0 }, { 2, 0.0, 2.0 }, { 3, 0.0, 4.0 } };
+
+    optics_order_seed order_seed(objects.size());
+    for (auto & object : objects) {
+        order_seed.push(&object);
+    }
+
+    objects[3].m_reachability_distance = 1.0;
+    order_seed.decrease(&objects[3]);
+
+    objects[0].m_reachability_distance = 0.5;
+    order_seed.decrease(&objects[0]);
+
+    const std::vector<std::size_t> expected_order = { 0, 1, 3, 2 };
+    for (const auto expected_index : expected_order) {
+        ASSERT_EQ(expected_index, order_seed.pop()->m_index);
+    }
+
+    ASSERT_TRUE(order_seed.empty());
+}
+
+
+TEST(utest_optics, order_seed_random_operations) {
+    const std::size_t amount = 200;
+
+    std::vector<optics_descriptor> objects;
+    for (std::size_t i = 0; i < amount; i++) {
+        objects.emplace_back(i, 0.0, (double) ((i * 37) % 101));
+    }
+
+    optics_order_seed order_seed(amount);
+    for (auto & object : objects) {
+        order_seed.push(&object);
+    }
+
+    for (std::size_t i = 0; i < amount; i += 3) {
+        objects[i].m_reachability_distance /= 2.0;
+        order_seed.decrease(&objects[i]);
+    }
+
+    double previous_distance = -1.0;
+    while (!order_seed.empty()) {
+        const optics_descriptor * object = order_seed.pop();
+        ASSERT_LE(previous_distance, object->m_reachability_distance);
+        previous_distance = object->m_reachability_distance;
+    }
+}
+
+
 #ifdef UT_PERFORMANCE_SESSION
 #include <chrono>
 
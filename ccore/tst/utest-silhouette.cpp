@@ -51,6 +51,35 @@ void template_correct_score_data_types(const dataset_ptr & p_data, const answer
 }
 
 
+void template_correct_score_order(const dataset_ptr & p_data, const answer & p_answer) {
+    silhouette_data result, result_reversed;
+
+    cluster_sequence clusters_reversed(p_answer.clusters().rbegin(), p_answer.clusters().rend());
+    for (auto & cluster : clusters_reversed) {
+        std::reverse(cluster.begin(), cluster.end());
+    }
+
+    silhouette().process(*p_data, p_answer.clusters(), result);
+    silhouette().process(*p_data, clusters_reversed, result_reversed);
+
+    ASSERT_EQ(p_data->size(), result_reversed.get_score().size());
+    for (std::size_t index_point = 0; index_point < p_data->size(); index_point++) {
+        ASSERT_NEAR(result.get_score()[index_point], result_reversed.get_score()[index_point], 1e-12);
+    }
+
+    /* score of each object is stored using its index */
+    const auto & first_cluster = p_answer.clusters().front();
+    silhouette_data result_single;
+    silhouette().process(*p_data, { first_cluster, { } }, result_single);
+
+    for (std::size_t index_point = 0; index_point < p_data->size(); index_point++) {
+        if (std::find(first_cluster.begin(), first_cluster.end(), index_point) == first_cluster.end()) {
+            ASSERT_EQ(0.0, result_single.get_score()[index_point]);
+        }
+    }
+}
+
+
 TEST(utest_silhouette, correct_score_simple01) {
     template_correct_scores(simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_01), answer_reader::read(SAMPLE_SIMPLE::SAMPLE_SIMPLE_01));
 }
@@ -115,3 +144,12 @@ TEST(utest_silhouette, correct_score_distance_matrix_simple07) {
 TEST(utest_silhouette, correct_score_distance_matrix_simple08) {
     template_correct_score_data_types(simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_08), answer_reader::read(SAMPLE_SIMPLE::SAMPLE_SIMPLE_08));
 }
+
+
+TEST(utest_silhouette, correct_score_order_simple03) {
+    template_correct_score_order(simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_03), answer_reader::read(SAMPLE_SIMPLE::SAMPLE_SIMPLE_03));
+}
+
+TEST(utest_silhouette, correct_score_order_simple04) {
+    template_correct_score_order(simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_04), answer_reader::read(SAMPLE_SIMPLE::SAMPLE_SIMPLE_04));
+}
@@ -29,6 +29,7 @@ Cluster analysis algorithms and methods (module pyclustering.cluster):
 - BANG (pyclustering.cluster.bang);
 - BIRCH (pyclustering.cluster.birch);
 - BSAS (pyclustering.cluster.bsas);
+- CLARA (pyclustering.cluster.clara);
 - CLARANS (pyclustering.cluster.clarans);
 - CLIQUE (pyclustering.cluster.clique);
 - CURE (pyclustering.cluster.cure);
@@ -10,13 +10,17 @@
 """
 
 
+import heapq
+
+import numpy
+
 from enum import IntEnum
 
 from pyclustering.cluster.encoder import type_encoding
 
-from pyclustering.utils import euclidean_distance_square
+from pyclustering.container.dendrogram import dendrogram
 
-from pyclustering.core.wrapper import ccore_library
+from pyclustering.core.wrapper import ccore_library, ccore_async_processing
 
 import pyclustering.core.agglomerative_wrapper as wrapper
 
@@ -39,12 +43,377 @@ class type_link(IntEnum):
     ## Distance between centers of clusters is considered as a link.
     CENTROID_LINK = 3
 
+    ## Increase of total within-cluster sum of squares after merging is considered as a link (Ward's method), it is
+    ## supported only by Python implementation.
+    WARD_LINK = 4
+
+
+
+class agglomerative_linkage:
+    """!
+    @brief Builds full merge history (linkage matrix) of agglomerative algorithm.
+    @details Each row of linkage matrix describes one merge: [left, right, height, size], where `left` and `right`
+              are identifiers of merged clusters, `height` is a link between them and `size` is amount of points in
+              the new cluster. Identifiers that are less than amount of points are points themselves, the cluster
+              that is created by merge `i` has identifier `amount_points + i`. The left cluster is the cluster
+              whose smallest index of point is smaller.
+
+              Links between points are square Euclidean distances. The history is built in line with link type:
+              - Single link: minimum spanning tree is built by Prim's algorithm, edges of the tree sorted by weight
+                 are merges, only one row of distances is kept in memory.
+              - Complete, average and Ward's links: nearest-neighbor chain algorithm with condensed distance matrix
+                 that is updated by Lance-Williams formulas, merges are sorted by height. In line with C++
+                 implementation average link is a sum of distances between points of clusters divided by sum of
+                 sizes of clusters.
+              - Centroid link: the closest pair is chosen on each step using the nearest neighbor of each cluster,
+                 distances between centers are calculated by one vectorized expression.
+
+              Merge history can be cut to obtain any amount of clusters without recalculation (see 'dendrogram').
+
+    """
+
+    def __init__(self, data, link):
+        """!
+        @brief Constructor of builder of merge history.
+
+        @param[in] data (array_like): Input data that is presented as a list of points.
+        @param[in] link (type_link): Link type that is used for calculation similarity between clusters.
+
+        """
+        self.__data = numpy.array(data, dtype=numpy.float64).reshape(len(data), -1)
+        self.__link = link
+
+
+    def process(self):
+        """!
+        @brief Builds merge history.
+
+        @return (numpy.ndarray) Linkage matrix where each row is [left, right, height, size].
+
+        """
+        if self.__link == type_link.SINGLE_LINK:
+            merges = self.__merge_by_minimum_spanning_tree()
+
+        elif self.__link == type_link.CENTROID_LINK:
+            merges = self.__merge_by_centroid_link()
+
+        else:
+            merges = self.__merge_by_nearest_neighbor_chain()
+
+        return self.__create_linkage(merges)
+
+
+    def __create_linkage(self, merges):
+        """!
+        @brief Creates linkage matrix from merges of clusters.
+
+        @param[in] merges (list): Merges in order of processing, each merge is presented by any points of merged
+                    clusters and by a link between clusters: (index_point1, index_point2, height).
+
+        @return (numpy.ndarray) Linkage matrix where each row is [left, right, height, size].
+
+        """
+        amount_points = len(self.__data)
+
+        parents = list(range(amount_points))     # root of each cluster is its smallest index of point
+        identifiers = list(range(amount_points))
+        sizes = [1] * amount_points
+
+        linkage = numpy.empty((len(merges), 4), dtype=numpy.float64)
+        for index_merge, (index_point1, index_point2, height) in enumerate(merges):
+            root1, root2 = self.__find_root(parents, index_point1), self.__find_root(parents, index_point2)
+            if root1 > root2:
+                root1, root2 = root2, root1
+
+            parents[root2] = root1
+            sizes[root1] += sizes[root2]
+
+            linkage[index_merge] = (identifiers[root1], identifiers[root2], height, sizes[root1])
+            identifiers[root1] = amount_points + index_merge
+
+        return linkage
+
+
+    @staticmethod
+    def __find_root(parents, index_point):
+        """!
+        @brief Finds root of the cluster of the point with path halving.
+
+        @param[in] parents (list): Parents of points.
+        @param[in] index_point (uint): Index of point.
+
+        @return (uint) Root of the cluster.
+
+        """
+        while parents[index_point] != index_point:
+            parents[index_point] = parents[parents[index_point]]
+            index_point = parents[index_point]
+
+        return index_point
+
+
+    def __merge_by_minimum_spanning_tree(self):
+        """!
+        @brief Builds minimum spanning tree by Prim's algorithm, its edges in order of weights are merges of single
+                link.
+
+        @return (list) Merges sorted by height.
+
+        """
+        amount_points = len(self.__data)
+
+        attached = numpy.zeros(amount_points, dtype=bool)
+        distances = numpy.full(amount_points, float('inf'))
+        sources = numpy.zeros(amount_points, dtype=numpy.int64)
+
+        edges = []
+        index_point = 0
+        for _ in range(amount_points - 1):
+            attached[index_point] = True
+
+            point_distances = self.__calculate_distances(self.__data, self.__data[index_point])
+            closer = (point_distances < distances) & ~attached
+            distances[closer] = point_distances[closer]
+            sources[closer] = index_point
+
+            distances[index_point] = float('inf')
+            index_point = int(numpy.argmin(numpy.where(attached, float('inf'), distances)))
+            edges.append((int(sources[index_point]), index_point, float(distances[index_point])))
+
+        return sorted(edges, key=lambda edge: edge[2])
+
+
+    def __merge_by_nearest_neighbor_chain(self):
+        """!
+        @brief Finds merges of complete, average or Ward's link using nearest-neighbor chain algorithm.
+        @details Merged cluster takes place of cluster with the smallest index in condensed distance matrix.
+
+        @return (list) Merges sorted by height.
+
+        """
+        amount_points = len(self.__data)
+        indexes = numpy.arange(amount_points)
+
+        # position of distance between i and j (i < j) in condensed matrix is offsets[i] + j
+        self.__offsets = indexes * amount_points - indexes * (indexes + 1) // 2 - indexes - 1
+        self.__condensed = numpy.empty(amount_points * (amount_points - 1) // 2, dtype=numpy.float64)
+        for index_point in range(amount_points - 1):
+            begin = self.__offsets[index_point] + index_point + 1
+            self.__condensed[begin:begin + amount_points - index_point - 1] = \
+                self.__calculate_distances(self.__data[index_point + 1:], self.__data[index_point])
+
+        if self.__link == type_link.WARD_LINK:
+            self.__condensed *= 0.5     # increase of sum of squares when two points are merged
+
+        self.__active = numpy.ones(amount_points, dtype=bool)
+        self.__sizes = numpy.ones(amount_points, dtype=numpy.float64)
+
+        merges, chain = [], []
+        for _ in range(amount_points - 1):
+            if len(chain) == 0:
+                chain.append(int(numpy.argmax(self.__active)))
+
+            while True:
+                index_cluster = chain[-1]
+                links = self.__get_links(index_cluster)
+
+                index_neighbor = int(numpy.argmin(links))
+                if (len(chain) > 1) and (links[chain[-2]] <= links[index_neighbor]):
+                    break   # reciprocal nearest neighbors are found
+
+                chain.append(index_neighbor)
+
+            index_cluster1, index_cluster2 = chain.pop(), chain.pop()
+            merges.append((index_cluster1, index_cluster2, float(links[index_cluster2])))
+            self.__update_links(min(index_cluster1, index_cluster2), max(index_cluster1, index_cluster2))
+
+        self.__offsets, self.__condensed, self.__active, self.__sizes = None, None, None, None
+        return sorted(merges, key=lambda merge: merge[2])
+
+
+    def __get_positions(self, index_cluster):
+        """!
+        @brief Returns positions of distances from the cluster to other clusters in condensed matrix.
+
+        @param[in] index_cluster (uint): Index of the cluster in condensed matrix.
+
+        @return (tuple) Positions of distances to clusters with smaller indexes and beginning of distances to
+                 clusters with bigger indexes: (positions, begin).
+
+        """
+        return self.__offsets[:index_cluster] + index_cluster, self.__offsets[index_cluster] + index_cluster + 1
+
+
+    def __get_values(self, index_cluster):
+        """!
+        @brief Returns values from condensed matrix between the cluster and all clusters.
+
+        @param[in] index_cluster (uint): Index of the cluster in condensed matrix.
+
+        @return (numpy.ndarray) Values, value of the cluster itself is undefined.
+
+        """
+        positions, begin = self.__get_positions(index_cluster)
+
+        values = numpy.empty(len(self.__active), dtype=numpy.float64)
+        values[:index_cluster] = self.__condensed[positions]
+        values[index_cluster + 1:] = self.__condensed[begin:begin + len(self.__active) - index_cluster - 1]
+        return values
+
+
+    def __get_links(self, index_cluster):
+        """!
+        @brief Returns links between the cluster and all clusters, links to merged clusters and to itself are
+                infinite.
+
+        @param[in] index_cluster (uint): Index of the cluster in condensed matrix.
+
+        @return (numpy.ndarray) Links between the cluster and all clusters.
+
+        """
+        links = self.__get_values(index_cluster)
+        if self.__link == type_link.AVERAGE_LINK:
+            links /= self.__sizes + self.__sizes[index_cluster]     # sum of distances is stored
+
+        links[~self.__active] = float('inf')
+        links[index_cluster] = float('inf')
+        return links
+
 
-class agglomerative:
+    def __update_links(self, index_cluster1, index_cluster2):
+        """!
+        @brief Merges the second cluster into the first and updates condensed matrix by Lance-Williams formula.
+
+        @param[in] index_cluster1 (uint): Index of the cluster that becomes merged cluster.
+        @param[in] index_cluster2 (uint): Index of the cluster that is removed.
+
+        """
+        values1, values2 = self.__get_values(index_cluster1), self.__get_values(index_cluster2)
+        size1, size2 = self.__sizes[index_cluster1], self.__sizes[index_cluster2]
+
+        if self.__link == type_link.COMPLETE_LINK:
+            values = numpy.maximum(values1, values2)
+
+        elif self.__link == type_link.AVERAGE_LINK:
+            values = values1 + values2
+
+        else:
+            link = values1[index_cluster2]
+            values = ((self.__sizes + size1) * values1 + (self.__sizes + size2) * values2 - self.__sizes * link) / \
+                     (self.__sizes + size1 + size2)
+
+        positions, begin = self.__get_positions(index_cluster1)
+        self.__condensed[positions] = values[:index_cluster1]
+        self.__condensed[begin:begin + len(self.__active) - index_cluster1 - 1] = values[index_cluster1 + 1:]
+
+        self.__sizes[index_cluster1] = size1 + size2
+        self.__active[index_cluster2] = False
+
+
+    def __merge_by_centroid_link(self):
+        """!
+        @brief Finds merges of centroid link, the closest pair of clusters is merged on each step.
+        @details The nearest cluster of each cluster is stored, clusters are ordered by distance to the nearest
+                  cluster using heap. Only clusters whose nearest cluster is merged are updated using distances to
+                  all clusters, other clusters are compared only with the merged cluster.
+
+        @return (list) Merges in order of processing.
+
+        """
+        amount_points = len(self.__data)
+
+        centers = self.__data.copy()
+        clusters = [[index_point] for index_point in range(amount_points)]
+        active = numpy.ones(amount_points, dtype=bool)
+
+        nearest_indexes = numpy.empty(amount_points, dtype=numpy.int64)
+        nearest_distances = numpy.empty(amount_points, dtype=numpy.float64)
+
+        def update_nearest(index_cluster, distances):
+            distances[~active] = float('inf')
+            distances[index_cluster] = float('inf')
+            nearest_indexes[index_cluster] = numpy.argmin(distances)
+            nearest_distances[index_cluster] = distances[nearest_indexes[index_cluster]]
+            heapq.heappush(heap, (float(nearest_distances[index_cluster]), index_cluster))
+
+        heap = []
+        for index_cluster in range(amount_points):
+            update_nearest(index_cluster, self.__calculate_distances(centers, centers[index_cluster]))
+
+        merges = []
+        for _ in range(amount_points - 1):
+            distance, index_cluster = heapq.heappop(heap)
+            while (active[index_cluster] == False) or (distance != nearest_distances[index_cluster]):
+                distance, index_cluster = heapq.heappop(heap)
+
+            index_cluster1, index_cluster2 = sorted((index_cluster, int(nearest_indexes[index_cluster])))
+            merges.append((index_cluster1, index_cluster2, distance))
+
+            # the merged cluster takes place of the first cluster
+            clusters[index_cluster1] += clusters[index_cluster2]
+            clusters[index_cluster2] = None
+            active[index_cluster2] = False
+
+            points = self.__data[clusters[index_cluster1]]
+            centers[index_cluster1] = numpy.cumsum(points, axis=0)[-1] / len(points)
+
+            distances = self.__calculate_distances(centers, centers[index_cluster1])
+            update_nearest(index_cluster1, distances.copy())
+
+            # clusters whose nearest cluster is merged should find a new one
+            updated = active & ((nearest_indexes == index_cluster1) | (nearest_indexes == index_cluster2))
+            updated[index_cluster1] = False
+            for index_updated in numpy.flatnonzero(updated).tolist():
+                update_nearest(index_updated, self.__calculate_distances(centers, centers[index_updated]))
+
+            # other clusters might become closer to the merged cluster
+            closer = active & ~updated & ((distances < nearest_distances) |
+                                          ((distances == nearest_distances) & (index_cluster1 < nearest_indexes)))
+            closer[index_cluster1] = False
+            for index_closer in numpy.flatnonzero(closer).tolist():
+                nearest_indexes[index_closer] = index_cluster1
+                nearest_distances[index_closer] = distances[index_closer]
+                heapq.heappush(heap, (float(distances[index_closer]), index_closer))
+
+        return merges
+
+
+    @staticmethod
+    def __calculate_distances(points, point):
+        """!
+        @brief Calculates square Euclidean distances between each point and the specified point.
+        @details Coordinates are accumulated one by one, therefore distances are equal to distances that are
+                  calculated by 'euclidean_distance_square'.
+
+        @param[in] points (numpy.ndarray): Points.
+        @param[in] point (numpy.ndarray): Point.
+
+        @return (numpy.ndarray) Distances from each point to the specified point.
+
+        """
+        distances = numpy.zeros(len(points), dtype=numpy.float64)
+        for index_dimension in range(points.shape[1]):
+            differences = points[:, index_dimension] - point[index_dimension]
+            distances += differences * differences
+
+        return distances
+
+
+class agglomerative(ccore_async_processing):
     """!
     @brief Class represents agglomerative algorithm for cluster analysis.
     @details Agglomerative algorithm considers each data point (object) as a separate cluster at the beginning and
               step by step finds the best pair of clusters for merge until required amount of clusters is obtained.
+
+              Python implementation builds full merge history (see 'agglomerative_linkage'), the history can be
+              obtained by `get_dendrogram()` and cut to obtain another amount of clusters without recalculation:
+    @code
+        agglomerative_instance = agglomerative(sample, 2, type_link.AVERAGE_LINK, ccore=False).process()
+        tree = agglomerative_instance.get_dendrogram()
+
+        for number_clusters in range(2, 10):
+            clusters = tree.get_clusters(number_clusters)
+    @endcode
     
     Example of agglomerative algorithm where centroid link is used:
     @code
@@ -107,6 +476,7 @@ class agglomerative:
                     [[0.1, 0.2], [0.4, 0.5], [1.3, 0.9]].
         @param[in] number_clusters (uint): Number of clusters that should be allocated.
         @param[in] link (type_link): Link type that is used for calculation similarity between objects and clusters, if it is not specified centroid link will be used by default.
+                    Ward's link is supported only by Python implementation.
         @param[in] ccore (bool): Defines should be CCORE (C++ pyclustering library) used instead of Python code or not (by default it is 'False').
         
         """  
@@ -121,13 +491,12 @@ class agglomerative:
             self.__similarity = type_link.CENTROID_LINK
         
         self.__clusters = []
-        self.__ccore = ccore
+        self.__dendrogram = None
+
+        self.__ccore = ccore and (self.__similarity != type_link.WARD_LINK)
         if self.__ccore:
             self.__ccore = ccore_library.workable()
 
-        if self.__similarity == type_link.CENTROID_LINK:
-            self.__centers = self.__pointer_data.copy()    # used in case of usage of centroid links
-
     
     def process(self):
         """!
@@ -143,13 +512,9 @@ class agglomerative:
             self.__clusters = wrapper.agglomerative_algorithm(self.__pointer_data, self.__number_clusters, self.__similarity)
 
         else:
-            self.__clusters = [[index] for index in range(0, len(self.__pointer_data))]
-            
-            current_number_clusters = len(self.__clusters)
-                
-            while current_number_clusters > self.__number_clusters:
-                self.__merge_similar_clusters()
-                current_number_clusters = len(self.__clusters)
+            linkage = agglomerative_linkage(self.__pointer_data, self.__similarity).process()
+            self.__dendrogram = dendrogram(linkage)
+            self.__clusters = self.__dendrogram.get_clusters(self.__number_clusters)
 
         return self
 
@@ -167,195 +532,54 @@ class agglomerative:
         """
         
         return self.__clusters
-    
-    
-    def get_cluster_encoding(self):
-        """!
-        @brief Returns clustering result representation type that indicate how clusters are encoded.
-        
-        @return (type_encoding) Clustering result representation.
-        
-        @see get_clusters()
-        
-        """
-        
-        return type_encoding.CLUSTER_INDEX_LIST_SEPARATION
 
 
-    def __merge_similar_clusters(self):
-        """!
-        @brief Merges the most similar clusters in line with link type.
-        
-        """
-        
-        if self.__similarity == type_link.AVERAGE_LINK:
-            self.__merge_by_average_link()
-        
-        elif self.__similarity == type_link.CENTROID_LINK:
-            self.__merge_by_centroid_link()
-        
-        elif self.__similarity == type_link.COMPLETE_LINK:
-            self.__merge_by_complete_link()
-        
-        elif self.__similarity == type_link.SINGLE_LINK:
-            self.__merge_by_signle_link()
-        
-        else:
-            raise NameError('Not supported similarity is used')
-    
-    
-    def __merge_by_average_link(self):
-        """!
-        @brief Merges the most similar clusters in line with average link type.
-        
-        """
-        
-        minimum_average_distance = float('Inf')
-        
-        for index_cluster1 in range(0, len(self.__clusters)):
-            for index_cluster2 in range(index_cluster1 + 1, len(self.__clusters)):
-                
-                # Find farthest objects
-                candidate_average_distance = 0.0
-                for index_object1 in self.__clusters[index_cluster1]:
-                    for index_object2 in self.__clusters[index_cluster2]:
-                        candidate_average_distance += euclidean_distance_square(self.__pointer_data[index_object1], self.__pointer_data[index_object2])
-                
-                candidate_average_distance /= (len(self.__clusters[index_cluster1]) + len(self.__clusters[index_cluster2]))
-                
-                if candidate_average_distance < minimum_average_distance:
-                    minimum_average_distance = candidate_average_distance
-                    indexes = [index_cluster1, index_cluster2]
-        
-        self.__clusters[indexes[0]] += self.__clusters[indexes[1]]
-        self.__clusters.pop(indexes[1])   # remove merged cluster.
-        
-    
-    def __merge_by_centroid_link(self):
+    def get_linkage(self):
         """!
-        @brief Merges the most similar clusters in line with centroid link type.
-        
-        """
+        @brief Returns full merge history (linkage matrix) where each row is [left, right, height, size].
         
-        minimum_centroid_distance = float('Inf')
-        indexes = None
+        @remark Merge history is available only if Python implementation is used, otherwise `None` is returned.
         
-        for index1 in range(0, len(self.__centers)):
-            for index2 in range(index1 + 1, len(self.__centers)):
-                distance = euclidean_distance_square(self.__centers[index1], self.__centers[index2])
-                if distance < minimum_centroid_distance:
-                    minimum_centroid_distance = distance
-                    indexes = [index1, index2]
+        @return (numpy.ndarray) Linkage matrix.
         
-        self.__clusters[indexes[0]] += self.__clusters[indexes[1]]
-        self.__centers[indexes[0]] = self.__calculate_center(self.__clusters[indexes[0]])
-         
-        self.__clusters.pop(indexes[1])   # remove merged cluster.
-        self.__centers.pop(indexes[1])    # remove merged center.
-    
-    
-    def __merge_by_complete_link(self):
-        """!
-        @brief Merges the most similar clusters in line with complete link type.
+        @see agglomerative_linkage
+        @see get_dendrogram()
         
         """
         
-        minimum_complete_distance = float('Inf')
-        indexes = None
-        
-        for index_cluster1 in range(0, len(self.__clusters)):
-            for index_cluster2 in range(index_cluster1 + 1, len(self.__clusters)):
-                candidate_maximum_distance = self.__calculate_farthest_distance(index_cluster1, index_cluster2)
-                
-                if candidate_maximum_distance < minimum_complete_distance:
-                    minimum_complete_distance = candidate_maximum_distance
-                    indexes = [index_cluster1, index_cluster2]
-
-        self.__clusters[indexes[0]] += self.__clusters[indexes[1]]
-        self.__clusters.pop(indexes[1])   # remove merged cluster.
-    
-    
-    def __calculate_farthest_distance(self, index_cluster1, index_cluster2):
+        if self.__dendrogram is None:
+            return None
+
+        return self.__dendrogram.get_linkage()
+
+
+    def get_dendrogram(self):
         """!
-        @brief Finds two farthest objects in two specified clusters in terms and returns distance between them.
+        @brief Returns dendrogram that can be cut to obtain any amount of clusters without recalculation.
         
-        @param[in] (uint) Index of the first cluster.
-        @param[in] (uint) Index of the second cluster.
+        @remark Dendrogram is available only if Python implementation is used, otherwise `None` is returned.
         
-        @return The farthest euclidean distance between two clusters.
+        @return (dendrogram) Dendrogram of the merge history.
         
-        """
-        candidate_maximum_distance = 0.0
-        for index_object1 in self.__clusters[index_cluster1]:
-            for index_object2 in self.__clusters[index_cluster2]:
-                distance = euclidean_distance_square(self.__pointer_data[index_object1], self.__pointer_data[index_object2])
-                
-                if distance > candidate_maximum_distance:
-                    candidate_maximum_distance = distance
-    
-        return candidate_maximum_distance
-    
-    
-    def __merge_by_signle_link(self):
-        """!
-        @brief Merges the most similar clusters in line with single link type.
+        @see get_linkage()
+        @see process()
         
         """
         
-        minimum_single_distance = float('Inf')
-        indexes = None
-        
-        for index_cluster1 in range(0, len(self.__clusters)):
-            for index_cluster2 in range(index_cluster1 + 1, len(self.__clusters)):
-                candidate_minimum_distance = self.__calculate_nearest_distance(index_cluster1, index_cluster2)
-                
-                if candidate_minimum_distance < minimum_single_distance:
-                    minimum_single_distance = candidate_minimum_distance
-                    indexes = [index_cluster1, index_cluster2]
-
-        self.__clusters[indexes[0]] += self.__clusters[indexes[1]]
-        self.__clusters.pop(indexes[1])   # remove merged cluster.
+        return self.__dendrogram
     
     
-    def __calculate_nearest_distance(self, index_cluster1, index_cluster2):
+    def get_cluster_encoding(self):
         """!
-        @brief Finds two nearest objects in two specified clusters and returns distance between them.
+        @brief Returns clustering result representation type that indicate how clusters are encoded.
         
-        @param[in] (uint) Index of the first cluster.
-        @param[in] (uint) Index of the second cluster.
+        @return (type_encoding) Clustering result representation.
         
-        @return The nearest euclidean distance between two clusters.
+        @see get_clusters()
         
         """
-        candidate_minimum_distance = float('Inf')
         
-        for index_object1 in self.__clusters[index_cluster1]:
-            for index_object2 in self.__clusters[index_cluster2]:
-                distance = euclidean_distance_square(self.__pointer_data[index_object1], self.__pointer_data[index_object2])
-                if distance < candidate_minimum_distance:
-                    candidate_minimum_distance = distance
-        
-        return candidate_minimum_distance
-    
-    
-    def __calculate_center(self, cluster):
-        """!
-        @brief Calculates new center.
-        
-        @return (list) New value of the center of the specified cluster.
-        
-        """
-         
-        dimension = len(self.__pointer_data[cluster[0]])
-        center = [0] * dimension
-        for index_point in cluster:
-            for index_dimension in range(0, dimension):
-                center[index_dimension] += self.__pointer_data[index_point][index_dimension]
-         
-        for index_dimension in range(0, dimension):
-            center[index_dimension] /= len(cluster)
-             
-        return center
+        return type_encoding.CLUSTER_INDEX_LIST_SEPARATION
 
 
     def __verify_arguments(self):
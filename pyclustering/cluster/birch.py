@@ -147,7 +147,8 @@ class birch:
 
         cf_data = [feature.get_centroid() for feature in self.__features]
 
-        algorithm = agglomerative(cf_data, self.__number_clusters, type_link.SINGLE_LINK).process()
+        # Python implementation builds single link clusters using minimum spanning tree that is faster than CCORE
+        algorithm = agglomerative(cf_data, self.__number_clusters, type_link.SINGLE_LINK, ccore=False).process()
         self.__cf_clusters = algorithm.get_clusters()
 
         cf_labels = cluster_encoder(type_encoding.CLUSTER_INDEX_LIST_SEPARATION, self.__cf_clusters, cf_data).\
@@ -9,7 +9,7 @@
 """
 
 
-from pyclustering.core.wrapper import ccore_library
+from pyclustering.core.wrapper import ccore_library, ccore_async_processing
 from pyclustering.core.bsas_wrapper import bsas as bsas_wrapper
 from pyclustering.core.metric_wrapper import metric_wrapper
 
@@ -59,7 +59,7 @@ class bsas_visualizer:
         return visualizer.show(figure=figure, display=display)
 
 
-class bsas:
+class bsas(ccore_async_processing):
     """!
     @brief Class represents BSAS clustering algorithm - basic sequential algorithmic scheme.
     @details Algorithm has two mandatory parameters: maximum allowable number of clusters and threshold
@@ -14,7 +14,6 @@
 
 import numpy
 import random
-import warnings
 
 from pyclustering.utils.metric import distance_metric, type_metric
 
@@ -187,6 +186,7 @@ class kmeans_plusplus_initializer:
         self.__data = numpy.array(data)
         self.__amount = amount_centers
         self.__free_indexes = set(range(len(self.__data)))
+        self.__shortest_distances = None
 
         if amount_candidates is None:
             self.__candidates = 3
@@ -227,7 +227,9 @@ class kmeans_plusplus_initializer:
     def __calculate_shortest_distances(self, data, centers):
         """!
         @brief Calculates distance from each data point to nearest center.
-        
+        @details Distances to previous centers are kept between calls, therefore only distances to the last center
+                  are calculated and each next center costs O(n) instead of O(n * k).
+
         @param[in] data (numpy.array): Array of points for that initialization is performed.
         @param[in] centers (numpy.array): Array of indexes that represents centers.
         
@@ -235,20 +237,19 @@ class kmeans_plusplus_initializer:
         
         """
 
-        dataset_differences = numpy.zeros((len(centers), len(data)))
-        for index_center in range(len(centers)):
-            center = data[centers[index_center]]
-
-            if self.__data_type == 'points':
-                dataset_differences[index_center] = self.__metric(data, center)
-            elif self.__data_type == 'distance_matrix':
-                dataset_differences[index_center] = numpy.array(self.__data[centers[index_center]])
+        index_center = centers[-1]
+        if self.__data_type == 'points':
+            center_distances = numpy.asarray(self.__metric(data, data[index_center]), dtype=float).reshape(-1)
+        else:
+            center_distances = numpy.array(self.__data[index_center], dtype=float)
 
-        with warnings.catch_warnings():
-            numpy.warnings.filterwarnings('ignore', r'All-NaN (slice|axis) encountered')
-            shortest_distances = numpy.nanmin(dataset_differences, axis=0)
+        if len(centers) == 1:
+            self.__shortest_distances = center_distances
+        else:
+            # NaN values are ignored in the same way as by 'numpy.nanmin'
+            self.__shortest_distances = numpy.fmin(self.__shortest_distances, center_distances)
 
-        return shortest_distances
+        return self.__shortest_distances.copy()
 
 
     def __get_next_center(self, centers):
@@ -325,12 +326,11 @@ class kmeans_plusplus_initializer:
         index_best_candidate = 0
         for i in range(self.__candidates):
             candidate_probability = random.random()
-            index_candidate = -1
 
-            for index_object in range(len(probabilities)):
-                if candidate_probability < probabilities[index_object]:
-                    index_candidate = index_object
-                    break
+            # the first point whose cumulative probability is greater than the random value
+            index_candidate = int(numpy.searchsorted(probabilities, candidate_probability, side='right'))
+            if index_candidate == len(probabilities):
+                index_candidate = -1
 
             if index_candidate == -1:
                 index_best_candidate = next(iter(self.__free_indexes))
@@ -363,6 +363,8 @@ class kmeans_plusplus_initializer:
             raise ValueError("In case of 'distance_matrix' data type, parameter 'return_index' cannot be 'False'. "
                              "Please, use 'return_index=True' in case of 'distance_matrix' data type.")
 
+        self.__free_indexes = set(range(len(self.__data)))
+
         index_point = self.__get_initial_center(True)
         centers = [index_point]
         self.__free_indexes.remove(index_point)
@@ -0,0 +1,327 @@
+"""!
+
+@brief Cluster analysis algorithm: CLARA (Clustering LARge Applications).
+@details Implementation based on book @cite book::finding_groups_in_data and paper
+          @cite article::cluster::kmedoids::fasterpam.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2020
+@copyright BSD-3-Clause
+
+"""
+
+
+import numpy
+
+from pyclustering.cluster.encoder import type_encoding
+from pyclustering.cluster.kmedoids import kmedoids, kmedoids_swap_type, build
+
+from pyclustering.core.wrapper import ccore_async_processing
+
+from pyclustering.utils.metric import distance_metric, type_metric
+from pyclustering.utils.sampling import reservoir_x
+
+
+class clara(ccore_async_processing):
+    """!
+    @brief Class represents clustering algorithm CLARA (Clustering LARge Applications).
+    @details CLARA is designed for datasets that are too big for K-Medoids (PAM) algorithm: distance matrix of such
+              datasets does not fit into memory and swap phase is too expensive. CLARA draws several random samples
+              of the input data using Reservoir Algorithm X, PAM BUILD and K-Medoids are applied to each sample, then
+              all points are assigned to the obtained medoids and the medoids with the smallest total deviation are
+              chosen. The best medoids are always included into the next sample, therefore each sample can only
+              improve the current solution.
+
+              Points are assigned to medoids by chunks (see argument `chunk_size`), therefore only
+              `chunk_size` x `k` distances are kept in memory. Distances are calculated using numpy for all metrics
+              except `type_metric.USER_DEFINED`, user-defined metric is called for each pair (point, medoid) unless
+              it is created with `numpy_usage=True` - in this case it should be able to process a chunk of points.
+
+              C++ implementation (CCORE) is used to process samples by PAM BUILD and K-Medoids if it is available.
+
+    Example where CLARA is used to cluster `Tetra` data:
+    @code
+        from pyclustering.cluster.clara import clara
+        from pyclustering.cluster import cluster_visualizer
+        from pyclustering.utils import read_sample
+        from pyclustering.samples.definitions import FCPS_SAMPLES
+
+        # Load list of points for cluster analysis.
+        sample = read_sample(FCPS_SAMPLES.SAMPLE_TETRA)
+
+        # Create instance of CLARA algorithm that uses 5 samples with 100 points.
+        clara_instance = clara(sample, 4, samples=5, sample_size=100)
+
+        # Run cluster analysis and obtain results.
+        clara_instance.process()
+        clusters = clara_instance.get_clusters()
+        medoids = clara_instance.get_medoids()
+
+        print("Medoids:", medoids)
+        print("Total Deviation:", clara_instance.get_total_deviation())
+
+        # Display clustering results.
+        visualizer = cluster_visualizer()
+        visualizer.append_clusters(clusters, sample)
+        visualizer.append_cluster(medoids, sample, markersize=30, marker='*', color='black')
+        visualizer.show()
+    @endcode
+
+    @see kmedoids
+
+    """
+
+    def __init__(self, data, amount_clusters, samples=5, sample_size=None, ccore=True, **kwargs):
+        """!
+        @brief Constructor of clustering algorithm CLARA.
+
+        @param[in] data (array_like): Input data that is presented as list of points (objects), each point should be
+                    represented by list or tuple.
+        @param[in] amount_clusters (uint): Amount of clusters that should be allocated.
+        @param[in] samples (uint): Amount of random samples that are processed by K-Medoids.
+        @param[in] sample_size (uint): Size of each sample, by default `80 + 4 * amount_clusters`.
+        @param[in] ccore (bool): If `True` then C++ implementation is used to process samples.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: `metric`, `itermax`, `swap`,
+                    `chunk_size`).
+
+        <b>Keyword Args:</b><br>
+            - metric (distance_metric): Metric that is used for distance calculation between two points.
+            - itermax (uint): Maximum number of iterations of K-Medoids for each sample (by default 200).
+            - swap (kmedoids_swap_type): Strategy that is used by K-Medoids to swap medoids (by default:
+               `kmedoids_swap_type.FASTPAM1`).
+            - chunk_size (uint): Amount of points that are assigned to medoids at once (by default 65536).
+
+        """
+        self.__pointer_data = numpy.asarray(data, dtype=numpy.float64)
+        if self.__pointer_data.ndim == 1:
+            self.__pointer_data = self.__pointer_data.reshape(-1, 1)
+
+        self.__amount_clusters = amount_clusters
+        self.__samples = samples
+        self.__sample_size = sample_size if sample_size is not None else 80 + 4 * amount_clusters
+        self.__sample_size = min(self.__sample_size, len(self.__pointer_data))
+        self.__ccore = ccore
+
+        self.__metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
+        self.__itermax = kwargs.get('itermax', 200)
+        self.__swap = kwargs.get('swap', kmedoids_swap_type.FASTPAM1)
+        self.__chunk_size = kwargs.get('chunk_size', 65536)
+
+        self.__clusters = []
+        self.__labels = []
+        self.__medoids = []
+        self.__total_deviation = float('inf')
+
+        self.__verify_arguments()
+
+        self.__chunk_calculator = self.__create_chunk_calculator()
+
+
+    def process(self):
+        """!
+        @brief Performs cluster analysis in line with rules of CLARA algorithm.
+
+        @return (clara) Returns itself (CLARA instance).
+
+        @see get_clusters()
+        @see get_medoids()
+
+        """
+        optimal_medoids, optimal_labels = [], None
+        optimal_deviation = float('inf')
+
+        for _ in range(self.__samples):
+            sample_indexes = self.__draw_sample(optimal_medoids)
+            medoids = self.__process_sample(sample_indexes)
+
+            labels, total_deviation = self.__assign_points(medoids)
+            if total_deviation < optimal_deviation:
+                optimal_medoids, optimal_labels = medoids, labels
+                optimal_deviation = total_deviation
+
+            if len(sample_indexes) == len(self.__pointer_data):
+                break   # the whole data is processed, other samples give the same result
+
+        self.__medoids = optimal_medoids
+        self.__total_deviation = optimal_deviation
+        self.__labels = optimal_labels.tolist()
+
+        order = numpy.argsort(optimal_labels, kind='stable')
+        borders = numpy.cumsum(numpy.bincount(optimal_labels, minlength=len(optimal_medoids)))[:-1]
+        self.__clusters = [cluster.tolist() for cluster in numpy.split(order, borders)]
+
+        return self
+
+
+    def get_clusters(self):
+        """!
+        @brief Returns list of allocated clusters, each cluster contains indexes of objects in list of data.
+
+        @see process()
+        @see get_labels()
+        @see get_medoids()
+
+        """
+        return self.__clusters
+
+
+    def get_labels(self):
+        """!
+        @brief Return list of labels, for example, [0, 1, 1, 1, 0] means that the first and the last points belong to
+                cluster with index `0`, and points in between belong to cluster `1`.
+
+        @see process()
+        @see get_clusters()
+
+        """
+        return self.__labels
+
+
+    def get_medoids(self):
+        """!
+        @brief Returns list of medoids of allocated clusters represented by indexes from the input data.
+
+        @see process()
+        @see get_clusters()
+
+        """
+        return self.__medoids
+
+
+    def get_total_deviation(self):
+        """!
+        @brief Returns total deviation of the best medoids - sum of distances from each point to its medoid.
+
+        @see process()
+
+        """
+        return self.__total_deviation
+
+
+    def get_cluster_encoding(self):
+        """!
+        @brief Returns clustering result representation type that indicate how clusters are encoded.
+
+        @return (type_encoding) Clustering result representation.
+
+        @see get_clusters()
+
+        """
+        return type_encoding.CLUSTER_INDEX_LIST_SEPARATION
+
+
+    def __draw_sample(self, medoids):
+        """!
+        @brief Draws random sample of the input data that contains the specified medoids.
+        @details Random points are drawn from points that are not medoids, therefore the sample always has the
+                  required size.
+
+        @param[in] medoids (list): Medoids that should be included into the sample.
+
+        @return (numpy.ndarray) Sorted indexes of points that form the sample.
+
+        """
+        medoids = numpy.sort(numpy.array(medoids, dtype=numpy.int64))
+
+        random_indexes = numpy.empty(0, dtype=numpy.int64)
+        amount_random = self.__sample_size - len(medoids)
+        if amount_random > 0:
+            random_indexes = numpy.array(reservoir_x(range(len(self.__pointer_data) - len(medoids)), amount_random),
+                                         dtype=numpy.int64)
+
+            # skip medoids: each index is shifted by amount of medoids that are located before or at it
+            random_indexes += numpy.searchsorted(medoids - numpy.arange(len(medoids)), random_indexes, side='right')
+
+        return numpy.unique(numpy.concatenate((medoids, random_indexes)))
+
+
+    def __process_sample(self, sample_indexes):
+        """!
+        @brief Finds medoids of the sample using PAM BUILD and K-Medoids.
+
+        @param[in] sample_indexes (numpy.ndarray): Indexes of points that form the sample.
+
+        @return (list) Medoids represented by indexes of the input data.
+
+        """
+        sample = self.__pointer_data[sample_indexes]
+        amount_clusters = min(self.__amount_clusters, len(sample))
+
+        initial_medoids = build(sample, amount_clusters, self.__ccore, metric=self.__metric).initialize()
+        kmedoids_instance = kmedoids(sample, initial_medoids, ccore=self.__ccore, metric=self.__metric,
+                                     itermax=self.__itermax, swap=self.__swap).process()
+
+        return sample_indexes[kmedoids_instance.get_medoids()].tolist()
+
+
+    def __assign_points(self, medoids):
+        """!
+        @brief Assigns each point of the input data to the closest medoid by chunks.
+
+        @param[in] medoids (list): Medoids represented by indexes of the input data.
+
+        @return (tuple) Labels of points and total deviation: (labels, total_deviation).
+
+        """
+        medoid_points = self.__pointer_data[medoids]
+        labels = numpy.empty(len(self.__pointer_data), dtype=numpy.int64)
+
+        total_deviation = 0.0
+        for chunk_start in range(0, len(self.__pointer_data), self.__chunk_size):
+            chunk = self.__pointer_data[chunk_start:chunk_start + self.__chunk_size]
+            distances = self.__chunk_calculator(chunk, medoid_points)
+
+            chunk_labels = numpy.argmin(distances, axis=1)
+            labels[chunk_start:chunk_start + len(chunk)] = chunk_labels
+            total_deviation += float(numpy.sum(distances[numpy.arange(len(chunk)), chunk_labels]))
+
+        return labels, total_deviation
+
+
+    def __create_chunk_calculator(self):
+        """!
+        @brief Creates calculator of distances between each point of a chunk and each medoid.
+
+        @return (callable) Calculator that returns matrix of distances where rows correspond to points and columns
+                 to medoids.
+
+        """
+        metric_type = self.__metric.get_type()
+        if (metric_type == type_metric.USER_DEFINED) and (self.__metric.get_arguments().get('numpy_usage', False) is False):
+            return lambda chunk, medoids: numpy.array([[self.__metric(point, medoid) for medoid in medoids]
+                                                       for point in chunk]).reshape(len(chunk), len(medoids))
+
+        metric = distance_metric(metric_type, **dict(self.__metric.get_arguments(), numpy_usage=True))
+        return lambda chunk, medoids: numpy.column_stack([numpy.asarray(metric(chunk, medoid), dtype=numpy.float64).reshape(-1)
+                                                          for medoid in medoids])
+
+
+    def __verify_arguments(self):
+        """!
+        @brief Verify input parameters for the algorithm and throw exception in case of incorrectness.
+
+        """
+        if len(self.__pointer_data) == 0:
+            raise ValueError("Input data is empty (size: '%d')." % len(self.__pointer_data))
+
+        if self.__amount_clusters <= 0:
+            raise ValueError("Amount of cluster (current value: '%d') for allocation should be greater than 0." %
+                             self.__amount_clusters)
+
+        if self.__amount_clusters > len(self.__pointer_data):
+            raise ValueError("Amount of cluster (current value: '%d') should be equal or less than data size "
+                             "(current value: '%d')." % (self.__amount_clusters, len(self.__pointer_data)))
+
+        if self.__samples <= 0:
+            raise ValueError("Amount of samples (current value: '%d') should be greater than 0." % self.__samples)
+
+        if self.__sample_size < self.__amount_clusters:
+            raise ValueError("Sample size (current value: '%d') should be equal or greater than amount of clusters "
+                             "(current value: '%d')." % (self.__sample_size, self.__amount_clusters))
+
+        if self.__itermax < 0:
+            raise ValueError("Maximum iterations (current value: '%d') should be greater or equal to 0." %
+                             self.__itermax)
+
+        if self.__chunk_size <= 0:
+            raise ValueError("Chunk size (current value: '%d') should be greater than 0." % self.__chunk_size)
@@ -10,40 +10,202 @@
 """
 
 
-import random
+import concurrent.futures
+
+import numpy
 
 from pyclustering.cluster.encoder import type_encoding
 
-from pyclustering.utils import euclidean_distance_square
+
+class clarans_local_search:
+    """!
+    @brief Search of a local minimum of CLARANS algorithm (one iteration of `numlocal`).
+    @details The search keeps distances from each point to each current medoid and distances from each point to the
+              nearest and the second nearest medoids, therefore cost of a random neighbor (swap of a medoid and a
+              non-medoid point) is calculated by one vectorized expression using only distances from points to the
+              candidate. The instance is independent from the algorithm and can be sent to another process.
+
+    """
+
+    def __init__(self, data, number_clusters, maxneighbor):
+        """!
+        @brief Constructor of local search of CLARANS algorithm.
+
+        @param[in] data (numpy.ndarray): Input data that is presented as two-dimensional array of points.
+        @param[in] number_clusters (uint): Amount of clusters that should be allocated.
+        @param[in] maxneighbor (uint): The maximum number of neighbors examined.
+
+        """
+        self.__pointer_data = data
+        self.__number_clusters = number_clusters
+        self.__maxneighbor = maxneighbor
+
+
+    def process(self, seed):
+        """!
+        @brief Finds local minimum starting from random medoids.
+
+        @param[in] seed (uint): Seed for random generator that is used by the search.
+
+        @return (tuple) Medoids of the local minimum and its estimation (total deviation): (medoids, estimation).
+
+        """
+        random_state = numpy.random.RandomState(seed)
+
+        medoids = random_state.choice(len(self.__pointer_data), self.__number_clusters, replace=False)
+        medoid_distances = numpy.array([self.calculate_distances(self.__pointer_data, index_medoid)
+                                        for index_medoid in medoids])
+
+        if len(self.__pointer_data) > self.__number_clusters:
+            self.__optimize_configuration(random_state, medoids, medoid_distances)
+
+        return medoids.tolist(), float(numpy.sum(numpy.min(medoid_distances, axis=0)))
+
+
+    @staticmethod
+    def calculate_distances(data, index_point):
+        """!
+        @brief Calculates square Euclidean distances from each point to the specified point.
+
+        @param[in] data (numpy.ndarray): Input data that is presented as two-dimensional array of points.
+        @param[in] index_point (uint): Index of the point.
+
+        @return (numpy.ndarray) Distances from each point to the specified point.
+
+        """
+        differences = data - data[index_point]
+        return numpy.einsum('ij,ij->i', differences, differences)
+
+
+    def __optimize_configuration(self, random_state, medoids, medoid_distances):
+        """!
+        @brief Replaces medoids by random neighbors while a better neighbor can be found in line with `maxneighbor`.
+
+        @param[in] random_state (numpy.random.RandomState): Random generator of the search.
+        @param[in,out] medoids (numpy.ndarray): Indexes of current medoids.
+        @param[in,out] medoid_distances (numpy.ndarray): Distances from each point to each medoid (k x n).
+
+        """
+        is_medoid = numpy.zeros(len(self.__pointer_data), dtype=bool)
+        is_medoid[medoids] = True
+
+        nearest_labels, nearest_distances, second_distances = self.__find_nearest_medoids(medoid_distances)
+
+        index_neighbor = 0
+        while index_neighbor < self.__maxneighbor:
+            # get random current medoid that is to be replaced and new candidate to be medoid
+            index_cluster = random_state.randint(self.__number_clusters)
+
+            index_candidate = random_state.randint(len(self.__pointer_data))
+            while is_medoid[index_candidate]:
+                index_candidate = random_state.randint(len(self.__pointer_data))
+
+            candidate_distances = self.calculate_distances(self.__pointer_data, index_candidate)
+
+            # points of the replaced medoid move to the second nearest medoid or to the candidate, other points
+            # stay with their nearest medoid or move to the candidate
+            remaining_distances = numpy.where(nearest_labels == index_cluster, second_distances, nearest_distances)
+            candidate_cost = numpy.sum(numpy.minimum(candidate_distances, remaining_distances) - nearest_distances)
+
+            if candidate_cost < 0:
+                is_medoid[medoids[index_cluster]] = False
+                is_medoid[index_candidate] = True
+
+                medoids[index_cluster] = index_candidate
+                medoid_distances[index_cluster] = candidate_distances
+
+                nearest_labels, nearest_distances, second_distances = self.__find_nearest_medoids(medoid_distances)
+
+                # reset iterations and starts investigation from the beginning
+                index_neighbor = 0
+
+            else:
+                index_neighbor += 1
+
+
+    @staticmethod
+    def __find_nearest_medoids(medoid_distances):
+        """!
+        @brief Finds the nearest and the second nearest medoids for each point.
+
+        @param[in] medoid_distances (numpy.ndarray): Distances from each point to each medoid (k x n).
+
+        @return (tuple) Index of the nearest medoid, distance to it and distance to the second nearest medoid for
+                 each point: (nearest_labels, nearest_distances, second_distances).
+
+        """
+        nearest_labels = numpy.argmin(medoid_distances, axis=0)
+        nearest_distances = medoid_distances[nearest_labels, numpy.arange(medoid_distances.shape[1])]
+
+        if len(medoid_distances) > 1:
+            second_distances = numpy.partition(medoid_distances, 1, axis=0)[1]
+        else:
+            second_distances = numpy.full(medoid_distances.shape[1], float('inf'))
+
+        return nearest_labels, nearest_distances, second_distances
+
 
 
 class clarans:
     """!
     @brief Class represents clustering algorithm CLARANS (a method for clustering objects for spatial data mining).
-    
+    @details Each local search keeps distances from points to the nearest and the second nearest medoids, therefore
+              cost of each random neighbor is calculated by vectorized expression over all points without recalculation
+              of distances to the current medoids.
+
+              Local searches (`numlocal`) are independent and use their own seeds that are generated from
+              `random_state`, they might be performed in parallel processes (see argument `processes`). Results do not
+              depend on amount of processes.
+
+    Example where CLARANS is used with four parallel processes:
+    @code
+        from pyclustering.cluster.clarans import clarans
+        from pyclustering.utils import read_sample
+        from pyclustering.samples.definitions import FCPS_SAMPLES
+
+        if __name__ == '__main__':
+            sample = read_sample(FCPS_SAMPLES.SAMPLE_TETRA)
+
+            clarans_instance = clarans(sample, 4, 8, 10, processes=4, random_state=1000).process()
+            print(clarans_instance.get_medoids())
+    @endcode
+
+    @remark Processes might be started using 'spawn' method (for example, on Windows), in this case code that runs
+             the algorithm should be protected by `if __name__ == '__main__':`.
+
     """
 
-    def __init__(self, data, number_clusters, numlocal, maxneighbor):
+    def __init__(self, data, number_clusters, numlocal, maxneighbor, **kwargs):
         """!
         @brief Constructor of clustering algorithm CLARANS.
         @details The higher the value of maxneighbor, the closer is CLARANS to K-Medoids, and the longer is each search of a local minima.
-        
+
         @param[in] data (list): Input data that is presented as list of points (objects), each point should be represented by list or tuple.
         @param[in] number_clusters (uint): Amount of clusters that should be allocated.
         @param[in] numlocal (uint): The number of local minima obtained (amount of iterations for solving the problem).
         @param[in] maxneighbor (uint): The maximum number of neighbors examined.
-        
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: `processes`, `random_state`).
+
+        <b>Keyword Args:</b><br>
+            - processes (uint): Amount of processes that are used to perform local searches (by default 1, local
+               searches are performed in the current process).
+            - random_state (int): Seed for random state (by default is `None`, current system time is used).
+
         """
-        
-        self.__pointer_data = data
+
+        self.__pointer_data = numpy.asarray(data, dtype=numpy.float64)
+        if self.__pointer_data.ndim == 1:
+            self.__pointer_data = self.__pointer_data.reshape(-1, 1)
+
         self.__numlocal = numlocal
         self.__maxneighbor = maxneighbor
         self.__number_clusters = number_clusters
-        
+
+        self.__processes = kwargs.get('processes', 1)
+        self.__random_state = kwargs.get('random_state', None)
+
         self.__clusters = []
-        self.__current = []
-        self.__belong = []
-        
+
         self.__optimal_medoids = []
         self.__optimal_estimation = float('inf')
 
@@ -62,6 +224,10 @@ class clarans:
             raise ValueError("Amount of cluster (current value: '%d') for allocation should be greater than 0." %
                              self.__number_clusters)
 
+        if self.__number_clusters > len(self.__pointer_data):
+            raise ValueError("Amount of cluster (current value: '%d') should be equal or less than data size "
+                             "(current value: '%d')." % (self.__number_clusters, len(self.__pointer_data)))
+
         if self.__numlocal < 0:
             raise ValueError("Local minima (current value: '%d') should be greater or equal to 0." % self.__numlocal)
 
@@ -69,63 +235,65 @@ class clarans:
             raise ValueError("Maximum number of neighbors (current value: '%d') should be greater or "
                              "equal to 0." % self.__maxneighbor)
 
+        if self.__processes <= 0:
+            raise ValueError("Amount of processes (current value: '%d') should be greater than 0." % self.__processes)
+
 
     def process(self):
         """!
         @brief Performs cluster analysis in line with rules of CLARANS algorithm.
 
         @return (clarans) Returns itself (CLARANS instance).
-        
+
         @see get_clusters()
         @see get_medoids()
-        
+
         """
-        
-        random.seed()
-        
-        for _ in range(0, self.__numlocal):
-            # set (current) random medoids
-            self.__current = random.sample(range(0, len(self.__pointer_data)), self.__number_clusters)
-            
-            # update clusters in line with random allocated medoids
-            self.__update_clusters(self.__current)
-            
-            # optimize configuration
-            self.__optimize_configuration()
-            
-            # obtain cost of current cluster configuration and compare it with the best obtained
-            estimation = self.__calculate_estimation()
+        seeds = numpy.random.RandomState(self.__random_state).randint(0, 2 ** 31 - 1, self.__numlocal).tolist()
+        local_search = clarans_local_search(self.__pointer_data, self.__number_clusters, self.__maxneighbor)
+
+        if (self.__processes > 1) and (len(seeds) > 1):
+            # seeds are sent by chunks, one chunk per process, therefore the data is pickled once for each process
+            processes = min(self.__processes, len(seeds))
+            chunk_size = -(-len(seeds) // processes)
+            with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as executor:
+                results = list(executor.map(local_search.process, seeds, chunksize=chunk_size))
+        else:
+            results = [local_search.process(seed) for seed in seeds]
+
+        # obtain cost of each cluster configuration and compare it with the best obtained
+        for medoids, estimation in results:
             if estimation < self.__optimal_estimation:
-                self.__optimal_medoids = self.__current[:]
+                self.__optimal_medoids = medoids
                 self.__optimal_estimation = estimation
-        
+
         self.__update_clusters(self.__optimal_medoids)
         return self
-    
-    
+
+
     def get_clusters(self):
         """!
         @brief Returns allocated clusters by the algorithm.
-        
+
         @remark Allocated clusters can be returned only after data processing (use method process()), otherwise empty list is returned.
-        
+
         @return (list) List of allocated clusters, each cluster contains indexes of objects in list of data.
-        
+
         @see process()
         @see get_medoids()
-        
+
         """
-        
+
         return self.__clusters
-    
-    
+
+
     def get_medoids(self):
         """!
         @brief Returns list of medoids of allocated clusters.
-        
+
         @see process()
         @see get_clusters()
-        
+
         """
 
         return self.__optimal_medoids
@@ -134,151 +302,31 @@ class clarans:
     def get_cluster_encoding(self):
         """!
         @brief Returns clustering result representation type that indicate how clusters are encoded.
-        
+
         @return (type_encoding) Clustering result representation.
-        
+
         @see get_clusters()
-        
+
         """
-        
+
         return type_encoding.CLUSTER_INDEX_LIST_SEPARATION
 
 
     def __update_clusters(self, medoids):
         """!
-        @brief Forms cluster in line with specified medoids by calculation distance from each point to medoids. 
-        
+        @brief Forms cluster in line with specified medoids by calculation distance from each point to medoids.
+
         """
-        
-        self.__belong = [0] * len(self.__pointer_data)
-        self.__clusters = [[] for i in range(len(medoids))]
-        for index_point in range(len(self.__pointer_data)):
-            index_optim = -1
-            dist_optim = 0.0
-             
-            for index in range(len(medoids)):
-                dist = euclidean_distance_square(self.__pointer_data[index_point], self.__pointer_data[medoids[index]])
-                 
-                if (dist < dist_optim) or (index == 0):
-                    index_optim = index
-                    dist_optim = dist
-
-            self.__clusters[index_optim].append(index_point)
-            self.__belong[index_point] = index_optim
-        
+        if len(medoids) == 0:
+            self.__clusters = []
+            return
+
+        medoid_distances = numpy.array([clarans_local_search.calculate_distances(self.__pointer_data, index_medoid)
+                                        for index_medoid in medoids])
+        labels = numpy.argmin(medoid_distances, axis=0)
+
+        order = numpy.argsort(labels, kind='stable')
+        borders = numpy.cumsum(numpy.bincount(labels, minlength=len(medoids)))[:-1]
+
         # If cluster is not able to capture object it should be removed
-        self.__clusters = [cluster for cluster in self.__clusters if len(cluster) > 0]
-    
-    
-    def __optimize_configuration(self):
-        """!
-        @brief Finds quasi-optimal medoids and updates in line with them clusters in line with algorithm's rules. 
-        
-        """
-        index_neighbor = 0
-        while (index_neighbor < self.__maxneighbor):
-            # get random current medoid that is to be replaced
-            current_medoid_index = self.__current[random.randint(0, self.__number_clusters - 1)]
-            current_medoid_cluster_index = self.__belong[current_medoid_index]
-            
-            # get new candidate to be medoid
-            candidate_medoid_index = random.randint(0, len(self.__pointer_data) - 1)
-            
-            while candidate_medoid_index in self.__current:
-                candidate_medoid_index = random.randint(0, len(self.__pointer_data) - 1)
-            
-            candidate_cost = 0.0
-            for point_index in range(0, len(self.__pointer_data)):
-                if point_index not in self.__current:
-                    # get non-medoid point and its medoid
-                    point_cluster_index = self.__belong[point_index]
-                    point_medoid_index = self.__current[point_cluster_index]
-                    
-                    # get other medoid that is nearest to the point (except current and candidate)
-                    other_medoid_index = self.__find_another_nearest_medoid(point_index, current_medoid_index)
-                    other_medoid_cluster_index = self.__belong[other_medoid_index]
-                    
-                    # for optimization calculate all required distances
-                    # from the point to current medoid
-                    distance_current = euclidean_distance_square(self.__pointer_data[point_index], self.__pointer_data[current_medoid_index])
-                    
-                    # from the point to candidate median
-                    distance_candidate = euclidean_distance_square(self.__pointer_data[point_index], self.__pointer_data[candidate_medoid_index])
-                    
-                    # from the point to nearest (own) medoid
-                    distance_nearest = float('inf')
-                    if ( (point_medoid_index != candidate_medoid_index) and (point_medoid_index != current_medoid_cluster_index) ):
-                        distance_nearest = euclidean_distance_square(self.__pointer_data[point_index], self.__pointer_data[point_medoid_index])
-                    
-                    # apply rules for cost calculation
-                    if (point_cluster_index == current_medoid_cluster_index):
-                        # case 1:
-                        if (distance_candidate >= distance_nearest):
-                            candidate_cost += distance_nearest - distance_current
-                        
-                        # case 2:
-                        else:
-                            candidate_cost += distance_candidate - distance_current
-                    
-                    elif (point_cluster_index == other_medoid_cluster_index):
-                        # case 3 ('nearest medoid' is the representative object of that cluster and object is more similar to 'nearest' than to 'candidate'):
-                        if (distance_candidate > distance_nearest):
-                            pass;
-                        
-                        # case 4:
-                        else:
-                            candidate_cost += distance_candidate - distance_nearest
-            
-            if (candidate_cost < 0):
-                # set candidate that has won
-                self.__current[current_medoid_cluster_index] = candidate_medoid_index
-                
-                # recalculate clusters
-                self.__update_clusters(self.__current)
-                
-                # reset iterations and starts investigation from the begining
-                index_neighbor = 0
-                
-            else:
-                index_neighbor += 1
-    
-    
-    def __find_another_nearest_medoid(self, point_index, current_medoid_index):
-        """!
-        @brief Finds the another nearest medoid for the specified point that is differ from the specified medoid. 
-        
-        @param[in] point_index: index of point in dataspace for that searching of medoid in current list of medoids is perfomed.
-        @param[in] current_medoid_index: index of medoid that shouldn't be considered as a nearest.
-        
-        @return (uint) index of the another nearest medoid for the point.
-        
-        """
-        other_medoid_index = -1
-        other_distance_nearest = float('inf')
-        for index_medoid in self.__current:
-            if (index_medoid != current_medoid_index):
-                other_distance_candidate = euclidean_distance_square(self.__pointer_data[point_index], self.__pointer_data[current_medoid_index])
-                
-                if other_distance_candidate < other_distance_nearest:
-                    other_distance_nearest = other_distance_candidate
-                    other_medoid_index = index_medoid
-        
-        return other_medoid_index
-    
-    
-    def __calculate_estimation(self):
-        """!
-        @brief Calculates estimation (cost) of the current clusters. The lower the estimation,
-               the more optimally configuration of clusters.
-        
-        @return (double) estimation of current clusters.
-        
-        """
-        estimation = 0.0
-        for index_cluster in range(0, len(self.__clusters)):
-            cluster = self.__clusters[index_cluster]
-            index_medoid = self.__current[index_cluster]
-            for index_point in cluster:
-                estimation += euclidean_distance_square(self.__pointer_data[index_point], self.__pointer_data[index_medoid])
-        
-        return estimation
+        self.__clusters = [cluster.tolist() for cluster in numpy.split(order, borders) if len(cluster) > 0]
@@ -15,7 +15,7 @@ import itertools
 from pyclustering.cluster import cluster_visualizer
 from pyclustering.cluster.encoder import type_encoding
 
-from pyclustering.core.wrapper import ccore_library
+from pyclustering.core.wrapper import ccore_library, ccore_async_processing
 
 import pyclustering.core.clique_wrapper as wrapper
 
@@ -413,7 +413,7 @@ class coordinate_iterator:
 
 
 
-class clique:
+class clique(ccore_async_processing):
     """!
     @brief Class implements CLIQUE grid based clustering algorithm.
     @details CLIQUE automatically finds subspaces with high-density clusters. It produces identical results
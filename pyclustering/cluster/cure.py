@@ -10,15 +10,18 @@
 """
 
 
+import concurrent.futures
+import heapq
+import itertools
+
 import numpy
 
 from pyclustering.cluster.encoder import type_encoding
 
-from pyclustering.utils import euclidean_distance_square
-
+from pyclustering.container.dendrogram import dendrogram
 from pyclustering.container.kdtree import kdtree
 
-from pyclustering.core.wrapper import ccore_library
+from pyclustering.core.wrapper import ccore_library, ccore_async_processing
 
 import pyclustering.core.cure_wrapper as wrapper
 
@@ -27,6 +30,7 @@ class cure_cluster:
     """!
     @brief Represents data cluster in CURE term. 
     @details CURE cluster is described by points of cluster, representation points of the cluster and by the cluster center.
+              Points, representation points and the center are stored as numpy arrays.
     
     """
     
@@ -34,28 +38,28 @@ class cure_cluster:
         """!
         @brief Constructor of CURE cluster.
         
-        @param[in] point (list): Point represented by list of coordinates.
+        @param[in] point (array_like): Point represented by list of coordinates.
         @param[in] index (uint): Index point in dataset.
         
         """
         
-        ## List of points that make up cluster.
-        self.points = [ ]
+        ## Points that make up cluster (numpy.array).
+        self.points = None
         
         ## Point indexes in dataset.
         self.indexes = -1
         
-        ## Mean of points that make up cluster.
+        ## Mean of points that make up cluster (numpy.array).
         self.mean = None
         
-        ## List of points that represents clusters.
-        self.rep = [ ]
+        ## Points that represents clusters (numpy.array).
+        self.rep = None
         
         if point is not None:
-            self.points = [ point ]
+            self.points = numpy.asarray(point, dtype=numpy.float64).reshape(1, -1)
             self.indexes = [ index ]
-            self.mean = point
-            self.rep = [ point ]
+            self.mean = self.points[0]
+            self.rep = self.points
         
         ## Pointer to the closest cluster.
         self.closest = None
@@ -69,12 +73,184 @@ class cure_cluster:
         
         """
         return "%s, %s" % (self.distance, self.points)
-        
 
-class cure:
+
+
+class cure_queue:
+    """!
+    @brief Queue of CURE clusters that are ordered by distance to their closest clusters.
+    @details The queue is a binary heap: each cluster has only one valid entry in the heap, an entry of a cluster
+              becomes invalid when the cluster is removed or relocated, and invalid entries are skipped during
+              extraction. Clusters with the same distance are ordered in line with time when they were inserted or
+              relocated. Insertion, removal, relocation and extraction take O(log n).
+
+    """
+
+    def __init__(self):
+        """!
+        @brief Creates empty queue.
+
+        """
+        self.__heap = []
+        self.__entries = {}
+        self.__sequence = itertools.count()
+
+
+    def __len__(self):
+        """!
+        @brief Returns amount of clusters in the queue.
+
+        """
+        return len(self.__entries)
+
+
+    def insert(self, cluster):
+        """!
+        @brief Inserts cluster to the queue using its current distance to the closest cluster.
+
+        @param[in] cluster (cure_cluster): Cluster that should be inserted.
+
+        """
+        entry = [cluster.distance, next(self.__sequence), cluster]
+        self.__entries[cluster] = entry
+        heapq.heappush(self.__heap, entry)
+
+
+    def remove(self, cluster):
+        """!
+        @brief Removes cluster from the queue.
+
+        @param[in] cluster (cure_cluster): Cluster that should be removed.
+
+        """
+        self.__entries.pop(cluster)[2] = None
+
+
+    def relocate(self, cluster):
+        """!
+        @brief Restores order of the queue after distance of the cluster to its closest cluster has been changed.
+
+        @param[in] cluster (cure_cluster): Cluster from the queue whose distance has been changed.
+
+        """
+        self.remove(cluster)
+        self.insert(cluster)
+
+
+    def top(self):
+        """!
+        @brief Returns cluster that has the nearest closest cluster without extraction.
+
+        @return (cure_cluster) Cluster that has the nearest closest cluster.
+
+        """
+        while self.__heap[0][2] is None:
+            heapq.heappop(self.__heap)
+
+        return self.__heap[0][2]
+
+
+    def pop(self):
+        """!
+        @brief Extracts cluster that has the nearest closest cluster.
+
+        @return (cure_cluster) Cluster that has the nearest closest cluster.
+
+        """
+        cluster = self.top()
+        heapq.heappop(self.__heap)
+        del self.__entries[cluster]
+        return cluster
+
+
+    def get_order(self, cluster):
+        """!
+        @brief Returns position of the cluster in the queue that can be used to compare clusters in line with order
+                of the queue.
+
+        @param[in] cluster (cure_cluster): Cluster from the queue.
+
+        @return (list) Position of the cluster: [distance, sequence number].
+
+        """
+        return self.__entries[cluster][:2]
+
+
+    def get_clusters(self):
+        """!
+        @brief Returns clusters in line with order of the queue.
+
+        @return (list) Clusters in the queue.
+
+        """
+        return [entry[2] for entry in sorted(self.__entries.values(), key=lambda entry: entry[:2])]
+
+
+
+class cure_partition:
+    """!
+    @brief Partial clustering of a partition of CURE sample.
+    @details Points of the partition are clustered by CURE until the required amount of partial clusters is reached.
+              The instance is independent from the algorithm and can be sent to another process.
+
+    """
+
+    def __init__(self, number_represent_points, compression, ccore):
+        """!
+        @brief Constructor of partial clustering of CURE sample.
+
+        @param[in] number_represent_points (uint): Number of representative points for each cluster.
+        @param[in] compression (double): Coefficient defines level of shrinking of representation points.
+        @param[in] ccore (bool): If True then CCORE (C++ solution) is used to cluster the partition.
+
+        """
+        self.__number_represent_points = number_represent_points
+        self.__compression = compression
+        self.__ccore = ccore
+
+
+    def process(self, points, amount_clusters):
+        """!
+        @brief Performs partial clustering of the partition.
+
+        @param[in] points (numpy.ndarray): Points of the partition.
+        @param[in] amount_clusters (uint): Amount of partial clusters that should be allocated.
+
+        @return (tuple) Partial clusters (indexes of points of the partition), their representation points and
+                 their means: (clusters, representors, means).
+
+        """
+        cure_instance = cure(points, amount_clusters, self.__number_represent_points, self.__compression,
+                             ccore=self.__ccore, merge_history=False).process()
+
+        return cure_instance.get_clusters(), cure_instance.get_representors(), cure_instance.get_means()
+
+
+
+class cure(ccore_async_processing):
     """!
     @brief Class represents clustering algorithm CURE with KD-tree optimization.
     @details CCORE option can be used to use the pyclustering core - C/C++ shared library for processing that significantly increases performance.
+
+              Python implementation keeps clusters in a binary heap ordered by distance to the closest cluster
+              (see 'cure_queue'), therefore extraction, insertion and relocation of clusters take O(log n). Each
+              cluster remembers clusters whose closest cluster it is, therefore after merging only these clusters are
+              updated instead of scanning the whole queue. Representative points are stored as numpy arrays,
+              distances from a merged cluster to all other clusters are calculated by one vectorized expression,
+              KD-tree of representative points is used to find new closest clusters of updated clusters.
+
+              Large datasets can be processed using random sampling and partitioning (see argument `sample_size`):
+              CURE is applied to a random sample only. The sample is divided into partitions (see argument
+              `partitions`), each partition is partially clustered until amount of its clusters is reduced in
+              `reduction` times (partitions might be processed in parallel processes, see argument `processes`),
+              after that partial clusters of all partitions are merged by Python implementation. Each point that does
+              not belong to the sample is assigned to the cluster of the closest representative point, points are
+              assigned by chunks (see argument `chunk_size`). CCORE is used to cluster partitions if it is enabled.
+
+              If the whole data is clustered by Python implementation then clusters are merged until one cluster is
+              obtained and full merge history is kept (see `get_dendrogram()`), height of each merge is square
+              distance between the closest representation points of merged clusters. Clusters for another amount of
+              clusters can be obtained from the history without recalculation.
     
     Here is an example how to perform cluster analysis of sample 'Lsun':
     @code
@@ -96,10 +272,24 @@ class cure:
         visualizer.append_clusters(clusters, input_data);
         visualizer.show();
     @endcode
+
+    Here is an example how to perform cluster analysis using sample of 2500 points that is divided into 5
+    partitions that are processed by 5 processes:
+    @code
+        from pyclustering.cluster.cure import cure
+
+        if __name__ == '__main__':
+            ...
+            cure_instance = cure(input_data, 3, sample_size=2500, partitions=5, processes=5, random_state=1000)
+            clusters = cure_instance.process().get_clusters()
+    @endcode
+
+    @remark Processes might be started using 'spawn' method (for example, on Windows), in this case code that runs
+             the algorithm should be protected by `if __name__ == '__main__':`.
     
     """
     
-    def __init__(self, data, number_cluster, number_represent_points = 5, compression = 0.5, ccore = True):
+    def __init__(self, data, number_cluster, number_represent_points = 5, compression = 0.5, ccore = True, **kwargs):
         """!
         @brief Constructor of clustering algorithm CURE.
         
@@ -108,14 +298,47 @@ class cure:
         @param[in] number_represent_points (uint): Number of representative points for each cluster.
         @param[in] compression (double): Coefficient defines level of shrinking of representation points toward the mean of the new created cluster after merging on each step. Usually it destributed from 0 to 1.
         @param[in] ccore (bool): If True then CCORE (C++ solution) will be used for solving.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: `sample_size`, `partitions`,
+                    `reduction`, `processes`, `chunk_size`, `random_state`, `merge_history`).
+
+        <b>Keyword Args:</b><br>
+            - sample_size (uint): Size of random sample that is clustered, other points are assigned to the closest
+               representative points (by default `None`, the whole data is clustered without sampling).
+            - partitions (uint): Amount of partitions of the sample (by default 1).
+            - reduction (double): Amount of clusters of each partition is reduced in `reduction` times by partial
+               clustering, but it is not less than amount of clusters (by default 3).
+            - processes (uint): Amount of processes that are used to cluster partitions (by default 1, partitions
+               are processed in the current process).
+            - chunk_size (uint): Amount of points that are assigned to representative points at once (by default
+               65536).
+            - random_state (int): Seed for random state (by default is `None`, current system time is used).
+            - merge_history (bool): If `True` then Python implementation that clusters the whole data merges clusters
+               until one cluster is obtained and keeps the merge history (by default `True`).
         
         """
         
-        self.__pointer_data = self.__prepare_data_points(data)
+        self.__sample_size = kwargs.get('sample_size', None)
+        self.__partitions = kwargs.get('partitions', 1)
+        self.__reduction = kwargs.get('reduction', 3)
+        self.__processes = kwargs.get('processes', 1)
+        self.__chunk_size = kwargs.get('chunk_size', 65536)
+        self.__random_state = kwargs.get('random_state', None)
+        self.__merge_history = kwargs.get('merge_history', True)
+
+        if self.__sample_size is None:
+            self.__pointer_data = self.__prepare_data_points(data)
+        else:
+            # sampled data is selected by indexes, therefore data is not converted to list
+            self.__pointer_data = numpy.asarray(data, dtype=numpy.float64)
+            if self.__pointer_data.ndim == 1:
+                self.__pointer_data = self.__pointer_data.reshape(-1, 1)
+
+            self.__sample_size = min(self.__sample_size, len(self.__pointer_data))
         
         self.__clusters = None
         self.__representors = None
         self.__means = None
+        self.__dendrogram = None
         
         self.__number_cluster = number_cluster
         self.__number_represent_points = number_represent_points
@@ -138,7 +361,10 @@ class cure:
         
         """
         
-        if self.__ccore is True:
+        if self.__sample_size is not None:
+            self.__process_by_sample()
+
+        elif self.__ccore is True:
             self.__process_by_ccore()
             
         else:
@@ -167,67 +393,163 @@ class cure:
         @brief Performs cluster analysis using python code.
 
         """
-        self.__create_queue()  # queue
+        data = numpy.array(self.__pointer_data, dtype=numpy.float64).reshape(len(self.__pointer_data), -1)
+        self.__agglomerate([cure_cluster(data[index_point], index_point) for index_point in range(len(data))],
+                           self.__merge_history)
+
+
+    def __process_by_sample(self):
+        """!
+        @brief Performs cluster analysis of random sample that is divided into partitions, other points are
+                assigned to the closest representative points.
+
+        """
+        random_state = numpy.random.RandomState(self.__random_state)
+        sample_indexes = random_state.choice(len(self.__pointer_data), self.__sample_size, replace=False)
+
+        partitions = numpy.array_split(sample_indexes, self.__partitions)
+        partition_points = [self.__pointer_data[partition] for partition in partitions]
+        amounts = [min(len(partition), max(self.__number_cluster, int(len(partition) // self.__reduction)))
+                   for partition in partitions]
+
+        partial_clustering = cure_partition(self.__number_represent_points, self.__compression, self.__ccore)
+
+        if (self.__processes > 1) and (len(partitions) > 1):
+            with concurrent.futures.ProcessPoolExecutor(max_workers=min(self.__processes, len(partitions))) as executor:
+                results = list(executor.map(partial_clustering.process, partition_points, amounts))
+        else:
+            results = [partial_clustering.process(points, amount) for points, amount in zip(partition_points, amounts)]
+
+        clusters = []
+        for partition, points, (partial_clusters, representors, means) in zip(partitions, partition_points, results):
+            for cluster_indexes, cluster_representors, cluster_mean in zip(partial_clusters, representors, means):
+                partial_cluster = cure_cluster(None, None)
+                partial_cluster.points = points[cluster_indexes]
+                partial_cluster.indexes = partition[cluster_indexes].tolist()
+                partial_cluster.mean = numpy.asarray(cluster_mean, dtype=numpy.float64)
+                partial_cluster.rep = numpy.asarray(cluster_representors, dtype=numpy.float64).reshape(-1, points.shape[1])
+                clusters.append(partial_cluster)
+
+        self.__agglomerate(clusters, False)
+        self.__assign_points()
+
+
+    def __assign_points(self):
+        """!
+        @brief Assigns points that do not belong to clusters of the sample to the closest representative points by
+                chunks.
+
+        """
+        labels = numpy.full(len(self.__pointer_data), -1, dtype=numpy.int64)
+        for index_cluster, cluster in enumerate(self.__clusters):
+            labels[cluster] = index_cluster
+
+        representatives = numpy.concatenate([numpy.array(representors, dtype=numpy.float64).reshape(-1, self.__pointer_data.shape[1])
+                                             for representors in self.__representors])
+        owners = numpy.repeat(numpy.arange(len(self.__representors)), [len(representors) for representors in self.__representors])
+
+        unlabeled = numpy.flatnonzero(labels < 0)
+        for chunk_start in range(0, len(unlabeled), self.__chunk_size):
+            chunk = unlabeled[chunk_start:chunk_start + self.__chunk_size]
+            distances = self.__calculate_distances(self.__pointer_data[chunk], representatives)
+            labels[chunk] = owners[numpy.argmin(distances, axis=1)]
+
+        order = numpy.argsort(labels, kind='stable')
+        borders = numpy.cumsum(numpy.bincount(labels, minlength=len(self.__representors)))[:-1]
+        self.__clusters = [cluster.tolist() for cluster in numpy.split(order, borders)]
+
+
+    def __agglomerate(self, clusters, merge_history):
+        """!
+        @brief Merges the closest clusters until the required amount of clusters is reached.
+
+        @param[in] clusters (list): Initial CURE clusters.
+        @param[in] merge_history (bool): If `True` then clusters are merged until one cluster is obtained and
+                    dendrogram of merges is created.
+
+        """
+        self.__dimension = clusters[0].rep.shape[1]
+
+        self.__create_queue(clusters)  # queue
         self.__create_kdtree()  # create k-d tree
 
-        while len(self.__queue) > self.__number_cluster:
-            cluster1 = self.__queue[0]  # cluster that has nearest neighbor.
+        self.__clusters, self.__dendrogram = None, None
+
+        identifiers = {current_cluster: index_cluster for index_cluster, current_cluster in enumerate(clusters)}
+        linkage = []
+
+        amount_clusters = 1 if merge_history else self.__number_cluster
+        while len(self.__queue) > amount_clusters:
+            if (self.__clusters is None) and (len(self.__queue) <= self.__number_cluster):
+                self.__store_clusters()
+
+            cluster1 = self.__queue.pop()  # cluster that has nearest neighbor.
             cluster2 = cluster1.closest  # closest cluster.
 
-            self.__queue.remove(cluster1)
             self.__queue.remove(cluster2)
 
+            # Clusters whose closest cluster is removed should be updated.
+            cluster_relocation_requests = self.__remove_referrers(cluster1) | self.__remove_referrers(cluster2)
+            cluster_relocation_requests.difference_update((cluster1, cluster2))
+            cluster_relocation_requests = sorted(cluster_relocation_requests, key=self.__queue.get_order)
+
             self.__delete_represented_points(cluster1)
             self.__delete_represented_points(cluster2)
 
             merged_cluster = self.__merge_clusters(cluster1, cluster2)
+            self.__referrers[merged_cluster] = set()
 
-            self.__insert_represented_points(merged_cluster)
-
-            # Pointers to clusters that should be relocated is stored here.
-            cluster_relocation_requests = []
+            linkage.append((identifiers.pop(cluster1), identifiers.pop(cluster2), cluster1.distance,
+                            len(merged_cluster.indexes)))
+            identifiers[merged_cluster] = len(clusters) + len(linkage) - 1
 
             # Check for the last cluster
+            distances = []
             if len(self.__queue) > 0:
-                merged_cluster.closest = self.__queue[0]  # arbitrary cluster from queue
-                merged_cluster.distance = self.__cluster_distance(merged_cluster, merged_cluster.closest)
-
-                for item in self.__queue:
-                    distance = self.__cluster_distance(merged_cluster, item)
-                    # Check if distance between new cluster and current is the best than now.
-                    if distance < merged_cluster.distance:
-                        merged_cluster.closest = item
-                        merged_cluster.distance = distance
-
-                    # Check if current cluster has removed neighbor.
-                    if (item.closest is cluster1) or (item.closest is cluster2):
-                        # If previous distance was less then distance to new cluster then nearest cluster should
-                        # be found in the tree.
-                        if item.distance < distance:
-                            (item.closest, item.distance) = self.__closest_cluster(item, distance)
-
-                            # TODO: investigation is required. There is assumption that itself and merged cluster
-                            # should be always in list of neighbors in line with specified radius. But merged cluster
-                            # may not be in list due to error calculation, therefore it should be added manually.
-                            if item.closest is None:
-                                item.closest = merged_cluster
-                                item.distance = distance
-
-                        else:
-                            item.closest = merged_cluster
-                            item.distance = distance
-
-                        cluster_relocation_requests.append(item)
+                distances = self.__update_merged_cluster(merged_cluster, cluster_relocation_requests)
+
+            self.__insert_represented_points(merged_cluster)
+
+            for item, distance in zip(cluster_relocation_requests, distances):
+                # If previous distance was less then distance to new cluster then nearest cluster should
+                # be found in the tree.
+                if item.distance < distance:
+                    closest, closest_distance = self.__closest_cluster(item, distance)
+
+                    # TODO: investigation is required. There is assumption that itself and merged cluster
+                    # should be always in list of neighbors in line with specified radius. But merged cluster
+                    # may not be in list due to error calculation, therefore it should be added manually.
+                    if closest is None:
+                        closest, closest_distance = merged_cluster, distance
+
+                else:
+                    closest, closest_distance = merged_cluster, distance
+
+                self.__set_closest(item, closest, closest_distance)
 
             # New cluster and updated clusters should relocated in queue
-            self.__insert_cluster(merged_cluster)
+            self.__queue.insert(merged_cluster)
             for item in cluster_relocation_requests:
-                self.__relocate_cluster(item)
+                self.__queue.relocate(item)
 
+        if self.__clusters is None:
+            self.__store_clusters()
+
+        if merge_history:
+            self.__dendrogram = dendrogram(linkage, len(clusters))
+
+
+    def __store_clusters(self):
+        """!
+        @brief Stores current clusters of the queue as the result of clustering.
+
+        """
         # Change cluster representation
-        self.__clusters = [cure_cluster_unit.indexes for cure_cluster_unit in self.__queue]
-        self.__representors = [cure_cluster_unit.rep for cure_cluster_unit in self.__queue]
-        self.__means = [cure_cluster_unit.mean for cure_cluster_unit in self.__queue]
+        clusters = self.__queue.get_clusters()
+
+        self.__clusters = [cure_cluster_unit.indexes for cure_cluster_unit in clusters]
+        self.__representors = [cure_cluster_unit.rep.tolist() for cure_cluster_unit in clusters]
+        self.__means = [cure_cluster_unit.mean.tolist() for cure_cluster_unit in clusters]
 
 
     def get_clusters(self):
@@ -275,6 +597,24 @@ class cure:
         return self.__means
 
 
+    def get_dendrogram(self):
+        """!
+        @brief Returns dendrogram of merges where height of each merge is square distance between the closest
+                representation points of merged clusters, the dendrogram can be cut to obtain any amount of clusters
+                without recalculation.
+        
+        @remark Dendrogram is available only if the whole data is clustered by Python implementation, otherwise
+                 `None` is returned.
+        
+        @return (dendrogram) Dendrogram of the merge history.
+        
+        @see process()
+        
+        """
+        
+        return self.__dendrogram
+
+
     def get_cluster_encoding(self):
         """!
         @brief Returns clustering result representation type that indicate how clusters are encoded.
@@ -321,33 +661,88 @@ class cure:
         if self.__number_represent_points <= 0:
             raise ValueError("Incorrect amount of representatives '%d'. Amount of representatives should be greater than 0." % self.__number_cluster)
 
+        if self.__sample_size is not None:
+            if self.__sample_size < self.__number_cluster:
+                raise ValueError("Sample size (current value: '%d') should be equal or greater than amount of clusters "
+                                 "(current value: '%d')." % (self.__sample_size, self.__number_cluster))
+
+            if (self.__partitions <= 0) or (self.__partitions > self.__sample_size):
+                raise ValueError("Amount of partitions (current value: '%d') should be in range [1, %d]." %
+                                 (self.__partitions, self.__sample_size))
+
+        if self.__reduction < 1:
+            raise ValueError("Reduction (current value: '%f') should be equal or greater than 1." % self.__reduction)
+
+        if self.__processes <= 0:
+            raise ValueError("Amount of processes (current value: '%d') should be greater than 0." % self.__processes)
+
+        if self.__chunk_size <= 0:
+            raise ValueError("Chunk size (current value: '%d') should be greater than 0." % self.__chunk_size)
 
-    def __insert_cluster(self, cluster):
+
+    def __set_closest(self, cluster, closest, distance):
         """!
-        @brief Insert cluster to the list (sorted queue) in line with sequence order (distance).
-        
-        @param[in] cluster (cure_cluster): Cluster that should be inserted.
-        
+        @brief Assigns the closest cluster to the specified cluster.
+
+        @param[in] cluster (cure_cluster): Cluster whose closest cluster is assigned.
+        @param[in] closest (cure_cluster): New closest cluster.
+        @param[in] distance (double): Distance to the new closest cluster.
+
         """
-        
-        for index in range(len(self.__queue)):
-            if cluster.distance < self.__queue[index].distance:
-                self.__queue.insert(index, cluster)
-                return
-    
-        self.__queue.append(cluster)
+        referrers = self.__referrers.get(cluster.closest)
+        if referrers is not None:
+            referrers.discard(cluster)
 
+        cluster.closest, cluster.distance = closest, distance
+        self.__referrers[closest].add(cluster)
 
-    def __relocate_cluster(self, cluster):
+
+    def __remove_referrers(self, cluster):
         """!
-        @brief Relocate cluster in list in line with distance order.
-        
-        @param[in] cluster (cure_cluster): Cluster that should be relocated in line with order.
-        
+        @brief Removes the cluster from the clusters that are referred as the closest and returns clusters whose
+                closest cluster is the removed cluster.
+
+        @param[in] cluster (cure_cluster): Cluster that is removed.
+
+        @return (set) Clusters whose closest cluster is the specified cluster.
+
         """
-        
-        self.__queue.remove(cluster)
-        self.__insert_cluster(cluster)
+        referrers = self.__referrers.get(cluster.closest)
+        if referrers is not None:
+            referrers.discard(cluster)
+
+        return self.__referrers.pop(cluster)
+
+
+    def __update_merged_cluster(self, merged_cluster, clusters):
+        """!
+        @brief Finds the closest cluster to the merged cluster and calculates distances from the merged cluster to
+                the specified clusters.
+        @details Distances from representation points of the merged cluster to all stored representation points
+                  are calculated at once. If there are several closest clusters then the first cluster in line with
+                  order of the queue is chosen.
+
+        @param[in] merged_cluster (cure_cluster): Merged cluster whose representation points are not stored yet.
+        @param[in] clusters (list): Clusters whose distances to the merged cluster should be returned.
+
+        @return (list) Distances from the merged cluster to the specified clusters.
+
+        """
+        size = self.__representative_size
+
+        distances = numpy.min(self.__calculate_distances(merged_cluster.rep, self.__representatives[:size]), axis=0)
+        distances[~self.__representative_alive[:size]] = float('inf')
+
+        nearest_distance = float(numpy.min(distances))
+        nearest_clusters = set(self.__representative_owners[:size][distances == nearest_distance])
+        self.__set_closest(merged_cluster, min(nearest_clusters, key=self.__queue.get_order), nearest_distance)
+
+        cluster_distances = []
+        for current_cluster in clusters:
+            index_begin = self.__representative_rows[current_cluster]
+            cluster_distances.append(float(numpy.min(distances[index_begin:index_begin + len(current_cluster.rep)])))
+
+        return cluster_distances
 
 
     def __closest_cluster(self, cluster, distance):
@@ -366,7 +761,7 @@ class cure:
 
         real_euclidean_distance = distance ** 0.5
 
-        for point in cluster.rep:
+        for point in cluster.rep.tolist():
             # Nearest nodes should be returned (at least it will return itself).
             nearest_nodes = self.__tree.find_nearest_dist_nodes(point, real_euclidean_distance)
             for (candidate_distance, kdtree_node) in nearest_nodes:
@@ -379,27 +774,76 @@ class cure:
 
     def __insert_represented_points(self, cluster):
         """!
-        @brief Insert representation points to the k-d tree.
+        @brief Insert representation points to the k-d tree and to the storage of representation points.
         
         @param[in] cluster (cure_cluster): Cluster whose representation points should be inserted.
         
         """
         
-        for point in cluster.rep:
+        for point in cluster.rep.tolist():
             self.__tree.insert(point, cluster)
 
+        amount = len(cluster.rep)
+        if self.__representative_size + amount > len(self.__representatives):
+            self.__compress_representatives(amount)
+
+        index_begin = self.__representative_size
+        index_end = index_begin + amount
+
+        self.__representatives[index_begin:index_end] = cluster.rep
+        self.__representative_owners[index_begin:index_end] = cluster
+        self.__representative_alive[index_begin:index_end] = True
+
+        self.__representative_rows[cluster] = index_begin
+        self.__representative_size = index_end
+
 
     def __delete_represented_points(self, cluster): 
         """!
-        @brief Remove representation points of clusters from the k-d tree
+        @brief Remove representation points of clusters from the k-d tree and from the storage of representation points.
         
         @param[in] cluster (cure_cluster): Cluster whose representation points should be removed.
         
         """
         
-        for point in cluster.rep:
+        for point in cluster.rep.tolist():
             self.__tree.remove(point, payload=cluster)
 
+        index_begin = self.__representative_rows.pop(cluster)
+        index_end = index_begin + len(cluster.rep)
+
+        self.__representative_owners[index_begin:index_end] = None
+        self.__representative_alive[index_begin:index_end] = False
+
+
+    def __compress_representatives(self, amount):
+        """!
+        @brief Removes deleted representation points from the storage and reserves place for new points.
+
+        @param[in] amount (uint): Amount of representation points that should be inserted.
+
+        """
+        alive = numpy.flatnonzero(self.__representative_alive[:self.__representative_size])
+        capacity = 2 * (len(alive) + amount)
+
+        representatives = numpy.empty((capacity, self.__dimension), dtype=numpy.float64)
+        representatives[:len(alive)] = self.__representatives[alive]
+
+        owners = numpy.empty(capacity, dtype=object)
+        owners[:len(alive)] = self.__representative_owners[alive]
+
+        self.__representatives = representatives
+        self.__representative_owners = owners
+        self.__representative_alive = numpy.zeros(capacity, dtype=bool)
+        self.__representative_alive[:len(alive)] = True
+        self.__representative_size = len(alive)
+
+        # representation points of each cluster are stored one after another
+        begins = numpy.ones(len(alive), dtype=bool)
+        begins[1:] = owners[1:len(alive)] != owners[:len(alive) - 1]
+
+        self.__representative_rows = {owners[index_begin]: index_begin for index_begin in numpy.flatnonzero(begins).tolist()}
+
 
     def __merge_clusters(self, cluster1, cluster2):
         """!
@@ -414,92 +858,100 @@ class cure:
         
         merged_cluster = cure_cluster(None, None)
         
-        merged_cluster.points = cluster1.points + cluster2.points
+        merged_cluster.points = numpy.concatenate((cluster1.points, cluster2.points))
         merged_cluster.indexes = cluster1.indexes + cluster2.indexes
         
-        # merged_cluster.mean = ( len(cluster1.points) * cluster1.mean + len(cluster2.points) * cluster2.mean ) / ( len(cluster1.points) + len(cluster2.points) );
-        dimension = len(cluster1.mean)
-        merged_cluster.mean = [0] * dimension
-        if merged_cluster.points[1:] == merged_cluster.points[:-1]:
+        if numpy.all(merged_cluster.points == merged_cluster.points[0]):
             merged_cluster.mean = merged_cluster.points[0]
         else:
-            for index in range(dimension):
-                merged_cluster.mean[index] = ( len(cluster1.points) * cluster1.mean[index] + len(cluster2.points) * cluster2.mean[index] ) / ( len(cluster1.points) + len(cluster2.points) );
+            size1, size2 = len(cluster1.points), len(cluster2.points)
+            merged_cluster.mean = (size1 * cluster1.mean + size2 * cluster2.mean) / (size1 + size2)
         
-        temporary = list()
+        # the farthest point from the mean is chosen first, then the farthest point from already chosen points
+        distances = self.__calculate_distances(merged_cluster.points, merged_cluster.mean[numpy.newaxis])[:, 0]
+        representatives = []
         
-        for index in range(self.__number_represent_points):
-            maximal_distance = 0
-            maximal_point = None
+        for _ in range(self.__number_represent_points):
+            index_point = len(distances) - 1 - int(numpy.argmax(distances[::-1]))
+            if (len(representatives) > 0) and (distances[index_point] == 0.0):
+                break   # all points coincide with already chosen points
             
-            for point in merged_cluster.points:
-                minimal_distance = 0
-                if index == 0:
-                    minimal_distance = euclidean_distance_square(point, merged_cluster.mean)
-                    #minimal_distance = euclidean_distance_sqrt(point, merged_cluster.mean);
-                else:
-                    minimal_distance = min([euclidean_distance_square(point, p) for p in temporary])
-                    #minimal_distance = cluster_distance(cure_cluster(point), cure_cluster(temporary[0]));
-                    
-                if minimal_distance >= maximal_distance:
-                    maximal_distance = minimal_distance
-                    maximal_point = point
-        
-            if maximal_point not in temporary:
-                temporary.append(maximal_point)
-                
-        for point in temporary:
-            representative_point = [0] * dimension
-            for index in range(dimension):
-                representative_point[index] = point[index] + self.__compression * (merged_cluster.mean[index] - point[index])
-                
-            merged_cluster.rep.append(representative_point)
+            representatives.append(index_point)
+            
+            point_distances = self.__calculate_distances(merged_cluster.points, merged_cluster.points[index_point:index_point + 1])[:, 0]
+            if len(representatives) == 1:
+                distances = point_distances
+            else:
+                distances = numpy.minimum(distances, point_distances)
+        
+        points = merged_cluster.points[representatives]
+        merged_cluster.rep = points + self.__compression * (merged_cluster.mean - points)
         
         return merged_cluster
 
 
-    def __create_queue(self):
+    def __create_queue(self, clusters):
         """!
         @brief Create queue of sorted clusters by distance between them, where first cluster has the nearest neighbor. At the first iteration each cluster contains only one point.
+        @details Distances between representation points are calculated by blocks of clusters.
         
-        @param[in] data (list): Input data that is presented as list of points (objects), each point should be represented by list or tuple.
-        
-        @return (list) Create queue of sorted clusters by distance between them.
+        @param[in] clusters (list): Initial CURE clusters.
         
         """
         
-        self.__queue = [cure_cluster(self.__pointer_data[index_point], index_point) for index_point in range(len(self.__pointer_data))]
+        amount_clusters = len(clusters)
+        representatives = numpy.concatenate([current_cluster.rep for current_cluster in clusters])
+        
+        # representation points of each cluster are located one after another
+        begins = numpy.zeros(amount_clusters + 1, dtype=numpy.int64)
+        numpy.cumsum([len(current_cluster.rep) for current_cluster in clusters], out=begins[1:])
         
         # set closest clusters
-        for i in range(0, len(self.__queue)):
-            minimal_distance = float('inf')
-            closest_index_cluster = -1
+        closest_indexes = numpy.empty(amount_clusters, dtype=numpy.int64)
+        closest_distances = numpy.empty(amount_clusters, dtype=numpy.float64)
+        
+        block_size = max(1, 2 ** 22 // len(representatives))
+        for index_begin in range(0, amount_clusters, block_size):
+            index_end = min(index_begin + block_size, amount_clusters)
+            block_distances = self.__calculate_distances(representatives[begins[index_begin]:begins[index_end]], representatives)
+            
+            if len(representatives) > amount_clusters:
+                # distance between clusters is the smallest distance between their representation points
+                block_distances = numpy.minimum.reduceat(block_distances, begins[:-1], axis=1)
+                block_distances = numpy.minimum.reduceat(block_distances, begins[index_begin:index_end] - begins[index_begin], axis=0)
             
-            for k in range(0, len(self.__queue)):
-                if i != k:
-                    dist = self.__cluster_distance(self.__queue[i], self.__queue[k])
-                    if dist < minimal_distance:
-                        minimal_distance = dist
-                        closest_index_cluster = k
+            rows = numpy.arange(index_end - index_begin)
+            block_distances[rows, rows + index_begin] = float('inf')
             
-            self.__queue[i].closest = self.__queue[closest_index_cluster]
-            self.__queue[i].distance = minimal_distance
+            closest_indexes[index_begin:index_end] = numpy.argmin(block_distances, axis=1)
+            closest_distances[index_begin:index_end] = block_distances[rows, closest_indexes[index_begin:index_end]]
+        
+        self.__referrers = {current_cluster: set() for current_cluster in clusters}
+        for index_cluster, current_cluster in enumerate(clusters):
+            current_cluster.closest = clusters[closest_indexes[index_cluster]]
+            current_cluster.distance = float(closest_distances[index_cluster])
+            self.__referrers[current_cluster.closest].add(current_cluster)
         
         # sort clusters
-        self.__queue.sort(key=lambda x: x.distance, reverse = False)
+        self.__queue = cure_queue()
+        for index_cluster in numpy.argsort(closest_distances, kind='stable'):
+            self.__queue.insert(clusters[index_cluster])
     
 
     def __create_kdtree(self):
         """!
         @brief Create k-d tree in line with created clusters. At the first iteration contains all points from the input data set.
+        @details Representation points are also stored as numpy array to calculate distances to all of them at once.
         
         @return (kdtree) k-d tree that consist of representative points of CURE clusters.
         
         """
 
+        clusters = self.__queue.get_clusters()
+
         representatives, payloads = [], []
-        for current_cluster in self.__queue:
-            for representative_point in current_cluster.rep:
+        for current_cluster in clusters:
+            for representative_point in current_cluster.rep.tolist():
                 representatives.append(representative_point)
                 payloads.append(current_cluster)
 
@@ -507,23 +959,39 @@ class cure:
         # when we have the biggest amount of nodes in the tree.
         self.__tree = kdtree(representatives, payloads)
 
+        capacity = 2 * len(representatives)
+
+        self.__representatives = numpy.empty((capacity, self.__dimension), dtype=numpy.float64)
+        self.__representatives[:len(representatives)] = representatives
 
-    def __cluster_distance(self, cluster1, cluster2):
+        self.__representative_owners = numpy.empty(capacity, dtype=object)
+        self.__representative_owners[:len(payloads)] = payloads
+
+        self.__representative_alive = numpy.zeros(capacity, dtype=bool)
+        self.__representative_alive[:len(representatives)] = True
+
+        self.__representative_size = len(representatives)
+        index_begins = numpy.cumsum([0] + [len(current_cluster.rep) for current_cluster in clusters[:-1]]).tolist()
+        self.__representative_rows = dict(zip(clusters, index_begins))
+
+
+    @staticmethod
+    def __calculate_distances(points1, points2):
         """!
-        @brief Calculate minimal distance between clusters using representative points.
+        @brief Calculate square Euclidean distances between each pair of points.
+        @details Coordinates are accumulated one by one, therefore distances are equal to distances that are
+                  calculated by 'euclidean_distance_square'.
         
-        @param[in] cluster1 (cure_cluster): The first cluster.
-        @param[in] cluster2 (cure_cluster): The second cluster.
+        @param[in] points1 (numpy.array): The first set of points.
+        @param[in] points2 (numpy.array): The second set of points.
         
-        @return (double) Euclidean distance between two clusters that is defined by minimum distance between representation points of two clusters.
+        @return (numpy.array) Distances where rows correspond to points from the first set and columns to the second.
         
         """
         
-        distance = float('inf')
-        for i in range(0, len(cluster1.rep)):
-            for k in range(0, len(cluster2.rep)):
-                dist = euclidean_distance_square(cluster1.rep[i], cluster2.rep[k])   # Fast mode
-                if dist < distance:
-                    distance = dist
-                    
-        return distance
+        distances = numpy.zeros((len(points1), len(points2)), dtype=numpy.float64)
+        for index_dimension in range(points1.shape[1]):
+            differences = numpy.subtract.outer(points1[:, index_dimension], points2[:, index_dimension])
+            distances += numpy.multiply(differences, differences, out=differences)
+        
+        return distances
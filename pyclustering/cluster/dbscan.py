@@ -10,19 +10,29 @@
 """
 
 
-from pyclustering.container.kdtree import kdtree_balanced
+import numpy
 
 from pyclustering.cluster.encoder import type_encoding
 
-from pyclustering.core.wrapper import ccore_library
+from pyclustering.container.neighborhood import neighborhood_index
+
+from pyclustering.core.wrapper import ccore_library, ccore_async_processing
 
 import pyclustering.core.dbscan_wrapper as wrapper
 
 
-class dbscan:
+class dbscan(ccore_async_processing):
     """!
     @brief Class represents clustering algorithm DBSCAN.
-    @details This DBSCAN algorithm is KD-tree optimized.
+    @details Python implementation of the algorithm uses eps-sized uniform grid to find neighbors of points (see
+              `neighborhood_index`): the data is split into cells whose size is equal to the connectivity radius,
+              therefore neighbors of a point are searched only in its own and adjacent cells using vectorized distance
+              calculation. Clusters are expanded in bulk using boolean state arrays.
+
+             Instance of `neighborhood_index` can be passed instead of input data, in this case neighbors are not
+             searched again and the index can be reused for several runs with different parameters (connectivity
+             radius should be less or equal to radius of the index). The index is always processed by Python
+             implementation.
              
              By default C/C++ pyclustering library is used for processing that significantly increases performance.
     
@@ -59,8 +69,9 @@ class dbscan:
         """!
         @brief Constructor of clustering algorithm DBSCAN.
         
-        @param[in] data (list): Input data that is presented as list of points or distance matrix (defined by parameter
-                   'data_type', by default data is considered as a list of points).
+        @param[in] data (list|neighborhood_index): Input data that is presented as list of points or distance matrix
+                   (defined by parameter 'data_type', by default data is considered as a list of points), or prebuilt
+                   neighborhood index.
         @param[in] eps (double): Connectivity radius between points, points may be connected if distance between them less then the radius.
         @param[in] neighbors (uint): minimum number of shared neighbors that is required for establish links between points.
         @param[in] ccore (bool): if True than DLL CCORE (C++ solution) will be used for solving the problem.
@@ -72,21 +83,15 @@ class dbscan:
         """
         
         self.__pointer_data = data
-        self.__kdtree = None
         self.__eps = eps
         self.__sqrt_eps = eps * eps
         self.__neighbors = neighbors
 
-        self.__visited = None
-        self.__belong = None
-
         self.__data_type = kwargs.get('data_type', 'points')
 
         self.__clusters = []
         self.__noise = []
 
-        self.__neighbor_searcher = None
-
         self.__initialize_ccore_state(ccore)
 
         self.__verify_arguments()
@@ -100,8 +105,8 @@ class dbscan:
         @return (tuple) Current state of the algorithm.
 
         """
-        return (self.__pointer_data, self.__eps, self.__sqrt_eps, self.__neighbors, self.__visited, self.__belong,
-                self.__data_type, self.__clusters, self.__noise, self.__ccore)
+        return (self.__pointer_data, self.__eps, self.__sqrt_eps, self.__neighbors, self.__data_type,
+                self.__clusters, self.__noise, self.__ccore)
 
 
     def __setstate__(self, state):
@@ -111,8 +116,8 @@ class dbscan:
                   state might be different if state is moved between platforms.
 
         """
-        self.__pointer_data, self.__eps, self.__sqrt_eps, self.__neighbors, self.__visited, self.__belong, \
-        self.__data_type, self.__clusters, self.__noise, self.__ccore = state
+        self.__pointer_data, self.__eps, self.__sqrt_eps, self.__neighbors, self.__data_type, \
+        self.__clusters, self.__noise, self.__ccore = state
 
         self.__initialize_ccore_state(True)
 
@@ -132,23 +137,8 @@ class dbscan:
             (self.__clusters, self.__noise) = wrapper.dbscan(self.__pointer_data, self.__eps, self.__neighbors, self.__data_type)
             
         else:
-            if self.__data_type == 'points':
-                self.__kdtree = kdtree_balanced(self.__pointer_data, range(len(self.__pointer_data)))
-
-            self.__visited = [False] * len(self.__pointer_data)
-            self.__belong = [False] * len(self.__pointer_data)
-
-            self.__neighbor_searcher = self.__create_neighbor_searcher(self.__data_type)
-
-            for i in range(0, len(self.__pointer_data)):
-                if self.__visited[i] is False:
-                    cluster = self.__expand_cluster(i)
-                    if cluster is not None:
-                        self.__clusters.append(cluster)
-
-            for i in range(0, len(self.__pointer_data)):
-                if self.__belong[i] is False:
-                    self.__noise.append(i)
+            index_pointer, neighbor_indexes, _ = self.__create_neighborhood_index().restrict(self.__eps)
+            self.__clusters, self.__noise = self.__expand_clusters(index_pointer, neighbor_indexes)
 
         return self
 
@@ -209,82 +199,90 @@ class dbscan:
         if self.__eps < 0:
             raise ValueError("Connectivity radius (current value: '%d') should be greater or equal to 0." % self.__eps)
 
+        if isinstance(self.__pointer_data, neighborhood_index) and (self.__eps > self.__pointer_data.radius):
+            raise ValueError("Connectivity radius (current value: '%f') should be less or equal to radius of the "
+                             "neighborhood index (current value: '%f')." % (self.__eps, self.__pointer_data.radius))
+
+        if self.__data_type not in ('points', 'distance_matrix'):
+            raise TypeError("Unknown type of data is specified '%s'" % self.__data_type)
+
 
-    def __create_neighbor_searcher(self, data_type):
+    def __create_neighborhood_index(self):
         """!
-        @brief Returns neighbor searcher in line with data type.
+        @brief Returns neighborhood index of the input data, the index is built if it has not been provided.
 
-        @param[in] data_type (string): Data type (points or distance matrix).
+        @return (neighborhood_index) Neighborhood index whose radius is not less than the connectivity radius.
 
         """
-        if data_type == 'points':
-            return self.__neighbor_indexes_points
-        elif data_type == 'distance_matrix':
-            return self.__neighbor_indexes_distance_matrix
-        else:
-            raise TypeError("Unknown type of data is specified '%s'" % data_type)
+        if isinstance(self.__pointer_data, neighborhood_index):
+            return self.__pointer_data
+
+        return neighborhood_index(self.__pointer_data, self.__eps, self.__data_type)
 
 
-    def __expand_cluster(self, index_point):
+    def __expand_clusters(self, index_pointer, neighbor_indexes):
         """!
-        @brief Expands cluster from specified point in the input data space.
-        
-        @param[in] index_point (list): Index of a point from the data.
+        @brief Expands clusters from core points using neighbors that are stored in CSR format.
+        @details Core points are used as seeds in line with their order in the input data, each cluster is expanded
+                  by layers: neighbors of all core points of the current layer are collected at once. Border point
+                  belongs to the cluster that reaches it first.
+
+        @param[in] index_pointer (numpy.ndarray): Offsets of neighbors of each point in array 'neighbor_indexes'.
+        @param[in] neighbor_indexes (numpy.ndarray): Concatenated indexes of neighbors of each point.
+
+        @return (tuple) Allocated clusters and noise: (clusters, noise).
 
-        @return (list) Return tuple of list of indexes that belong to the same cluster and list of points that are marked as noise: (cluster, noise), or None if nothing has been expanded.
-        
         """
-        
-        cluster = None
-        self.__visited[index_point] = True
-        neighbors = self.__neighbor_searcher(index_point)
-         
-        if len(neighbors) >= self.__neighbors:
-            cluster = [index_point]
-             
-            self.__belong[index_point] = True
-             
-            for i in neighbors:
-                if self.__visited[i] is False:
-                    self.__visited[i] = True
+        amount_neighbors = numpy.diff(index_pointer)
+        core = amount_neighbors >= self.__neighbors
 
-                    next_neighbors = self.__neighbor_searcher(i)
-                     
-                    if len(next_neighbors) >= self.__neighbors:
-                        neighbors += [k for k in next_neighbors if ( (k in neighbors) == False) and k != index_point]
-                 
-                if self.__belong[i] is False:
-                    cluster.append(i)
-                    self.__belong[i] = True
+        labels = numpy.full(len(amount_neighbors), -1, dtype=numpy.int64)
+        clusters = []
 
-        return cluster
+        for index_seed in numpy.flatnonzero(core):
+            if labels[index_seed] != -1:
+                continue
 
+            index_cluster = len(clusters)
+            labels[index_seed] = index_cluster
 
-    def __neighbor_indexes_points(self, index_point):
-        """!
-        @brief Return neighbors of the specified object in case of sequence of points.
+            layer = numpy.array([index_seed], dtype=numpy.int64)
+            cluster = [layer]
 
-        @param[in] index_point (uint): Index point whose neighbors are should be found.
+            while len(layer) > 0:
+                neighbors = self.__gather_neighbors(index_pointer, neighbor_indexes, amount_neighbors, layer)
+                neighbors = numpy.unique(neighbors[labels[neighbors] == -1])
 
-        @return (list) List of indexes of neighbors in line the connectivity radius.
+                labels[neighbors] = index_cluster
+                cluster.append(neighbors)
 
-        """
-        kdnodes = self.__kdtree.find_nearest_dist_nodes(self.__pointer_data[index_point], self.__eps)
-        return [node_tuple[1].payload for node_tuple in kdnodes if node_tuple[1].payload != index_point]
+                layer = neighbors[core[neighbors]]
+
+            clusters.append(numpy.concatenate(cluster).tolist())
 
+        return clusters, numpy.flatnonzero(labels == -1).tolist()
 
-    def __neighbor_indexes_distance_matrix(self, index_point):
+
+    @staticmethod
+    def __gather_neighbors(index_pointer, neighbor_indexes, amount_neighbors, points):
         """!
-        @brief Return neighbors of the specified object in case of distance matrix.
+        @brief Returns concatenated neighbors of the specified points.
 
-        @param[in] index_point (uint): Index point whose neighbors are should be found.
+        @param[in] index_pointer (numpy.ndarray): Offsets of neighbors of each point in array 'neighbor_indexes'.
+        @param[in] neighbor_indexes (numpy.ndarray): Concatenated indexes of neighbors of each point.
+        @param[in] amount_neighbors (numpy.ndarray): Amount of neighbors of each point.
+        @param[in] points (numpy.ndarray): Indexes of points whose neighbors should be returned.
 
-        @return (list) List of indexes of neighbors in line the connectivity radius.
+        @return (numpy.ndarray) Indexes of neighbors (may contain duplicates).
 
         """
-        distances = self.__pointer_data[index_point]
-        return [index_neighbor for index_neighbor in range(len(distances))
-                if ((distances[index_neighbor] <= self.__eps) and (index_neighbor != index_point))]
+        lengths = amount_neighbors[points]
+        total = int(lengths.sum())
+        if total == 0:
+            return numpy.empty(0, dtype=numpy.int64)
+
+        shifts = numpy.repeat(index_pointer[points] - (numpy.cumsum(lengths) - lengths), lengths)
+        return neighbor_indexes[shifts + numpy.arange(total)]
 
 
     def __initialize_ccore_state(self, ccore):
@@ -296,6 +294,6 @@ class dbscan:
         @param[in] ccore (bool):
 
         """
-        self.__ccore = ccore
+        self.__ccore = ccore and not isinstance(self.__pointer_data, neighborhood_index)
         if self.__ccore:
             self.__ccore = ccore_library.workable()
@@ -13,13 +13,14 @@
 import math
 
 from pyclustering.cluster.kmeans import kmeans
+from pyclustering.cluster.ksweep import ksweep
 from pyclustering.cluster.center_initializer import kmeans_plusplus_initializer, random_center_initializer
-from pyclustering.core.wrapper import ccore_library
+from pyclustering.core.wrapper import ccore_library, ccore_async_processing
 
 import pyclustering.core.elbow_wrapper as wrapper
 
 
-class elbow:
+class elbow(ccore_async_processing):
     """!
     @brief Class represents Elbow method that is used to find out appropriate amount of clusters in a dataset.
     @details The elbow is a heuristic method of interpretation and validation of consistency within cluster analysis
@@ -84,19 +85,25 @@ class elbow:
         @param[in] data (array_like): Input data that is presented as array of points (objects), each point should be represented by array_like data structure.
         @param[in] kmin (int): Minimum amount of clusters that should be considered.
         @param[in] kmax (int): Maximum amount of clusters that should be considered.
-        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: `ccore`, `initializer`, `random_state`, `kstep`).
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: `ccore`, `initializer`, `random_state`,
+                    `kstep`, `warm_start`, `workers`).
 
         <b>Keyword Args:</b><br>
             - ccore (bool): If `True` then C++ implementation of pyclustering library is used (by default `True`).
             - initializer (callable): Center initializer that is used by K-Means algorithm (by default K-Means++).
             - random_state (int): Seed for random state (by default is `None`, current system time is used).
             - kstep (int): Search step in the interval [kmin, kmax] (by default is `1`).
+            - warm_start (bool): If `True` then each K is initialized by splitting clusters with the biggest
+               within-cluster error of the previous K (by default `False`), see `ksweep`.
+            - workers (uint): Amount of threads that process K values in parallel (by default 1), see `ksweep`.
 
         """
 
         self.__initializer = kwargs.get('initializer', kmeans_plusplus_initializer)
         self.__random_state = kwargs.get('random_state', None)
         self.__kstep = kwargs.get('kstep', 1)
+        self.__warm_start = kwargs.get('warm_start', False)
+        self.__workers = kwargs.get('workers', 1)
 
         self.__ccore = kwargs.get('ccore', True) or \
                        isinstance(self.__initializer, kmeans_plusplus_initializer) or \
@@ -112,6 +119,7 @@ class elbow:
         self.__wce = []
         self.__elbows = []
         self.__kvalue = -1
+        self.__times = {}
 
         self.__verify_arguments()
 
@@ -125,7 +133,7 @@ class elbow:
         @return
 
         """
-        if self.__ccore:
+        if self.__ccore and (self.__warm_start is False) and (self.__workers == 1):
             self.__process_by_ccore()
         else:
             self.__process_by_python()
@@ -151,15 +159,16 @@ class elbow:
 
     def __process_by_python(self):
         """!
-        @brief Performs processing using python implementation.
+        @brief Performs processing using python implementation, K values are processed by `ksweep`.
 
         """
-        for amount in range(self.__kmin, self.__kmax + 1, self.__kstep):
-            centers = self.__initializer(self.__data, amount, random_state=self.__random_state).initialize()
-            instance = kmeans(self.__data, centers, ccore=False)
-            instance.process()
+        kvalues = range(self.__kmin, self.__kmax + 1, self.__kstep)
+        sweep_instance = ksweep(self.__data, kvalues, kmeans, evaluator=lambda data, instance: instance.get_total_wce(),
+                                initializer=self.__initializer, random_state=self.__random_state,
+                                warm_start=self.__warm_start, workers=self.__workers, ccore=self.__ccore).process()
 
-            self.__wce.append(instance.get_total_wce())
+        self.__wce = [sweep_instance.get_results()[k] for k in kvalues]
+        self.__times = sweep_instance.get_times()
 
         self.__calculate_elbows()
         self.__find_optimal_kvalue()
@@ -183,6 +192,16 @@ class elbow:
         return self.__wce
 
 
+    def get_times(self):
+        """!
+        @brief Returns processing time of K-Means in seconds for each K value.
+        @details Time is measured only by Python implementation, empty dictionary is returned if C++ implementation
+                  is used.
+
+        """
+        return self.__times
+
+
     def __calculate_elbows(self):
         """!
         @brief Calculates potential elbows.
@@ -235,6 +254,9 @@ class elbow:
             raise ValueError("The search step is too high '%d' for analysis (amount of K for analysis is '%d'). "
                              "It is require to have at least three K to build elbow." % (self.__kstep, steps_to_process))
 
+        if self.__workers <= 0:
+            raise ValueError("Amount of workers (current value: '%d') should be greater than 0." % self.__workers)
+
         if len(self.__data) < self.__kmax:
             raise ValueError("K max value '%d' is greater than amount of points in data '%d'." %
                              (self.__kmax, len(self.__data)))
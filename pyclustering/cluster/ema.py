@@ -13,6 +13,9 @@
 import numpy
 import random
 
+import scipy.linalg
+import scipy.special
+
 from pyclustering.cluster import cluster_visualizer
 from pyclustering.cluster.center_initializer import kmeans_plusplus_initializer
 from pyclustering.cluster.kmeans import kmeans
@@ -80,6 +83,23 @@ class ema_init_type(IntEnum):
 
 
 
+class ema_covariance_type(IntEnum):
+    """!
+    @brief Enumeration of covariance types that are used by Expectation-Maximization algorithm.
+
+    """
+
+    ## Each cluster has its own general covariance matrix.
+    FULL = 0
+
+    ## Each cluster has its own diagonal covariance matrix (features are considered as independent).
+    DIAGONAL = 1
+
+    ## Each cluster has its own single variance that is used for all features.
+    SPHERICAL = 2
+
+
+
 class ema_initializer():
     """!
     @brief Provides services for preparing initial means and covariances for Expectation-Maximization algorithm.
@@ -468,11 +488,31 @@ class ema:
     final result (the last step) is on the right side:
     @image html ema_old_faithful_clustering.png
     
+    Probability densities are calculated in log-domain: each covariance matrix is factorized by Cholesky
+    decomposition once per iteration and log-densities of all points are obtained by one triangular solve, belong
+    probabilities are normalized using log-sum-exp, therefore high-dimensional data does not lead to underflow.
+    Diagonal and spherical covariances (see 'ema_covariance_type') reduce cost of each iteration and amount of
+    parameters that should be estimated:
+    @code
+        from pyclustering.cluster.ema import ema, ema_covariance_type
+        from pyclustering.utils import read_sample
+        from pyclustering.samples.definitions import FCPS_SAMPLES
+
+        sample = read_sample(FCPS_SAMPLES.SAMPLE_HEPTA)
+
+        ema_instance = ema(sample, 7, covariance_type=ema_covariance_type.DIAGONAL).process()
+        print(ema_instance.get_clusters())
+    @endcode
+
     @see ema_visualizer
     @see ema_observer
     
     """
-    def __init__(self, data, amount_clusters, means=None, variances=None, observer=None, tolerance=0.00001, iterations=100):
+
+    __VARIANCE_RELATIVE_FLOOR = 1e-6
+    __VARIANCE_ABSOLUTE_FLOOR = 1e-10
+
+    def __init__(self, data, amount_clusters, means=None, variances=None, observer=None, tolerance=0.00001, iterations=100, **kwargs):
         """!
         @brief Initializes Expectation-Maximization algorithm for cluster analysis.
         
@@ -488,14 +528,23 @@ class ema:
                     previous log-likelihood estimation is less then 'tolerance' then clustering is over).
         @param[in] iterations (uint): Additional stop condition parameter that defines maximum number of steps that can be
                     performed by the algorithm during clustering process.
-        
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'covariance_type').
+
+        <b>Keyword Args:</b><br>
+            - covariance_type (ema_covariance_type): Type of covariance of each cluster (by default
+               'ema_covariance_type.FULL').
+
         """
         
-        self.__data = numpy.array(data)
+        self.__data = numpy.array(data, dtype=numpy.float64)
+        if self.__data.ndim == 1:
+            self.__data = self.__data.reshape(-1, 1)
+
         self.__amount_clusters = amount_clusters
         self.__tolerance = tolerance
         self.__iterations = iterations
         self.__observer = observer
+        self.__covariance_type = kwargs.get('covariance_type', ema_covariance_type.FULL)
         
         self.__means = means
         self.__variances = variances
@@ -507,11 +556,13 @@ class ema:
             
             if len(self.__means) != amount_clusters:
                 self.__amount_clusters = len(self.__means)
-        
-        self.__rc = [ [0.0] * len(self.__data) for _ in range(amount_clusters) ]
-        self.__pic = [1.0] * amount_clusters
+
+        self.__means = [numpy.asarray(mean, dtype=numpy.float64).reshape(-1) for mean in self.__means]
+        self.__variances = [self.__restrict_covariance(variance) for variance in self.__variances]
+
+        self.__rc = numpy.zeros((self.__amount_clusters, len(self.__data)))
+        self.__pic = numpy.full(self.__amount_clusters, 1.0)
         self.__clusters = []
-        self.__gaussians = [ [] for _ in range(amount_clusters) ]
         self.__stop = False
 
 
@@ -528,7 +579,7 @@ class ema:
         
         current_iteration = 0
         while(self.__stop is False) and (abs(previous_likelihood - current_likelihood) > self.__tolerance) and (current_iteration < self.__iterations):
-            self.__expectation_step()
+            likelihood = self.__expectation_step()
             self.__maximization_step()
             
             current_iteration += 1
@@ -537,8 +588,7 @@ class ema:
             self.__notify()
             
             previous_likelihood = current_likelihood
-            current_likelihood = self.__log_likelihood()
-            self.__stop = self.__get_stop_condition()
+            current_likelihood = likelihood
         
         self.__normalize_probabilities()
         return self
@@ -568,7 +618,7 @@ class ema:
         
         """
         
-        return self.__variances
+        return self.__get_public_covariances()
 
 
     def get_probabilities(self):
@@ -590,147 +640,191 @@ class ema:
         
         """
         
-        return self.__rc
+        return self.__rc.tolist()
 
 
     def __erase_empty_clusters(self):
-        clusters, means, variances, pic, gaussians, rc = [], [], [], [], [], []
-
-        for index_cluster in range(len(self.__clusters)):
-            if len(self.__clusters[index_cluster]) > 0:
-                clusters.append(self.__clusters[index_cluster])
-                means.append(self.__means[index_cluster])
-                variances.append(self.__variances[index_cluster])
-                pic.append(self.__pic[index_cluster])
-                gaussians.append(self.__gaussians[index_cluster])
-                rc.append(self.__rc[index_cluster])
-        
-        if len(self.__clusters) != len(clusters):
-            self.__clusters, self.__means, self.__variances, self.__pic = clusters, means, variances, pic
-            self.__gaussians, self.__rc = gaussians, rc
+        non_empty = [index_cluster for index_cluster in range(len(self.__clusters))
+                     if len(self.__clusters[index_cluster]) > 0]
+
+        if len(self.__clusters) != len(non_empty):
+            self.__clusters = [self.__clusters[index_cluster] for index_cluster in non_empty]
+            self.__means = [self.__means[index_cluster] for index_cluster in non_empty]
+            self.__variances = [self.__variances[index_cluster] for index_cluster in non_empty]
+            self.__pic = self.__pic[non_empty]
+            self.__rc = self.__rc[non_empty]
             self.__amount_clusters = len(self.__clusters)
 
 
     def __notify(self):
         if self.__observer is not None:
-            self.__observer.notify(self.__means, self.__variances, self.__clusters)
+            self.__observer.notify(self.__means, self.__get_public_covariances(), self.__clusters)
+
+
+    def __get_public_covariances(self):
+        """!
+        @brief Returns covariances in the form that is provided to a user: variance in case of one-dimensional data
+                and covariance matrix otherwise.
+
+        @return (list) Variance or covariance matrix of each cluster.
+
+        """
+        if self.__data.shape[1] == 1:
+            return [covariance.item() for covariance in self.__variances]
+
+        return self.__variances
 
 
     def __extract_clusters(self):
-        self.__clusters = [[] for _ in range(self.__amount_clusters)]
-        for index_point in range(len(self.__data)):
-            candidates = []
-            for index_cluster in range(self.__amount_clusters):
-                candidates.append((index_cluster, self.__rc[index_cluster][index_point]))
-            
-            index_winner = max(candidates, key=lambda candidate: candidate[1])[0]
-            self.__clusters[index_winner].append(index_point)
-        
+        labels = numpy.argmax(self.__rc, axis=0)
+
+        order = numpy.argsort(labels, kind='stable')
+        borders = numpy.cumsum(numpy.bincount(labels, minlength=self.__amount_clusters))[:-1]
+        self.__clusters = [cluster.tolist() for cluster in numpy.split(order, borders)]
+
         self.__erase_empty_clusters()
 
 
-    def __log_likelihood(self):
-        likelihood = 0.0
-        
-        for index_point in range(len(self.__data)):
-            particle = 0.0
-            for index_cluster in range(self.__amount_clusters):
-                particle += self.__pic[index_cluster] * self.__gaussians[index_cluster][index_point]
+    def __expectation_step(self):
+        """!
+        @brief Calculates belong probability of each point to each cluster in log-domain.
 
-            if particle > 0.0:
-                likelihood += numpy.log(particle)
-        
-        return likelihood
+        @return (float) Log-likelihood of the current means, covariances and mixing coefficients.
 
+        """
+        log_probabilities = numpy.log(self.__pic)[:, numpy.newaxis] + self.__calculate_log_densities()
+        log_normalization = scipy.special.logsumexp(log_probabilities, axis=0)
 
-    def __probabilities(self, index_cluster, index_point):
-        divider = 0.0
-        for i in range(self.__amount_clusters):
-            divider += self.__pic[i] * self.__gaussians[i][index_point]
-        
-        if (divider != 0.0) and (divider != float('inf')):
-            return self.__pic[index_cluster] * self.__gaussians[index_cluster][index_point] / divider
-        
-        return 1.0
+        self.__rc = numpy.exp(log_probabilities - log_normalization)
+        return float(numpy.sum(log_normalization))
 
 
-    def __expectation_step(self):
-        self.__gaussians = [ [] for _ in range(self.__amount_clusters) ]
-        for index in range(self.__amount_clusters):
-            self.__gaussians[index] = gaussian(self.__data, self.__means[index], self.__variances[index])
-        
-        self.__rc = [ [0.0] * len(self.__data) for _ in range(self.__amount_clusters) ]
+    def __calculate_log_densities(self):
+        """!
+        @brief Calculates logarithm of gaussian density of each point for each cluster.
+        @details Each covariance matrix is factorized once, log-densities of all points are calculated by one
+                  triangular solve in case of full covariance and by one matrix product in case of diagonal and
+                  spherical covariances.
+
+        @return (numpy.array) Log-densities where rows correspond to clusters and columns to points.
+
+        """
+        dimension = self.__data.shape[1]
+        log_densities = numpy.empty((self.__amount_clusters, len(self.__data)))
+
         for index_cluster in range(self.__amount_clusters):
-            for index_point in range(len(self.__data)):
-                self.__rc[index_cluster][index_point] = self.__probabilities(index_cluster, index_point)
+            deviations = self.__data - self.__means[index_cluster]
+            covariance = self.__variances[index_cluster]
+
+            if self.__covariance_type == ema_covariance_type.FULL:
+                cholesky = self.__factorize_covariance(covariance)
+                solution = scipy.linalg.solve_triangular(cholesky, deviations.T, lower=True, check_finite=False)
+
+                mahalanobis = numpy.einsum('ij,ij->j', solution, solution)
+                log_determinant = 2.0 * numpy.sum(numpy.log(numpy.abs(numpy.diag(cholesky))))
+
+            else:
+                variances = self.__floor_variances(numpy.diag(covariance))
+
+                mahalanobis = numpy.dot(deviations * deviations, 1.0 / variances)
+                log_determinant = numpy.sum(numpy.log(variances))
+
+            log_densities[index_cluster] = -0.5 * (dimension * numpy.log(2.0 * pi) + log_determinant + mahalanobis)
+
+        return log_densities
+
+
+    def __factorize_covariance(self, covariance):
+        """!
+        @brief Calculates lower triangular factor L of covariance matrix where L * L^T is equal to the matrix.
+        @details Eigenvalues of singular covariance matrix (for example, cluster that consists of one point) are
+                  restricted from below before factorization.
+
+        @param[in] covariance (numpy.array): Covariance matrix.
+
+        @return (numpy.array) Lower triangular factor.
+
+        """
+        try:
+            return scipy.linalg.cholesky(covariance, lower=True, check_finite=False)
+        except scipy.linalg.LinAlgError:
+            values, vectors = scipy.linalg.eigh(covariance, check_finite=False)
+            root = vectors * numpy.sqrt(self.__floor_variances(values))
+
+            # root * root^T = R^T * R where R is obtained by QR decomposition of root^T
+            return scipy.linalg.qr(root.T, mode='r', check_finite=False)[0].T
+
+
+    def __floor_variances(self, variances):
+        """!
+        @brief Restricts variances (or eigenvalues of covariance matrix) from below to avoid degenerate densities.
+
+        @param[in] variances (numpy.array): Variances that should be restricted.
+
+        @return (numpy.array) Restricted variances.
+
+        """
+        floor = max(float(numpy.max(variances)) * ema.__VARIANCE_RELATIVE_FLOOR, ema.__VARIANCE_ABSOLUTE_FLOOR)
+        return numpy.maximum(variances, floor)
 
 
     def __maximization_step(self):
-        self.__pic = []
-        self.__means = []
+        masses = numpy.sum(self.__rc, axis=1)
+
+        possible_clusters = masses > 0.0
+        self.__rc, masses = self.__rc[possible_clusters], masses[possible_clusters]
+        self.__amount_clusters = len(masses)
+
+        self.__pic = masses / len(self.__data)
+
+        means = numpy.dot(self.__rc, self.__data) / masses[:, numpy.newaxis]
+        self.__means = list(means)
         self.__variances = []
-        
-        amount_impossible_clusters = 0
-        
+
         for index_cluster in range(self.__amount_clusters):
-            mc = numpy.sum(self.__rc[index_cluster])
-            
-            if mc == 0.0:
-                amount_impossible_clusters += 1
-                continue
-            
-            self.__pic.append( mc / len(self.__data) )
-            self.__means.append( self.__update_mean(self.__rc[index_cluster], mc) )
-            self.__variances.append( self.__update_covariance(self.__means[-1], self.__rc[index_cluster], mc) )
-        
-        self.__amount_clusters -= amount_impossible_clusters
+            deviations = self.__data - means[index_cluster]
+            weights = self.__rc[index_cluster]
 
+            if self.__covariance_type == ema_covariance_type.FULL:
+                covariance = numpy.dot((deviations * weights[:, numpy.newaxis]).T, deviations) / masses[index_cluster]
+            else:
+                covariance = numpy.diag(numpy.dot(weights, deviations * deviations) / masses[index_cluster])
 
-    def __get_stop_condition(self):
-        for covariance in self.__variances:
-            if numpy.linalg.norm(covariance) == 0.0:
-                return True
-        
-        return False
+            self.__variances.append(self.__restrict_covariance(covariance))
 
+        self.__stop = any(numpy.linalg.norm(covariance) == 0.0 for covariance in self.__variances)
 
-    def __update_covariance(self, means, rc, mc):
-        covariance = 0.0
-        for index_point in range(len(self.__data)):
-            deviation = numpy.array([self.__data[index_point] - means])
-            covariance += rc[index_point] * deviation.T.dot(deviation)
-        
-        covariance = covariance / mc
-        return covariance
 
+    def __restrict_covariance(self, variance):
+        """!
+        @brief Converts variance or covariance matrix to covariance matrix of the used covariance type.
 
-    def __update_mean(self, rc, mc):
-        mean = 0.0
-        for index_point in range(len(self.__data)):
-            mean += rc[index_point] * self.__data[index_point]
-        
-        mean = mean / mc
-        return mean
+        @param[in] variance (float|array_like): Variance or covariance matrix.
 
+        @return (numpy.array) Covariance matrix (dimension x dimension).
 
-    def __normalize_probabilities(self):
-        for index_point in range(len(self.__data)):
-            probability = 0.0
-            for index_cluster in range(len(self.__clusters)):
-                probability += self.__rc[index_cluster][index_point]
-            
-            if abs(probability - 1.0) > 0.000001:
-                self.__normalize_probability(index_point, probability)
+        """
+        dimension = self.__data.shape[1]
 
+        covariance = numpy.asarray(variance, dtype=numpy.float64)
+        if covariance.size == 1:
+            covariance = numpy.eye(dimension) * covariance.item()
+        else:
+            covariance = covariance.reshape(dimension, dimension)
 
-    def __normalize_probability(self, index_point, probability):
-        if probability == 0.0:
-            return
-        
-        normalization = 1.0 / probability
+        if self.__covariance_type == ema_covariance_type.DIAGONAL:
+            covariance = numpy.diag(numpy.diag(covariance))
+        elif self.__covariance_type == ema_covariance_type.SPHERICAL:
+            covariance = numpy.eye(dimension) * numpy.mean(numpy.diag(covariance))
 
-        for index_cluster in range(len(self.__clusters)):
-            self.__rc[index_cluster][index_point] *= normalization
+        return covariance
+
+
+    def __normalize_probabilities(self):
+        probabilities = numpy.sum(self.__rc, axis=0)
+
+        normalized = probabilities > 0.0
+        self.__rc[:, normalized] /= probabilities[normalized]
 
 
     def __verify_arguments(self):
@@ -744,3 +838,7 @@ class ema:
         if self.__amount_clusters < 1:
             raise ValueError("Amount of clusters (current value '%d') should be greater or equal to 1." %
                              self.__amount_clusters)
+
+        if self.__covariance_type not in (ema_covariance_type.FULL, ema_covariance_type.DIAGONAL,
+                                          ema_covariance_type.SPHERICAL):
+            raise ValueError("Unknown covariance type '%s' is specified." % str(self.__covariance_type))
@@ -11,13 +11,14 @@
 
 
 import numpy
+import scipy.sparse
 
 import pyclustering.core.fcm_wrapper as wrapper
 
-from pyclustering.core.wrapper import ccore_library
+from pyclustering.core.wrapper import ccore_library, ccore_async_processing
 
 
-class fcm:
+class fcm(ccore_async_processing):
     """!
     @brief Class represents Fuzzy C-means (FCM) clustering algorithm.
     @details Fuzzy clustering is a form of clustering in which each data point can belong to more than one cluster.
@@ -34,6 +35,15 @@ class fcm:
 
     CCORE implementation of the algorithm uses thread pool to parallelize the clustering process.
 
+    Python implementation processes data by blocks of `chunk_size` points: membership of points of a block is
+    calculated and accumulated to centers at once, therefore the whole membership matrix is not kept during
+    clustering. Computations might be performed in single precision (`dtype=numpy.float32`) and only the `top_m`
+    biggest memberships of each point might be stored in the result using sparse matrix:
+    @code
+        fcm_instance = fcm(sample, initial_centers, ccore=False, dtype=numpy.float32, top_m=2).process()
+        membership = fcm_instance.get_membership()   # scipy.sparse.csr_matrix
+    @endcode
+
     Here is an example how to perform cluster analysis using Fuzzy C-Means algorithm:
     @code
         from pyclustering.samples.definitions import FAMOUS_SAMPLES
@@ -96,7 +106,8 @@ class fcm:
 
         @param[in] data (array_like): Input data that is presented as array of points (objects), each point should be represented by array_like data structure.
         @param[in] initial_centers (array_like): Initial coordinates of centers of clusters that are represented by array_like data structure: [center1, center2, ...].
-        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'tolerance', 'itermax', 'm').
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'ccore', 'tolerance', 'itermax', 'm',
+                    'chunk_size', 'dtype', 'top_m').
 
         <b>Keyword Args:</b><br>
             - ccore (bool): Defines should be CCORE library (C++ pyclustering library) used instead of Python code or not.
@@ -104,6 +115,13 @@ class fcm:
             - itermax (uint): Maximum number of iterations that is used for clustering process (by default: 200).
             - m (float): Hyper-parameter that controls how fuzzy the cluster will be. The higher it is, the fuzzier the cluster will be in the end.
                This parameter should be greater than 1 (by default: 2).
+            - chunk_size (uint): Amount of points that are processed at once by python implementation, it bounds
+               memory usage by 'chunk_size' x 'amount of centers' (by default: 4096).
+            - dtype (type): Floating point type that is used by python implementation: `numpy.float64` or
+               `numpy.float32` (by default: `numpy.float64`).
+            - top_m (uint): If it is specified then only `top_m` biggest memberships of each point are stored and
+               membership is returned as `scipy.sparse.csr_matrix`, python implementation is used in this case (by
+               default all memberships are stored).
 
         """
 
@@ -118,7 +136,14 @@ class fcm:
 
         self.__degree = 2.0 / (self.__m - 1)
 
+        self.__chunk_size = kwargs.get('chunk_size', 4096)
+        self.__dtype = kwargs.get('dtype', numpy.float64)
+        self.__top_m = kwargs.get('top_m', None)
+
         self.__ccore = kwargs.get('ccore', True)
+        if (self.__top_m is not None) or (numpy.dtype(self.__dtype) != numpy.float64):
+            self.__ccore = False
+
         if self.__ccore is True:
             self.__ccore = ccore_library.workable()
 
@@ -180,7 +205,9 @@ class fcm:
         @brief Returns cluster membership (probability) for each point in data.
 
         @return (array_like) Membership for each point in format [[Px1(c1), Px1(c2), ...], [Px2(c1), Px2(c2), ...], ...],
-                 where [Px1(c1), Px1(c2), ...] membership for point x1.
+                 where [Px1(c1), Px1(c2), ...] membership for point x1. If argument 'top_m' is specified then
+                 membership is returned as 'scipy.sparse.csr_matrix' that contains only 'top_m' the biggest
+                 memberships of each point.
 
         @see process()
         @see get_clusters()
@@ -207,62 +234,130 @@ class fcm:
         @brief Performs cluster analysis using Python implementation.
 
         """
-        self.__data = numpy.array(self.__data)
-        self.__centers = numpy.array(self.__centers)
+        self.__data = numpy.asarray(self.__data, dtype=self.__dtype)
+        self.__centers = numpy.asarray(self.__centers, dtype=self.__dtype)
 
-        self.__membership = numpy.zeros((len(self.__data), len(self.__centers)))
+        previous_centers = self.__centers
 
         change = float('inf')
         iteration = 0
 
         while change > self.__tolerance and iteration < self.__itermax:
-            self.__update_membership()
             centers = self.__calculate_centers()
             change = self.__calculate_changes(centers)
 
+            previous_centers = self.__centers
             self.__centers = centers
             iteration += 1
 
-        self.__extract_clusters()
+        if iteration > 0:
+            labels = self.__update_membership(previous_centers)
+        else:
+            labels = numpy.zeros(len(self.__data), dtype=numpy.intp)
+            self.__membership = numpy.zeros((len(self.__data), len(self.__centers)), dtype=self.__dtype)
+            if self.__top_m is not None:
+                self.__membership = scipy.sparse.csr_matrix(self.__membership)
+
+        self.__extract_clusters(labels)
 
 
     def __calculate_centers(self):
         """!
         @brief Calculate center using membership of each cluster.
-
-        @return (list) Updated clusters as list of clusters. Each cluster contains indexes of objects from data.
+        @details Membership is calculated for each block of points and accumulated to centers, therefore only
+                  membership of one block is kept in memory.
 
         @return (numpy.array) Updated centers.
 
         """
-        dimension = self.__data.shape[1]
-        centers = numpy.zeros((len(self.__centers), dimension))
+        dividend = numpy.zeros((len(self.__centers), self.__data.shape[1]), dtype=numpy.float64)
+        divider = numpy.zeros(len(self.__centers), dtype=numpy.float64)
+
+        for index_begin in range(0, len(self.__data), self.__chunk_size):
+            block = self.__data[index_begin:index_begin + self.__chunk_size]
+            membership = self.__calculate_block_membership(block)
 
-        for i in range(len(self.__centers)):
             # multiplication '@' requires python version 3.5
-            centers[i] = numpy.divide(self.__membership[:, i] @ self.__data, numpy.sum(self.__membership[:, i]))
+            dividend += membership.T @ block
+            divider += numpy.sum(membership, axis=0)
 
-        return centers
+        return (dividend / divider[:, numpy.newaxis]).astype(self.__dtype)
 
 
-    def __update_membership(self):
+    def __update_membership(self, centers):
         """!
-        @brief Update membership for each point in line with current cluster centers.
+        @brief Update membership for each point in line with specified cluster centers.
+
+        @param[in] centers (numpy.array): Cluster centers.
+
+        @return (numpy.array) Index of cluster with the biggest membership for each point.
 
         """
-        data_difference = numpy.zeros((len(self.__centers), len(self.__data)))
+        amount_points, amount_centers = len(self.__data), len(centers)
+        labels = numpy.empty(amount_points, dtype=numpy.intp)
+
+        top_m = self.__top_m
+        if top_m is None:
+            self.__membership = numpy.empty((amount_points, amount_centers), dtype=self.__dtype)
+        else:
+            top_m = min(top_m, amount_centers)
+            indexes = numpy.empty((amount_points, top_m), dtype=numpy.intp)
+            values = numpy.empty((amount_points, top_m), dtype=self.__dtype)
 
-        for i in range(len(self.__centers)):
-            data_difference[i] = numpy.sum(numpy.square(self.__data - self.__centers[i]), axis=1)
+        for index_begin in range(0, amount_points, self.__chunk_size):
+            index_end = min(index_begin + self.__chunk_size, amount_points)
+            membership = self.__calculate_block_membership(self.__data[index_begin:index_end], centers)
 
-        for i in range(len(self.__data)):
-            for j in range(len(self.__centers)):
-                divider = sum([pow(data_difference[j][i] / data_difference[k][i], self.__degree) for k in range(len(self.__centers)) if data_difference[k][i] != 0.0])
+            labels[index_begin:index_end] = numpy.argmax(membership, axis=1)
 
-                if divider != 0.0:
-                    self.__membership[i][j] = 1.0 / divider
-                else:
-                    self.__membership[i][j] = 1.0
+            if top_m is None:
+                self.__membership[index_begin:index_end] = membership
+            else:
+                block_indexes = numpy.argpartition(membership, amount_centers - top_m, axis=1)[:, amount_centers - top_m:]
+                block_indexes.sort(axis=1)
+
+                indexes[index_begin:index_end] = block_indexes
+                values[index_begin:index_end] = numpy.take_along_axis(membership, block_indexes, axis=1)
+
+        if top_m is not None:
+            index_pointer = numpy.arange(0, amount_points * top_m + 1, top_m)
+            self.__membership = scipy.sparse.csr_matrix((values.reshape(-1), indexes.reshape(-1), index_pointer),
+                                                        shape=(amount_points, amount_centers))
+
+        return labels
+
+
+    def __calculate_block_membership(self, block, centers=None):
+        """!
+        @brief Calculate membership of each point of the block.
+        @details Membership is calculated using ratios of square distances to the closest center, therefore powers
+                  of very small or very big distances do not overflow. If a point coincides with a center then its
+                  membership to the center is 1.0.
+
+        @param[in] block (numpy.array): Block of points.
+        @param[in] centers (numpy.array): Cluster centers, if 'None' then current centers are used.
+
+        @return (numpy.array) Membership matrix where rows correspond to points and columns to centers.
+
+        """
+        if centers is None:
+            centers = self.__centers
+
+        centers = numpy.broadcast_to(centers, (len(centers), block.shape[1]))
+
+        distances = numpy.zeros((len(block), len(centers)), dtype=self.__dtype)
+        for index_dimension in range(block.shape[1]):
+            differences = numpy.subtract.outer(block[:, index_dimension], centers[:, index_dimension])
+            distances += numpy.multiply(differences, differences, out=differences)
+
+        is_zero = (distances == 0.0)
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            nearest = numpy.min(numpy.where(is_zero, numpy.inf, distances), axis=1, keepdims=True)
+            ratios = numpy.where(is_zero, 0.0, numpy.power(nearest / distances, self.__degree)).astype(self.__dtype)
+            membership = ratios / numpy.sum(ratios, axis=1, keepdims=True)
+
+        membership[is_zero] = 1.0
+        return membership
 
 
     def __calculate_changes(self, updated_centers):
@@ -276,12 +371,16 @@ class fcm:
         return numpy.max(changes)
 
 
-    def __extract_clusters(self):
-        self.__clusters = [[] for i in range(len(self.__centers))]
-        belongs = numpy.argmax(self.__membership, axis=1)
+    def __extract_clusters(self, labels):
+        """!
+        @brief Allocate each point to the cluster with the biggest membership.
+
+        @param[in] labels (numpy.array): Index of cluster with the biggest membership for each point.
 
-        for i in range(len(belongs)):
-            self.__clusters[belongs[i]].append(i)
+        """
+        order = numpy.argsort(labels, kind='stable')
+        borders = numpy.cumsum(numpy.bincount(labels, minlength=len(self.__centers)))[:-1]
+        self.__clusters = [cluster.tolist() for cluster in numpy.split(order, borders)]
 
 
     def __verify_arguments(self):
@@ -294,3 +393,14 @@ class fcm:
 
         if len(self.__centers) == 0:
             raise ValueError("Initial centers are empty (size: '%d')." % len(self.__centers))
+
+        if self.__chunk_size <= 0:
+            raise ValueError("Chunk size (current value: '%d') should be greater than 0." % self.__chunk_size)
+
+        if numpy.dtype(self.__dtype) not in (numpy.float32, numpy.float64):
+            raise ValueError("Floating point type (current value: '%s') should be 'numpy.float32' or "
+                             "'numpy.float64'." % str(self.__dtype))
+
+        if (self.__top_m is not None) and (self.__top_m <= 0):
+            raise ValueError("Amount of stored memberships (current value: '%d') should be greater than 0." %
+                             self.__top_m)
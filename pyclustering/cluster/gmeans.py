@@ -10,11 +10,13 @@
 """
 
 
+import concurrent.futures
+
 import numpy
 import scipy.stats
 
 from pyclustering.core.gmeans_wrapper import gmeans as gmeans_wrapper
-from pyclustering.core.wrapper import ccore_library
+from pyclustering.core.wrapper import ccore_library, ccore_async_processing
 
 from pyclustering.cluster.center_initializer import kmeans_plusplus_initializer
 from pyclustering.cluster.encoder import type_encoding
@@ -22,7 +24,7 @@ from pyclustering.cluster.kmeans import kmeans
 from pyclustering.utils import distance_metric, type_metric
 
 
-class gmeans:
+class gmeans(ccore_async_processing):
     """!
     @brief Class implements G-Means clustering algorithm.
     @details The G-means algorithm starts with a small number of centers, and grows the number of centers.
@@ -115,7 +117,8 @@ class gmeans:
         @param[in] k_init (uint): Initial amount of centers (by default started search from 1).
         @param[in] ccore (bool): Defines whether CCORE library (C/C++ part of the library) should be used instead of
                     Python code.
-        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: `tolerance`, `repeat`, `k_max`, `random_state`).
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: `tolerance`, `repeat`, `k_max`, `random_state`,
+                    `processes`).
 
         <b>Keyword Args:</b><br>
             - tolerance (double): tolerance (double): Stop condition for each K-Means iteration: if maximum value of
@@ -126,9 +129,11 @@ class gmeans:
                condition. When the maximum amount is reached then algorithm stops processing. By default the maximum
                amount of clusters is not restricted (`k_max` is -1).
             - random_state (int): Seed for random state (by default is `None`, current system time is used).
+            - processes (uint): Amount of processes that are used by Python implementation to test clusters (by
+               default 1, clusters are tested in the current process). Results do not depend on amount of processes.
 
         """
-        self.__data = data
+        self.__data = numpy.asarray(data, dtype=numpy.float64)
         self.__k_init = k_init
 
         self.__clusters = []
@@ -140,6 +145,10 @@ class gmeans:
         self.__repeat = kwargs.get('repeat', 3)
         self.__k_max = kwargs.get('k_max', -1)
         self.__random_state = kwargs.get('random_state', None)
+        self.__processes = kwargs.get('processes', 1)
+
+        # results of statistical test of clusters that are not changed since the previous iteration
+        self.__tested_clusters = {}
 
         if self.__ccore is True:
             self.__ccore = ccore_library.workable()
@@ -271,12 +280,24 @@ class gmeans:
     def _statistical_optimization(self):
         """!
         @brief Try to split cluster into two to find optimal amount of clusters.
+        @details Result of the test is remembered for each cluster, a cluster is tested again only if it has been
+                  changed by K-Means since the previous iteration. Clusters that should be tested are processed in
+                  parallel processes if argument `processes` is greater than 1.
 
         """
+        keys = [numpy.asarray(cluster, dtype=numpy.int64).tobytes() for cluster in self.__clusters]
+        untested = [index for index in range(len(keys)) if keys[index] not in self.__tested_clusters]
+
+        results = self._test_clusters([self.__clusters[index] for index in untested])
+
+        tested_clusters = {key: self.__tested_clusters[key] for key in keys if key in self.__tested_clusters}
+        tested_clusters.update((keys[index], result) for index, result in zip(untested, results))
+        self.__tested_clusters = tested_clusters
+
         centers = []
         potential_amount_clusters = len(self.__clusters)
         for index in range(len(self.__clusters)):
-            new_centers = self._split_and_search_optimal(self.__clusters[index])
+            new_centers = self.__tested_clusters[keys[index]]
             if (new_centers is None) or ((self.__k_max != -1) and (potential_amount_clusters >= self.__k_max)):
                 centers.append(self.__centers[index])
             else:
@@ -286,6 +307,24 @@ class gmeans:
         self.__centers = centers
 
 
+    def _test_clusters(self, clusters):
+        """!
+        @brief Splits each cluster into two and checks correctness by Anderson-Darling test.
+
+        @param[in] clusters (list): Clusters that should be tested.
+
+        @return (list) Result of `_split_and_search_optimal` for each cluster.
+
+        """
+        if (self.__processes > 1) and (len(clusters) > 1):
+            processes = min(self.__processes, len(clusters))
+            chunk_size = -(-len(clusters) // processes)
+            with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as executor:
+                return list(executor.map(self._split_and_search_optimal, clusters, chunksize=chunk_size))
+
+        return [self._split_and_search_optimal(cluster) for cluster in clusters]
+
+
     def _split_and_search_optimal(self, cluster):
         """!
         @brief Split specified cluster into two by performing K-Means clustering and check correctness by
@@ -299,7 +338,7 @@ class gmeans:
         if len(cluster) == 1:
             return None
 
-        points = [self.__data[index_point] for index_point in cluster]
+        points = self.__data[numpy.asarray(cluster, dtype=numpy.int64)]
         new_clusters, new_centers, _ = self._search_optimal_parameters(points, 2)
 
         if len(new_centers) > 1:
@@ -345,8 +384,9 @@ class gmeans:
         @return (array_like) Transformed 1-dimensional data.
 
         """
-        square_norm = numpy.sum(numpy.multiply(vector, vector))
-        return numpy.divide(numpy.sum(numpy.multiply(data, vector), axis=1), square_norm)
+        vector = numpy.asarray(vector, dtype=numpy.float64)
+        square_norm = numpy.dot(vector, vector)
+        return numpy.dot(data, vector) / square_norm
 
 
     def _search_optimal_parameters(self, data, amount):
@@ -428,3 +468,6 @@ class gmeans:
 
         if (self.__k_max != -1) and (self.__k_max < self.__k_init):
             raise ValueError("Initial amount of clusters should be less than the maximum amount 'k_max'.")
+
+        if self.__processes <= 0:
+            raise ValueError("Amount of processes (current value: '%d') should be greater than 0." % self.__processes)
@@ -12,18 +12,45 @@
 import copy
 import numpy
 
+from enum import IntEnum
+
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 
 import pyclustering.core.kmeans_wrapper as wrapper
 
-from pyclustering.core.wrapper import ccore_library
+from pyclustering.core.wrapper import ccore_library, ccore_async_processing
 from pyclustering.core.metric_wrapper import metric_wrapper
 
 from pyclustering.cluster.encoder import type_encoding
+from pyclustering.cluster.center_initializer import kmeans_plusplus_initializer
 from pyclustering.cluster import cluster_visualizer
 
-from pyclustering.utils.metric import distance_metric, type_metric
+from pyclustering.utils.metric import distance_metric, type_metric, euclidean_distance_square_matrix
+
+
+class kmeans_algorithm_type(IntEnum):
+    """!
+    @brief Enumeration of algorithms that are used by K-Means to assign points to clusters.
+    @details All algorithms produce the same clustering results, but accelerated algorithms use triangle inequality
+              to avoid distance calculations for points that cannot change their clusters. Accelerated algorithms are
+              applicable only for Euclidean and square Euclidean metrics.
+
+    """
+
+    ## Standard algorithm that calculates distance from each point to each center on each iteration.
+    LLOYD = 0
+
+    ## Elkan's algorithm that keeps upper bound of distance to the assigned center and lower bound of distance to
+    ## each center for each point @cite inproceedings::kmeans::elkan. It performs minimal amount of distance
+    ## calculations, but requires N x K memory for lower bounds. Suitable for data with big dimension.
+    ELKAN = 1
+
+    ## Hamerly's algorithm that keeps upper bound of distance to the assigned center and only one lower bound of
+    ## distance to the second closest center for each point @cite inproceedings::kmeans::hamerly. Suitable for data
+    ## with low or moderate dimension.
+    HAMERLY = 2
+
 
 
 class kmeans_observer:
@@ -263,7 +290,7 @@ class kmeans_visualizer:
 
 
 
-class kmeans:
+class kmeans(ccore_async_processing):
     """!
     @brief Class implements K-Means clustering algorithm.
     @details K-Means clustering aims to partition n observations into k clusters in which each observation belongs to
@@ -305,7 +332,18 @@ class kmeans:
         kmeans_visualizer.show_clusters(sample, clusters, final_centers)
     @endcode
 
-    Example #2 - Clustering using specific distance metric, for example, Manhattan distance:
+    Example #2 - Clustering with several restarts where the first one uses specified initial centers and others are
+    initialized by K-Means++, the result with the smallest total within-cluster errors is returned:
+    @code
+        initial_centers = kmeans_plusplus_initializer(sample, 2, random_state=1000).initialize()
+
+        kmeans_instance = kmeans(sample, initial_centers, n_init=20, random_state=1000).process()
+
+        print("Total WCE of the best restart:", kmeans_instance.get_total_wce())
+        print("Total WCE of each restart:", kmeans_instance.get_restarts_wce())
+    @endcode
+
+    Example #3 - Clustering using specific distance metric, for example, Manhattan distance:
     @code
         # prepare input data and initial centers for cluster analysis using K-Means
 
@@ -335,14 +373,25 @@ class kmeans:
         @param[in] initial_centers (array_like): Initial coordinates of centers of clusters that are represented by array_like data structure: [center1, center2, ...].
         @param[in] tolerance (double): Stop condition: if maximum value of change of centers of clusters is less than tolerance then algorithm stops processing.
         @param[in] ccore (bool): Defines should be CCORE library (C++ pyclustering library) used instead of Python code or not.
-        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'observer', 'metric', 'itermax').
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'observer', 'metric', 'itermax', 'chunk_size', 'algorithm',
+                    'n_init', 'random_state').
         
         <b>Keyword Args:</b><br>
             - observer (kmeans_observer): Observer of the algorithm to collect information about clustering process on each iteration.
             - metric (distance_metric): Metric that is used for distance calculation between two points (by default euclidean square distance).
             - itermax (uint): Maximum number of iterations that is used for clustering process (by default: 200).
+            - chunk_size (uint): Amount of points that are processed at once by python implementation during distance
+               calculation, it bounds memory usage by 'chunk_size' x 'amount of centers' (by default: 4096).
+            - algorithm (kmeans_algorithm_type): Algorithm that is used to assign points to clusters, accelerated
+               algorithms require Euclidean or square Euclidean metric (by default: 'kmeans_algorithm_type.LLOYD').
+            - n_init (uint): Amount of restarts, the first restart uses 'initial_centers', others use centers that are
+               initialized by K-Means++ with the same amount of centers. Restarts share input data and they are
+               processed in parallel by CCORE, the result with the smallest total WCE is returned (by default: 1).
+               Observer is not supported in case of several restarts.
+            - random_state (int): Seed for K-Means++ that initializes centers of restarts (by default: `None`).
         
         @see center_initializer
+        @see kmeans_algorithm_type
         
         """
         self.__pointer_data = numpy.array(data)
@@ -354,6 +403,15 @@ class kmeans:
         self.__observer = kwargs.get('observer', None)
         self.__metric = copy.copy(kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE)))
         self.__itermax = kwargs.get('itermax', 100)
+        self.__chunk_size = kwargs.get('chunk_size', 4096)
+        self.__algorithm = kwargs.get('algorithm', kmeans_algorithm_type.LLOYD)
+        self.__n_init = kwargs.get('n_init', 1)
+        self.__random_state = kwargs.get('random_state', None)
+        self.__restarts_wce = []
+
+        self.__labels = None
+        self.__upper_bounds = None
+        self.__lower_bounds = None
 
         if self.__metric.get_type() != type_metric.USER_DEFINED:
             self.__metric.enable_numpy_usage()
@@ -381,10 +439,15 @@ class kmeans:
         if len(self.__pointer_data[0]) != len(self.__centers[0]):
             raise ValueError("Dimension of the input data and dimension of the initial cluster centers must be equal.")
 
-        if self.__ccore is True:
-            self.__process_by_ccore()
+        if self.__n_init > 1:
+            self.__process_restarts()
         else:
-            self.__process_by_python()
+            if self.__ccore is True:
+                self.__process_by_ccore()
+            else:
+                self.__process_by_python()
+
+            self.__restarts_wce = [self.__total_wce]
 
         return self
 
@@ -397,7 +460,7 @@ class kmeans:
         ccore_metric = metric_wrapper.create_instance(self.__metric)
 
         results = wrapper.kmeans(self.__pointer_data, self.__centers, self.__tolerance, self.__itermax,
-                                 (self.__observer is not None), ccore_metric.get_pointer())
+                                 (self.__observer is not None), ccore_metric.get_pointer(), self.__algorithm)
 
         self.__clusters = results[0]
         self.__centers = results[1]
@@ -409,6 +472,41 @@ class kmeans:
         self.__total_wce = results[4][0]
 
 
+    def __process_restarts(self):
+        """!
+        @brief Performs cluster analysis several times using different initial centers, result with the smallest
+                total within-cluster errors is kept.
+
+        """
+        initializer = kmeans_plusplus_initializer(self.__pointer_data, len(self.__centers),
+                                                  random_state=self.__random_state)
+
+        initial_centers = [self.__centers]
+        initial_centers += [numpy.array(initializer.initialize()) for _ in range(self.__n_init - 1)]
+
+        if self.__ccore is True:
+            ccore_metric = metric_wrapper.create_instance(self.__metric)
+            results = wrapper.kmeans_restarts(self.__pointer_data, initial_centers, self.__tolerance,
+                                              self.__itermax, ccore_metric.get_pointer(), self.__algorithm)
+
+            self.__clusters, self.__centers = results[0], results[1]
+            self.__total_wce, self.__restarts_wce = results[2][0], results[3]
+            return
+
+        best_result = None
+        self.__restarts_wce = []
+
+        for centers in initial_centers:
+            self.__clusters, self.__centers = [], centers
+            self.__process_by_python()
+
+            self.__restarts_wce.append(self.__total_wce)
+            if (best_result is None) or (self.__total_wce < best_result[2]):
+                best_result = (self.__clusters, self.__centers, self.__total_wce)
+
+        self.__clusters, self.__centers, self.__total_wce = best_result
+
+
     def __process_by_python(self):
         """!
         @brief Performs cluster analysis using python code.
@@ -417,24 +515,30 @@ class kmeans:
 
         maximum_change = float('inf')
         iteration = 0
+        labels = None
+
+        self.__labels = None
 
         if self.__observer is not None:
-            initial_clusters = self.__update_clusters()
+            initial_clusters, _ = self.__update_clusters()
             self.__observer.notify(initial_clusters, self.__centers.tolist())
 
         while maximum_change > self.__tolerance and iteration < self.__itermax:
-            self.__clusters = self.__update_clusters()
-            updated_centers = self.__update_centers()  # changes should be calculated before assignment
+            self.__clusters, labels = self.__update_clusters()
+            updated_centers = self.__update_centers(labels)  # changes should be calculated before assignment
 
             if self.__observer is not None:
                 self.__observer.notify(self.__clusters, updated_centers.tolist())
 
             maximum_change = self.__calculate_changes(updated_centers)
 
+            if self.__algorithm != kmeans_algorithm_type.LLOYD:
+                self.__update_bounds(updated_centers)
+
             self.__centers = updated_centers    # assign center after change calculation
             iteration += 1
 
-        self.__calculate_total_wce()
+        self.__calculate_total_wce(labels)
 
 
     def predict(self, points):
@@ -452,14 +556,7 @@ class kmeans:
         if len(self.__clusters) == 0:
             return []
 
-        differences = numpy.zeros((len(nppoints), len(self.__centers)))
-        for index_point in range(len(nppoints)):
-            if self.__metric.get_type() != type_metric.USER_DEFINED:
-                differences[index_point] = self.__metric(nppoints[index_point], self.__centers)
-            else:
-                differences[index_point] = [self.__metric(nppoints[index_point], center) for center in self.__centers]
-
-        return numpy.argmin(differences, axis=1)
+        return self.__calculate_nearest_centers(nppoints, numpy.array(self.__centers))
 
 
     def get_clusters(self):
@@ -503,6 +600,20 @@ class kmeans:
         return self.__total_wce
 
 
+    def get_restarts_wce(self):
+        """!
+        @brief Returns total within-cluster errors of each restart in case of several restarts ('n_init').
+
+        @return (list) Total WCE of each restart, the first one corresponds to specified initial centers. Empty list
+                 is returned if 'process()' method was not called.
+
+        @see get_total_wce()
+
+        """
+
+        return self.__restarts_wce
+
+
     def get_cluster_encoding(self):
         """!
         @brief Returns clustering result representation type that indicate how clusters are encoded.
@@ -521,70 +632,317 @@ class kmeans:
         @brief Calculate distance (in line with specified metric) to each point from the each cluster. Nearest points
                 are captured by according clusters and as a result clusters are updated.
         
-        @return (list) Updated clusters as list of clusters. Each cluster contains indexes of objects from data.
+        @return (tuple) Updated clusters as list of clusters where each cluster contains indexes of objects from data,
+                 and labels (numpy.array) that define cluster index of each object (empty clusters are excluded).
         
         """
-        
-        clusters = [[] for _ in range(len(self.__centers))]
-        
-        dataset_differences = self.__calculate_dataset_difference(len(clusters))
-        
-        optimum_indexes = numpy.argmin(dataset_differences, axis=0)
-        for index_point in range(len(optimum_indexes)):
-            index_cluster = optimum_indexes[index_point]
-            clusters[index_cluster].append(index_point)
-        
-        clusters = [cluster for cluster in clusters if len(cluster) > 0]
 
-        return clusters
+        if self.__algorithm == kmeans_algorithm_type.LLOYD:
+            labels = self.__calculate_nearest_centers(self.__pointer_data, self.__centers)
+        else:
+            labels = self.__calculate_bounded_nearest_centers()
+
+        cluster_sizes = numpy.bincount(labels, minlength=len(self.__centers))
+        labels = (numpy.cumsum(cluster_sizes > 0) - 1)[labels]
+        cluster_sizes = cluster_sizes[cluster_sizes > 0]
+
+        ordered_points = numpy.argsort(labels, kind='stable')
+        clusters = [cluster.tolist() for cluster in numpy.split(ordered_points, numpy.cumsum(cluster_sizes)[:-1])]
 
+        return clusters, labels
 
-    def __update_centers(self):
+
+    def __update_centers(self, labels):
         """!
         @brief Calculate centers of clusters in line with contained objects.
         
+        @param[in] labels (numpy.array): Cluster index of each object.
+        
         @return (numpy.array) Updated centers.
         
         """
-        
+
+        amount_clusters = len(self.__clusters)
         dimension = self.__pointer_data.shape[1]
-        centers = numpy.zeros((len(self.__clusters), dimension))
-        
-        for index in range(len(self.__clusters)):
-            cluster_points = self.__pointer_data[self.__clusters[index], :]
-            centers[index] = cluster_points.mean(axis=0)
 
-        return numpy.array(centers)
+        centers = numpy.zeros((amount_clusters, dimension))
+        for index_dimension in range(dimension):
+            centers[:, index_dimension] = numpy.bincount(labels, weights=self.__pointer_data[:, index_dimension],
+                                                         minlength=amount_clusters)
+
+        cluster_sizes = numpy.bincount(labels, minlength=amount_clusters)
+        return centers / cluster_sizes[:, numpy.newaxis]
 
 
-    def __calculate_total_wce(self):
+    def __calculate_total_wce(self, labels):
         """!
         @brief Calculate total within cluster errors that is depend on metric that was chosen for K-Means algorithm.
 
-        """
+        @param[in] labels (numpy.array): Cluster index of each object, if 'None' then clusters are not allocated.
 
-        dataset_differences = self.__calculate_dataset_difference(len(self.__clusters))
+        """
 
         self.__total_wce = 0.0
-        for index_cluster in range(len(self.__clusters)):
-            for index_point in self.__clusters[index_cluster]:
-                self.__total_wce += dataset_differences[index_cluster][index_point]
+        if labels is None:
+            return
+
+        errors = numpy.zeros(len(self.__pointer_data))
+        for index_begin in range(0, len(self.__pointer_data), self.__chunk_size):
+            index_end = index_begin + self.__chunk_size
+
+            points = self.__pointer_data[index_begin:index_end]
+            centers = self.__centers[labels[index_begin:index_end]]
+
+            if self.__metric.get_type() != type_metric.USER_DEFINED:
+                errors[index_begin:index_end] = self.__metric(points, centers)
+            else:
+                errors[index_begin:index_end] = [self.__metric(point, center) for point, center in zip(points, centers)]
+
+        # summation order matters: errors are summed sequentially cluster by cluster as point by point summation does,
+        # therefore total error is bit-for-bit equal to the error that is summed over clusters by users (and to the
+        # results of previous versions), 'numpy.sum' uses pairwise summation whose rounding is different and
+        # 'numpy.cumsum' is the vectorized sequential summation
+        errors = errors[numpy.argsort(labels, kind='stable')]
+        self.__total_wce = float(numpy.cumsum(errors)[-1])
+
+
+    def __calculate_nearest_centers(self, points, centers):
+        """!
+        @brief Calculate index of the nearest center for each point.
+        @details Points are processed by blocks of 'chunk_size' points to bound memory usage. In case of Euclidean
+                  metrics distance blocks are calculated by matrix product (see `euclidean_distance_square_matrix`).
+
+        @param[in] points (numpy.array): Points for which the nearest centers are searched.
+        @param[in] centers (numpy.array): Centers of clusters.
+
+        @return (numpy.array) Index of the nearest center for each point.
+
+        """
 
+        labels = numpy.empty(len(points), dtype=numpy.intp)
+        euclidean = self.__metric.get_type() in (type_metric.EUCLIDEAN, type_metric.EUCLIDEAN_SQUARE)
 
-    def __calculate_dataset_difference(self, amount_clusters):
+        for index_begin in range(0, len(points), self.__chunk_size):
+            index_end = index_begin + self.__chunk_size
+
+            if euclidean is True:
+                differences = euclidean_distance_square_matrix(points[index_begin:index_end], centers)
+            else:
+                differences = self.__calculate_block_difference(points[index_begin:index_end], centers)
+
+            labels[index_begin:index_end] = numpy.argmin(differences, axis=1)
+
+        return labels
+
+
+    def __calculate_block_difference(self, points, centers):
         """!
-        @brief Calculate distance from each point to each cluster center.
+        @brief Calculate distance from each point of the block to each cluster center.
+
+        @param[in] points (numpy.array): Block of points.
+        @param[in] centers (numpy.array): Centers of clusters.
+
+        @return (numpy.array) Distance matrix where rows correspond to points and columns to centers.
 
         """
-        dataset_differences = numpy.zeros((amount_clusters, len(self.__pointer_data)))
-        for index_center in range(amount_clusters):
+
+        differences = numpy.zeros((len(points), len(centers)))
+        for index_center in range(len(centers)):
             if self.__metric.get_type() != type_metric.USER_DEFINED:
-                dataset_differences[index_center] = self.__metric(self.__pointer_data, self.__centers[index_center])
+                differences[:, index_center] = self.__metric(points, centers[index_center])
             else:
-                dataset_differences[index_center] = [self.__metric(point, self.__centers[index_center])
-                                                     for point in self.__pointer_data]
+                differences[:, index_center] = [self.__metric(point, centers[index_center]) for point in points]
 
-        return dataset_differences
+        return differences
+
+
+    def __calculate_bounded_nearest_centers(self):
+        """!
+        @brief Calculate index of the nearest center for each point using bounds of distances (Elkan's or Hamerly's
+                algorithm), distances are calculated only for points whose bounds do not guarantee the same center.
+
+        @return (numpy.array) Index of the nearest center for each point.
+
+        """
+
+        if self.__labels is None:
+            self.__initialize_bounds()
+            return self.__labels
+
+        center_distances = self.__calculate_euclidean_distances(self.__centers, self.__centers)
+        numpy.fill_diagonal(center_distances, numpy.inf)
+        half_separations = 0.5 * numpy.min(center_distances, axis=1)
+
+        if self.__algorithm == kmeans_algorithm_type.ELKAN:
+            candidates = numpy.flatnonzero(self.__upper_bounds > half_separations[self.__labels])
+            self.__update_bounds_elkan(candidates, 0.5 * center_distances)
+        else:
+            thresholds = numpy.maximum(half_separations[self.__labels], self.__lower_bounds)
+            candidates = numpy.flatnonzero(self.__upper_bounds > thresholds)
+            self.__update_bounds_hamerly(candidates, thresholds[candidates])
+
+        return self.__labels
+
+
+    def __initialize_bounds(self):
+        """!
+        @brief Assigns points to the nearest centers and initializes bounds of distances.
+
+        """
+
+        amount_points = len(self.__pointer_data)
+
+        self.__labels = numpy.empty(amount_points, dtype=numpy.intp)
+        self.__upper_bounds = numpy.empty(amount_points)
+
+        if self.__algorithm == kmeans_algorithm_type.ELKAN:
+            self.__lower_bounds = numpy.empty((amount_points, len(self.__centers)))
+        else:
+            self.__lower_bounds = numpy.empty(amount_points)
+
+        for index_begin in range(0, amount_points, self.__chunk_size):
+            index_end = min(index_begin + self.__chunk_size, amount_points)
+            distances = self.__calculate_euclidean_distances(self.__pointer_data[index_begin:index_end], self.__centers)
+
+            self.__assign_by_distances(numpy.arange(index_begin, index_end), distances)
+
+
+    def __update_bounds_elkan(self, candidates, half_center_distances):
+        """!
+        @brief Updates nearest centers of candidate points using Elkan's algorithm.
+
+        @param[in] candidates (numpy.array): Indexes of points whose upper bound exceeds half distance to other centers.
+        @param[in] half_center_distances (numpy.array): Half distances between centers.
+
+        """
+
+        for index_begin in range(0, len(candidates), self.__chunk_size):
+            points = candidates[index_begin:index_begin + self.__chunk_size]
+            labels = self.__labels[points]
+
+            # upper bounds are tightened by exact distances to the assigned centers
+            upper_bounds = self.__calculate_point_distances(points, labels)
+            self.__lower_bounds[points, labels] = upper_bounds
+
+            lower_bounds = self.__lower_bounds[points]
+            pending = (upper_bounds[:, numpy.newaxis] > lower_bounds) & \
+                      (upper_bounds[:, numpy.newaxis] > half_center_distances[labels])
+            pending[numpy.arange(len(points)), labels] = False
+
+            rows, columns = numpy.nonzero(pending)
+            distances = self.__calculate_point_distances(points[rows], columns)
+            self.__lower_bounds[points[rows], columns] = distances
+
+            candidate_distances = numpy.full(pending.shape, numpy.inf)
+            candidate_distances[numpy.arange(len(points)), labels] = upper_bounds
+            candidate_distances[rows, columns] = distances
+
+            self.__labels[points] = numpy.argmin(candidate_distances, axis=1)
+            self.__upper_bounds[points] = numpy.min(candidate_distances, axis=1)
+
+
+    def __update_bounds_hamerly(self, candidates, thresholds):
+        """!
+        @brief Updates nearest centers of candidate points using Hamerly's algorithm.
+
+        @param[in] candidates (numpy.array): Indexes of points whose upper bound exceeds threshold.
+        @param[in] thresholds (numpy.array): Maximum of lower bound and half distance to the closest center for each
+                    candidate point.
+
+        """
+
+        # upper bounds are tightened by exact distances to the assigned centers
+        self.__upper_bounds[candidates] = self.__calculate_point_distances(candidates, self.__labels[candidates])
+        candidates = candidates[self.__upper_bounds[candidates] > thresholds]
+
+        for index_begin in range(0, len(candidates), self.__chunk_size):
+            points = candidates[index_begin:index_begin + self.__chunk_size]
+            distances = self.__calculate_euclidean_distances(self.__pointer_data[points], self.__centers)
+
+            self.__assign_by_distances(points, distances)
+
+
+    def __assign_by_distances(self, points, distances):
+        """!
+        @brief Assigns points to the nearest centers using distances to all centers and resets their bounds.
+
+        @param[in] points (numpy.array): Indexes of points.
+        @param[in] distances (numpy.array): Distances from the points to all centers.
+
+        """
+
+        labels = numpy.argmin(distances, axis=1)
+        rows = numpy.arange(len(points))
+
+        self.__labels[points] = labels
+        self.__upper_bounds[points] = distances[rows, labels]
+
+        if self.__algorithm == kmeans_algorithm_type.ELKAN:
+            self.__lower_bounds[points] = distances
+        elif distances.shape[1] > 1:
+            distances[rows, labels] = numpy.inf
+            self.__lower_bounds[points] = numpy.min(distances, axis=1)
+        else:
+            self.__lower_bounds[points] = numpy.inf
+
+
+    def __update_bounds(self, updated_centers):
+        """!
+        @brief Updates bounds of distances in line with movement of centers, bounds that are related to clusters without
+                points are removed.
+
+        @param[in] updated_centers (numpy.array): New centers of non-empty clusters.
+
+        """
+
+        cluster_sizes = numpy.bincount(self.__labels, minlength=len(self.__centers))
+        non_empty = cluster_sizes > 0
+
+        self.__labels = (numpy.cumsum(non_empty) - 1)[self.__labels]
+        movements = numpy.sqrt(numpy.sum(numpy.square(self.__centers[non_empty] - updated_centers), axis=1))
+
+        self.__upper_bounds += movements[self.__labels]
+
+        if self.__algorithm == kmeans_algorithm_type.ELKAN:
+            if not numpy.all(non_empty):
+                self.__lower_bounds = self.__lower_bounds[:, non_empty]
+
+            self.__lower_bounds -= movements
+            numpy.maximum(self.__lower_bounds, 0.0, out=self.__lower_bounds)
+
+        elif len(movements) > 1:
+            second_largest, largest = numpy.argsort(movements)[-2:]
+            self.__lower_bounds -= numpy.where(self.__labels == largest, movements[second_largest], movements[largest])
+
+
+    def __calculate_point_distances(self, points, labels):
+        """!
+        @brief Calculate Euclidean distance between points and specified centers.
+
+        @param[in] points (numpy.array): Indexes of points.
+        @param[in] labels (numpy.array): Indexes of centers for each point.
+
+        @return (numpy.array) Euclidean distance between each point and its center.
+
+        """
+
+        return numpy.sqrt(numpy.sum(numpy.square(self.__pointer_data[points] - self.__centers[labels]), axis=1))
+
+
+    @staticmethod
+    def __calculate_euclidean_distances(points, centers):
+        """!
+        @brief Calculate Euclidean distance matrix between points and centers using matrix product.
+
+        @param[in] points (numpy.array): Points for which distances are calculated.
+        @param[in] centers (numpy.array): Centers of clusters.
+
+        @return (numpy.array) Distance matrix where rows correspond to points and columns to centers.
+
+        """
+
+        distances = euclidean_distance_square_matrix(points, centers)
+        return numpy.sqrt(distances, out=distances)
 
 
     def __calculate_changes(self, updated_centers):
@@ -628,3 +986,420 @@ class kmeans:
         if self.__itermax < 0:
             raise ValueError("Maximum iterations (current value: '%d') should be greater or equal to 0." %
                              self.__tolerance)
+
+        if self.__chunk_size <= 0:
+            raise ValueError("Chunk size (current value: '%d') should be greater than 0." % self.__chunk_size)
+
+        if self.__n_init <= 0:
+            raise ValueError("Amount of restarts (current value: '%d') should be greater than 0." % self.__n_init)
+
+        if (self.__n_init > 1) and (self.__observer is not None):
+            raise ValueError("Observer is not supported in case of several restarts (current value: '%d')." %
+                             self.__n_init)
+
+        if self.__algorithm not in list(kmeans_algorithm_type):
+            raise ValueError("Unknown K-Means algorithm type (current value: '%s')." % str(self.__algorithm))
+
+        if (self.__algorithm != kmeans_algorithm_type.LLOYD) and \
+                (self.__metric.get_type() not in [type_metric.EUCLIDEAN, type_metric.EUCLIDEAN_SQUARE]):
+            raise ValueError("Accelerated K-Means algorithms (current value: '%s') require Euclidean metric "
+                             "(current value: '%s')." % (kmeans_algorithm_type(self.__algorithm).name,
+                                                         self.__metric.get_type().name))
+
+
+
+class minibatch_kmeans:
+    """!
+    @brief Class implements Mini-Batch K-Means clustering algorithm.
+    @details Mini-Batch K-Means updates centers using small random batches of points instead of the whole dataset on
+              each iteration. Each center has its own learning rate that is inversely proportional to amount of points
+              that have been assigned to the center so far, therefore centers converge to means of points like in
+              K-Means algorithm but the dataset is never loaded in memory at once.
+
+    Input data might be presented by array_like structure (for example, memory-mapped `numpy.memmap` array) or by
+    iterator (generator) of blocks of points. In case of array_like structure batches are randomly sampled from data and
+    clusters are allocated by the final pass over the data when centers are converged. In case of iterator the data is
+    consumed sequentially only once, therefore clusters are not allocated (only centers), but `predict()` can be used
+    to label points.
+
+    Implementation based on paper @cite inproceedings::kmeans::2.
+
+    Example of clustering of memory-mapped data:
+    @code
+        import numpy
+
+        from pyclustering.cluster.kmeans import minibatch_kmeans
+        from pyclustering.cluster.center_initializer import kmeans_plusplus_initializer
+
+        # Memory-mapped file with points that are stored as float64 array with 8 columns.
+        data = numpy.memmap('points.dat', dtype=numpy.float64, mode='r').reshape(-1, 8)
+
+        # Initial centers are calculated using random subset of points.
+        subset = data[numpy.random.randint(0, len(data), 10000)]
+        initial_centers = kmeans_plusplus_initializer(subset, 20).initialize()
+
+        instance = minibatch_kmeans(data, initial_centers, batch_size=2048, itermax=500).process()
+        centers = instance.get_centers()
+        clusters = instance.get_clusters()
+    @endcode
+
+    Example of clustering of stream of points:
+    @code
+        def read_blocks():
+            for filename in ['points-1.npy', 'points-2.npy', 'points-3.npy']:
+                yield numpy.load(filename)
+
+        instance = minibatch_kmeans(read_blocks(), initial_centers, batch_size=2048).process()
+        labels = instance.predict(numpy.load('points-4.npy'))
+    @endcode
+
+    @see kmeans
+
+    """
+
+    def __init__(self, data, initial_centers, batch_size=1024, tolerance=0.001, **kwargs):
+        """!
+        @brief Constructor of clustering algorithm Mini-Batch K-Means.
+
+        @param[in] data (array_like|iterator): Input data that is presented as array of points (objects) or as iterator
+                    of blocks of points, each block should be represented by array_like data structure. Data is
+                    considered as a stream if it does not support `len()` and indexing (for example, generator).
+        @param[in] initial_centers (array_like): Initial coordinates of centers of clusters that are represented by array_like data structure: [center1, center2, ...].
+        @param[in] batch_size (uint): Amount of points that are used to update centers on each iteration.
+        @param[in] tolerance (double): Stop condition: if maximum value of change of centers of clusters is less than tolerance then algorithm stops processing.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'observer', 'metric', 'itermax', 'chunk_size', 'random_state').
+
+        <b>Keyword Args:</b><br>
+            - observer (kmeans_observer): Observer of the algorithm to collect information about clustering process on
+               each iteration, clusters that are passed to the observer contain only points of processed batch.
+            - metric (distance_metric): Metric that is used for distance calculation between two points (by default euclidean square distance).
+            - itermax (uint): Maximum number of batches that are used for clustering process (by default: 100).
+            - chunk_size (uint): Amount of points that are processed at once during allocation of clusters (by default: 4096).
+            - random_state (int): Seed for random generator that is used to sample batches (by default is `None`, current system time is used).
+
+        """
+        self.__stream = not (hasattr(data, '__len__') and hasattr(data, '__getitem__'))
+        self.__pointer_data = data if self.__stream or isinstance(data, numpy.ndarray) else numpy.asarray(data)
+
+        self.__clusters = []
+        self.__centers = numpy.array(initial_centers, dtype=float)
+        self.__counters = numpy.zeros(len(self.__centers))
+        self.__batch_size = batch_size
+        self.__tolerance = tolerance
+        self.__total_wce = 0.0
+
+        self.__observer = kwargs.get('observer', None)
+        self.__metric = copy.copy(kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE)))
+        self.__itermax = kwargs.get('itermax', 100)
+        self.__chunk_size = kwargs.get('chunk_size', 4096)
+        self.__random_state = numpy.random.RandomState(kwargs.get('random_state', None))
+
+        if self.__metric.get_type() != type_metric.USER_DEFINED:
+            self.__metric.enable_numpy_usage()
+        else:
+            self.__metric.disable_numpy_usage()
+
+        self.__verify_arguments()
+
+
+    def process(self):
+        """!
+        @brief Performs cluster analysis in line with rules of Mini-Batch K-Means algorithm.
+
+        @return (minibatch_kmeans) Returns itself (Mini-Batch K-Means instance).
+
+        @see get_clusters()
+        @see get_centers()
+
+        """
+
+        if self.__stream is True:
+            self.__process_stream()
+        else:
+            self.__process_array()
+
+        return self
+
+
+    def __process_array(self):
+        """!
+        @brief Performs cluster analysis using random batches that are sampled from the input data.
+
+        """
+
+        if len(self.__pointer_data[0]) != len(self.__centers[0]):
+            raise ValueError("Dimension of the input data and dimension of the initial cluster centers must be equal.")
+
+        maximum_change = float('inf')
+        iteration = 0
+
+        while maximum_change > self.__tolerance and iteration < self.__itermax:
+            # sorted indexes provide sequential access to memory-mapped data
+            indexes = numpy.sort(self.__random_state.randint(0, len(self.__pointer_data), self.__batch_size))
+            maximum_change = self.__process_batch(numpy.asarray(self.__pointer_data[indexes]), indexes)
+            iteration += 1
+
+        if iteration > 0:
+            self.__allocate_clusters()
+
+
+    def __process_stream(self):
+        """!
+        @brief Performs cluster analysis using batches that are consequently taken from the input iterator.
+
+        """
+
+        buffer = []
+        buffer_size = 0
+        offset = 0
+        iteration = 0
+
+        if self.__itermax == 0:
+            return
+
+        for block in self.__pointer_data:
+            block = numpy.asarray(block)
+            if len(block) == 0:
+                continue
+
+            if len(block[0]) != len(self.__centers[0]):
+                raise ValueError("Dimension of the input data and dimension of the initial cluster centers must be equal.")
+
+            buffer.append(block)
+            buffer_size += len(block)
+
+            while buffer_size >= self.__batch_size:
+                points = numpy.concatenate(buffer)
+                batch, buffer = points[:self.__batch_size], [points[self.__batch_size:]]
+                buffer_size -= self.__batch_size
+
+                maximum_change = self.__process_batch(batch, numpy.arange(offset, offset + len(batch)))
+                offset += len(batch)
+                iteration += 1
+
+                if maximum_change <= self.__tolerance or iteration >= self.__itermax:
+                    return
+
+        if buffer_size > 0:
+            points = numpy.concatenate(buffer)
+            self.__process_batch(points, numpy.arange(offset, offset + len(points)))
+
+
+    def __process_batch(self, batch, indexes):
+        """!
+        @brief Updates centers using batch of points, each center is moved towards its points with own learning rate.
+        @details Learning rate of a center is equal to amount of points from the batch that are assigned to the center
+                  divided by total amount of points that have been assigned to the center during clustering process.
+
+        @param[in] batch (numpy.array): Points of the batch.
+        @param[in] indexes (numpy.array): Indexes of points of the batch in the input data.
+
+        @return (float) Maximum change of centers.
+
+        """
+
+        labels = self.__calculate_nearest_centers(batch)
+        amount_centers = len(self.__centers)
+
+        sizes = numpy.bincount(labels, minlength=amount_centers)
+        sums = numpy.zeros(self.__centers.shape)
+        for index_dimension in range(self.__centers.shape[1]):
+            sums[:, index_dimension] = numpy.bincount(labels, weights=batch[:, index_dimension],
+                                                      minlength=amount_centers)
+
+        self.__counters += sizes
+        updated_centers = self.__centers.copy()
+
+        assigned = sizes > 0
+        updated_centers[assigned] += (sums[assigned] - sizes[assigned, numpy.newaxis] * self.__centers[assigned]) / \
+                                     self.__counters[assigned, numpy.newaxis]
+
+        if self.__stream is True:
+            self.__total_wce += float(numpy.sum(self.__calculate_errors(batch, updated_centers[labels])))
+
+        if self.__observer is not None:
+            ordered_points = numpy.argsort(labels, kind='stable')
+            clusters = [indexes[cluster].tolist() for cluster in numpy.split(ordered_points, numpy.cumsum(sizes)[:-1])]
+            self.__observer.notify(clusters, updated_centers.tolist())
+
+        if self.__metric.get_type() != type_metric.USER_DEFINED:
+            changes = self.__metric(self.__centers, updated_centers)
+        else:
+            changes = [self.__metric(center, updated_center) for center, updated_center in zip(self.__centers, updated_centers)]
+
+        self.__centers = updated_centers
+        return numpy.max(changes)
+
+
+    def __allocate_clusters(self):
+        """!
+        @brief Allocates clusters using final centers by the pass over the input data, clusters without points and
+                their centers are excluded.
+
+        """
+
+        labels = numpy.empty(len(self.__pointer_data), dtype=numpy.intp)
+        self.__total_wce = 0.0
+
+        for index_begin in range(0, len(self.__pointer_data), self.__chunk_size):
+            index_end = index_begin + self.__chunk_size
+            points = numpy.asarray(self.__pointer_data[index_begin:index_end])
+
+            labels[index_begin:index_end] = self.__calculate_nearest_centers(points)
+
+        cluster_sizes = numpy.bincount(labels, minlength=len(self.__centers))
+        labels = (numpy.cumsum(cluster_sizes > 0) - 1)[labels]
+        self.__centers = self.__centers[cluster_sizes > 0]
+        cluster_sizes = cluster_sizes[cluster_sizes > 0]
+
+        ordered_points = numpy.argsort(labels, kind='stable')
+        self.__clusters = [cluster.tolist() for cluster in numpy.split(ordered_points, numpy.cumsum(cluster_sizes)[:-1])]
+
+        for index_begin in range(0, len(self.__pointer_data), self.__chunk_size):
+            index_end = index_begin + self.__chunk_size
+            points = numpy.asarray(self.__pointer_data[index_begin:index_end])
+
+            errors = self.__calculate_errors(points, self.__centers[labels[index_begin:index_end]])
+            self.__total_wce += float(numpy.sum(errors))
+
+
+    def predict(self, points):
+        """!
+        @brief Calculates the closest cluster to each point.
+
+        @param[in] points (array_like): Points for which closest clusters are calculated.
+
+        @return (list) List of closest clusters for each point. Each cluster is denoted by index. Return empty
+                 collection if 'process()' method was not called.
+
+        """
+
+        nppoints = numpy.array(points)
+        if numpy.sum(self.__counters) == 0:
+            return []
+
+        labels = numpy.empty(len(nppoints), dtype=numpy.intp)
+        for index_begin in range(0, len(nppoints), self.__chunk_size):
+            index_end = index_begin + self.__chunk_size
+            labels[index_begin:index_end] = self.__calculate_nearest_centers(nppoints[index_begin:index_end])
+
+        return labels
+
+
+    def get_clusters(self):
+        """!
+        @brief Returns list of allocated clusters, each cluster contains indexes of objects in list of data.
+        @details Clusters are not allocated in case of iterator input data, in this case empty list is returned.
+
+        @see process()
+        @see get_centers()
+
+        """
+
+        return self.__clusters
+
+
+    def get_centers(self):
+        """!
+        @brief Returns list of centers of allocated clusters.
+
+        @see process()
+        @see get_clusters()
+
+        """
+
+        return self.__centers.tolist()
+
+
+    def get_total_wce(self):
+        """!
+        @brief Returns sum of metric errors that depends on metric that was used for clustering (by default SSE - Sum of Squared Errors).
+        @details In case of array_like input data the error is calculated by the final pass over the data, in case of
+                  iterator input data the error is accumulated over batches using centers that were updated by the batch.
+
+        @see process()
+        @see get_clusters()
+
+        """
+
+        return self.__total_wce
+
+
+    def get_cluster_encoding(self):
+        """!
+        @brief Returns clustering result representation type that indicate how clusters are encoded.
+
+        @return (type_encoding) Clustering result representation.
+
+        @see get_clusters()
+
+        """
+
+        return type_encoding.CLUSTER_INDEX_LIST_SEPARATION
+
+
+    def __calculate_nearest_centers(self, points):
+        """!
+        @brief Calculate index of the nearest center for each point.
+
+        @param[in] points (numpy.array): Points for which the nearest centers are searched.
+
+        @return (numpy.array) Index of the nearest center for each point.
+
+        """
+
+        if self.__metric.get_type() in (type_metric.EUCLIDEAN, type_metric.EUCLIDEAN_SQUARE):
+            differences = euclidean_distance_square_matrix(points, self.__centers)
+
+        else:
+            differences = numpy.zeros((len(points), len(self.__centers)))
+            for index_center in range(len(self.__centers)):
+                if self.__metric.get_type() != type_metric.USER_DEFINED:
+                    differences[:, index_center] = self.__metric(points, self.__centers[index_center])
+                else:
+                    differences[:, index_center] = [self.__metric(point, self.__centers[index_center]) for point in points]
+
+        return numpy.argmin(differences, axis=1)
+
+
+    def __calculate_errors(self, points, centers):
+        """!
+        @brief Calculate distance between each point and its center.
+
+        @param[in] points (numpy.array): Points for which errors are calculated.
+        @param[in] centers (numpy.array): Center of each point.
+
+        @return (numpy.array) Distance between each point and its center.
+
+        """
+
+        if self.__metric.get_type() != type_metric.USER_DEFINED:
+            return self.__metric(points, centers)
+
+        return numpy.array([self.__metric(point, center) for point, center in zip(points, centers)])
+
+
+    def __verify_arguments(self):
+        """!
+        @brief Verify input parameters for the algorithm and throw exception in case of incorrectness.
+
+        """
+        if self.__stream is False and len(self.__pointer_data) == 0:
+            raise ValueError("Input data is empty (size: '%d')." % len(self.__pointer_data))
+
+        if len(self.__centers) == 0:
+            raise ValueError("Initial centers are empty (size: '%d')." % len(self.__centers))
+
+        if self.__batch_size <= 0:
+            raise ValueError("Batch size (current value: '%d') should be greater than 0." % self.__batch_size)
+
+        if self.__tolerance < 0:
+            raise ValueError("Tolerance (current value: '%d') should be greater or equal to 0." %
+                             self.__tolerance)
+
+        if self.__itermax < 0:
+            raise ValueError("Maximum iterations (current value: '%d') should be greater or equal to 0." %
+                             self.__itermax)
+
+        if self.__chunk_size <= 0:
+            raise ValueError("Chunk size (current value: '%d') should be greater than 0." % self.__chunk_size)
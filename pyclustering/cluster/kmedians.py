@@ -10,7 +10,6 @@
 """
 
 
-import math
 import numpy
 
 from pyclustering.cluster.encoder import type_encoding
@@ -19,14 +18,18 @@ from pyclustering.utils.metric import distance_metric, type_metric
 
 import pyclustering.core.kmedians_wrapper as wrapper
 
-from pyclustering.core.wrapper import ccore_library
+from pyclustering.core.wrapper import ccore_library, ccore_async_processing
 from pyclustering.core.metric_wrapper import metric_wrapper
 
 
-class kmedians:
+class kmedians(ccore_async_processing):
     """!
     @brief Class represents clustering algorithm K-Medians.
     @details The algorithm is less sensitive to outliers than K-Means. Medians are calculated instead of centroids.
+
+             Python implementation assigns points to the closest medians by blocks of `chunk_size` points using numpy,
+             median of each cluster is found by selection algorithm (`numpy.partition`) in linear time instead of
+             sorting. Weighted median is used if weights of points are specified (see argument `weights`).
     
     Example:
     @code
@@ -65,11 +68,18 @@ class kmedians:
         @param[in] initial_medians (list): Initial coordinates of medians of clusters that are represented by list: [center1, center2, ...].
         @param[in] tolerance (double): Stop condition: if maximum value of change of centers of clusters is less than tolerance than algorithm will stop processing
         @param[in] ccore (bool): Defines should be CCORE library (C++ pyclustering library) used instead of Python code or not.
-        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'metric', 'itermax').
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'metric', 'itermax', 'chunk_size',
+                    'weights').
 
         <b>Keyword Args:</b><br>
             - metric (distance_metric): Metric that is used for distance calculation between two points.
             - itermax (uint): Maximum number of iterations for cluster analysis.
+            - chunk_size (uint): Amount of points that are processed at once by python implementation during distance
+               calculation, it bounds memory usage by 'chunk_size' x 'amount of medians' (by default: 4096). In case of
+               Manhattan metric the memory usage is 'chunk_size' x 'amount of medians' x 'dimension'.
+            - weights (array_like): Non-negative weight of each point, if it is specified then weighted median is
+               calculated for each cluster and total WCE is weighted sum of errors. Weights are supported only by
+               python implementation.
         
         """
         self.__pointer_data = numpy.array(data)
@@ -79,16 +89,26 @@ class kmedians:
         self.__total_wce = 0
 
         self.__itermax = kwargs.get('itermax', 100)
+        self.__chunk_size = kwargs.get('chunk_size', 4096)
+        self.__weights = kwargs.get('weights', None)
+        if self.__weights is not None:
+            self.__weights = numpy.asarray(self.__weights, dtype=numpy.float64)
+
         self.__metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
         if self.__metric is None:
             self.__metric = distance_metric(type_metric.EUCLIDEAN_SQUARE)
 
-        self.__ccore = ccore and self.__metric.get_type() != type_metric.USER_DEFINED
+        self.__ccore = ccore and self.__metric.get_type() != type_metric.USER_DEFINED and self.__weights is None
         if self.__ccore:
             self.__ccore = ccore_library.workable()
 
         self.__verify_arguments()
 
+        self.__numpy_metric = self.__metric
+        if self.__metric.get_type() != type_metric.USER_DEFINED:
+            self.__numpy_metric = distance_metric(self.__metric.get_type(),
+                                                  **dict(self.__metric.get_arguments(), numpy_usage=True))
+
 
     def process(self):
         """!
@@ -108,28 +128,39 @@ class kmedians:
             self.__clusters, self.__medians = wrapper.kmedians(self.__pointer_data, self.__medians, self.__tolerance, self.__itermax, ccore_metric.get_pointer())
 
         else:
-            changes = float('inf')
-             
-            # Check for dimension
-            if len(self.__pointer_data[0]) != len(self.__medians[0]):
-                raise NameError('Dimension of the input data and dimension of the initial medians must be equal.')
-
-            iterations = 0
-            while changes > self.__tolerance and iterations < self.__itermax:
-                self.__clusters = self.__update_clusters()
-                updated_centers = self.__update_medians()
-             
-                changes = max([self.__metric(self.__medians[index], updated_centers[index]) for index in range(len(updated_centers))])
-                 
-                self.__medians = updated_centers
-
-                iterations += 1
+            self.__process_by_python()
 
         self.__calculate_total_wce()
 
         return self
 
 
+    def __process_by_python(self):
+        """!
+        @brief Performs cluster analysis using python code.
+
+        """
+        # Check for dimension
+        if len(self.__pointer_data[0]) != len(self.__medians[0]):
+            raise NameError('Dimension of the input data and dimension of the initial medians must be equal.')
+
+        medians = numpy.asarray(self.__medians, dtype=numpy.float64)
+
+        changes = float('inf')
+        iterations = 0
+        while changes > self.__tolerance and iterations < self.__itermax:
+            labels, self.__clusters = self.__update_clusters(medians)
+            updated_medians = self.__update_medians(labels, len(self.__clusters))
+
+            changes = float(numpy.max(self.__calculate_distances(medians[:len(updated_medians)], updated_medians)))
+            medians = updated_medians
+
+            iterations += 1
+
+        if iterations > 0:
+            self.__medians = medians
+
+
     def predict(self, points):
         """!
         @brief Calculates the closest cluster to each point.
@@ -168,11 +199,8 @@ class kmedians:
         if len(self.__clusters) == 0:
             return []
 
-        differences = numpy.zeros((len(points), len(self.__medians)))
-        for index_point in range(len(points)):
-            differences[index_point] = [ self.__metric(points[index_point], center) for center in self.__medians ]
-
-        return numpy.argmin(differences, axis=1)
+        points = numpy.asarray(points, dtype=numpy.float64)
+        return self.__calculate_nearest_medians(points, numpy.asarray(self.__medians, dtype=numpy.float64))
 
 
     def get_clusters(self):
@@ -229,96 +257,200 @@ class kmedians:
         return type_encoding.CLUSTER_INDEX_LIST_SEPARATION
 
 
-    def __update_clusters(self):
+    def __update_clusters(self, medians):
         """!
-        @brief Calculate Manhattan distance to each point from the each cluster. 
+        @brief Calculate distance to each point from the each cluster.
         @details Nearest points are captured by according clusters and as a result clusters are updated.
-        
-        @return (list) updated clusters as list of clusters where each cluster contains indexes of objects from data.
-        
+
+        @param[in] medians (numpy.array): Medians of clusters.
+
+        @return (tuple) Cluster index of each point and updated clusters where each cluster contains indexes of objects
+                 from data: (labels, clusters).
+
         """
-        
-        clusters = [[] for i in range(len(self.__medians))]
-        for index_point in range(len(self.__pointer_data)):
-            index_optim = -1
-            dist_optim = 0.0
-             
-            for index in range(len(self.__medians)):
-                dist = self.__metric(self.__pointer_data[index_point], self.__medians[index])
-                 
-                if (dist < dist_optim) or (index == 0):
-                    index_optim = index
-                    dist_optim = dist
-             
-            clusters[index_optim].append(index_point)
-            
+        labels = self.__calculate_nearest_medians(self.__pointer_data, medians)
+
         # If cluster is not able to capture object it should be removed
-        clusters = [cluster for cluster in clusters if len(cluster) > 0]
-        
-        return clusters
-    
+        cluster_sizes = numpy.bincount(labels, minlength=len(medians))
+        non_empty = cluster_sizes > 0
+        labels = (numpy.cumsum(non_empty) - 1)[labels]
 
-    def __calculate_total_wce(self):
+        order = numpy.argsort(labels, kind='stable')
+        borders = numpy.cumsum(cluster_sizes[non_empty])[:-1]
+        clusters = [cluster.tolist() for cluster in numpy.split(order, borders)]
+
+        return labels, clusters
+
+
+    def __calculate_nearest_medians(self, points, medians):
         """!
-        @brief Calculate total within cluster errors that is depend on metric that was chosen for K-Medians algorithm.
+        @brief Calculate index of the nearest median for each point by blocks of 'chunk_size' points.
+
+        @param[in] points (numpy.array): Points for which the nearest medians are searched.
+        @param[in] medians (numpy.array): Medians of clusters.
+
+        @return (numpy.array) Index of the nearest median for each point.
 
         """
+        labels = numpy.empty(len(points), dtype=numpy.intp)
+        for index_begin in range(0, len(points), self.__chunk_size):
+            index_end = index_begin + self.__chunk_size
 
-        dataset_differences = self.__calculate_dataset_difference(len(self.__clusters))
+            differences = self.__calculate_block_difference(points[index_begin:index_end], medians)
+            labels[index_begin:index_end] = numpy.argmin(differences, axis=1)
 
-        self.__total_wce = 0
-        for index_cluster in range(len(self.__clusters)):
-            for index_point in self.__clusters[index_cluster]:
-                self.__total_wce += dataset_differences[index_cluster][index_point]
+        return labels
 
 
-    def __calculate_dataset_difference(self, amount_clusters):
+    def __calculate_block_difference(self, points, medians):
         """!
-        @brief Calculate distance from each point to each cluster center.
+        @brief Calculate distance from each point of the block to each median.
+        @details In case of Manhattan metric the whole block is calculated by one matrix operation.
+
+        @param[in] points (numpy.array): Block of points.
+        @param[in] medians (numpy.array): Medians of clusters.
+
+        @return (numpy.array) Distance matrix where rows correspond to points and columns to medians.
 
         """
-        self.__metric.enable_numpy_usage()
-        dataset_differences = numpy.zeros((amount_clusters, len(self.__pointer_data)))
-        for index_center in range(amount_clusters):
+        if self.__metric.get_type() == type_metric.MANHATTAN:
+            return numpy.sum(numpy.abs(points[:, numpy.newaxis, :] - medians[numpy.newaxis, :, :]), axis=2)
+
+        differences = numpy.zeros((len(points), len(medians)))
+        for index_median in range(len(medians)):
             if self.__metric.get_type() != type_metric.USER_DEFINED:
-                dataset_differences[index_center] = self.__metric(self.__pointer_data, self.__medians[index_center])
+                differences[:, index_median] = self.__numpy_metric(points, medians[index_median])
             else:
-                dataset_differences[index_center] = [self.__metric(point, self.__medians[index_center])
-                                                      for point in self.__pointer_data]
-        self.__metric.disable_numpy_usage()
-        return dataset_differences
+                differences[:, index_median] = [self.__metric(point, medians[index_median]) for point in points]
 
+        return differences
 
-    def __update_medians(self):
+
+    def __calculate_distances(self, points, medians):
+        """!
+        @brief Calculate distance from each point to the corresponding median.
+
+        @param[in] points (numpy.array): Points.
+        @param[in] medians (numpy.array): Median for each point.
+
+        @return (numpy.array) Distance from each point to its median.
+
+        """
+        if self.__metric.get_type() != type_metric.USER_DEFINED:
+            return numpy.asarray(self.__numpy_metric(points, medians), dtype=numpy.float64).reshape(len(points))
+
+        return numpy.array([self.__metric(point, median) for point, median in zip(points, medians)])
+
+
+    def __calculate_total_wce(self):
+        """!
+        @brief Calculate total within cluster errors that is depend on metric that was chosen for K-Medians algorithm.
+
+        """
+
+        self.__total_wce = 0
+        if len(self.__clusters) == 0:
+            return
+
+        labels = numpy.empty(len(self.__pointer_data), dtype=numpy.intp)
+        for index_cluster, cluster in enumerate(self.__clusters):
+            labels[cluster] = index_cluster
+
+        medians = numpy.asarray(self.__medians, dtype=numpy.float64)
+        errors = numpy.zeros(len(self.__pointer_data))
+        for index_begin in range(0, len(self.__pointer_data), self.__chunk_size):
+            index_end = index_begin + self.__chunk_size
+
+            points = self.__pointer_data[index_begin:index_end]
+            errors[index_begin:index_end] = self.__calculate_distances(points, medians[labels[index_begin:index_end]])
+
+        if self.__weights is not None:
+            errors *= self.__weights
+
+        # summation order matters: errors are summed sequentially cluster by cluster as point by point summation does,
+        # therefore total error is bit-for-bit equal to the error that is summed over clusters by users (and to the
+        # results of previous versions), 'numpy.sum' uses pairwise summation whose rounding is different and
+        # 'numpy.cumsum' is the vectorized sequential summation
+        errors = errors[numpy.argsort(labels, kind='stable')]
+        self.__total_wce = float(numpy.cumsum(errors)[-1])
+
+
+    def __update_medians(self, labels, amount_clusters):
         """!
         @brief Calculate medians of clusters in line with contained objects.
-        
-        @return (list) list of medians for current number of clusters.
-        
+
+        @param[in] labels (numpy.array): Cluster index of each point.
+        @param[in] amount_clusters (uint): Amount of clusters.
+
+        @return (numpy.array) Medians for current number of clusters.
+
         """
-         
-        medians = [[] for i in range(len(self.__clusters))]
-         
-        for index in range(len(self.__clusters)):
-            medians[index] = [0.0 for i in range(len(self.__pointer_data[0]))]
-            length_cluster = len(self.__clusters[index])
-            
-            for index_dimension in range(len(self.__pointer_data[0])):
-                sorted_cluster = sorted(self.__clusters[index], key=lambda x: self.__pointer_data[x][index_dimension])
-                
-                relative_index_median = int(math.floor((length_cluster - 1) / 2))
-                index_median = sorted_cluster[relative_index_median]
-                
-                if (length_cluster % 2) == 0:
-                    index_median_second = sorted_cluster[relative_index_median + 1]
-                    medians[index][index_dimension] = (self.__pointer_data[index_median][index_dimension] + self.__pointer_data[index_median_second][index_dimension]) / 2.0
-                    
-                else:
-                    medians[index][index_dimension] = self.__pointer_data[index_median][index_dimension]
-             
+        order = numpy.argsort(labels, kind='stable')
+        borders = numpy.cumsum(numpy.bincount(labels, minlength=amount_clusters))[:-1]
+
+        medians = numpy.zeros((amount_clusters, len(self.__pointer_data[0])))
+        for index_cluster, cluster in enumerate(numpy.split(order, borders)):
+            points = self.__pointer_data[cluster]
+
+            if self.__weights is None:
+                medians[index_cluster] = self.__calculate_median(points)
+            else:
+                medians[index_cluster] = self.__calculate_weighted_median(points, self.__weights[cluster])
+
         return medians
 
 
+    @staticmethod
+    def __calculate_median(points):
+        """!
+        @brief Calculate median of each dimension using selection algorithm.
+        @details In case of even amount of points the median is an average of two middle values.
+
+        @param[in] points (numpy.array): Points of a cluster.
+
+        @return (numpy.array) Median of the points.
+
+        """
+        length = len(points)
+        index_median = (length - 1) // 2
+
+        if (length % 2) == 0:
+            partitioned = numpy.partition(points, (index_median, index_median + 1), axis=0)
+            return (partitioned[index_median] + partitioned[index_median + 1]) / 2.0
+
+        return numpy.partition(points, index_median, axis=0)[index_median]
+
+
+    @staticmethod
+    def __calculate_weighted_median(points, weights):
+        """!
+        @brief Calculate weighted median of each dimension.
+        @details The weighted median is the smallest value whose cumulative weight is at least half of the total weight,
+                  if the cumulative weight is exactly the half then the median is an average of the value and the next
+                  one. In case of equal weights the result is the same as the median.
+
+        @param[in] points (numpy.array): Points of a cluster.
+        @param[in] weights (numpy.array): Weights of the points.
+
+        @return (numpy.array) Weighted median of the points.
+
+        """
+        order = numpy.argsort(points, axis=0, kind='stable')
+        sorted_points = numpy.take_along_axis(points, order, axis=0)
+        cumulative_weights = numpy.cumsum(weights[order], axis=0)
+
+        half_weight = cumulative_weights[-1] / 2.0
+        index_lower = numpy.argmax(cumulative_weights >= half_weight, axis=0)
+        index_upper = numpy.argmax(cumulative_weights > half_weight, axis=0)
+
+        dimensions = numpy.arange(points.shape[1])
+        lower = sorted_points[index_lower, dimensions]
+        upper = sorted_points[index_upper, dimensions]
+
+        is_half = cumulative_weights[index_lower, dimensions] == half_weight
+        return numpy.where(is_half, (lower + upper) / 2.0, lower)
+
+
     def __verify_arguments(self):
         """!
         @brief Verify input parameters for the algorithm and throw exception in case of incorrectness.
@@ -343,3 +475,14 @@ class kmedians:
         if self.__itermax < 0:
             raise ValueError("Maximum iterations (current value: '%d') should be greater or equal to 0." %
                              self.__itermax)
+
+        if self.__chunk_size <= 0:
+            raise ValueError("Chunk size (current value: '%d') should be greater than 0." % self.__chunk_size)
+
+        if self.__weights is not None:
+            if len(self.__weights) != len(self.__pointer_data):
+                raise ValueError("Amount of weights (current value: '%d') should be equal to amount of points "
+                                 "(current value: '%d')." % (len(self.__weights), len(self.__pointer_data)))
+
+            if numpy.any(self.__weights < 0):
+                raise ValueError("Weights of points should be greater or equal to 0.")
@@ -11,6 +11,8 @@
 
 import numpy
 
+from enum import IntEnum
+
 from pyclustering.cluster.encoder import type_encoding
 
 from pyclustering.utils.metric import distance_metric, type_metric
@@ -18,7 +20,7 @@ from pyclustering.utils.metric import distance_metric, type_metric
 import pyclustering.core.pam_build_wrapper as pam_build_wrapper
 import pyclustering.core.kmedoids_wrapper as kmedoids_wrapper
 
-from pyclustering.core.wrapper import ccore_library
+from pyclustering.core.wrapper import ccore_library, ccore_async_processing
 from pyclustering.core.metric_wrapper import metric_wrapper
 
 
@@ -236,7 +238,29 @@ class build:
 
 
 
-class kmedoids:
+class kmedoids_swap_type(IntEnum):
+    """!
+    @brief Enumeration of strategies that are used by K-Medoids to swap medoids with non-medoid objects.
+
+    """
+
+    ## Original PAM SWAP phase where cost of each pair (medoid, candidate) is calculated separately, the best swap is
+    ## applied on each iteration. Complexity of the iteration is \f$O\left ( k\left ( n-k \right )^{2} \right )\f$.
+    PAM = 0
+
+    ## FastPAM1 SWAP phase where costs of removal of all medoids are calculated in one pass over objects for each
+    ## candidate @cite article::cluster::kmedoids::fasterpam. It performs the same swaps as PAM, but complexity of
+    ## the iteration is \f$O\left ( \left ( n-k \right )^{2} \right )\f$.
+    FASTPAM1 = 1
+
+    ## FasterPAM SWAP phase where each candidate is swapped eagerly with the best medoid as soon as the swap reduces
+    ## total deviation @cite article::cluster::kmedoids::fasterpam. An iteration is one pass over all candidates,
+    ## therefore much less iterations are required, but results might differ from PAM.
+    FASTERPAM = 2
+
+
+
+class kmedoids(ccore_async_processing):
     """!
     @brief Class represents clustering algorithm K-Medoids (PAM algorithm).
     @details PAM is a partitioning clustering algorithm that uses the medoids instead of centers like in case of K-Means
@@ -247,6 +271,10 @@ class kmedoids:
               initialization algorithm for that purpose. K-Means++ is also could be considered as an initialization
               algorithm with smaller complexity `O(nk)`, but produces a worse starting point.
 
+              By default FastPAM1 swap strategy is used that produces the same result as PAM, but evaluates removal of
+              all medoids in one pass for each candidate. FasterPAM strategy that swaps medoids eagerly can be chosen
+              using argument `swap` (see `kmedoids_swap_type`).
+
     Implementation based on paper @cite inproceedings::cluster::kmedoids::1.
 
     There is an example where PAM algorithm is used to cluster `Tetra` data where PAM BUILD algorithm is used to
@@ -374,20 +402,24 @@ class kmedoids:
         @param[in] initial_index_medoids (list): Indexes of intial medoids (indexes of points in input data).
         @param[in] tolerance (double): Stop condition: if maximum value of distance change of medoids of clusters is less than tolerance than algorithm will stop processing.
         @param[in] ccore (bool): If `True` then C++ implementation is used instead of Python code.
-        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: `metric`, `data_type`, `itermax`).
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: `metric`, `data_type`, `itermax`, `swap`).
 
         <b>Keyword Args:</b><br>
             - metric (distance_metric): Metric that is used for distance calculation between two points.
             - data_type (string): Data type of input sample `data` that is processed by the algorithm (`points`, `distance_matrix`).
             - itermax (uint): Maximum number of iteration for cluster analysis.
+            - swap (kmedoids_swap_type): Strategy that is used to swap medoids (by default: `kmedoids_swap_type.FASTPAM1`).
+
+        @see kmedoids_swap_type
 
         """
         self.__pointer_data = data
         self.__clusters = []
         self.__medoid_indexes = initial_index_medoids[:]
         self.__labels = [-1] * len(data)
-        self.__distance_first_medoid = [float('inf')] * len(data)
-        self.__distance_second_medoid = [float('inf')] * len(data)
+        self.__distance_first_medoid = None
+        self.__distance_second_medoid = None
+        self.__medoid_distances = None
         self.__tolerance = tolerance
         self.__iterations = 0
         self.__total_deviation = float('inf')
@@ -396,8 +428,10 @@ class kmedoids:
         self.__data_type = kwargs.get('data_type', 'points')
         self.__itermax = kwargs.get('itermax', 200)
         self.__initializer = kwargs.get('initializer', 'build')
+        self.__swap = kwargs.get('swap', kmedoids_swap_type.FASTPAM1)
 
         self.__distance_calculator = self.__create_distance_calculator()
+        self.__distance_row_calculator = self.__create_distance_row_calculator()
 
         self.__ccore = ccore and self.__metric.get_type() != type_metric.USER_DEFINED
         if self.__ccore:
@@ -421,12 +455,7 @@ class kmedoids:
         
         if self.__ccore is True:
             ccore_metric = metric_wrapper.create_instance(self.__metric)
-            self.__clusters, self.__medoid_indexes, self.__iterations, self.__total_deviation = kmedoids_wrapper.kmedoids(self.__pointer_data, self.__medoid_indexes, self.__tolerance, self.__itermax, ccore_metric.get_pointer(), self.__data_type)
-
-            # TODO: calculate it on C++ side as well
-            for index_cluster in range(len(self.__clusters)):
-                for index_point in self.__clusters[index_cluster]:
-                    self.__labels[index_point] = index_cluster
+            self.__clusters, self.__medoid_indexes, self.__iterations, self.__total_deviation = kmedoids_wrapper.kmedoids(self.__pointer_data, self.__medoid_indexes, self.__tolerance, self.__itermax, ccore_metric.get_pointer(), self.__data_type, self.__swap)
 
         else:
             changes = float('inf')
@@ -435,6 +464,8 @@ class kmedoids:
             self.__iterations = 0
 
             if self.__itermax > 0:
+                self.__medoid_distances = numpy.array([self.__distance_row_calculator(index_medoid)
+                                                       for index_medoid in self.__medoid_indexes])
                 self.__total_deviation = self.__update_clusters()
 
             while (changes > self.__tolerance) and (self.__iterations < self.__itermax):
@@ -448,10 +479,14 @@ class kmedoids:
                 else:
                     break
 
-
-
             self.__erase_empty_clusters()
 
+        # TODO: calculate it on C++ side as well
+        self.__labels = [-1] * len(self.__pointer_data)
+        for index_cluster in range(len(self.__clusters)):
+            for index_point in self.__clusters[index_cluster]:
+                self.__labels[index_point] = index_cluster
+
         return self
 
 
@@ -595,6 +630,9 @@ class kmedoids:
             raise ValueError("Maximum iterations (current value: '%d') should be greater or equal to 0." %
                              self.__tolerance)
 
+        if self.__swap not in (kmedoids_swap_type.PAM, kmedoids_swap_type.FASTPAM1, kmedoids_swap_type.FASTERPAM):
+            raise ValueError("Unknown swap strategy is specified '%s'." % str(self.__swap))
+
 
     def __create_distance_calculator(self):
         """!
@@ -616,6 +654,28 @@ class kmedoids:
             raise TypeError("Unknown type of data is specified '%s'" % self.__data_type)
 
 
+    def __create_distance_row_calculator(self):
+        """!
+        @brief Creates calculator of distances from an object to all objects in line with algorithms parameters.
+
+        @return (callable) Distance row calculator that returns `numpy.ndarray`.
+
+        """
+        if self.__data_type == 'distance_matrix':
+            return lambda index: numpy.asarray(self.__pointer_data[index], dtype=numpy.float64).reshape(-1)
+
+        if self.__metric.get_type() == type_metric.USER_DEFINED:
+            return lambda index: numpy.array([self.__distance_calculator(index_point, index)
+                                              for index_point in range(len(self.__pointer_data))])
+
+        points = numpy.asarray(self.__pointer_data, dtype=numpy.float64)
+        if points.ndim == 1:
+            points = points.reshape(-1, 1)
+
+        metric = distance_metric(self.__metric.get_type(), **dict(self.__metric.get_arguments(), numpy_usage=True))
+        return lambda index: numpy.asarray(metric(points, points[index]), dtype=numpy.float64).reshape(-1)
+
+
     def __update_clusters(self):
         """!
         @brief Calculate distance to each point from the each cluster.
@@ -624,38 +684,68 @@ class kmedoids:
         @return (double) Total deviation (distance from each point to its closest medoid).
 
         """
+        self.__assign_points()
 
-        total_deviation = 0.0
-        self.__clusters = [[] for i in range(len(self.__medoid_indexes))]
-        for index_point in range(len(self.__pointer_data)):
-            index_optim = -1
-            dist_optim_first = float('Inf')
-            dist_optim_second = float('Inf')
-            
-            for index in range(len(self.__medoid_indexes)):
-                dist = self.__distance_calculator(index_point, self.__medoid_indexes[index])
+        self.__clusters = [numpy.flatnonzero(self.__labels == index_cluster).tolist()
+                           for index_cluster in range(len(self.__medoid_indexes))]
+
+        return float(numpy.sum(self.__distance_first_medoid))
+
+
+    def __assign_points(self):
+        """!
+        @brief Assigns each point to the closest medoid using distances from medoids to all points.
+        @details Labels, distances to the closest and to the second closest medoids are updated.
+
+        """
+        amount_points = self.__medoid_distances.shape[1]
 
-                if dist < dist_optim_first:
-                    dist_optim_second = dist_optim_first
-                    index_optim = index
-                    dist_optim_first = dist
-                elif dist < dist_optim_second:
-                    dist_optim_second = dist
+        self.__labels = numpy.argmin(self.__medoid_distances, axis=0)
+        self.__distance_first_medoid = self.__medoid_distances[self.__labels, numpy.arange(amount_points)]
 
-            total_deviation += dist_optim_first
-            self.__clusters[index_optim].append(index_point)
-            self.__labels[index_point] = index_optim
+        if len(self.__medoid_indexes) > 1:
+            self.__distance_second_medoid = numpy.partition(self.__medoid_distances, 1, axis=0)[1]
+        else:
+            self.__distance_second_medoid = numpy.full(amount_points, float('inf'))
+
+
+    def __replace_medoid(self, index_cluster, index_candidate, candidate_distances=None):
+        """!
+        @brief Replaces medoid of the specified cluster by the candidate.
+
+        @param[in] index_cluster (uint): Index of cluster whose medoid is replaced.
+        @param[in] index_candidate (uint): Index of point that becomes a new medoid.
+        @param[in] candidate_distances (numpy.ndarray): Distances from the candidate to all points if they have been
+                    already calculated.
 
-            self.__distance_first_medoid[index_point] = dist_optim_first
-            self.__distance_second_medoid[index_point] = dist_optim_second
+        """
+        if candidate_distances is None:
+            candidate_distances = self.__distance_row_calculator(index_candidate)
 
-        return total_deviation
+        self.__medoid_indexes[index_cluster] = index_candidate
+        self.__medoid_distances[index_cluster] = candidate_distances
 
 
     def __swap_medoids(self):
         """!
         @brief Swap existed medoid with non-medoid points in order to find the most optimal medoid.
 
+        @return (double) Cost that is needed to swap two medoids, `inf` if there is no swap that reduces total deviation.
+
+        """
+        if self.__swap == kmedoids_swap_type.PAM:
+            return self.__swap_medoids_pam()
+
+        elif self.__swap == kmedoids_swap_type.FASTPAM1:
+            return self.__swap_medoids_fastpam1()
+
+        return self.__swap_medoids_eager()
+
+
+    def __swap_medoids_pam(self):
+        """!
+        @brief Finds the best pair (medoid, candidate) calculating cost of each pair separately and applies the swap.
+
         @return (double) Cost that is needed to swap two medoids.
 
         """
@@ -675,12 +765,116 @@ class kmedoids:
                     optimal_index_cluster = index_cluster
                     optimal_index_medoid = candidate_medoid_index
 
-        if optimal_index_cluster is not None:
-            self.__medoid_indexes[optimal_index_cluster] = optimal_index_medoid
+        if optimal_swap_cost >= 0.0:
+            return float('inf')
+
+        self.__replace_medoid(optimal_index_cluster, optimal_index_medoid)
+        return optimal_swap_cost
+
+
+    def __swap_medoids_fastpam1(self):
+        """!
+        @brief Finds the best pair (medoid, candidate) calculating cost of removal of each medoid in one pass for each
+                candidate and applies the swap.
+        @details Candidates are processed in blocks, the same pair as in case of PAM is chosen: the smallest cost,
+                  then the smallest index of cluster, then the smallest index of candidate.
+
+        @return (double) Cost that is needed to swap two medoids.
+
+        """
+        candidates = numpy.flatnonzero(self.__distance_first_medoid != 0.0)
+        candidates = candidates[numpy.isin(candidates, self.__medoid_indexes, invert=True)]
+
+        amount_points = len(self.__distance_first_medoid)
+
+        optimal_swap_cost = float('inf')
+        optimal_index_cluster = None
+        optimal_index_medoid = None
+        optimal_distances = None
+
+        block_size = max(1, 2 ** 22 // amount_points)
+        for block_start in range(0, len(candidates), block_size):
+            block = candidates[block_start:block_start + block_size]
+            block_distances = numpy.array([self.__distance_row_calculator(index_candidate) for index_candidate in block])
+
+            costs = self.__calculate_swap_costs(block, block_distances)
+
+            position = int(numpy.argmin(costs.T))
+            index_cluster, index_block = divmod(position, len(block))
+            swap_cost = costs[index_block, index_cluster]
+
+            is_better_cluster = (optimal_index_cluster is not None) and (index_cluster < optimal_index_cluster)
+            if (swap_cost < optimal_swap_cost) or ((swap_cost == optimal_swap_cost) and is_better_cluster):
+                optimal_swap_cost = swap_cost
+                optimal_index_cluster = index_cluster
+                optimal_index_medoid = block[index_block]
+                optimal_distances = block_distances[index_block]
+
+        if optimal_swap_cost >= 0.0:
+            return float('inf')
 
+        self.__replace_medoid(optimal_index_cluster, int(optimal_index_medoid), optimal_distances)
         return optimal_swap_cost
 
 
+    def __swap_medoids_eager(self):
+        """!
+        @brief Passes through all candidates and swaps each of them with the best medoid if the swap reduces total
+                deviation (FasterPAM).
+
+        @return (double) Total cost of applied swaps, `inf` if nothing has been swapped.
+
+        """
+        total_swap_cost = 0.0
+        swapped = False
+
+        for index_candidate in range(len(self.__distance_first_medoid)):
+            if (self.__distance_first_medoid[index_candidate] == 0.0) or (index_candidate in self.__medoid_indexes):
+                continue
+
+            candidate_distances = self.__distance_row_calculator(index_candidate)
+            costs = self.__calculate_swap_costs(numpy.array([index_candidate]), candidate_distances[numpy.newaxis, :])[0]
+
+            index_cluster = int(numpy.argmin(costs))
+            if costs[index_cluster] < 0.0:
+                self.__replace_medoid(index_cluster, index_candidate, candidate_distances)
+                self.__assign_points()
+
+                total_swap_cost += costs[index_cluster]
+                swapped = True
+
+        return total_swap_cost if swapped else float('inf')
+
+
+    def __calculate_swap_costs(self, candidates, candidate_distances):
+        """!
+        @brief Calculates costs to swap each candidate with each current medoid.
+        @details Change of total deviation that is caused by adding of the candidate is shared by all medoids,
+                  therefore only removal loss is accumulated separately for each cluster by one `bincount` call over
+                  pairs (candidate, cluster), thus complexity does not depend on amount of clusters.
+
+        @param[in] candidates (numpy.ndarray): Indexes of points that are considered as medoid candidates.
+        @param[in] candidate_distances (numpy.ndarray): Distances from each candidate to all points.
+
+        @return (numpy.ndarray) Matrix of costs where rows correspond to candidates and columns to clusters.
+
+        """
+        gains = numpy.minimum(candidate_distances - self.__distance_first_medoid, 0.0)
+        losses = numpy.minimum(candidate_distances, self.__distance_second_medoid) - self.__distance_first_medoid - gains
+
+        rows = numpy.arange(len(candidates))
+        gains[rows, candidates] = 0.0
+        losses[rows, candidates] = 0.0
+
+        amount_clusters = len(self.__medoid_indexes)
+        bins = (rows * amount_clusters)[:, numpy.newaxis] + self.__labels
+        losses = numpy.bincount(bins.ravel(), weights=losses.ravel(),
+                                minlength=len(candidates) * amount_clusters).reshape(len(candidates), amount_clusters)
+
+        shared = numpy.sum(gains, axis=1) - self.__distance_first_medoid[candidates]
+        return losses + shared[:, numpy.newaxis]
+
+
     def __calculate_swap_cost(self, index_candidate, cluster_index):
         """!
         @brief Calculates cost to swap `index_candidate` with the current medoid `cluster_index`.
@@ -0,0 +1,339 @@
+"""!
+
+@brief Sweep over amount of clusters for K-algorithms (K-Means, K-Medians, K-Medoids).
+@details The sweep is shared by methods that search for appropriate amount of clusters (Elbow, Silhouette K-Search).
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2020
+@copyright BSD-3-Clause
+
+"""
+
+
+import concurrent.futures
+import threading
+import time
+
+import numpy
+
+from pyclustering.cluster.center_initializer import kmeans_plusplus_initializer
+from pyclustering.cluster.kmeans import kmeans
+from pyclustering.cluster.kmedians import kmedians
+from pyclustering.cluster.kmedoids import kmedoids
+
+
+class ksweep:
+    """!
+    @brief Performs cluster analysis by K-algorithm for each K value and evaluates each result.
+    @details Input data is converted to numpy array once and the same array is used by all K values and by all
+              workers, therefore the data is not copied for each K value. K values are processed by a pool of threads
+              (see argument `workers`), C++ implementation of K-algorithms and Silhouette releases GIL, therefore
+              K values are processed in parallel.
+
+              In case of warm start each K value is initialized using result of the previous K value: the cluster
+              with the biggest within-cluster error is split into two clusters until the required amount of clusters
+              is reached. Clustering is sequential in this case, but evaluation of each result is performed by the
+              pool while the next K value is processed.
+
+    Example where total within-cluster errors are calculated for K from 2 to 10 using four threads:
+    @code
+        from pyclustering.cluster.kmeans import kmeans
+        from pyclustering.cluster.ksweep import ksweep
+        from pyclustering.utils import read_sample
+        from pyclustering.samples.definitions import FCPS_SAMPLES
+
+        sample = read_sample(FCPS_SAMPLES.SAMPLE_HEPTA)
+
+        evaluator = lambda data, instance: instance.get_total_wce()
+        sweep_instance = ksweep(sample, range(2, 11), kmeans, evaluator=evaluator, workers=4).process()
+
+        print(sweep_instance.get_results())
+        print(sweep_instance.get_times())
+    @endcode
+
+    """
+
+    def __init__(self, data, kvalues, algorithm, **kwargs):
+        """!
+        @brief Constructor of sweep over amount of clusters.
+
+        @param[in] data (array_like): Input data that is presented as array of points (objects), each point should be
+                    represented by array_like data structure.
+        @param[in] kvalues (iterable): K values (amount of clusters) that should be processed.
+        @param[in] algorithm (type): K-algorithm that is used for cluster analysis (`kmeans`, `kmedians`, `kmedoids`).
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: `evaluator`, `initializer`,
+                    `random_state`, `warm_start`, `workers`, `ccore`).
+
+        <b>Keyword Args:</b><br>
+            - evaluator (callable): Function with two arguments (data, instance of K-algorithm) that evaluates
+               clustering result, by default clusters are returned.
+            - initializer (callable): Center initializer that is used to initialize K-algorithm (by default K-Means++).
+            - random_state (int): Seed for random state (by default is `None`, current system time is used).
+            - warm_start (bool): If `True` then each K value is initialized using result of the previous one (by
+               default `False`).
+            - workers (uint): Amount of threads that are used to process K values (by default 1, K values are
+               processed in the current thread).
+            - ccore (bool): If `True` then C++ implementation of K-algorithm is used (by default `True`).
+
+        """
+        self.__data = numpy.ascontiguousarray(data, dtype=numpy.float64)
+        self.__kvalues = list(kvalues)
+        self.__algorithm = algorithm
+
+        self.__evaluator = kwargs.get('evaluator', lambda data, instance: instance.get_clusters())
+        self.__initializer = kwargs.get('initializer', kmeans_plusplus_initializer)
+        self.__random_state = kwargs.get('random_state', None)
+        self.__warm_start = kwargs.get('warm_start', False)
+        self.__workers = kwargs.get('workers', 1)
+        self.__ccore = kwargs.get('ccore', True)
+
+        self.__return_index = algorithm is kmedoids
+
+        # initializers use global random generators, therefore they are called sequentially
+        self.__initializer_lock = threading.Lock()
+
+        self.__instances = {}
+        self.__results = {}
+        self.__times = {}
+
+        self.__verify_arguments()
+
+
+    def process(self):
+        """!
+        @brief Performs cluster analysis and evaluation for each K value.
+
+        @return (ksweep) Returns itself (sweep instance).
+
+        @see get_results()
+        @see get_times()
+
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.__workers) as executor:
+            if self.__warm_start:
+                futures = self.__process_warm_start(executor)
+            else:
+                futures = {k: executor.submit(self.__process_kvalue, k, None) for k in self.__kvalues}
+
+            for k in self.__kvalues:
+                self.__instances[k], self.__results[k], self.__times[k] = futures[k].result()
+
+        return self
+
+
+    def get_kvalues(self):
+        """!
+        @brief Returns K values that are processed.
+
+        """
+        return self.__kvalues
+
+
+    def get_instances(self):
+        """!
+        @brief Returns processed instances of K-algorithm for each K value.
+
+        @return (dict) Instance of K-algorithm for each K value.
+
+        """
+        return self.__instances
+
+
+    def get_results(self):
+        """!
+        @brief Returns evaluation of clustering result for each K value.
+
+        @return (dict) Result of evaluator for each K value.
+
+        """
+        return self.__results
+
+
+    def get_times(self):
+        """!
+        @brief Returns processing time (cluster analysis and evaluation) in seconds for each K value.
+
+        @return (dict) Processing time for each K value.
+
+        """
+        return self.__times
+
+
+    def __process_warm_start(self, executor):
+        """!
+        @brief Performs cluster analysis sequentially using the previous result to initialize the next K value,
+                evaluation is performed by the pool.
+
+        @param[in] executor (concurrent.futures.Executor): Pool that is used for evaluation.
+
+        @return (dict) Futures of results for each K value.
+
+        """
+        futures = {}
+        previous_instance, previous_k = None, None
+
+        for k in self.__kvalues:
+            start_time = time.perf_counter()
+
+            initial_values = None
+            if (previous_instance is not None) and (k > previous_k):
+                initial_values = self.__split_clusters(previous_instance, k)
+
+            instance = self.__cluster(k, initial_values)
+            futures[k] = executor.submit(self.__evaluate, instance, time.perf_counter() - start_time)
+
+            previous_instance, previous_k = instance, k
+
+        return futures
+
+
+    def __process_kvalue(self, k, initial_values):
+        """!
+        @brief Performs cluster analysis and evaluation for the specified K value.
+
+        @param[in] k (uint): Amount of clusters.
+        @param[in] initial_values (list): Initial centers or medoids, if `None` then initializer is used.
+
+        @return (tuple) Instance of K-algorithm, evaluation result and processing time: (instance, result, time).
+
+        """
+        start_time = time.perf_counter()
+        instance = self.__cluster(k, initial_values)
+        return self.__evaluate(instance, time.perf_counter() - start_time)
+
+
+    def __evaluate(self, instance, elapsed_time):
+        """!
+        @brief Evaluates clustering result.
+
+        @param[in] instance (object): Processed instance of K-algorithm.
+        @param[in] elapsed_time (double): Time that has been spent on cluster analysis.
+
+        @return (tuple) Instance of K-algorithm, evaluation result and processing time: (instance, result, time).
+
+        """
+        start_time = time.perf_counter()
+        result = self.__evaluator(self.__data, instance)
+        return instance, result, elapsed_time + time.perf_counter() - start_time
+
+
+    def __cluster(self, k, initial_values):
+        """!
+        @brief Performs cluster analysis by K-algorithm.
+
+        @param[in] k (uint): Amount of clusters.
+        @param[in] initial_values (list): Initial centers or medoids, if `None` then initializer is used.
+
+        @return (object) Processed instance of K-algorithm.
+
+        """
+        if initial_values is None:
+            with self.__initializer_lock:
+                initial_values = self.__initializer(self.__data, k, random_state=self.__random_state) \
+                    .initialize(return_index=self.__return_index)
+
+        return self.__algorithm(self.__data, initial_values, ccore=self.__ccore).process()
+
+
+    def __split_clusters(self, instance, k):
+        """!
+        @brief Creates initial centers (or medoids) for the specified K value by splitting clusters with the biggest
+                within-cluster error of the previous result.
+
+        @param[in] instance (object): Processed instance of K-algorithm with less amount of clusters.
+        @param[in] k (uint): Amount of clusters that is required.
+
+        @return (list) Initial centers or medoids, `None` if clusters cannot be split.
+
+        """
+        clusters = [numpy.array(cluster, dtype=numpy.int64) for cluster in instance.get_clusters()]
+        centers = self.__get_centers(instance)
+        if len(clusters) != len(centers):
+            return None
+
+        errors = [self.__calculate_error(cluster, center) for cluster, center in zip(clusters, centers)]
+
+        while len(centers) < k:
+            index_cluster = int(numpy.argmax(errors))
+            cluster = clusters[index_cluster]
+            if len(cluster) < 2:
+                return None
+
+            local_data = self.__data[cluster]
+            with self.__initializer_lock:
+                local_initial = kmeans_plusplus_initializer(local_data, 2, random_state=self.__random_state) \
+                    .initialize(return_index=self.__return_index)
+
+            local_instance = self.__algorithm(local_data, local_initial, ccore=self.__ccore).process()
+            local_clusters = [cluster[numpy.array(local_cluster, dtype=numpy.int64)]
+                              for local_cluster in local_instance.get_clusters()]
+            local_centers = self.__get_centers(local_instance)
+            if len(local_clusters) != 2:
+                return None
+
+            if self.__return_index:
+                local_centers = [cluster[index_medoid] for index_medoid in local_centers]
+
+            clusters[index_cluster:index_cluster + 1] = local_clusters
+            centers[index_cluster:index_cluster + 1] = local_centers
+            errors[index_cluster:index_cluster + 1] = [self.__calculate_error(local_cluster, local_center)
+                                                       for local_cluster, local_center in zip(local_clusters,
+                                                                                              local_centers)]
+
+        if self.__return_index:
+            return [int(index_medoid) for index_medoid in centers]
+
+        return [list(center) for center in centers]
+
+
+    def __get_centers(self, instance):
+        """!
+        @brief Returns centers (or medoids) of processed instance of K-algorithm.
+
+        @param[in] instance (object): Processed instance of K-algorithm.
+
+        @return (list) Centers or indexes of medoids.
+
+        """
+        if self.__algorithm is kmedians:
+            return list(instance.get_medians())
+        elif self.__algorithm is kmedoids:
+            return list(instance.get_medoids())
+
+        return list(instance.get_centers())
+
+
+    def __calculate_error(self, cluster, center):
+        """!
+        @brief Calculates within-cluster error (sum of square Euclidean distances) of the cluster.
+
+        @param[in] cluster (numpy.ndarray): Indexes of points that belong to the cluster.
+        @param[in] center (array_like|uint): Center of the cluster or index of its medoid.
+
+        @return (double) Within-cluster error.
+
+        """
+        if self.__return_index:
+            center = self.__data[center]
+
+        differences = self.__data[cluster] - numpy.asarray(center, dtype=numpy.float64)
+        return float(numpy.einsum('ij,ij->', differences, differences))
+
+
+    def __verify_arguments(self):
+        """!
+        @brief Verify input parameters for the algorithm and throw exception in case of incorrectness.
+
+        """
+        if len(self.__data) == 0:
+            raise ValueError("Input data is empty (size: '%d')." % len(self.__data))
+
+        if self.__algorithm not in (kmeans, kmedians, kmedoids):
+            raise TypeError("Unknown K-algorithm '%s' is specified." % str(self.__algorithm))
+
+        for k in self.__kvalues:
+            if (k <= 0) or (k > len(self.__data)):
+                raise ValueError("K value '%d' should be in range [1, %d]." % (k, len(self.__data)))
+
+        if self.__workers <= 0:
+            raise ValueError("Amount of workers (current value: '%d') should be greater than 0." % self.__workers)
@@ -10,16 +10,19 @@
 """
 
 
-import math
+import heapq
+import itertools
+
+import numpy
 import matplotlib.pyplot as plt
 
-from pyclustering.container.kdtree import kdtree_balanced
+from pyclustering.container.neighborhood import neighborhood_index
 
 from pyclustering.cluster.encoder import type_encoding
 
 from pyclustering.utils.color import color as color_list
 
-from pyclustering.core.wrapper import ccore_library
+from pyclustering.core.wrapper import ccore_library, ccore_async_processing
 
 import pyclustering.core.optics_wrapper as wrapper
 
@@ -87,6 +90,24 @@ class ordering_analyser:
     @details Using cluster-ordering it is able to connectivity radius for allocation of specified amount of clusters and
               calculate amount of clusters using specified connectivity radius. Cluster-ordering is formed by OPTICS algorithm
               during cluster analysis.
+
+              Extrema of the diagram are indexed once when the analyser is created, therefore amount of clusters for
+              any radius is obtained in O(log n) by binary search and connectivity radius search does not rescan the
+              diagram on each iteration.
+
+              The analyser can be created directly from neighborhood index, in this case cluster-ordering is formed by
+              OPTICS algorithm using radius of the index and neighbors that are stored in it:
+    @code
+        from pyclustering.cluster.optics import ordering_analyser
+        from pyclustering.container.neighborhood import neighborhood_index
+        from pyclustering.utils import read_sample
+        from pyclustering.samples.definitions import FCPS_SAMPLES
+
+        index = neighborhood_index(read_sample(FCPS_SAMPLES.SAMPLE_LSUN), 2.0)
+        for minpts in range(3, 10):
+            radius, _ = ordering_analyser(index, minpts=minpts).calculate_connvectivity_radius(3)
+            print(minpts, radius)
+    @endcode
     
     @see optics
     
@@ -101,14 +122,27 @@ class ordering_analyser:
         return self.__ordering
     
     
-    def __init__(self, ordering_diagram):
+    def __init__(self, ordering_diagram, **kwargs):
         """!
         @brief Analyser of ordering diagram that is based on reachability-distances.
-        
+
+        @param[in] ordering_diagram (list|neighborhood_index): Cluster-ordering diagram or neighborhood index that is
+                    used to form the diagram.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'minpts').
+
+        <b>Keyword Args:</b><br>
+            - minpts (uint): Minimum number of neighbors that is used to form the diagram from neighborhood index
+               (by default 1).
+
         @see calculate_connvectivity_radius
         
         """
+        if isinstance(ordering_diagram, neighborhood_index):
+            minpts = kwargs.get('minpts', 1)
+            ordering_diagram = optics(ordering_diagram, ordering_diagram.radius, minpts).process().get_ordering()
+
         self.__ordering = ordering_diagram
+        self.__create_extrema_index()
     
     
     def __len__(self):
@@ -139,12 +173,13 @@ class ordering_analyser:
 
         result = None
         
-        amount, borders = self.extract_cluster_amount(maximum_distance)
+        radius = maximum_distance
+        amount = self.__calculate_cluster_amount(radius)
         if amount <= amount_clusters:
             for _ in range(maximum_iterations):
                 radius = (lower_distance + upper_distance) / 2.0
                 
-                amount, borders = self.extract_cluster_amount(radius)
+                amount = self.__calculate_cluster_amount(radius)
                 if amount == amount_clusters:
                     result = radius
                     break
@@ -158,7 +193,7 @@ class ordering_analyser:
                 elif amount < amount_clusters:
                     upper_distance = radius
         
-        return result, borders
+        return result, self.__calculate_cluster_borders(radius)
     
     
     def extract_cluster_amount(self, radius):
@@ -175,52 +210,76 @@ class ordering_analyser:
         
         """
         
-        amount_clusters = 1
-        
-        cluster_start = False
-        cluster_pick = False
-        total_similarity = True
-        previous_cluster_distance = None
-        previous_distance = None
-        
-        cluster_borders = []
-        
-        for index_ordering in range(len(self.__ordering)):
-            distance = self.__ordering[index_ordering]
-            if distance >= radius:
-                if cluster_start is False:
-                    cluster_start = True
-                    amount_clusters += 1
-                    
-                    if index_ordering != 0:
-                        cluster_borders.append(index_ordering)
-                
-                else:
-                    if (distance < previous_cluster_distance) and (cluster_pick is False):
-                        cluster_pick = True
-                    
-                    elif (distance > previous_cluster_distance) and (cluster_pick is True):
-                        cluster_pick = False
-                        amount_clusters += 1
-                        
-                        if index_ordering != 0:
-                            cluster_borders.append(index_ordering)
-                
-                previous_cluster_distance = distance
-            
-            else:
-                cluster_start = False
-                cluster_pick = False
-            
-            if (previous_distance is not None) and (distance != previous_distance):
-                total_similarity = False
-            
-            previous_distance = distance
-        
-        if (total_similarity is True) and (previous_distance > radius):
-            amount_clusters = 0
+        return self.__calculate_cluster_amount(radius), self.__calculate_cluster_borders(radius)
+
+
+    def __create_extrema_index(self):
+        """!
+        @brief Indexes extrema of ordering diagram that define amount of clusters for any connectivity radius.
+        @details Cluster starts in the position where diagram crosses radius from below, and each valley (strict local
+                  minimum) of the diagram above the radius separates one more cluster. Therefore position 'i' starts
+                  cluster for radius 'r' if 'ordering[i - 1] < r <= ordering[i]' and valley separates clusters if its
+                  value is not less than 'r'. Bounds of these conditions are sorted to count them by binary search.
+
+        """
+        ordering = numpy.asarray(self.__ordering, dtype=numpy.float64).reshape(-1)
+
+        # Position 'i' starts cluster for radius 'r' in (lower, upper].
+        previous = numpy.concatenate(([-numpy.inf], ordering))[:len(ordering)]
+        self.__start_positions = numpy.flatnonzero(previous < ordering)
+        self.__start_lower = previous[self.__start_positions]
+        self.__start_upper = ordering[self.__start_positions]
+
+        # Valleys are strict local minima of the diagram without plateaus, border is placed where diagram grows again.
+        changes = numpy.flatnonzero(numpy.diff(ordering, prepend=numpy.nan) != 0.0)
+        compressed = ordering[changes]
+        valleys = numpy.flatnonzero((compressed[1:-1] < compressed[:-2]) & (compressed[1:-1] < compressed[2:])) + 1
+        self.__valley_values = compressed[valleys]
+        self.__valley_borders = changes[valleys + 1]
+
+        self.__sorted_start_lower = numpy.sort(self.__start_lower)
+        self.__sorted_start_upper = numpy.sort(self.__start_upper)
+        self.__sorted_valley_values = numpy.sort(self.__valley_values)
+
+        self.__total_similarity = (len(changes) <= 1)
+        self.__last_distance = ordering[-1] if len(ordering) > 0 else None
 
-        return amount_clusters, cluster_borders
+
+    def __calculate_cluster_amount(self, radius):
+        """!
+        @brief Calculates amount of clusters that can be allocated by the specified radius using indexed extrema.
+
+        @param[in] radius (double): connectivity radius that is used for cluster allocation.
+
+        @return (uint) Amount of clusters.
+
+        """
+        if (self.__total_similarity is True) and (self.__last_distance is not None) and (self.__last_distance > radius):
+            return 0
+
+        amount_starts = int(numpy.searchsorted(self.__sorted_start_lower, radius, side='left')) - \
+                        int(numpy.searchsorted(self.__sorted_start_upper, radius, side='left'))
+
+        amount_valleys = len(self.__sorted_valley_values) - \
+                         int(numpy.searchsorted(self.__sorted_valley_values, radius, side='left'))
+
+        return 1 + amount_starts + amount_valleys
+
+
+    def __calculate_cluster_borders(self, radius):
+        """!
+        @brief Returns borders between clusters that are allocated by the specified radius.
+
+        @param[in] radius (double): connectivity radius that is used for cluster allocation.
+
+        @return (list) Indexes from ordering diagram where clusters start.
+
+        """
+        starts = self.__start_positions[(self.__start_lower < radius) & (self.__start_upper >= radius)]
+        valleys = self.__valley_borders[self.__valley_values >= radius]
+
+        borders = numpy.sort(numpy.concatenate((starts[starts != 0], valleys)))
+        return borders.tolist()
 
 
 class optics_descriptor:
@@ -260,9 +319,75 @@ class optics_descriptor:
         return '(%s, [c: %s, r: %s])' % (self.index_object, self.core_distance, self.reachability_distance)
 
 
-class optics:
+class optics_order_seed:
     """!
-    @brief Class represents clustering algorithm OPTICS (Ordering Points To Identify Clustering Structure) with KD-tree optimization (ccore options is supported).
+    @brief Order seed of OPTICS algorithm - priority queue of objects that are ordered by reachability distance.
+    @details The seed is a binary heap with decrease-key operation: each object has only one valid entry in the heap,
+              an entry of an object becomes invalid when its reachability distance is decreased, and invalid entries
+              are skipped during extraction. Objects with the same reachability distance are ordered in line with time
+              when they were inserted or when their reachability distance was decreased. Insertion, extraction and
+              decrease-key take O(log n).
+
+    """
+
+    def __init__(self):
+        """!
+        @brief Creates empty order seed.
+
+        """
+        self.__heap = []
+        self.__entries = {}
+        self.__sequence = itertools.count()
+
+
+    def __len__(self):
+        """!
+        @brief Returns amount of objects in the order seed.
+
+        """
+        return len(self.__entries)
+
+
+    def push(self, optics_object):
+        """!
+        @brief Inserts object to the order seed using its current reachability distance.
+
+        @param[in] optics_object (optics_descriptor): Object that should be inserted.
+
+        """
+        entry = [optics_object.reachability_distance, next(self.__sequence), optics_object]
+        self.__entries[optics_object.index_object] = entry
+        heapq.heappush(self.__heap, entry)
+
+
+    def decrease(self, optics_object):
+        """!
+        @brief Restores order of the seed after reachability distance of the object has been decreased.
+
+        @param[in] optics_object (optics_descriptor): Object from the order seed whose reachability distance has been decreased.
+
+        """
+        self.__entries.pop(optics_object.index_object)[2] = None
+        self.push(optics_object)
+
+
+    def pop(self):
+        """!
+        @brief Extracts object with the smallest reachability distance from the order seed.
+
+        @return (optics_descriptor) Object with the smallest reachability distance.
+
+        """
+        while True:
+            optics_object = heapq.heappop(self.__heap)[2]
+            if optics_object is not None:
+                del self.__entries[optics_object.index_object]
+                return optics_object
+
+
+class optics(ccore_async_processing):
+    """!
+    @brief Class represents clustering algorithm OPTICS (Ordering Points To Identify Clustering Structure) with neighborhood index optimization (ccore options is supported).
     @details OPTICS is a density-based algorithm. Purpose of the algorithm is to provide explicit clusters, but create clustering-ordering representation of the input data. 
              Clustering-ordering information contains information about internal structures of data set in terms of density and proper connectivity radius can be obtained
              for allocation required amount of clusters using this diagram. In case of usage additional input parameter 'amount of clusters' connectivity radius should be
@@ -375,7 +500,9 @@ class optics:
         """!
         @brief Constructor of clustering algorithm OPTICS.
         
-        @param[in] sample (list): Input data that is presented as a list of points (objects), where each point is represented by list or tuple.
+        @param[in] sample (list|neighborhood_index): Input data that is presented as a list of points (objects), where each point is represented by list or tuple,
+                    or as prebuilt neighborhood index (in this case Python implementation is used and connectivity radius should be less or equal to radius of the index,
+                    the index should be built with `kdtree_order=True` to obtain the same ordering as C++ implementation in case of equal distances).
         @param[in] eps (double): Connectivity radius between points, points may be connected if distance between them less than the radius.
         @param[in] minpts (uint): Minimum number of shared neighbors that is required for establishing links between points.
         @param[in] amount_clusters (uint): Optional parameter where amount of clusters that should be allocated is specified.
@@ -398,13 +525,13 @@ class optics:
         self.__clusters = None
         self.__noise = None
         self.__optics_objects = None
+        self.__ordered_indexes = None
+        self.__extraction_index = None
 
         self.__data_type = kwargs.get('data_type', 'points')
         
-        self.__kdtree = None
-        self.__ccore = ccore
-
-        self.__neighbor_searcher = self.__create_neighbor_searcher(self.__data_type)
+        self.__index = None
+        self.__ccore = ccore and not isinstance(sample, neighborhood_index)
 
         if self.__ccore:
             self.__ccore = ccore_library.workable()
@@ -440,9 +567,11 @@ class optics:
         """
 
         (self.__clusters, self.__noise, self.__ordering, self.__eps,
-         objects_indexes, objects_core_distances, objects_reachability_distances) = \
+         objects_indexes, objects_core_distances, objects_reachability_distances, self.__ordered_indexes) = \
             wrapper.optics(self.__sample_pointer, self.__eps, self.__minpts, self.__amount_clusters, self.__data_type)
 
+        self.__extraction_index = None
+
         self.__optics_objects = []
         for i in range(len(objects_indexes)):
             if objects_core_distances[i] < 0.0:
@@ -463,8 +592,10 @@ class optics:
 
         """
 
-        if self.__data_type == 'points':
-            self.__kdtree = kdtree_balanced(self.__sample_pointer, range(len(self.__sample_pointer)))
+        if isinstance(self.__sample_pointer, neighborhood_index):
+            self.__index = self.__sample_pointer
+        else:
+            self.__index = neighborhood_index(self.__sample_pointer, self.__eps, self.__data_type, kdtree_order=True)
 
         self.__allocate_clusters()
 
@@ -485,6 +616,8 @@ class optics:
         self.__processed = [False] * len(sample)
         self.__optics_objects = [optics_descriptor(i) for i in range(len(sample))]      # List of OPTICS objects that corresponds to objects from input sample.
         self.__ordered_database = []        # List of OPTICS objects in traverse order.
+        self.__ordered_indexes = None       # Indexes of OPTICS objects in traverse order.
+        self.__extraction_index = None      # Sorted core and reachability distances for cluster extraction.
         
         self.__clusters = None      # Result of clustering (list of clusters where each cluster contains indexes of objects from input data).
         self.__noise = None         # Result of clustering (noise).
@@ -598,6 +731,62 @@ class optics:
         return self.__eps
     
 
+    def extract_cluster_amount(self, radius):
+        """!
+        @brief Returns amount of clusters that are allocated by the specified connectivity radius without processing.
+        @details Amount of clusters is calculated in O(log n) using sorted core and reachability distances of objects,
+                  the radius should be less or equal to the connectivity radius that was used for processing.
+
+        @param[in] radius (double): Connectivity radius that is used for cluster allocation.
+
+        @return (uint) Amount of clusters.
+
+        @see extract_clusters()
+        @see get_radius()
+
+        """
+        self.__verify_extraction_radius(radius)
+
+        _, _, _, sorted_core_distances, sorted_maximum_distances = self.__extraction_index
+        return int(numpy.searchsorted(sorted_core_distances, radius, side='right') -
+                   numpy.searchsorted(sorted_maximum_distances, radius, side='right'))
+
+
+    def extract_clusters(self, radius):
+        """!
+        @brief Returns clusters and noise that are allocated by the specified connectivity radius without processing.
+        @details Clusters are extracted from traverse order of objects using their core and reachability distances,
+                  the radius should be less or equal to the connectivity radius that was used for processing.
+
+        @param[in] radius (double): Connectivity radius that is used for cluster allocation.
+
+        @return (tuple) Allocated clusters and noise: (clusters, noise).
+
+        @see extract_cluster_amount()
+        @see get_radius()
+
+        """
+        self.__verify_extraction_radius(radius)
+
+        order, core_distances, reachability_distances, _, _ = self.__extraction_index
+
+        starts = (reachability_distances > radius) & (core_distances <= radius)
+        labels = numpy.cumsum(starts) - 1
+        labels[~starts & (reachability_distances > radius)] = -1
+
+        noise = order[labels == -1].tolist()
+
+        members = labels >= 0
+        if not numpy.any(members):
+            return [], noise
+
+        member_order = numpy.argsort(labels[members], kind='stable')
+        member_labels = labels[members][member_order]
+        clusters = numpy.split(order[members][member_order], numpy.flatnonzero(numpy.diff(member_labels)) + 1)
+
+        return [cluster.tolist() for cluster in clusters], noise
+
+
     def get_cluster_encoding(self):
         """!
         @brief Returns clustering result representation type that indicate how clusters are encoded.
@@ -611,21 +800,6 @@ class optics:
         return type_encoding.CLUSTER_INDEX_LIST_SEPARATION
 
 
-    def __create_neighbor_searcher(self, data_type):
-        """!
-        @brief Returns neighbor searcher in line with data type.
-
-        @param[in] data_type (string): Data type (points or distance matrix).
-
-        """
-        if data_type == 'points':
-            return self.__neighbor_indexes_points
-        elif data_type == 'distance_matrix':
-            return self.__neighbor_indexes_distance_matrix
-        else:
-            raise TypeError("Unknown type of data is specified '%s'" % data_type)
-
-
     def __expand_cluster_order(self, optics_object):
         """!
         @brief Expand cluster order from not processed optic-object that corresponds to object from input data.
@@ -638,31 +812,28 @@ class optics:
         
         optics_object.processed = True
         
-        neighbors_descriptor = self.__neighbor_searcher(optics_object)
+        neighbors_descriptor = self.__neighbor_indexes(optics_object)
         optics_object.reachability_distance = None
         
         self.__ordered_database.append(optics_object)
         
         # Check core distance
         if len(neighbors_descriptor) >= self.__minpts:
-            neighbors_descriptor.sort(key = lambda obj: obj[1])
             optics_object.core_distance = neighbors_descriptor[self.__minpts - 1][1]
             
             # Continue processing
-            order_seed = list()
+            order_seed = optics_order_seed()
             self.__update_order_seed(optics_object, neighbors_descriptor, order_seed)
             
             while len(order_seed) > 0:
-                optic_descriptor = order_seed[0]
-                order_seed.remove(optic_descriptor)
+                optic_descriptor = order_seed.pop()
                 
-                neighbors_descriptor = self.__neighbor_searcher(optic_descriptor)
+                neighbors_descriptor = self.__neighbor_indexes(optic_descriptor)
                 optic_descriptor.processed = True
                 
                 self.__ordered_database.append(optic_descriptor)
                 
                 if len(neighbors_descriptor) >= self.__minpts:
-                    neighbors_descriptor.sort(key = lambda obj: obj[1])
                     optic_descriptor.core_distance = neighbors_descriptor[self.__minpts - 1][1]
                     
                     self.__update_order_seed(optic_descriptor, neighbors_descriptor, order_seed)
@@ -678,20 +849,30 @@ class optics:
         @brief Extract clusters and noise from order database.
         
         """
-     
-        self.__clusters = []
-        self.__noise = []
+        self.__ordered_indexes = [optics_object.index_object for optics_object in self.__ordered_database]
+        self.__clusters, self.__noise = self.extract_clusters(self.__eps)
 
-        current_cluster = self.__noise
-        for optics_object in self.__ordered_database:
-            if (optics_object.reachability_distance is None) or (optics_object.reachability_distance > self.__eps):
-                if (optics_object.core_distance is not None) and (optics_object.core_distance <= self.__eps):
-                    self.__clusters.append([ optics_object.index_object ])
-                    current_cluster = self.__clusters[-1]
-                else:
-                    self.__noise.append(optics_object.index_object)
-            else:
-                current_cluster.append(optics_object.index_object)
+
+    def __create_extraction_index(self):
+        """!
+        @brief Creates arrays of core and reachability distances in traverse order that are used for cluster extraction.
+        @details Object starts a new cluster for radius 'r' if its core distance is less or equal to 'r' and its
+                  reachability distance is greater than 'r', therefore amount of clusters is equal to the difference
+                  between amount of core distances and amount of maximums of core and reachability distances that are
+                  less or equal to 'r'. Both sequences are sorted to count them by binary search.
+
+        """
+        order = numpy.asarray(self.__ordered_indexes, dtype=numpy.int64)
+
+        core_distances = numpy.array([numpy.inf if optics_object.core_distance is None else optics_object.core_distance
+                                      for optics_object in self.__optics_objects], dtype=numpy.float64)[order]
+
+        reachability_distances = numpy.array([numpy.inf if optics_object.reachability_distance is None
+                                              else optics_object.reachability_distance
+                                              for optics_object in self.__optics_objects], dtype=numpy.float64)[order]
+
+        self.__extraction_index = (order, core_distances, reachability_distances, numpy.sort(core_distances),
+                                   numpy.sort(numpy.maximum(core_distances, reachability_distances)))
 
 
     def __update_order_seed(self, optic_descriptor, neighbors_descriptors, order_seed):
@@ -700,60 +881,50 @@ class optics:
         
         @param[in] optic_descriptor (optics_descriptor): Core-object whose neighbors should be analysed.
         @param[in] neighbors_descriptors (list): List of neighbors of core-object.
-        @param[in|out] order_seed (list): List of sorted object in line with reachable distance.
+        @param[in|out] order_seed (optics_order_seed): Objects that are ordered in line with reachable distance.
         
         """
         
-        for neighbor_descriptor in neighbors_descriptors:
-            index_neighbor = neighbor_descriptor[0]
-            current_reachable_distance = neighbor_descriptor[1]
+        for index_neighbor, current_reachable_distance in neighbors_descriptors:
+            neighbor_object = self.__optics_objects[index_neighbor]
             
-            if self.__optics_objects[index_neighbor].processed is not True:
+            if neighbor_object.processed is not True:
                 reachable_distance = max(current_reachable_distance, optic_descriptor.core_distance)
-                if self.__optics_objects[index_neighbor].reachability_distance is None:
-                    self.__optics_objects[index_neighbor].reachability_distance = reachable_distance
-                    
-                    # insert element in queue O(n) - worst case.
-                    index_insertion = len(order_seed)
-                    for index_seed in range(0, len(order_seed)):
-                        if reachable_distance < order_seed[index_seed].reachability_distance:
-                            index_insertion = index_seed
-                            break
-                    
-                    order_seed.insert(index_insertion, self.__optics_objects[index_neighbor])
+                if neighbor_object.reachability_distance is None:
+                    neighbor_object.reachability_distance = reachable_distance
+                    order_seed.push(neighbor_object)
 
-                else:
-                    if reachable_distance < self.__optics_objects[index_neighbor].reachability_distance:
-                        self.__optics_objects[index_neighbor].reachability_distance = reachable_distance
-                        order_seed.sort(key=lambda obj: obj.reachability_distance)
+                elif reachable_distance < neighbor_object.reachability_distance:
+                    neighbor_object.reachability_distance = reachable_distance
+                    order_seed.decrease(neighbor_object)
 
 
-    def __neighbor_indexes_points(self, optic_object):
+    def __neighbor_indexes(self, optic_object):
         """!
-        @brief Return neighbors of the specified object in case of sequence of points.
+        @brief Return neighbors of the specified object using neighborhood index.
 
         @param[in] optic_object (optics_descriptor): Object for which neighbors should be returned in line with connectivity radius.
 
-        @return (list) List of indexes of neighbors in line the connectivity radius.
+        @return (list) List of neighbors in line the connectivity radius that is sorted by distance, where each neighbor is represented by its index and distance to it.
 
         """
-        kdnodes = self.__kdtree.find_nearest_dist_nodes(self.__sample_pointer[optic_object.index_object], self.__eps)
-        return [[node_tuple[1].payload, math.sqrt(node_tuple[0])] for node_tuple in kdnodes if
-                node_tuple[1].payload != optic_object.index_object]
+        indexes, distances = self.__index.neighbors(optic_object.index_object, self.__eps)
+        return list(zip(indexes.tolist(), distances.tolist()))
 
 
-    def __neighbor_indexes_distance_matrix(self, optic_object):
+    def __verify_extraction_radius(self, radius):
         """!
-        @brief Return neighbors of the specified object in case of distance matrix.
-
-        @param[in] optic_object (optics_descriptor): Object for which neighbors should be returned in line with connectivity radius.
+        @brief Verifies radius that is used for cluster extraction and creates extraction index if it is required.
 
-        @return (list) List of indexes of neighbors in line the connectivity radius.
+        @param[in] radius (double): Connectivity radius that is used for cluster extraction.
 
         """
-        distances = self.__sample_pointer[optic_object.index_object]
-        return [[index_neighbor, distances[index_neighbor]] for index_neighbor in range(len(distances))
-                if ((distances[index_neighbor] <= self.__eps) and (index_neighbor != optic_object.index_object))]
+        if radius > self.__eps:
+            raise ValueError("Connectivity radius (current value: '%f') should be less or equal to the radius that "
+                             "was used for processing (current value: '%f')." % (radius, self.__eps))
+
+        if self.__extraction_index is None:
+            self.__create_extraction_index()
 
 
     def __verify_arguments(self):
@@ -767,6 +938,13 @@ class optics:
         if self.__eps < 0:
             raise ValueError("Connectivity radius (current value: '%d') should be greater or equal to 0." % self.__eps)
 
+        if isinstance(self.__sample_pointer, neighborhood_index) and (self.__eps > self.__sample_pointer.radius):
+            raise ValueError("Connectivity radius (current value: '%f') should be less or equal to radius of the "
+                             "neighborhood index (current value: '%f')." % (self.__eps, self.__sample_pointer.radius))
+
+        if self.__data_type not in ('points', 'distance_matrix'):
+            raise TypeError("Unknown type of data is specified '%s'" % self.__data_type)
+
         if self.__minpts < 0:
             raise ValueError("Minimum number of neighbors (current value: '%d') should be greater than 0." %
                              self.__minpts)
@@ -10,18 +10,52 @@
 """
 
 
+import heapq
+
+import numpy
+import scipy.sparse
+
+from enum import IntEnum
+
 from pyclustering.cluster.encoder import type_encoding
 
-from pyclustering.utils import euclidean_distance
+from pyclustering.container.dendrogram import dendrogram
+from pyclustering.container.neighborhood import neighborhood_index
 
-from pyclustering.core.wrapper import ccore_library
+from pyclustering.core.wrapper import ccore_library, ccore_async_processing
 
 import pyclustering.core.rock_wrapper as wrapper
 
 
-class rock:
+class rock_link_type(IntEnum):
+    """!
+    @brief Enumeration of link types that are used by ROCK algorithm to calculate links between clusters.
+
+    """
+
+    ## Link between two points exists if they are neighbors, links between clusters is amount of pairs of neighbors
+    ## (the same links are used by C++ implementation).
+    NEIGHBORS = 0
+
+    ## Amount of links between two points is amount of their common neighbors (each point is considered as its own
+    ## neighbor) as it is defined in the paper, link matrix is a square of adjacency matrix.
+    COMMON_NEIGHBORS = 1
+
+
+
+class rock(ccore_async_processing):
     """!
     @brief The class represents clustering algorithm ROCK.
+    @details Python implementation builds sparse graph of neighbors using neighborhood index (see
+              'neighborhood_index') and sparse matrix of links, therefore neither distance matrix nor adjacency
+              matrix is created. As it is described in the paper, each cluster has its own local heap of clusters
+              that are linked with it ordered by goodness measure and the global heap contains the best pair of each
+              cluster. Links of merged cluster are obtained as a sum of links of the merged clusters, therefore
+              only clusters that are linked with the merged clusters are updated on each step.
+
+              Python implementation merges clusters while they are linked and keeps full merge history (see
+              `get_dendrogram()`), height of each merge is inverse goodness measure. Clusters for another amount
+              of clusters can be obtained from the history without recalculation.
 
     Example:
     @code
@@ -50,7 +84,7 @@ class rock:
        
     """
     
-    def __init__(self, data, eps, number_clusters, threshold=0.5, ccore=True):
+    def __init__(self, data, eps, number_clusters, threshold=0.5, ccore=True, **kwargs):
         """!
         @brief Constructor of clustering algorithm ROCK.
         
@@ -59,6 +93,11 @@ class rock:
         @param[in] number_clusters (uint): Defines number of clusters that should be allocated from the input data set.
         @param[in] threshold (double): Value that defines degree of normalization that influences on choice of clusters for merging during processing.
         @param[in] ccore (bool): Defines should be CCORE (C++ pyclustering library) used instead of Python code or not.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: `link_type`).
+
+        <b>Keyword Args:</b><br>
+            - link_type (rock_link_type): Type of links between points (by default `rock_link_type.NEIGHBORS`), CCORE
+               is used only with `rock_link_type.NEIGHBORS`.
         
         """
         
@@ -66,10 +105,12 @@ class rock:
         self.__eps = eps
         self.__number_clusters = number_clusters
         self.__threshold = threshold
+        self.__link_type = kwargs.get('link_type', rock_link_type.NEIGHBORS)
         
         self.__clusters = None
+        self.__dendrogram = None
         
-        self.__ccore = ccore
+        self.__ccore = ccore and (self.__link_type == rock_link_type.NEIGHBORS)
         if self.__ccore:
             self.__ccore = ccore_library.workable()
 
@@ -77,9 +118,6 @@ class rock:
 
         self.__degree_normalization = 1.0 + 2.0 * ((1.0 - threshold) / (1.0 + threshold))
 
-        self.__adjacency_matrix = None
-        self.__create_adjacency_matrix()
-
 
     def process(self):
         """!
@@ -97,17 +135,9 @@ class rock:
         if self.__ccore is True:
             self.__clusters = wrapper.rock(self.__pointer_data, self.__eps, self.__number_clusters, self.__threshold)
         
-        else:  
-            self.__clusters = [[index] for index in range(len(self.__pointer_data))]
-            
-            while len(self.__clusters) > self.__number_clusters:
-                indexes = self.__find_pair_clusters(self.__clusters)
-                
-                if indexes != [-1, -1]:
-                    self.__clusters[indexes[0]] += self.__clusters[indexes[1]]
-                    self.__clusters.pop(indexes[1])   # remove merged cluster.
-                else:
-                    break  # totally separated clusters have been allocated
+        else:
+            self.__process_by_python()
+
         return self
 
     
@@ -124,6 +154,22 @@ class rock:
         return self.__clusters
 
 
+    def get_dendrogram(self):
+        """!
+        @brief Returns dendrogram of merges where height of each merge is inverse goodness measure, the dendrogram
+                can be cut to obtain any amount of clusters without recalculation.
+
+        @remark Dendrogram is available only if Python implementation is used, otherwise `None` is returned.
+
+        @return (dendrogram) Dendrogram of the merge history.
+
+        @see process()
+
+        """
+
+        return self.__dendrogram
+
+
     def get_cluster_encoding(self):
         """!
         @brief Returns clustering result representation type that indicate how clusters are encoded.
@@ -137,85 +183,164 @@ class rock:
         return type_encoding.CLUSTER_INDEX_LIST_SEPARATION
 
 
-    def __find_pair_clusters(self, clusters):
+    def __process_by_python(self):
         """!
-        @brief Returns pair of clusters that are best candidates for merging in line with goodness measure.
-               The pair of clusters for which the above goodness measure is maximum is the best pair of clusters to be merged.
-               
-        @param[in] clusters (list): List of clusters that have been allocated during processing, each cluster is represented by list of indexes of points from the input data set.
-        
-        @return (list) List that contains two indexes of clusters (from list 'clusters') that should be merged on this step.
-                It can be equals to [-1, -1] when no links between clusters.
-        
+        @brief Performs cluster analysis using python code.
+        @details Clusters are identified by handles, merged cluster gets new handle that is its identifier in
+                  linkage matrix. Pairs of clusters with the same goodness measure are ordered by the first points
+                  of clusters, therefore the pair of clusters with the smallest indexes of points is merged first.
+
         """
-        
-        maximum_goodness = 0.0
-        cluster_indexes = [-1, -1]
-        
-        for i in range(0, len(clusters)):
-            for j in range(i + 1, len(clusters)):
-                goodness = self.__calculate_goodness(clusters[i], clusters[j])
-                if goodness > maximum_goodness:
-                    maximum_goodness = goodness
-                    cluster_indexes = [i, j]
-        
-        return cluster_indexes
+        link_matrix = self.__create_link_matrix()
+        amount_points = len(self.__pointer_data)
+
+        self.__links = [dict(zip(link_matrix.indices[link_matrix.indptr[index_point]:link_matrix.indptr[index_point + 1]].tolist(),
+                                 link_matrix.data[link_matrix.indptr[index_point]:link_matrix.indptr[index_point + 1]].tolist()))
+                        for index_point in range(amount_points)]
+
+        self.__sizes = [1] * amount_points
+        self.__ranks = list(range(amount_points))
+        self.__linkage = []
+        self.__alive = [True] * amount_points
+
+        self.__global_heap = []
+        self.__best_pairs = [None] * amount_points
+        self.__local_heaps = []
+        for handle in range(amount_points):
+            local_heap = [self.__calculate_goodness(handle, neighbor, number_links) + (neighbor,)
+                          for neighbor, number_links in self.__links[handle].items()]
+            heapq.heapify(local_heap)
+            self.__local_heaps.append(local_heap)
+            self.__update_best_pair(handle)
+
+        while len(self.__global_heap) > 0:
+            entry = heapq.heappop(self.__global_heap)
+            handle = entry[3]
+            if (self.__alive[handle] is False) or (self.__best_pairs[handle] != entry[:3]):
+                continue    # the cluster has been merged or its best pair has been changed
+
+            self.__merge_clusters(handle, self.__local_heaps[handle][0][3], -1.0 / entry[0])
+
+        # totally separated clusters might be allocated if there are no links between them
+        self.__dendrogram = dendrogram(self.__linkage, amount_points)
+        self.__clusters = self.__dendrogram.get_clusters(self.__number_clusters)
+
+        self.__links, self.__local_heaps, self.__global_heap, self.__linkage = None, None, None, None
 
 
-    def __calculate_links(self, cluster1, cluster2):
+    def __merge_clusters(self, handle1, handle2, height):
         """!
-        @brief Returns number of link between two clusters. 
-        @details Link between objects (points) exists only if distance between them less than connectivity radius.
-        
-        @param[in] cluster1 (list): The first cluster.
-        @param[in] cluster2 (list): The second cluster.
-        
-        @return (uint) Number of links between two clusters.
-        
+        @brief Merges two clusters into new cluster, links of the new cluster are sums of links of merged clusters.
+
+        @param[in] handle1 (uint): Handle of the first cluster that should be merged.
+        @param[in] handle2 (uint): Handle of the second cluster that should be merged.
+        @param[in] height (double): Height of the merge in the dendrogram (inverse goodness measure).
+
         """
-        
-        number_links = 0
-        
-        for index1 in cluster1:
-            for index2 in cluster2:
-                number_links += self.__adjacency_matrix[index1][index2]
-                
-        return number_links
-            
+        if self.__ranks[handle1] > self.__ranks[handle2]:
+            handle1, handle2 = handle2, handle1
+
+        merged_handle = len(self.__alive)
+        self.__sizes.append(self.__sizes[handle1] + self.__sizes[handle2])
+        self.__ranks.append(self.__ranks[handle1])
+        self.__linkage.append((handle1, handle2, height, self.__sizes[merged_handle]))
+        self.__alive.append(True)
+        self.__best_pairs.append(None)
+
+        self.__alive[handle1], self.__alive[handle2] = False, False
+
+        merged_links = {neighbor: number_links for neighbor, number_links in self.__links[handle1].items()
+                        if neighbor != handle2}
+        for neighbor, number_links in self.__links[handle2].items():
+            if neighbor != handle1:
+                merged_links[neighbor] = merged_links.get(neighbor, 0) + number_links
 
-    def __create_adjacency_matrix(self):
+        self.__links[handle1], self.__links[handle2] = None, None
+        self.__local_heaps[handle1], self.__local_heaps[handle2] = None, None
+        self.__links.append(merged_links)
+
+        merged_heap = []
+        for neighbor, number_links in merged_links.items():
+            neighbor_links = self.__links[neighbor]
+            neighbor_links.pop(handle1, None)
+            neighbor_links.pop(handle2, None)
+            neighbor_links[merged_handle] = number_links
+
+            goodness = self.__calculate_goodness(merged_handle, neighbor, number_links)
+            heapq.heappush(self.__local_heaps[neighbor], goodness + (merged_handle,))
+            merged_heap.append(goodness + (neighbor,))
+
+            self.__update_best_pair(neighbor)
+
+        heapq.heapify(merged_heap)
+        self.__local_heaps.append(merged_heap)
+        self.__update_best_pair(merged_handle)
+
+
+    def __update_best_pair(self, handle):
         """!
-        @brief Creates 2D adjacency matrix (list of lists) where each element described existence of link between points (means that points are neighbors).
-        
+        @brief Removes merged clusters from the top of the local heap of the cluster and updates the global heap if
+                the best pair of the cluster is changed.
+
+        @param[in] handle (uint): Handle of the cluster.
+
         """
-        
-        size_data = len(self.__pointer_data)
-        
-        self.__adjacency_matrix = [[0 for i in range(size_data)] for j in range(size_data)]
-        for i in range(0, size_data):
-            for j in range(i + 1, size_data):
-                distance = euclidean_distance(self.__pointer_data[i], self.__pointer_data[j])
-                if (distance <= self.__eps):
-                    self.__adjacency_matrix[i][j] = 1
-                    self.__adjacency_matrix[j][i] = 1
-        
-    
+        local_heap = self.__local_heaps[handle]
+        while (len(local_heap) > 0) and (self.__alive[local_heap[0][3]] is False):
+            heapq.heappop(local_heap)
+
+        best_pair = local_heap[0][:3] if len(local_heap) > 0 else None
+        if best_pair != self.__best_pairs[handle]:
+            self.__best_pairs[handle] = best_pair
+            if best_pair is not None:
+                heapq.heappush(self.__global_heap, best_pair + (handle,))
+
+
+    def __create_link_matrix(self):
+        """!
+        @brief Creates sparse matrix of links between points using neighborhood index.
+
+        @return (scipy.sparse.csr_matrix) Matrix of links between points.
 
-    def __calculate_goodness(self, cluster1, cluster2):
+        """
+        index = neighborhood_index(self.__pointer_data, self.__eps)
+
+        amount_points = len(self.__pointer_data)
+        adjacency_matrix = scipy.sparse.csr_matrix((numpy.ones(len(index.get_indexes()), dtype=numpy.int64),
+                                                    index.get_indexes(), index.get_index_pointer()),
+                                                   shape=(amount_points, amount_points))
+
+        if self.__link_type == rock_link_type.NEIGHBORS:
+            return adjacency_matrix
+
+        adjacency_matrix = adjacency_matrix + scipy.sparse.identity(amount_points, dtype=numpy.int64, format='csr')
+
+        link_matrix = (adjacency_matrix @ adjacency_matrix).tocsr()
+        link_matrix.setdiag(0)
+        link_matrix.eliminate_zeros()
+        link_matrix.sort_indices()
+        return link_matrix
+
+
+    def __calculate_goodness(self, handle1, handle2, number_links):
         """!
         @brief Calculates coefficient 'goodness measurement' between two clusters. The coefficient defines level of suitability of clusters for merging.
         
-        @param[in] cluster1 (list): The first cluster.
-        @param[in] cluster2 (list): The second cluster.
+        @param[in] handle1 (uint): Handle of the first cluster.
+        @param[in] handle2 (uint): Handle of the second cluster.
+        @param[in] number_links (uint): Number of links between clusters.
         
-        @return Goodness measure between two clusters.
+        @return (tuple) Key of the pair of clusters in heaps: negative goodness measure and ranks of clusters.
         
         """
         
-        number_links = self.__calculate_links(cluster1, cluster2)
-        devider = (len(cluster1) + len(cluster2)) ** self.__degree_normalization - len(cluster1) ** self.__degree_normalization - len(cluster2) ** self.__degree_normalization
+        if self.__ranks[handle1] > self.__ranks[handle2]:
+            handle1, handle2 = handle2, handle1
+
+        size1, size2 = self.__sizes[handle1], self.__sizes[handle2]
+        devider = (size1 + size2) ** self.__degree_normalization - size1 ** self.__degree_normalization - size2 ** self.__degree_normalization
         
-        return number_links / devider
+        return -(number_links / devider), self.__ranks[handle1], self.__ranks[handle2]
 
 
     def __verify_arguments(self):
@@ -235,3 +360,6 @@ class rock:
         if (self.__number_clusters is not None) and (self.__number_clusters <= 0):
             raise ValueError("Amount of clusters (current value: '%d') should be greater than 0." %
                              self.__number_clusters)
+
+        if self.__link_type not in (rock_link_type.NEIGHBORS, rock_link_type.COMMON_NEIGHBORS):
+            raise ValueError("Unknown link type '%s' is specified." % str(self.__link_type))
@@ -10,24 +10,27 @@
 """
 
 
+import concurrent.futures
+
 from enum import IntEnum
 
 import numpy
+import scipy.stats
 
 from pyclustering.cluster.kmeans import kmeans
 from pyclustering.cluster.kmedians import kmedians
 from pyclustering.cluster.kmedoids import kmedoids
-from pyclustering.cluster.center_initializer import kmeans_plusplus_initializer
+from pyclustering.cluster.ksweep import ksweep
 
 from pyclustering.utils.metric import distance_metric, type_metric
 
-from pyclustering.core.wrapper import ccore_library
+from pyclustering.core.wrapper import ccore_library, ccore_async_processing
 from pyclustering.core.metric_wrapper import metric_wrapper
 
 import pyclustering.core.silhouette_wrapper as wrapper
 
 
-class silhouette:
+class silhouette(ccore_async_processing):
     """!
     @brief Represents Silhouette method that is used interpretation and validation of consistency.
     @details The silhouette value is a measure of how similar an object is to its own cluster compared to other clusters.
@@ -134,19 +137,31 @@ class silhouette:
                     points or distance matrix (defined by parameter 'data_type', by default data is considered as a list
                     of points).
         @param[in] clusters (list): Clusters that have been obtained after cluster analysis.
-        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'metric').
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'metric', 'data_type', 'ccore',
+                    'processes', 'sample_size', 'confidence', 'random_state').
 
         <b>Keyword Args:</b><br>
             - metric (distance_metric): Metric that was used for cluster analysis and should be used for Silhouette
                score calculation (by default Square Euclidean distance).
             - data_type (string): Data type of input sample 'data' that is processed by the algorithm ('points', 'distance_matrix').
             - ccore (bool): If True then CCORE (C++ implementation of pyclustering library) is used (by default True).
+            - processes (uint): Amount of processes that are used by Python implementation to process blocks of
+               objects (by default 1, blocks are processed in the current process).
+            - sample_size (uint): Amount of randomly chosen objects whose scores are calculated, by default scores are
+               calculated for all objects. Python implementation is always used for sampled mode.
+            - confidence (double): Confidence level of interval on the mean score (by default 0.95).
+            - random_state (int): Seed for random state that is used to choose objects in sampled mode (by default is
+               `None`, current system time is used).
 
         """
         self.__data = data
         self.__clusters = clusters
         self.__metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
         self.__data_type = kwargs.get('data_type', 'points')
+        self.__processes = kwargs.get('processes', 1)
+        self.__sample_size = kwargs.get('sample_size', None)
+        self.__confidence = kwargs.get('confidence', 0.95)
+        self.__random_state = kwargs.get('random_state', None)
 
         if self.__metric.get_type() != type_metric.USER_DEFINED:
             self.__metric.enable_numpy_usage()
@@ -154,8 +169,10 @@ class silhouette:
             self.__metric.disable_numpy_usage()
 
         self.__score = [0.0] * len(data)
+        self.__sample = list(range(len(data)))
 
         self.__ccore = kwargs.get('ccore', True) and self.__metric.get_type() != type_metric.USER_DEFINED
+        self.__ccore = self.__ccore and self.__sample_size is None
         if self.__ccore:
             self.__ccore = ccore_library.workable()
 
@@ -192,144 +209,261 @@ class silhouette:
     def __process_by_python(self):
         """!
         @brief Performs processing using python code.
+        @details Objects are processed by blocks, distances from objects of a block to all objects are summed for each
+                  cluster by one `bincount` call. Blocks might be processed in parallel processes.
 
         """
-        for index_cluster in range(len(self.__clusters)):
-            for index_point in self.__clusters[index_cluster]:
-                self.__score[index_point] = self.__calculate_score(index_point, index_cluster)
+        labels = numpy.full(len(self.__data), -1, dtype=numpy.int64)
+        for index_cluster, cluster in enumerate(self.__clusters):
+            labels[cluster] = index_cluster
+
+        objects = numpy.flatnonzero(labels >= 0)
+        if (self.__sample_size is not None) and (self.__sample_size < len(objects)):
+            random_state = numpy.random.RandomState(self.__random_state)
+            objects = numpy.sort(random_state.choice(objects, self.__sample_size, replace=False))
+
+        calculator = silhouette_block_calculator(self.__data, labels, self.__metric, self.__data_type)
+
+        # each process should have at least one block
+        block_size = min(calculator.get_block_size(), max(1, -(-len(objects) // self.__processes)))
+        blocks = [objects[index:index + block_size] for index in range(0, len(objects), block_size)]
+
+        if (self.__processes > 1) and (len(blocks) > 1):
+            # blocks are sent by chunks, one chunk per process, therefore the data is pickled once for each process
+            processes = min(self.__processes, len(blocks))
+            chunk_size = -(-len(blocks) // processes)
+            with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as executor:
+                block_scores = list(executor.map(calculator.process, blocks, chunksize=chunk_size))
+        else:
+            block_scores = [calculator.process(block) for block in blocks]
+
+        if self.__sample_size is None:
+            score = numpy.zeros(len(self.__data))
+        else:
+            score = numpy.full(len(self.__data), float('nan'))
+
+        if len(block_scores) > 0:
+            score[objects] = numpy.concatenate(block_scores)
+
+        self.__score = score.tolist()
+        self.__sample = objects.tolist()
 
 
     def get_score(self):
         """!
         @brief Returns Silhouette score for each object from input data.
+        @details In sampled mode (see argument `sample_size`) scores of objects that are not in the sample are equal
+                  to `NaN`.
 
         @see process
+        @see get_sample
 
         """
         return self.__score
 
 
-    def __calculate_score(self, index_point, index_cluster):
+    def get_sample(self):
         """!
-        @brief Calculates Silhouette score for the specific object defined by index_point.
+        @brief Returns indexes of objects whose scores have been calculated.
+        @details All objects that belong to clusters are returned if sampled mode is not used.
 
-        @param[in] index_point (uint): Index point from input data for which Silhouette score should be calculated.
-        @param[in] index_cluster (uint): Index cluster to which the point belongs to.
-
-        @return (float) Silhouette score for the object.
+        @see process
+        @see get_score
 
         """
-        if self.__data_type == 'points':
-            difference = self.__calculate_dataset_difference(index_point)
-        else:
-            difference = self.__data[index_point]
-
-        a_score = self.__calculate_within_cluster_score(index_cluster, difference)
-        b_score = self.__caclulate_optimal_neighbor_cluster_score(index_cluster, difference)
+        if self.__ccore is True:
+            return sorted(index_point for cluster in self.__clusters for index_point in cluster)
 
-        return (b_score - a_score) / max(a_score, b_score)
+        return self.__sample
 
 
-    def __calculate_within_cluster_score(self, index_cluster, difference):
+    def get_mean_score(self):
         """!
-        @brief Calculates 'A' score for the specific object in cluster to which it belongs to.
+        @brief Returns mean Silhouette score of objects whose scores have been calculated.
+        @details Objects of clusters that consist of one object do not have a score (`NaN`) and they are not considered.
 
-        @param[in] index_point (uint): Index point from input data for which 'A' score should be calculated.
-        @param[in] index_cluster (uint): Index cluster to which the point is belong to.
+        @return (double) Mean Silhouette score.
 
-        @return (float) 'A' score for the object.
+        @see get_confidence_interval
 
         """
-
-        score = self.__calculate_cluster_difference(index_cluster, difference)
-        if len(self.__clusters[index_cluster]) == 1:
+        scores = self.__get_sample_scores()
+        if len(scores) == 0:
             return float('nan')
-        return score / (len(self.__clusters[index_cluster]) - 1)
+
+        return float(numpy.mean(scores))
 
 
-    def __calculate_cluster_score(self, index_cluster, difference):
+    def get_confidence_interval(self):
         """!
-        @brief Calculates 'B*' score for the specific object for specific cluster.
+        @brief Returns confidence interval on the mean Silhouette score in line with confidence level.
+        @details Normal approximation with finite population correction is used in sampled mode, the interval is
+                  degenerate (both bounds are equal to the mean score) if scores of all objects have been calculated.
 
-        @param[in] index_point (uint): Index point from input data for which 'B*' score should be calculated.
-        @param[in] index_cluster (uint): Index cluster to which the point is belong to.
+        @return (tuple) Lower and upper bounds of the interval: (lower, upper).
 
-        @return (float) 'B*' score for the object for specific cluster.
+        @see get_mean_score
 
         """
+        scores = self.__get_sample_scores()
+        mean = self.get_mean_score()
 
-        score = self.__calculate_cluster_difference(index_cluster, difference)
-        return score / len(self.__clusters[index_cluster])
+        population = sum(len(cluster) for cluster in self.__clusters)
+        if (len(scores) < 2) or (len(scores) >= population):
+            return mean, mean
 
+        correction = (population - len(scores)) / (population - 1)
+        error = numpy.std(scores, ddof=1) / numpy.sqrt(len(scores)) * numpy.sqrt(correction)
+        error *= scipy.stats.norm.ppf(0.5 + self.__confidence / 2.0)
 
-    def __caclulate_optimal_neighbor_cluster_score(self, index_cluster, difference):
+        return float(mean - error), float(mean + error)
+
+
+    def __get_sample_scores(self):
         """!
-        @brief Calculates 'B' score for the specific object for the nearest cluster.
+        @brief Returns scores of objects whose scores have been calculated excluding `NaN` values.
 
-        @param[in] index_point (uint): Index point from input data for which 'B' score should be calculated.
-        @param[in] index_cluster (uint): Index cluster to which the point is belong to.
+        @return (numpy.ndarray) Scores of sampled objects.
+
+        """
+        scores = numpy.array(self.__score, dtype=numpy.float64)[self.get_sample()]
+        return scores[~numpy.isnan(scores)]
 
-        @return (float) 'B' score for the object.
+
+    def __verify_arguments(self):
+        """!
+        @brief Verify input parameters for the algorithm and throw exception in case of incorrectness.
 
         """
+        if len(self.__data) == 0:
+            raise ValueError("Input data is empty (size: '%d')." % len(self.__data))
+
+        if len(self.__clusters) == 0:
+            raise ValueError("Input clusters are empty (size: '%d')." % len(self.__clusters))
 
-        optimal_score = float('inf')
-        for index_neighbor_cluster in range(len(self.__clusters)):
-            if index_cluster != index_neighbor_cluster:
-                candidate_score = self.__calculate_cluster_score(index_neighbor_cluster, difference)
-                if candidate_score < optimal_score:
-                    optimal_score = candidate_score
+        if self.__processes <= 0:
+            raise ValueError("Amount of processes (current value: '%d') should be greater than 0." % self.__processes)
 
-        if optimal_score == float('inf'):
-            optimal_score = -1.0
+        if (self.__sample_size is not None) and (self.__sample_size <= 0):
+            raise ValueError("Sample size (current value: '%d') should be greater than 0." % self.__sample_size)
 
-        return optimal_score
+        if not (0.0 < self.__confidence < 1.0):
+            raise ValueError("Confidence level (current value: '%f') should be in range (0, 1)." % self.__confidence)
 
 
-    def __calculate_cluster_difference(self, index_cluster, difference):
+
+class silhouette_block_calculator:
+    """!
+    @brief Calculates Silhouette scores for blocks of objects.
+    @details Distances from objects of a block to all objects are calculated at once and summed for each pair (object
+              of the block, cluster) by one `bincount` call. The instance is independent from
+              Silhouette method and can be sent to another process, metric should be picklable in this case
+              (user-defined function should be defined on module level).
+
+    @see silhouette
+
+    """
+
+    def __init__(self, data, labels, metric, data_type):
         """!
-        @brief Calculates distance from each object in specified cluster to specified object.
+        @brief Initializes calculator of Silhouette scores.
 
-        @param[in] index_point (uint): Index point for which difference is calculated.
+        @param[in] data (numpy.ndarray): Input data that is presented as points or distance matrix.
+        @param[in] labels (numpy.ndarray): Index of cluster of each object, `-1` if object does not belong to any
+                    cluster.
+        @param[in] metric (distance_metric): Metric that should be used for Silhouette score calculation.
+        @param[in] data_type (string): Data type of input data ('points', 'distance_matrix').
 
-        @return (list) Distance from specified object to each object from input data in specified cluster.
+        """
+        self.__data = data
+        self.__labels = labels
+        self.__metric = metric
+        self.__data_type = data_type
+
+        self.__amount_clusters = int(labels.max()) + 1
+        self.__clustered = numpy.flatnonzero(labels >= 0)
+        self.__clustered_labels = labels[self.__clustered]
+        self.__sizes = numpy.bincount(self.__clustered_labels, minlength=self.__amount_clusters).astype(numpy.float64)
+
+
+    def get_block_size(self):
+        """!
+        @brief Returns amount of objects in a block that is processed at once to keep distance matrix in memory.
+
+        @return (uint) Amount of objects in a block.
 
         """
-        cluster_difference = 0.0
-        for index_point in self.__clusters[index_cluster]:
-            cluster_difference += difference[index_point]
+        width = len(self.__data)
+        if (self.__data_type == 'points') and (self.__metric.get_type() not in (type_metric.EUCLIDEAN,
+                                                                                 type_metric.EUCLIDEAN_SQUARE)):
+            width *= len(self.__data[0])
 
-        return cluster_difference
+        return max(1, 2 ** 22 // width)
 
 
-    def __calculate_dataset_difference(self, index_point):
+    def process(self, block):
         """!
-        @brief Calculate distance from each object to specified object.
+        @brief Calculates Silhouette scores for the specified objects.
 
-        @param[in] index_point (uint): Index point for which difference with other points is calculated.
+        @param[in] block (numpy.ndarray): Indexes of objects that belong to clusters.
 
-        @return (list) Distance to each object from input data from the specified.
+        @return (numpy.ndarray) Silhouette score of each object.
 
         """
+        own_labels = self.__labels[block]
+        own_rows = numpy.arange(len(block))
 
-        if self.__metric.get_type() != type_metric.USER_DEFINED:
-            dataset_differences = self.__metric(self.__data, self.__data[index_point])
-        else:
-            dataset_differences = [self.__metric(point, self.__data[index_point]) for point in self.__data]
+        distances = self.__calculate_distances(block)
+        if len(self.__clustered) < len(self.__labels):
+            distances = distances[:, self.__clustered]
+        bins = (own_rows * self.__amount_clusters)[:, numpy.newaxis] + self.__clustered_labels
+        cluster_sums = numpy.bincount(bins.ravel(), weights=distances.ravel(),
+                                      minlength=len(block) * self.__amount_clusters)
+        cluster_sums = cluster_sums.reshape(len(block), self.__amount_clusters)
 
-        return dataset_differences
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            a_score = cluster_sums[own_rows, own_labels] / (self.__sizes[own_labels] - 1.0)
+            a_score[self.__sizes[own_labels] == 1] = float('nan')
 
+            neighbor_scores = cluster_sums / self.__sizes
+            neighbor_scores[:, self.__sizes == 0] = float('inf')
+            neighbor_scores[own_rows, own_labels] = float('inf')
 
-    def __verify_arguments(self):
+        b_score = numpy.min(neighbor_scores, axis=1)
+        b_score[numpy.isinf(b_score)] = -1.0
+
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            return (b_score - a_score) / numpy.maximum(a_score, b_score)
+
+
+    def __calculate_distances(self, block):
         """!
-        @brief Verify input parameters for the algorithm and throw exception in case of incorrectness.
+        @brief Calculates distances from each object of the block to each object of input data.
+
+        @param[in] block (numpy.ndarray): Indexes of objects.
+
+        @return (numpy.ndarray) Distance matrix (block size x data size).
 
         """
-        if len(self.__data) == 0:
-            raise ValueError("Input data is empty (size: '%d')." % len(self.__data))
+        if self.__data_type != 'points':
+            return numpy.asarray(self.__data[block], dtype=numpy.float64)
 
-        if len(self.__clusters) == 0:
-            raise ValueError("Input clusters are empty (size: '%d')." % len(self.__clusters))
+        metric_type = self.__metric.get_type()
+        if metric_type in (type_metric.EUCLIDEAN, type_metric.EUCLIDEAN_SQUARE):
+            distances = numpy.zeros((len(block), len(self.__data)))
+            for dimension in range(self.__data.shape[1]):
+                differences = numpy.subtract.outer(self.__data[block, dimension], self.__data[:, dimension])
+                distances += numpy.square(differences, out=differences)
+
+            return numpy.sqrt(distances) if metric_type == type_metric.EUCLIDEAN else distances
+
+        if metric_type != type_metric.USER_DEFINED:
+            points = numpy.repeat(self.__data[block], len(self.__data), axis=0)
+            others = numpy.tile(self.__data, (len(block), 1))
+            return numpy.asarray(self.__metric(points, others), dtype=numpy.float64).reshape(len(block), -1)
+
+        return numpy.array([[self.__metric(point, self.__data[index_point]) for point in self.__data]
+                            for index_point in block], dtype=numpy.float64)
 
 
 
@@ -368,7 +502,7 @@ class silhouette_ksearch_type(IntEnum):
 
 
 
-class silhouette_ksearch:
+class silhouette_ksearch(ccore_async_processing):
     """!
     @brief Represent algorithm for searching optimal number of clusters using specified K-algorithm (K-Means,
             K-Medians, K-Medoids) that is based on Silhouette method.
@@ -421,12 +555,17 @@ class silhouette_ksearch:
         @param[in] kmin (uint): Minimum amount of clusters that might be allocated. Should be equal or greater than `2`.
         @param[in] kmax (uint): Maximum amount of clusters that might be allocated. Should be equal or less than amount
                     of points in input data.
-        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: `algorithm`, `random_state`).
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: `algorithm`, `random_state`, `ccore`,
+                    `warm_start`, `workers`).
 
         <b>Keyword Args:</b><br>
             - algorithm (silhouette_ksearch_type): Defines algorithm that is used for searching optimal number of
                clusters (by default K-Means).
+            - random_state (int): Seed for random state (by default is `None`, current system time is used).
             - ccore (bool): If True then CCORE (C++ implementation of pyclustering library) is used (by default True).
+            - warm_start (bool): If `True` then each K is initialized by splitting the worst cluster of the previous K
+               (by default `False`), see `ksweep`.
+            - workers (uint): Amount of threads that process K values in parallel (by default 1), see `ksweep`.
 
         """
         self.__data = data
@@ -435,11 +574,13 @@ class silhouette_ksearch:
 
         self.__algorithm = kwargs.get('algorithm', silhouette_ksearch_type.KMEANS)
         self.__random_state = kwargs.get('random_state', None)
-        self.__return_index = self.__algorithm == silhouette_ksearch_type.KMEDOIDS
+        self.__warm_start = kwargs.get('warm_start', False)
+        self.__workers = kwargs.get('workers', 1)
 
         self.__amount = -1
         self.__score = -1.0
         self.__scores = {}
+        self.__times = {}
 
         self.__verify_arguments()
 
@@ -457,7 +598,7 @@ class silhouette_ksearch:
         @return (silhouette_search) Itself instance (silhouette_search)
 
         """
-        if self.__ccore is True:
+        if (self.__ccore is True) and (self.__warm_start is False) and (self.__workers == 1):
             self.__process_by_ccore()
         else:
             self.__process_by_python()
@@ -483,20 +624,22 @@ class silhouette_ksearch:
 
     def __process_by_python(self):
         """!
-        @brief Performs processing using python code.
+        @brief Performs processing using python code, K values are processed by `ksweep`.
 
         """
+        sweep_instance = ksweep(self.__data, range(self.__kmin, self.__kmax), self.__algorithm.get_type(),
+                                evaluator=self.__calculate_score, random_state=self.__random_state,
+                                warm_start=self.__warm_start, workers=self.__workers, ccore=self.__ccore).process()
+
         self.__scores = {}
+        self.__times = sweep_instance.get_times()
 
-        for k in range(self.__kmin, self.__kmax):
-            clusters = self.__calculate_clusters(k)
-            if len(clusters) != k:
+        for k, (amount, score) in sweep_instance.get_results().items():
+            if amount != k:
                 self.__scores[k] = float('nan')
                 continue
 
-            score = silhouette(self.__data, clusters).process().get_score()
-
-            self.__scores[k] = sum(score) / len(score)
+            self.__scores[k] = score
 
             if self.__scores[k] > self.__score:
                 self.__score = self.__scores[k]
@@ -539,18 +682,33 @@ class silhouette_ksearch:
         return self.__scores
 
 
-    def __calculate_clusters(self, k):
+    def get_times(self):
         """!
-        @brief Performs cluster analysis using specified K value.
+        @brief Returns processing time (cluster analysis and Silhouette score calculation) in seconds for each K value.
+        @details Time is measured only by Python implementation, empty dictionary is returned if C++ implementation
+                  is used.
 
-        @param[in] k (uint): Amount of clusters that should be allocated.
+        @return (dict) Processing time for each K value.
 
-        @return (array_like) Allocated clusters.
+        @see process, get_scores
 
         """
-        initial_values = kmeans_plusplus_initializer(self.__data, k, random_state=self.__random_state).initialize(return_index=self.__return_index)
-        algorithm_type = self.__algorithm.get_type()
-        return algorithm_type(self.__data, initial_values).process().get_clusters()
+        return self.__times
+
+
+    def __calculate_score(self, data, instance):
+        """!
+        @brief Calculates mean Silhouette score of clustering result.
+
+        @param[in] data (numpy.ndarray): Input data that has been used for cluster analysis.
+        @param[in] instance (object): Processed instance of K-algorithm.
+
+        @return (tuple) Amount of allocated clusters and mean Silhouette score: (amount, score).
+
+        """
+        clusters = instance.get_clusters()
+        score = silhouette(data, clusters, ccore=self.__ccore).process().get_score()
+        return len(clusters), sum(score) / len(score)
 
 
     def __verify_arguments(self):
@@ -565,3 +723,6 @@ class silhouette_ksearch:
         if self.__kmin <= 1:
             raise ValueError("K min value '" + str(self.__kmin) + "' should be greater than 1 (impossible to provide "
                              "silhouette score for only one cluster).")
+
+        if self.__workers <= 0:
+            raise ValueError("Amount of workers (current value: '%d') should be greater than 0." % self.__workers)
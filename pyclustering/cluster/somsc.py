@@ -13,13 +13,13 @@
 """
 
 
-from pyclustering.core.wrapper import ccore_library
+from pyclustering.core.wrapper import ccore_library, ccore_async_processing
 from pyclustering.cluster.encoder import type_encoding
 from pyclustering.nnet.som import som, som_parameters
 from pyclustering.nnet.som import type_conn
 
 
-class somsc:
+class somsc(ccore_async_processing):
     """!
     @brief   Class represents a simple clustering algorithm based on the self-organized feature map.
     @details This algorithm uses amount of clusters that should be allocated as a size of SOM map. Captured
@@ -62,3 +62,26 @@ class AgglomerativeTestTemplates:
                 allocated_number_objects += 1
             
         assert (number_objects == allocated_number_objects);    # number of allocated objects should be the same.
+
+    @staticmethod
+    def templateLinkageCut(path, link, amounts_clusters):
+        sample = read_sample(path)
+
+        tree = agglomerative(sample, 1, link, False).process().get_dendrogram()
+        linkage = tree.get_linkage()
+
+        assert linkage.shape == (len(sample) - 1, 4);
+        assert linkage[-1][3] == len(sample);
+
+        for number_clusters in amounts_clusters:
+            expected_clusters = agglomerative(sample, number_clusters, link, False).process().get_clusters()
+            assert tree.get_clusters(number_clusters) == expected_clusters;
+
+    @staticmethod
+    def templatePythonCoreAgreement(path, number_clusters, link):
+        sample = read_sample(path)
+
+        python_clusters = agglomerative(sample, number_clusters, link, False).process().get_clusters()
+        core_clusters = agglomerative(sample, number_clusters, link, True).process().get_clusters()
+
+        assert sorted(sorted(cluster) for cluster in python_clusters) == sorted(sorted(cluster) for cluster in core_clusters);
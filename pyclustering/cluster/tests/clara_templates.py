@@ -0,0 +1,74 @@
+"""!
+
+@brief Test templates for CLARA clustering module.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2020
+@copyright BSD-3-Clause
+
+"""
+
+
+from pyclustering.tests.assertion import assertion
+
+from pyclustering.cluster.clara import clara
+from pyclustering.cluster.kmedoids import kmedoids, build
+
+from pyclustering.utils import read_sample
+from pyclustering.utils.metric import distance_metric, type_metric
+
+
+class clara_test_template:
+    @staticmethod
+    def templateClusterAllocation(path_to_file, amount_clusters, expected_cluster_length, ccore, **kwargs):
+        sample = read_sample(path_to_file)
+        metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
+
+        testing_result = False
+
+        # it's randomized algorithm therefore attempts are required
+        for _ in range(5):
+            clara_instance = clara(sample, amount_clusters, ccore=ccore, **kwargs).process()
+
+            clusters = clara_instance.get_clusters()
+            medoids = clara_instance.get_medoids()
+            labels = clara_instance.get_labels()
+
+            assertion.eq(len(clusters), len(medoids))
+            assertion.eq(len(sample), len(labels))
+            assertion.eq(len(sample), sum([len(cluster) for cluster in clusters]))
+            assertion.eq(len(medoids), len(set(medoids)))
+
+            expected_total_deviation = 0.0
+            for index_cluster, cluster in enumerate(clusters):
+                assertion.true(medoids[index_cluster] in cluster)
+                for index_point in cluster:
+                    assertion.eq(index_cluster, labels[index_point])
+                    expected_total_deviation += metric(sample[medoids[index_cluster]], sample[index_point])
+
+            assertion.eq_float(expected_total_deviation, clara_instance.get_total_deviation(), 0.000001)
+
+            if expected_cluster_length is not None:
+                if sorted([len(cluster) for cluster in clusters]) != sorted(expected_cluster_length):
+                    continue
+
+            testing_result = True
+            break
+
+        assertion.true(testing_result)
+
+
+    @staticmethod
+    def templateWholeDataSample(path_to_file, amount_clusters, ccore, **kwargs):
+        sample = read_sample(path_to_file)
+        metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
+
+        # sample that covers the whole data gives the same result as PAM BUILD and K-Medoids
+        initial_medoids = build(sample, amount_clusters, ccore, metric=metric).initialize()
+        expected_medoids = kmedoids(sample, initial_medoids, ccore=ccore, metric=metric).process().get_medoids()
+
+        for chunk_size in [1, 7, len(sample)]:
+            clara_instance = clara(sample, amount_clusters, samples=3, sample_size=len(sample), ccore=ccore,
+                                   chunk_size=chunk_size, **kwargs).process()
+
+            assertion.eq(expected_medoids, clara_instance.get_medoids())
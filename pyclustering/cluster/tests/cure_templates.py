@@ -88,14 +88,74 @@ class CureTestTemplates:
 
 
     @staticmethod
-    def exception(type, input_data, number_cluster, number_represent_points, compression, ccore_flag):
+    def template_python_core_agreement(path, number_cluster, number_represent_points, compression):
+        sample = read_sample(path)
+
+        python_instance = cure(sample, number_cluster, number_represent_points, compression, ccore=False).process()
+        core_instance = cure(sample, number_cluster, number_represent_points, compression, ccore=True).process()
+
+        python_clusters = sorted(sorted(cluster) for cluster in python_instance.get_clusters())
+        core_clusters = sorted(sorted(cluster) for cluster in core_instance.get_clusters())
+
+        assertion.eq(core_clusters, python_clusters)
+
+
+    @staticmethod
+    def template_random_blobs(amount_clusters, cluster_size, dimension, seed, ccore_flag=False, **kwargs):
+        generator = numpy.random.RandomState(seed)
+        sample = numpy.concatenate([generator.normal(10.0 * index_cluster, 0.5, (cluster_size, dimension))
+                                    for index_cluster in range(amount_clusters)])
+
+        cure_instance = cure(sample, amount_clusters, 5, 0.5, ccore=ccore_flag, **kwargs).process()
+        clusters = cure_instance.get_clusters()
+
+        assertion.eq(amount_clusters, len(clusters))
+        assertion.eq(amount_clusters, len(cure_instance.get_representors()))
+
+        expected_clusters = [list(range(index_cluster * cluster_size, (index_cluster + 1) * cluster_size))
+                             for index_cluster in range(amount_clusters)]
+        assertion.eq(expected_clusters, sorted(sorted(cluster) for cluster in clusters))
+
+
+    @staticmethod
+    def template_sampling(path, cluster_sizes, number_cluster, sample_size, partitions, ccore_flag, **kwargs):
+        sample = read_sample(path)
+
+        cure_instance = cure(sample, number_cluster, 5, 0.3, ccore=ccore_flag, sample_size=sample_size,
+                             partitions=partitions, **kwargs).process()
+
+        clusters = cure_instance.get_clusters()
+        assertion.eq(number_cluster, len(cure_instance.get_representors()))
+        assertion.eq(number_cluster, len(cure_instance.get_means()))
+
+        assertion.eq(list(range(len(sample))), sorted(index_point for cluster in clusters for index_point in cluster))
+        assertion.eq(sorted(cluster_sizes), sorted(len(cluster) for cluster in clusters))
+
+
+    @staticmethod
+    def template_dendrogram_cut(path, amounts_clusters, number_represent_points, compression):
+        sample = read_sample(path)
+
+        tree = cure(sample, 1, number_represent_points, compression, ccore=False).process().get_dendrogram()
+        assertion.eq(len(sample), len(tree))
+        assertion.eq(len(sample) - 1, len(tree.get_linkage()))
+
+        for number_cluster in amounts_clusters:
+            cure_instance = cure(sample, number_cluster, number_represent_points, compression, ccore=False).process()
+            expected_clusters = sorted(cure_instance.get_clusters(), key=min)
+            assertion.eq(expected_clusters, tree.get_clusters(number_cluster))
+            assertion.eq(expected_clusters, cure_instance.get_dendrogram().get_clusters(number_cluster))
+
+
+    @staticmethod
+    def exception(type, input_data, number_cluster, number_represent_points, compression, ccore_flag, **kwargs):
         try:
             if isinstance(input_data, str):
                 sample = read_sample(input_data)
             else:
                 sample = input_data
 
-            cure_instance = cure(sample, number_cluster, number_represent_points, compression, ccore=ccore_flag)
+            cure_instance = cure(sample, number_cluster, number_represent_points, compression, ccore=ccore_flag, **kwargs)
             cure_instance.process()
 
         except type:
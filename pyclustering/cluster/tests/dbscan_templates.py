@@ -17,6 +17,8 @@ from random import random, shuffle
 from pyclustering.utils import read_sample, calculate_distance_matrix
 from pyclustering.cluster.dbscan import dbscan
 
+from pyclustering.container.neighborhood import neighborhood_index
+
 from pyclustering.tests.assertion import assertion
 
 from pyclustering.samples.definitions import SIMPLE_SAMPLES
@@ -24,6 +26,19 @@ from pyclustering.samples import answer_reader
 
 
 class DbscanTestTemplates:
+    @staticmethod
+    def templateProcessAsync(path, radius, neighbors, amount_instances, ccore):
+        sample = read_sample(path)
+
+        expected_instance = dbscan(sample, radius, neighbors, ccore).process()
+
+        futures = [dbscan(sample, radius, neighbors, ccore).process_async() for _ in range(amount_instances)]
+        for future in futures:
+            instance = future.result()
+            assertion.eq(expected_instance.get_clusters(), instance.get_clusters())
+            assertion.eq(expected_instance.get_noise(), instance.get_noise())
+
+
     @staticmethod
     def templateClusteringResults(path, radius, neighbors, expected_length_clusters, ccore, **kwargs):
         random_order = kwargs.get('random_order', False)
@@ -170,6 +185,39 @@ class DbscanTestTemplates:
         assertion.eq(expected_length_clusters, sorted([len(cluster) for cluster in clusters]))
 
 
+    @staticmethod
+    def templateClusteringPointsAgainstDistanceMatrix(sample, radius, neighbors, ccore):
+        distance_matrix = calculate_distance_matrix(sample)
+
+        points_instance = dbscan(sample, radius, neighbors, ccore).process()
+        matrix_instance = dbscan(distance_matrix, radius, neighbors, ccore, data_type='distance_matrix').process()
+
+        expected_clusters = sorted([sorted(cluster) for cluster in matrix_instance.get_clusters()])
+        actual_clusters = sorted([sorted(cluster) for cluster in points_instance.get_clusters()])
+
+        assertion.eq(sorted(matrix_instance.get_noise()), sorted(points_instance.get_noise()))
+        assertion.eq(len(expected_clusters), len(actual_clusters))
+        assertion.eq(sorted([len(cluster) for cluster in expected_clusters]),
+                     sorted([len(cluster) for cluster in actual_clusters]))
+
+
+    @staticmethod
+    def templateClusteringNeighborhoodIndex(path, index_radius, radius, neighbors_range, ccore):
+        sample = read_sample(path)
+        index = neighborhood_index(sample, index_radius)
+
+        for neighbors in neighbors_range:
+            expected_instance = dbscan(sample, radius, neighbors, ccore).process()
+            actual_instance = dbscan(index, radius, neighbors, ccore).process()
+
+            expected_clusters = sorted([sorted(cluster) for cluster in expected_instance.get_clusters()])
+            actual_clusters = sorted([sorted(cluster) for cluster in actual_instance.get_clusters()])
+
+            assertion.eq(sorted(expected_instance.get_noise()), sorted(actual_instance.get_noise()))
+            assertion.eq(sorted([len(cluster) for cluster in expected_clusters]),
+                         sorted([len(cluster) for cluster in actual_clusters]))
+
+
     @staticmethod
     def pickle_dump_load(ccore):
         dump_file_name = tempfile.gettempdir() + os.sep + 'test_dbscan_file.pkl'
@@ -86,3 +86,15 @@ class elbow_test_template:
 
             assertion.eq(elbow_1, elbow_2)
             assertion.eq(wce_1, wce_2)
+
+
+    @staticmethod
+    def calculate_times(path_to_data, kmin, kmax, ccore, **kwargs):
+        sample = read_sample(path_to_data)
+
+        elbow_instance = elbow(sample, kmin, kmax, ccore=ccore, **kwargs).process()
+        times = elbow_instance.get_times()
+
+        assertion.eq(list(range(kmin, kmax + 1)), sorted(times.keys()))
+        for k in times:
+            assertion.le(0.0, times[k])
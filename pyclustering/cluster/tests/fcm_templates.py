@@ -9,6 +9,9 @@
 """
 
 
+import numpy
+import scipy.sparse
+
 from pyclustering.tests.assertion import assertion
 
 from pyclustering.cluster.fcm import fcm
@@ -55,3 +58,52 @@ class fcm_test_template:
             obtained_cluster_sizes.sort()
             expected_cluster_length.sort()
             assertion.eq(obtained_cluster_sizes, expected_cluster_length)
+
+
+    @staticmethod
+    def chunk_size(path, initial_centers, m, chunk_size):
+        sample = read_sample(path)
+
+        expected = fcm(sample, initial_centers, m=m, ccore=False).process()
+        obtained = fcm(sample, initial_centers, m=m, ccore=False, chunk_size=chunk_size).process()
+
+        assertion.eq(expected.get_clusters(), obtained.get_clusters())
+        assertion.true(numpy.allclose(expected.get_centers(), obtained.get_centers()))
+        assertion.true(numpy.allclose(expected.get_membership(), obtained.get_membership()))
+
+    @staticmethod
+    def single_precision(path, initial_centers, m):
+        sample = read_sample(path)
+
+        expected = fcm(sample, initial_centers, m=m, ccore=False).process()
+        obtained = fcm(sample, initial_centers, m=m, ccore=False, dtype=numpy.float32).process()
+
+        assertion.eq(numpy.float32, obtained.get_membership().dtype)
+        assertion.eq(numpy.float32, obtained.get_centers().dtype)
+        assertion.true(numpy.allclose(expected.get_centers(), obtained.get_centers(), atol=0.001))
+        assertion.eq(sorted(len(cluster) for cluster in expected.get_clusters()),
+                     sorted(len(cluster) for cluster in obtained.get_clusters()))
+
+    @staticmethod
+    def top_membership(path, initial_centers, m, top_m):
+        sample = read_sample(path)
+
+        expected = fcm(sample, initial_centers, m=m, ccore=False).process()
+        obtained = fcm(sample, initial_centers, m=m, ccore=False, top_m=top_m).process()
+
+        assertion.eq(expected.get_clusters(), obtained.get_clusters())
+
+        membership = obtained.get_membership()
+        assertion.true(scipy.sparse.issparse(membership))
+        assertion.eq((len(sample), len(initial_centers)), membership.shape)
+
+        expected_membership = numpy.array(expected.get_membership())
+        amount_values = min(top_m, len(initial_centers))
+        assertion.eq(len(sample) * amount_values, membership.nnz)
+
+        for index_point in range(len(sample)):
+            row = membership.getrow(index_point)
+            assertion.true(numpy.allclose(expected_membership[index_point, row.indices], row.data))
+
+            expected_values = numpy.sort(expected_membership[index_point])[-amount_values:]
+            assertion.true(numpy.allclose(expected_values, numpy.sort(row.data)))
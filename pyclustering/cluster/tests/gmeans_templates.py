@@ -28,6 +28,7 @@ class gmeans_test_template(unittest.TestCase):
 
         k_max = kwargs.get('k_max', -1)
         random_state = kwargs.get('random_state', None)
+        processes = kwargs.get('processes', 1)
         data = read_sample(sample_path)
 
         if isinstance(answer, str):
@@ -44,7 +45,8 @@ class gmeans_test_template(unittest.TestCase):
             amount_clusters = len(answer)
 
         for _ in range(attempts):
-            gmeans_instance = gmeans(data, amount, ccore, k_max=k_max, random_state=random_state).process()
+            gmeans_instance = gmeans(data, amount, ccore, k_max=k_max, random_state=random_state,
+                                     processes=processes).process()
 
             clusters = gmeans_instance.get_clusters()
             centers = gmeans_instance.get_centers()
@@ -86,4 +88,15 @@ class gmeans_test_template(unittest.TestCase):
 
             return
 
-        self.fail("Expected result is not obtained during %d attempts: %s\n" % (attempts, failures))
\ No newline at end of file
+        self.fail("Expected result is not obtained during %d attempts: %s\n" % (attempts, failures))
+
+
+    def processes(self, sample_path, amount, processes, **kwargs):
+        data = read_sample(sample_path)
+
+        gmeans_instance1 = gmeans(data, amount, False, **kwargs).process()
+        gmeans_instance2 = gmeans(data, amount, False, processes=processes, **kwargs).process()
+
+        self.assertEqual(gmeans_instance1.get_total_wce(), gmeans_instance2.get_total_wce())
+        self.assertEqual(gmeans_instance1.get_centers(), gmeans_instance2.get_centers())
+        self.assertEqual(gmeans_instance1.get_clusters(), gmeans_instance2.get_clusters())
\ No newline at end of file
@@ -18,6 +18,7 @@ matplotlib.use('Agg')
 
 from pyclustering.cluster.tests.integration               import it_agglomerative as cluster_agglomerative_integration_tests
 from pyclustering.cluster.tests.integration               import it_bsas          as cluster_bsas_integration_tests
+from pyclustering.cluster.tests.integration               import it_clara         as cluster_clara_integration_tests
 from pyclustering.cluster.tests.integration               import it_clique        as cluster_clique_integration_tests
 from pyclustering.cluster.tests.integration               import it_cure          as cluster_cure_integration_tests
 from pyclustering.cluster.tests.integration               import it_dbscan        as cluster_dbscan_integration_tests
@@ -28,6 +29,7 @@ from pyclustering.cluster.tests.integration               import it_hsyncnet
 from pyclustering.cluster.tests.integration               import it_kmeans        as cluster_kmeans_integration_tests
 from pyclustering.cluster.tests.integration               import it_kmedians      as cluster_kmedians_integration_tests
 from pyclustering.cluster.tests.integration               import it_kmedoids      as cluster_kmedoids_integration_tests
+from pyclustering.cluster.tests.integration               import it_ksweep        as cluster_ksweep_integration_tests
 from pyclustering.cluster.tests.integration               import it_mbsas         as cluster_mbsas_integration_tests
 from pyclustering.cluster.tests.integration               import it_optics        as cluster_optics_integration_tests
 from pyclustering.cluster.tests.integration               import it_rock          as cluster_rock_integration_tests
@@ -47,6 +49,7 @@ class clustering_integration_tests(suite_holder):
     def fill_suite(integration_cluster_suite):
         integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_agglomerative_integration_tests))
         integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_bsas_integration_tests))
+        integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_clara_integration_tests))
         integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_clique_integration_tests))
         integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_cure_integration_tests))
         integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_dbscan_integration_tests))
@@ -57,6 +60,7 @@ class clustering_integration_tests(suite_holder):
         integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_kmeans_integration_tests))
         integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_kmedians_integration_tests))
         integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_kmedoids_integration_tests))
+        integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_ksweep_integration_tests))
         integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_mbsas_integration_tests))
         integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_optics_integration_tests))
         integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_rock_integration_tests))
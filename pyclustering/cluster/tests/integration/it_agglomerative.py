@@ -17,7 +17,7 @@ matplotlib.use('Agg')
 from pyclustering.cluster.tests.agglomerative_templates import AgglomerativeTestTemplates
 from pyclustering.cluster.agglomerative import agglomerative, type_link
 
-from pyclustering.samples.definitions import SIMPLE_SAMPLES
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
 
 from pyclustering.core.tests import remove_library, corrupt_library
 
@@ -114,6 +114,19 @@ class AgglomerativeIntegrationTest(unittest.TestCase):
     def testTwoClusterAllocationTheSameObjectLinkSingleByCore(self):
         AgglomerativeTestTemplates.templateClusterAllocationTheSameObjects(10, 2, type_link.SINGLE_LINK, True);
 
+    def testPythonCoreAgreementLinkAverage(self):
+        AgglomerativeTestTemplates.templatePythonCoreAgreement(FCPS_SAMPLES.SAMPLE_LSUN, 3, type_link.AVERAGE_LINK)
+
+    def testPythonCoreAgreementLinkComplete(self):
+        AgglomerativeTestTemplates.templatePythonCoreAgreement(FCPS_SAMPLES.SAMPLE_LSUN, 3, type_link.COMPLETE_LINK)
+
+    def testPythonCoreAgreementLinkSingle(self):
+        AgglomerativeTestTemplates.templatePythonCoreAgreement(FCPS_SAMPLES.SAMPLE_LSUN, 3, type_link.SINGLE_LINK)
+
+    def testLinkWardByCore(self):
+        AgglomerativeTestTemplates.templateClusteringResults(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, type_link.WARD_LINK, [10, 10, 10, 30], True)
+
+
     def testCoreInterfaceIntInputData(self):
         agglomerative_instance = agglomerative([ [1], [2], [3], [20], [21], [22] ], 2, type_link.SINGLE_LINK, True);
         agglomerative_instance.process();
@@ -0,0 +1,49 @@
+"""!
+
+@brief Integration-tests for CLARA algorithm.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2020
+@copyright BSD-3-Clause
+
+"""
+
+
+import unittest
+
+import matplotlib
+matplotlib.use('Agg')
+
+from pyclustering.cluster.kmedoids import kmedoids_swap_type
+from pyclustering.cluster.tests.clara_templates import clara_test_template
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
+
+from pyclustering.utils.metric import distance_metric, type_metric
+
+
+class ClaraIntegrationTest(unittest.TestCase):
+    def testClusterAllocationSampleSimple1ByCore(self):
+        clara_test_template.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 2, [5, 5], True)
+
+    def testClusterAllocationSampleSimple3ByCore(self):
+        clara_test_template.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, [10, 10, 10, 30], True, sample_size=30)
+
+    def testClusterAllocationSampleSimple4ByCore(self):
+        clara_test_template.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, 5, [15, 15, 15, 15, 15], True, sample_size=40)
+
+    def testClusterAllocationSampleSimple4FasterPamByCore(self):
+        clara_test_template.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, 5, [15, 15, 15, 15, 15], True, sample_size=40, swap=kmedoids_swap_type.FASTERPAM)
+
+    def testClusterAllocationSampleSimple4ManhattanByCore(self):
+        metric = distance_metric(type_metric.MANHATTAN)
+        clara_test_template.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, 5, [15, 15, 15, 15, 15], True, sample_size=40, metric=metric)
+
+    def testClusterAllocationTetraByCore(self):
+        clara_test_template.templateClusterAllocation(FCPS_SAMPLES.SAMPLE_TETRA, 4, [100, 100, 100, 100], True, sample_size=120)
+
+    def testWholeDataSampleSimple3ByCore(self):
+        clara_test_template.templateWholeDataSample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, True)
+
+    def testWholeDataSampleSimple4ByCore(self):
+        clara_test_template.templateWholeDataSample(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, 5, True)
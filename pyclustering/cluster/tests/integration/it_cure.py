@@ -15,7 +15,7 @@ import unittest
 import matplotlib
 matplotlib.use('Agg')
 
-from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES, FAMOUS_SAMPLES
 
 from pyclustering.cluster.cure import cure
 from pyclustering.cluster.tests.cure_templates import CureTestTemplates
@@ -77,6 +77,31 @@ class CureIntegrationTest(unittest.TestCase):
         CureTestTemplates.templateEncoderProcedures(True)
 
 
+    def testPythonCoreAgreementSampleLsun(self):
+        CureTestTemplates.template_python_core_agreement(FCPS_SAMPLES.SAMPLE_LSUN, 3, 5, 0.3)
+
+    def testPythonCoreAgreementSampleTarget(self):
+        CureTestTemplates.template_python_core_agreement(FCPS_SAMPLES.SAMPLE_TARGET, 6, 5, 0.3)
+
+    def testPythonCoreAgreementSampleOldFaithful(self):
+        CureTestTemplates.template_python_core_agreement(FAMOUS_SAMPLES.SAMPLE_OLD_FAITHFUL, 2, 5, 0.3)
+
+
+    def testSamplingSampleLsunByCore(self):
+        CureTestTemplates.template_sampling(FCPS_SAMPLES.SAMPLE_LSUN, [100, 101, 202], 3, 300, 3, True, random_state=1)
+
+    def testSamplingRandomBlobsByCore(self):
+        CureTestTemplates.template_random_blobs(4, 1000, 2, 1000, True, sample_size=400, partitions=4, random_state=1)
+
+    def testSamplingRandomBlobsParallelByCore(self):
+        CureTestTemplates.template_random_blobs(4, 1000, 2, 1000, True, sample_size=400, partitions=4, processes=2, random_state=1)
+
+
+    def testDendrogramByCore(self):
+        cure_instance = cure([ [1], [2], [3], [20], [21], [22] ], 2, ccore = True).process()
+        self.assertIsNone(cure_instance.get_dendrogram())
+
+
     def testCoreInterfaceIntInputData(self):
         cure_instance = cure([ [1], [2], [3], [20], [21], [22] ], 2, ccore = True)
         cure_instance.process()
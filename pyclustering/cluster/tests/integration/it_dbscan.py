@@ -104,6 +104,10 @@ class DbscanIntegrationTest(unittest.TestCase):
         DbscanTestTemplates.pickle_dump_load(True)
 
 
+    def testProcessAsyncSampleSimple3ByCore(self):
+        DbscanTestTemplates.templateProcessAsync(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 0.7, 3, 8, True)
+
+
     def testProcessingWhenLibraryCoreRemoved(self):
         self.runRemovedLibraryCoreTest()
 
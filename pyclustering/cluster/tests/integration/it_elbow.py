@@ -93,4 +93,14 @@ class elbow_integration_test(unittest.TestCase):
         elbow_test_template.random_state_fixed(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 1, 10, True, random_state=5, initializer=random_center_initializer)
 
     def test_elbow_random_state_continuous(self):
-        elbow_test_template.random_state_fixed(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 1, 10, True, random_state=5, repeat=10)
\ No newline at end of file
+        elbow_test_template.random_state_fixed(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 1, 10, True, random_state=5, repeat=10)
+
+
+    def test_elbow_simple_03_warm_start(self):
+        elbow_test_template.calculate_elbow(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, SIMPLE_ANSWERS.ANSWER_SIMPLE3, 1, 10, True, warm_start=True)
+
+    def test_elbow_simple_03_workers(self):
+        elbow_test_template.calculate_elbow(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, SIMPLE_ANSWERS.ANSWER_SIMPLE3, 1, 10, True, workers=4)
+
+    def test_elbow_times(self):
+        elbow_test_template.calculate_times(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 1, 10, True, workers=2)
@@ -16,7 +16,7 @@ import matplotlib
 matplotlib.use('Agg')
 
 from pyclustering.cluster.tests.kmeans_templates import KmeansTestTemplates
-from pyclustering.cluster.kmeans import kmeans
+from pyclustering.cluster.kmeans import kmeans, kmeans_algorithm_type
 
 from pyclustering.samples.definitions import SIMPLE_SAMPLES
 
@@ -171,6 +171,67 @@ class KmeansIntegrationTest(unittest.TestCase):
         KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, [[3.5, 4.8], [6.9, 7], [7.5, 0.5]], [10, 5, 8], True, itermax=10)
 
 
+    def testElkanClusterAllocationSampleSimple1ByCore(self):
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], True, algorithm=kmeans_algorithm_type.ELKAN)
+
+    def testElkanClusterAllocationSampleSimple1EuclideanByCore(self):
+        metric = distance_metric(type_metric.EUCLIDEAN)
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], True, metric=metric, algorithm=kmeans_algorithm_type.ELKAN)
+
+    def testElkanClusterAllocationSampleSimple3ByCore(self):
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], [10, 10, 10, 30], True, algorithm=kmeans_algorithm_type.ELKAN)
+
+    def testElkanWrongNumberOfCentersSimpleSample2ByCore(self):
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, [[3.5, 4.8], [6.9, 7], [7.5, 0.5], [7.3, 4.5], [3.1, 5.4]], None, False, algorithm=kmeans_algorithm_type.ELKAN)
+
+    def testElkanEquivalenceSampleSimple3ByCore(self):
+        KmeansTestTemplates.templateAlgorithmEquivalence(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], kmeans_algorithm_type.ELKAN, True)
+
+    def testElkanEquivalenceRandomDataByCore(self):
+        numpy.random.seed(1000)
+        data = numpy.random.rand(500, 3).tolist()
+        KmeansTestTemplates.templateAlgorithmEquivalence(data, data[:12], kmeans_algorithm_type.ELKAN, True)
+
+    def testHamerlyClusterAllocationSampleSimple1ByCore(self):
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], True, algorithm=kmeans_algorithm_type.HAMERLY)
+
+    def testHamerlyClusterAllocationSampleSimple1EuclideanByCore(self):
+        metric = distance_metric(type_metric.EUCLIDEAN)
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], True, metric=metric, algorithm=kmeans_algorithm_type.HAMERLY)
+
+    def testHamerlyClusterAllocationSampleSimple3ByCore(self):
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], [10, 10, 10, 30], True, algorithm=kmeans_algorithm_type.HAMERLY)
+
+    def testHamerlyWrongNumberOfCentersSimpleSample2ByCore(self):
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, [[3.5, 4.8], [6.9, 7], [7.5, 0.5], [7.3, 4.5], [3.1, 5.4]], None, False, algorithm=kmeans_algorithm_type.HAMERLY)
+
+    def testHamerlyEquivalenceSampleSimple3ByCore(self):
+        KmeansTestTemplates.templateAlgorithmEquivalence(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], kmeans_algorithm_type.HAMERLY, True)
+
+    def testHamerlyEquivalenceRandomDataByCore(self):
+        numpy.random.seed(1000)
+        data = numpy.random.rand(500, 3).tolist()
+        KmeansTestTemplates.templateAlgorithmEquivalence(data, data[:12], kmeans_algorithm_type.HAMERLY, True)
+
+
+    def testRestartsSampleSimple3ByCore(self):
+        KmeansTestTemplates.templateRestarts(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], 5, True)
+
+    def testRestartsSampleSimple5ByCore(self):
+        KmeansTestTemplates.templateRestarts(SIMPLE_SAMPLES.SAMPLE_SIMPLE5, [[0.0, 1.0], [0.0, 0.0], [1.0, 1.0], [1.0, 0.0]], 3, True)
+
+    def testRestartsManhattanSampleSimple3ByCore(self):
+        metric = distance_metric(type_metric.MANHATTAN)
+        KmeansTestTemplates.templateRestarts(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], 4, True, metric=metric)
+
+
+    def testProcessAsyncSampleSimple1ByCore(self):
+        KmeansTestTemplates.templateProcessAsync(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], 1, True)
+
+    def testProcessAsyncSeveralInstancesSampleSimple3ByCore(self):
+        KmeansTestTemplates.templateProcessAsync(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], 8, True)
+
+
     def testShowResultsSampleSimple01(self):
         KmeansTestTemplates.templateShowClusteringResultNoFailure(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.5, 5.6], [6.8, 7.4]], True)
 
@@ -16,7 +16,7 @@ import matplotlib
 matplotlib.use('Agg')
 
 from pyclustering.cluster.tests.kmedoids_templates import kmedoids_test_template
-from pyclustering.cluster.kmedoids import kmedoids
+from pyclustering.cluster.kmedoids import kmedoids, kmedoids_swap_type
 
 from pyclustering.samples.definitions import SIMPLE_SAMPLES, SIMPLE_ANSWERS
 
@@ -192,6 +192,32 @@ class KmedoidsIntegrationTest(unittest.TestCase):
         kmedoids_test_template.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, [3, 12, 20], [10, 5, 8], True, itermax=10)
 
 
+    def testSwapStrategiesSimple01ByCore(self):
+        kmedoids_test_template.templateSwapStrategies(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [1, 2, 3, 4], True)
+
+    def testSwapStrategiesSimple03ByCore(self):
+        kmedoids_test_template.templateSwapStrategies(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [4, 7, 12, 20], True)
+
+    def testSwapStrategiesSimple03DistanceMatrixByCore(self):
+        kmedoids_test_template.templateSwapStrategies(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [4, 7, 12, 20], True, data_type='distance_matrix')
+
+    def testSwapStrategiesSimple03ManhattanByCore(self):
+        kmedoids_test_template.templateSwapStrategies(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [4, 7, 12, 20], True, metric=distance_metric(type_metric.MANHATTAN))
+
+    def testClusterAllocationFasterPamSimple04ByCore(self):
+        kmedoids_test_template.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, [2, 7, 15, 22, 30], [15, 15, 15, 15, 15], True, swap=kmedoids_swap_type.FASTERPAM)
+
+    def testSwapStrategiesCoreAndPython(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+        for swap in kmedoids_swap_type:
+            python_instance = kmedoids(sample, [4, 7, 12, 20], ccore=False, swap=swap).process()
+            core_instance = kmedoids(sample, [4, 7, 12, 20], ccore=True, swap=swap).process()
+
+            self.assertEqual(python_instance.get_medoids(), core_instance.get_medoids())
+            self.assertEqual(python_instance.get_clusters(), core_instance.get_clusters())
+            self.assertEqual(python_instance.get_iterations(), core_instance.get_iterations())
+
+
     def testSimple01AnswerByCore(self):
         kmedoids_test_template.clustering_with_answer(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, SIMPLE_ANSWERS.ANSWER_SIMPLE1, True, random_state=1000)
 
@@ -0,0 +1,50 @@
+"""!
+
+@brief Integration-tests for sweep over amount of clusters.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2020
+@copyright BSD-3-Clause
+
+"""
+
+
+import unittest
+
+import matplotlib
+matplotlib.use('Agg')
+
+from pyclustering.cluster.kmeans import kmeans
+from pyclustering.cluster.kmedians import kmedians
+from pyclustering.cluster.kmedoids import kmedoids
+from pyclustering.cluster.tests.ksweep_templates import ksweep_test_template
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
+
+
+class ksweep_integration_tests(unittest.TestCase):
+    def test_process_kmeans_simple03_by_core(self):
+        ksweep_test_template.process(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, range(1, 8), kmeans, True)
+
+    def test_process_kmedians_simple03_by_core(self):
+        ksweep_test_template.process(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, range(1, 8), kmedians, True)
+
+    def test_process_kmedoids_simple03_by_core(self):
+        ksweep_test_template.process(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, range(1, 8), kmedoids, True)
+
+
+    def test_warm_start_kmeans_simple03_by_core(self):
+        ksweep_test_template.warm_start(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, range(1, 8), kmeans, True)
+
+    def test_warm_start_kmedoids_simple04_by_core(self):
+        ksweep_test_template.warm_start(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, range(2, 7), kmedoids, True)
+
+    def test_warm_start_hepta_by_core(self):
+        ksweep_test_template.warm_start(FCPS_SAMPLES.SAMPLE_HEPTA, range(2, 12), kmeans, True, workers=4)
+
+
+    def test_workers_kmeans_simple03_by_core(self):
+        ksweep_test_template.workers(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, range(1, 8), kmeans, True, 4)
+
+    def test_workers_kmedians_hepta_by_core(self):
+        ksweep_test_template.workers(FCPS_SAMPLES.SAMPLE_HEPTA, range(2, 12), kmedians, True, 3)
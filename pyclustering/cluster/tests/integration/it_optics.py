@@ -18,7 +18,7 @@ matplotlib.use('Agg')
 from pyclustering.cluster.tests.optics_templates import OpticsTestTemplates
 from pyclustering.cluster.optics import optics
 
-from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES, FAMOUS_SAMPLES
 
 from pyclustering.core.tests import remove_library
 
@@ -100,6 +100,19 @@ class OpticsIntegrationTest(unittest.TestCase):
     def testClusteringLsunRadiusGreaterByCore(self):
         OpticsTestTemplates.templateClusteringResults(FCPS_SAMPLES.SAMPLE_LSUN, 1.0, 3, 3, [99, 100, 202], True)
 
+    def testExtractClustersSampleSimple3ByCore(self):
+        OpticsTestTemplates.templateExtractClusters(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 1.0, 3, True)
+
+    def testExtractClustersLsunByCore(self):
+        OpticsTestTemplates.templateExtractClusters(FCPS_SAMPLES.SAMPLE_LSUN, 0.5, 5, True)
+
+
+    def testOrderingAgreementWithCoreOldFaithful(self):
+        OpticsTestTemplates.templateOrderingAgreementWithCore(FAMOUS_SAMPLES.SAMPLE_OLD_FAITHFUL, 1.0, 5)
+
+    def testOrderingAgreementWithCoreLsun(self):
+        OpticsTestTemplates.templateOrderingAgreementWithCore(FCPS_SAMPLES.SAMPLE_LSUN, 0.5, 5)
+
 
     def testCoreInterfaceIntInputData(self):
         optics_instance = optics([ [1], [2], [3], [20], [21], [22] ], 3, 2, 2, True)
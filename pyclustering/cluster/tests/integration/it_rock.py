@@ -15,9 +15,9 @@ import matplotlib;
 matplotlib.use('Agg');
 
 from pyclustering.cluster.tests.rock_templates import RockTestTemplates;
-from pyclustering.cluster.rock import rock;
+from pyclustering.cluster.rock import rock, rock_link_type;
 
-from pyclustering.samples.definitions import SIMPLE_SAMPLES;
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES;
 
 from pyclustering.core.tests import remove_library;
 
@@ -46,6 +46,20 @@ class RockIntegrationTest(unittest.TestCase):
     def testClusterAllocationOneDimensionDataByCore(self):
         RockTestTemplates.templateClusterAllocationOneDimensionData(True);
 
+    def testPythonCoreAgreementSampleLsun(self):
+        RockTestTemplates.templatePythonCoreAgreement(FCPS_SAMPLES.SAMPLE_LSUN, 0.5, 3, 0.5)
+
+    def testPythonCoreAgreementSampleHepta(self):
+        RockTestTemplates.templatePythonCoreAgreement(FCPS_SAMPLES.SAMPLE_HEPTA, 1.0, 7, 0.5)
+
+    def testCommonNeighborsByCore(self):
+        RockTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 1, 4, 0.5, [10, 10, 10, 30], True, link_type=rock_link_type.COMMON_NEIGHBORS)
+
+    def testDendrogramByCore(self):
+        rock_instance = rock([ [1], [2], [3], [20], [21], [22] ], 3, 2, 0.5, True).process();
+        self.assertIsNone(rock_instance.get_dendrogram());
+
+
     def testCoreInterfaceIntInputData(self):
         optics_instance = rock([ [1], [2], [3], [20], [21], [22] ], 3, 2, 0.5, True);
         optics_instance.process();
@@ -198,3 +198,24 @@ class silhouette_integration_tests(unittest.TestCase):
 
     def test_random_state_1024_kmedoids(self):
         silhouette_test_template.random_state(2, 10, silhouette_ksearch_type.KMEDIANS, 1024, True)
+
+
+    def test_parallel_scores_simple03(self):
+        silhouette_test_template.correct_parallel_scores(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, SIMPLE_ANSWERS.ANSWER_SIMPLE3, 2, True)
+
+    def test_sampled_scores_simple03(self):
+        silhouette_test_template.correct_sampled_scores(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, SIMPLE_ANSWERS.ANSWER_SIMPLE3, 20, 1000, True)
+
+    def test_sampled_scores_simple04(self):
+        silhouette_test_template.correct_sampled_scores(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, SIMPLE_ANSWERS.ANSWER_SIMPLE4, 30, 5, True)
+
+    def test_correct_ksearch_simple03_warm_start(self):
+        silhouette_test_template.correct_ksearch(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, SIMPLE_ANSWERS.ANSWER_SIMPLE3, 2, 10,
+                                                 silhouette_ksearch_type.KMEANS, True, warm_start=True)
+
+    def test_correct_ksearch_simple03_workers(self):
+        silhouette_test_template.correct_ksearch(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, SIMPLE_ANSWERS.ANSWER_SIMPLE3, 2, 10,
+                                                 silhouette_ksearch_type.KMEDOIDS, True, workers=4)
+
+    def test_random_state_workers_kmedians(self):
+        silhouette_test_template.random_state(2, 10, silhouette_ksearch_type.KMEDIANS, 1000, True, workers=4)
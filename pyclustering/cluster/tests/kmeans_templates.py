@@ -12,7 +12,7 @@
 from pyclustering.tests.assertion import assertion
 
 from pyclustering.cluster.encoder import type_encoding, cluster_encoder
-from pyclustering.cluster.kmeans import kmeans, kmeans_observer, kmeans_visualizer
+from pyclustering.cluster.kmeans import kmeans, kmeans_observer, kmeans_visualizer, minibatch_kmeans, kmeans_algorithm_type
 
 from pyclustering.utils import read_sample
 from pyclustering.utils.metric import distance_metric, type_metric
@@ -23,6 +23,13 @@ import numpy
 
 
 class KmeansTestTemplates:
+    @staticmethod
+    def templateLengthProcessDataWithOffset(data, start_centers, expected_cluster_length, offset, **kwargs):
+        sample = (numpy.array(read_sample(data)) + offset).tolist()
+        start_centers = (numpy.array(start_centers) + offset).tolist()
+
+        KmeansTestTemplates.templateLengthProcessData(sample, start_centers, expected_cluster_length, False, **kwargs)
+
     @staticmethod
     def templateLengthProcessData(data, start_centers, expected_cluster_length, ccore, **kwargs):
         if isinstance(data, str):
@@ -32,8 +39,11 @@ class KmeansTestTemplates:
 
         metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
         itermax = kwargs.get('itermax', 200)
+        chunk_size = kwargs.get('chunk_size', 4096)
+        algorithm = kwargs.get('algorithm', kmeans_algorithm_type.LLOYD)
         
-        kmeans_instance = kmeans(sample, start_centers, 0.001, ccore, metric=metric, itermax=itermax)
+        kmeans_instance = kmeans(sample, start_centers, 0.001, ccore, metric=metric, itermax=itermax,
+                                 chunk_size=chunk_size, algorithm=algorithm)
         kmeans_instance.process()
         
         clusters = kmeans_instance.get_clusters()
@@ -66,6 +76,67 @@ class KmeansTestTemplates:
             assertion.eq(obtained_cluster_sizes, expected_cluster_length)
 
 
+    @staticmethod
+    def templateAlgorithmEquivalence(data, start_centers, algorithm, ccore, **kwargs):
+        if isinstance(data, str):
+            sample = read_sample(data)
+        else:
+            sample = data
+
+        metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
+        itermax = kwargs.get('itermax', 200)
+
+        expected_instance = kmeans(sample, start_centers, 0.001, ccore, metric=metric, itermax=itermax,
+                                   algorithm=kmeans_algorithm_type.LLOYD).process()
+
+        actual_instance = kmeans(sample, start_centers, 0.001, ccore, metric=metric, itermax=itermax,
+                                 algorithm=algorithm).process()
+
+        assertion.eq(expected_instance.get_clusters(), actual_instance.get_clusters())
+        assertion.eq(len(expected_instance.get_centers()), len(actual_instance.get_centers()))
+
+        for expected_center, actual_center in zip(expected_instance.get_centers(), actual_instance.get_centers()):
+            assertion.true(numpy.allclose(expected_center, actual_center))
+
+
+    @staticmethod
+    def templateRestarts(path_to_file, start_centers, n_init, ccore, **kwargs):
+        sample = read_sample(path_to_file)
+
+        random_state = kwargs.get('random_state', 1000)
+        metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
+
+        kmeans_instance = kmeans(sample, start_centers, 0.001, ccore, n_init=n_init, random_state=random_state,
+                                 metric=metric).process()
+
+        restarts_wce = kmeans_instance.get_restarts_wce()
+        assertion.eq(n_init, len(restarts_wce))
+        assertion.eq(min(restarts_wce), kmeans_instance.get_total_wce())
+
+        single_instance = kmeans(sample, start_centers, 0.001, ccore, metric=metric).process()
+        assertion.true(numpy.isclose(single_instance.get_total_wce(), restarts_wce[0]))
+        assertion.ge(single_instance.get_total_wce(), kmeans_instance.get_total_wce())
+
+        clusters = kmeans_instance.get_clusters()
+        assertion.eq(len(sample), sum([len(cluster) for cluster in clusters]))
+        assertion.eq(len(clusters), len(kmeans_instance.get_centers()))
+
+        python_instance = kmeans(sample, start_centers, 0.001, False, n_init=n_init, random_state=random_state,
+                                 metric=metric).process()
+        assertion.true(numpy.allclose(python_instance.get_restarts_wce(), restarts_wce))
+
+
+    @staticmethod
+    def templateProcessAsync(path_to_file, start_centers, amount_instances, ccore):
+        sample = read_sample(path_to_file)
+
+        expected_clusters = kmeans(sample, start_centers, 0.001, ccore).process().get_clusters()
+
+        futures = [kmeans(sample, start_centers, 0.001, ccore).process_async() for _ in range(amount_instances)]
+        for future in futures:
+            assertion.eq(expected_clusters, future.result().get_clusters())
+
+
     @staticmethod
     def templatePredict(path_to_file, initial_centers, points, expected_closest_clusters, ccore, **kwargs):
         sample = read_sample(path_to_file)
@@ -152,3 +223,68 @@ class KmeansTestTemplates:
         kmeans_instance.process()
 
         kmeans_visualizer.animate_cluster_allocation(sample, observer)
+
+
+    @staticmethod
+    def templateMinibatchLengthProcessData(data, start_centers, expected_cluster_length, batch_size, **kwargs):
+        sample = read_sample(data)
+
+        metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
+        itermax = kwargs.get('itermax', 200)
+
+        instance = minibatch_kmeans(sample, start_centers, batch_size, 0.001, metric=metric, itermax=itermax,
+                                    random_state=1000)
+        instance.process()
+
+        clusters = instance.get_clusters()
+        centers = instance.get_centers()
+        wce = instance.get_total_wce()
+
+        if itermax == 0:
+            assertion.eq(start_centers, centers)
+            assertion.eq([], clusters)
+            assertion.eq(0.0, wce)
+            return
+
+        expected_wce = 0.0
+        for index_cluster in range(len(clusters)):
+            for index_point in clusters[index_cluster]:
+                expected_wce += metric(sample[index_point], centers[index_cluster])
+
+        assertion.eq_float(expected_wce, wce, 0.000001)
+        assertion.eq(len(clusters), len(centers))
+
+        obtained_cluster_sizes = sorted([len(cluster) for cluster in clusters])
+        assertion.eq(sorted(expected_cluster_length), obtained_cluster_sizes)
+
+        closest_clusters = instance.predict(sample)
+        for index_cluster in range(len(clusters)):
+            for index_point in clusters[index_cluster]:
+                assertion.eq(index_cluster, closest_clusters[index_point])
+
+
+    @staticmethod
+    def templateMinibatchStreamProcessData(data, start_centers, batch_size, block_size, **kwargs):
+        sample = numpy.array(read_sample(data))
+        observer = kwargs.get('observer', None)
+
+        def generate_blocks():
+            for _ in range(10):
+                permutation = numpy.random.permutation(len(sample))
+                for index_begin in range(0, len(sample), block_size):
+                    yield sample[permutation[index_begin:index_begin + block_size]]
+
+        instance = minibatch_kmeans(generate_blocks(), start_centers, batch_size, 0.0, observer=observer, itermax=1000)
+        instance.process()
+
+        assertion.eq([], instance.get_clusters())
+        assertion.eq(len(start_centers), len(instance.get_centers()))
+        assertion.gt(instance.get_total_wce(), 0.0)
+
+        expected_batches = int(numpy.ceil(10 * len(sample) / batch_size))
+        if observer is not None:
+            assertion.eq(expected_batches, len(observer))
+
+        reference = kmeans(sample, start_centers, 0.001, False).process()
+        for expected_center, center in zip(reference.get_centers(), instance.get_centers()):
+            assertion.gt(0.5, numpy.max(numpy.abs(numpy.array(expected_center) - numpy.array(center))))
@@ -109,3 +109,36 @@ class KmediansTestTemplates:
         closest_clusters = kmeans_instance.predict(points)
         assertion.eq(len(expected_closest_clusters), len(closest_clusters))
         assertion.true(numpy.array_equal(numpy.array(expected_closest_clusters), closest_clusters))
+
+
+    @staticmethod
+    def templateChunkSize(path_to_file, initial_medians, chunk_sizes, **kwargs):
+        sample = read_sample(path_to_file)
+        metric = kwargs.get('metric', None)
+
+        expected = kmedians(sample, initial_medians, 0.001, False, metric=metric).process()
+        for chunk_size in chunk_sizes:
+            actual = kmedians(sample, initial_medians, 0.001, False, metric=metric, chunk_size=chunk_size).process()
+
+            assertion.eq(expected.get_clusters(), actual.get_clusters())
+            assertion.eq(expected.get_medians(), actual.get_medians())
+            assertion.eq(expected.get_total_wce(), actual.get_total_wce())
+
+
+    @staticmethod
+    def templateWeightsAsDuplicates(path_to_file, initial_medians, **kwargs):
+        sample = read_sample(path_to_file)
+        metric = kwargs.get('metric', None)
+
+        weights = [1 + index % 3 for index in range(len(sample))]
+        duplicated_sample = [point for point, weight in zip(sample, weights) for _ in range(weight)]
+
+        weighted = kmedians(sample, initial_medians, 0.001, False, metric=metric, weights=weights).process()
+        duplicated = kmedians(duplicated_sample, initial_medians, 0.001, False, metric=metric).process()
+
+        assertion.eq(len(duplicated.get_clusters()), len(weighted.get_clusters()))
+        assertion.eq(sorted(sum(weights[index] for index in cluster) for cluster in weighted.get_clusters()),
+                     sorted(len(cluster) for cluster in duplicated.get_clusters()))
+
+        assertion.true(numpy.allclose(weighted.get_medians(), duplicated.get_medians()))
+        assertion.true(numpy.isclose(weighted.get_total_wce(), duplicated.get_total_wce()))
@@ -14,7 +14,7 @@ import numpy
 
 from pyclustering.tests.assertion import assertion
 
-from pyclustering.cluster.kmedoids import kmedoids, build
+from pyclustering.cluster.kmedoids import kmedoids, kmedoids_swap_type, build
 from pyclustering.cluster.center_initializer import kmeans_plusplus_initializer
 
 from pyclustering.samples import answer_reader
@@ -38,6 +38,7 @@ class kmedoids_test_template:
         input_type = kwargs.get('input_type', 'list')
         initialize_medoids = kwargs.get('initialize_medoids', None)
         itermax = kwargs.get('itermax', 200)
+        swap = kwargs.get('swap', kmedoids_swap_type.FASTPAM1)
 
         if metric is None:
             metric = distance_metric(type_metric.EUCLIDEAN_SQUARE)
@@ -58,7 +59,7 @@ class kmedoids_test_template:
             if initialize_medoids is not None:
                 initial_medoids = kmeans_plusplus_initializer(sample, initialize_medoids).initialize(return_index=True)
 
-            kmedoids_instance = kmedoids(input_data, initial_medoids, 0.001, ccore=ccore_flag, metric=metric, data_type=data_type, itermax=itermax)
+            kmedoids_instance = kmedoids(input_data, initial_medoids, 0.001, ccore=ccore_flag, metric=metric, data_type=data_type, itermax=itermax, swap=swap)
             kmedoids_instance.process()
 
             clusters = kmedoids_instance.get_clusters()
@@ -197,6 +198,46 @@ class kmedoids_test_template:
         assertion.true(numpy.array_equal(numpy.array(expected_closest_clusters), closest_clusters))
 
 
+    @staticmethod
+    def templateSwapStrategies(path_to_file, initial_medoids, ccore, **kwargs):
+        sample = read_sample(path_to_file)
+
+        data_type = kwargs.get('data_type', 'points')
+        metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
+
+        input_data = sample
+        if data_type == 'distance_matrix':
+            input_data = calculate_distance_matrix(sample, metric)
+
+        results = {}
+        for swap in (kmedoids_swap_type.PAM, kmedoids_swap_type.FASTPAM1, kmedoids_swap_type.FASTERPAM):
+            results[swap] = kmedoids(input_data, initial_medoids, 0.001, ccore, metric=metric, data_type=data_type,
+                                     swap=swap).process()
+
+        pam_instance = results[kmedoids_swap_type.PAM]
+        fastpam1_instance = results[kmedoids_swap_type.FASTPAM1]
+        fasterpam_instance = results[kmedoids_swap_type.FASTERPAM]
+
+        # FastPAM1 performs exactly the same swaps as PAM.
+        assertion.eq(pam_instance.get_medoids(), fastpam1_instance.get_medoids())
+        assertion.eq(pam_instance.get_clusters(), fastpam1_instance.get_clusters())
+        assertion.eq(pam_instance.get_iterations(), fastpam1_instance.get_iterations())
+        assertion.eq_float(pam_instance.get_total_deviation(), fastpam1_instance.get_total_deviation(), 0.000001)
+
+        # FasterPAM swaps eagerly, it needs less iterations and might converge to another local optimum.
+        assertion.eq(len(initial_medoids), len(fasterpam_instance.get_medoids()))
+        assertion.le(fasterpam_instance.get_iterations(), pam_instance.get_iterations())
+        assertion.le(fasterpam_instance.get_total_deviation(), pam_instance.get_total_deviation() * 1.1 + 0.000001)
+
+        for instance in (pam_instance, fastpam1_instance, fasterpam_instance):
+            expected_total_deviation = 0.0
+            for index_cluster, cluster in enumerate(instance.get_clusters()):
+                index_medoid = instance.get_medoids()[index_cluster]
+                expected_total_deviation += sum(metric(sample[index_medoid], sample[index_point]) for index_point in cluster)
+
+            assertion.eq_float(expected_total_deviation, instance.get_total_deviation(), 0.000001)
+
+
     @staticmethod
     def clustering_with_answer(data_file, answer_file, ccore, **kwargs):
         data_type = kwargs.get('data_type', 'points')
@@ -0,0 +1,71 @@
+"""!
+
+@brief Test templates for sweep over amount of clusters.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2020
+@copyright BSD-3-Clause
+
+"""
+
+
+from pyclustering.cluster.ksweep import ksweep
+
+from pyclustering.tests.assertion import assertion
+
+from pyclustering.utils import read_sample
+
+
+class ksweep_test_template:
+    @staticmethod
+    def process(path_to_data, kvalues, algorithm, ccore, **kwargs):
+        sample = read_sample(path_to_data)
+
+        sweep_instance = ksweep(sample, kvalues, algorithm, ccore=ccore, **kwargs).process()
+
+        results = sweep_instance.get_results()
+        instances = sweep_instance.get_instances()
+        times = sweep_instance.get_times()
+
+        assertion.eq(list(kvalues), sweep_instance.get_kvalues())
+        assertion.eq(sorted(kvalues), sorted(results.keys()))
+        assertion.eq(sorted(kvalues), sorted(instances.keys()))
+        assertion.eq(sorted(kvalues), sorted(times.keys()))
+
+        for k in kvalues:
+            assertion.le(0.0, times[k])
+
+            clusters = instances[k].get_clusters()
+            assertion.eq(len(sample), sum([len(cluster) for cluster in clusters]))
+            assertion.eq(sorted(range(len(sample))), sorted([index for cluster in clusters for index in cluster]))
+
+        return sweep_instance
+
+
+    @staticmethod
+    def warm_start(path_to_data, kvalues, algorithm, ccore, **kwargs):
+        sweep_instance = ksweep_test_template.process(path_to_data, kvalues, algorithm, ccore, warm_start=True, **kwargs)
+
+        for k in kvalues:
+            assertion.eq(k, len(sweep_instance.get_results()[k]))
+
+
+    @staticmethod
+    def workers(path_to_data, kvalues, algorithm, ccore, amount_workers, **kwargs):
+        expected = ksweep_test_template.process(path_to_data, kvalues, algorithm, ccore, random_state=1000, **kwargs)
+        actual = ksweep_test_template.process(path_to_data, kvalues, algorithm, ccore, random_state=1000,
+                                              workers=amount_workers, **kwargs)
+
+        assertion.eq(expected.get_results(), actual.get_results())
+
+
+    @staticmethod
+    def evaluator(path_to_data, kvalues, algorithm, ccore, **kwargs):
+        evaluator = lambda data, instance: (len(data), len(instance.get_clusters()))
+        sweep_instance = ksweep_test_template.process(path_to_data, kvalues, algorithm, ccore, evaluator=evaluator,
+                                                      **kwargs)
+
+        size = len(read_sample(path_to_data))
+        for k in kvalues:
+            assertion.eq(size, sweep_instance.get_results()[k][0])
+            assertion.ge(k, sweep_instance.get_results()[k][1])
@@ -11,6 +11,8 @@
 
 from pyclustering.cluster.optics import optics, ordering_analyser
 
+from pyclustering.container.neighborhood import neighborhood_index
+
 from pyclustering.utils import read_sample, calculate_distance_matrix
 
 from pyclustering.tests.assertion import assertion
@@ -64,4 +66,66 @@ class OpticsTestTemplates:
 
             amount_clusters, borders = analyser.extract_cluster_amount(optics_instance.get_radius())
             assert amount_clusters == len(expected_length_clusters)
-            assert len(borders) == amount_clusters - 1
\ No newline at end of file
+            assert len(borders) == amount_clusters - 1
+
+
+    @staticmethod
+    def templateClusteringResultsNeighborhoodIndex(path, index_radius, radius, neighbors, amount_clusters, expected_length_clusters):
+        sample = read_sample(path)
+        index = neighborhood_index(sample, index_radius)
+
+        optics_instance = optics(index, radius, neighbors, amount_clusters)
+        optics_instance.process()
+
+        expected_instance = optics(sample, radius, neighbors, amount_clusters, False)
+        expected_instance.process()
+
+        clusters = optics_instance.get_clusters()
+        assertion.eq(len(sample), sum([len(cluster) for cluster in clusters]) + len(optics_instance.get_noise()))
+        assertion.eq(sorted(expected_length_clusters), sorted([len(cluster) for cluster in clusters]))
+        assertion.eq(expected_instance.get_ordering(), optics_instance.get_ordering())
+
+
+    @staticmethod
+    def templateOrderingAnalyserNeighborhoodIndex(path, radius, minpts):
+        sample = read_sample(path)
+        index = neighborhood_index(sample, radius)
+
+        expected_ordering = optics(sample, radius, minpts, ccore=False).process().get_ordering()
+        analyser = ordering_analyser(index, minpts=minpts)
+
+        assertion.eq(expected_ordering, analyser.cluster_ordering)
+
+
+    @staticmethod
+    def templateExtractClusters(path, radius, neighbors, ccore):
+        sample = read_sample(path)
+
+        optics_instance = optics(sample, radius, neighbors, ccore=ccore)
+        optics_instance.process()
+
+        clusters, noise = optics_instance.extract_clusters(radius)
+        assertion.eq(optics_instance.get_clusters(), clusters)
+        assertion.eq(optics_instance.get_noise(), noise)
+        assertion.eq(len(clusters), optics_instance.extract_cluster_amount(radius))
+
+        for step in range(1, 20):
+            extraction_radius = radius * step / 20.0
+            clusters, noise = optics_instance.extract_clusters(extraction_radius)
+
+            assertion.eq(len(sample), sum([len(cluster) for cluster in clusters]) + len(noise))
+            assertion.eq(sorted(range(len(sample))), sorted([index for cluster in clusters for index in cluster] + noise))
+            assertion.eq(len(clusters), optics_instance.extract_cluster_amount(extraction_radius))
+
+
+    @staticmethod
+    def templateOrderingAgreementWithCore(path, radius, neighbors):
+        sample = read_sample(path)
+
+        python_ordering = optics(sample, radius, neighbors, ccore=False).process().get_ordering()
+        core_ordering = optics(sample, radius, neighbors, ccore=True).process().get_ordering()
+
+        assertion.eq(len(core_ordering), len(python_ordering))
+        for python_value, core_value in zip(python_ordering, core_ordering):
+            assertion.eq_float(python_value, core_value, 0.000001)
+
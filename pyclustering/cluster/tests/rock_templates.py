@@ -9,6 +9,8 @@
 """
 
 
+import numpy;
+
 from pyclustering.cluster.rock import rock;
 
 from pyclustering.utils import read_sample;
@@ -18,10 +20,10 @@ from random import random;
 
 class RockTestTemplates:
     @staticmethod
-    def templateLengthProcessData(path_to_file, radius, cluster_numbers, threshold, expected_cluster_length, ccore):
+    def templateLengthProcessData(path_to_file, radius, cluster_numbers, threshold, expected_cluster_length, ccore, **kwargs):
         sample = read_sample(path_to_file);
         
-        rock_instance = rock(sample, radius, cluster_numbers, threshold, ccore);
+        rock_instance = rock(sample, radius, cluster_numbers, threshold, ccore, **kwargs);
         rock_instance.process();
         clusters = rock_instance.get_clusters();
         
@@ -46,3 +48,38 @@ class RockTestTemplates:
         assert len(clusters) == 4;
         for cluster in clusters:
             assert len(cluster) == 10;
+
+
+    @staticmethod
+    def templatePythonCoreAgreement(path_to_file, radius, cluster_numbers, threshold):
+        sample = read_sample(path_to_file);
+
+        python_clusters = rock(sample, radius, cluster_numbers, threshold, False).process().get_clusters();
+        core_clusters = rock(sample, radius, cluster_numbers, threshold, True).process().get_clusters();
+
+        assert sorted(sorted(cluster) for cluster in python_clusters) == sorted(sorted(cluster) for cluster in core_clusters);
+
+
+    @staticmethod
+    def templateClusterAllocationRandomBlobs(amount_clusters, cluster_size, radius, ccore, **kwargs):
+        generator = numpy.random.RandomState(1000);
+        input_data = numpy.concatenate([generator.uniform(0.0, 1.0, (cluster_size, 2)) + [2.0 * index_cluster, 0.0]
+                                        for index_cluster in range(amount_clusters)]);
+
+        clusters = rock(input_data, radius, amount_clusters, 0.5, ccore, **kwargs).process().get_clusters();
+
+        expected_clusters = [list(range(index_cluster * cluster_size, (index_cluster + 1) * cluster_size))
+                             for index_cluster in range(amount_clusters)];
+        assert sorted(sorted(cluster) for cluster in clusters) == expected_clusters;
+
+
+    @staticmethod
+    def templateDendrogramCut(path_to_file, radius, threshold, amounts_clusters, **kwargs):
+        sample = read_sample(path_to_file);
+
+        tree = rock(sample, radius, 1, threshold, False, **kwargs).process().get_dendrogram();
+        assert len(tree) == len(sample);
+
+        for number_clusters in amounts_clusters:
+            expected_clusters = rock(sample, radius, number_clusters, threshold, False, **kwargs).process().get_clusters();
+            assert tree.get_clusters(number_clusters) == expected_clusters;
@@ -20,6 +20,10 @@ from pyclustering.tests.assertion import assertion
 from pyclustering.utils import read_sample, calculate_distance_matrix, distance_metric, type_metric
 
 
+def manhattan_distance(point1, point2):
+    return sum(abs(value1 - value2) for value1, value2 in zip(point1, point2))
+
+
 class silhouette_test_template:
     @staticmethod
     def correct_scores(sample_path, answer_path, ccore_flag, **kwargs):
@@ -51,7 +55,7 @@ class silhouette_test_template:
 
 
     @staticmethod
-    def correct_ksearch(sample_path, answer_path, kmin, kmax, algorithm, ccore_flag):
+    def correct_ksearch(sample_path, answer_path, kmin, kmax, algorithm, ccore_flag, **kwargs):
         attempts = 15
         testing_result = False
 
@@ -59,7 +63,7 @@ class silhouette_test_template:
         clusters = answer_reader(answer_path).get_clusters()
 
         for _ in range(attempts):
-            ksearch_instance = silhouette_ksearch(sample, kmin, kmax, algorithm=algorithm, ccore=ccore_flag).process()
+            ksearch_instance = silhouette_ksearch(sample, kmin, kmax, algorithm=algorithm, ccore=ccore_flag, **kwargs).process()
             amount = ksearch_instance.get_amount()
             score = ksearch_instance.get_score()
             scores = ksearch_instance.get_scores()
@@ -83,14 +87,14 @@ class silhouette_test_template:
 
 
     @staticmethod
-    def random_state(kmin, kmax, algorithm, random_state, ccore_flag):
+    def random_state(kmin, kmax, algorithm, random_state, ccore_flag, **kwargs):
         sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE4)
 
         ksearch_instance_1 = silhouette_ksearch(sample, kmin, kmax, algorithm=algorithm, random_state=random_state,
-                                                ccore=ccore_flag).process()
+                                                ccore=ccore_flag, **kwargs).process()
 
         ksearch_instance_2 = silhouette_ksearch(sample, kmin, kmax, algorithm=algorithm, random_state=random_state,
-                                                ccore=ccore_flag).process()
+                                                ccore=ccore_flag, **kwargs).process()
 
         assertion.eq(ksearch_instance_1.get_amount(), ksearch_instance_2.get_amount())
         assertion.eq(ksearch_instance_1.get_score(), ksearch_instance_2.get_score())
@@ -104,3 +108,56 @@ class silhouette_test_template:
                 continue
             else:
                 assertion.eq(scores1[key], scores2[key])
+
+
+    @staticmethod
+    def correct_parallel_scores(sample_path, answer_path, processes, ccore_flag, **kwargs):
+        sample = read_sample(sample_path)
+        if kwargs.get('data_type', 'points') == 'distance_matrix':
+            sample = calculate_distance_matrix(sample, distance_metric(type_metric.EUCLIDEAN_SQUARE))
+        clusters = answer_reader(answer_path).get_clusters()
+
+        expected_scores = silhouette(sample, clusters, ccore=ccore_flag, **kwargs).process().get_score()
+        actual_scores = silhouette(sample, clusters, ccore=ccore_flag, processes=processes, **kwargs).process().get_score()
+
+        assertion.eq(len(expected_scores), len(actual_scores))
+        for index_point in range(len(expected_scores)):
+            assertion.eq_float(expected_scores[index_point], actual_scores[index_point], 0.0000001)
+
+
+    @staticmethod
+    def correct_sampled_scores(sample_path, answer_path, sample_size, random_state, ccore_flag):
+        sample = read_sample(sample_path)
+        clusters = answer_reader(answer_path).get_clusters()
+
+        expected_scores = silhouette(sample, clusters, ccore=ccore_flag).process().get_score()
+
+        silhouette_instance = silhouette(sample, clusters, ccore=ccore_flag, sample_size=sample_size,
+                                         random_state=random_state).process()
+
+        scores = silhouette_instance.get_score()
+        sampled_objects = silhouette_instance.get_sample()
+
+        assertion.eq(len(sample), len(scores))
+        assertion.eq(min(sample_size, len(sample)), len(sampled_objects))
+        assertion.eq(len(sampled_objects), len(set(sampled_objects)))
+
+        for index_point in range(len(sample)):
+            if index_point in sampled_objects:
+                assertion.eq_float(expected_scores[index_point], scores[index_point], 0.0000001)
+            elif sample_size < len(sample):
+                assertion.true(math.isnan(scores[index_point]))
+
+        mean_score = silhouette_instance.get_mean_score()
+        expected_mean = sum(scores[index_point] for index_point in sampled_objects) / len(sampled_objects)
+        assertion.eq_float(expected_mean, mean_score, 0.0000001)
+
+        lower, upper = silhouette_instance.get_confidence_interval()
+        assertion.le(lower, mean_score)
+        assertion.ge(upper, mean_score)
+        if sample_size >= len(sample):
+            assertion.eq(lower, upper)
+
+        same_instance = silhouette(sample, clusters, ccore=ccore_flag, sample_size=sample_size,
+                                   random_state=random_state).process()
+        assertion.eq(sampled_objects, same_instance.get_sample())
@@ -21,6 +21,7 @@ from pyclustering.cluster.tests.unit               import ut_bang
 from pyclustering.cluster.tests.unit               import ut_birch              as cluster_birch_unit_tests
 from pyclustering.cluster.tests.unit               import ut_bsas               as cluster_bsas_unit_tests
 from pyclustering.cluster.tests.unit               import ut_center_initializer as cluster_center_initializer_unit_tests
+from pyclustering.cluster.tests.unit               import ut_clara              as cluster_clara_unit_tests
 from pyclustering.cluster.tests.unit               import ut_clarans            as cluster_clarans_unit_tests
 from pyclustering.cluster.tests.unit               import ut_clique             as cluster_clique_unit_tests
 from pyclustering.cluster.tests.unit               import ut_cure               as cluster_cure_unit_tests
@@ -37,6 +38,7 @@ from pyclustering.cluster.tests.unit               import ut_hsyncnet
 from pyclustering.cluster.tests.unit               import ut_kmeans             as cluster_kmeans_unit_tests
 from pyclustering.cluster.tests.unit               import ut_kmedians           as cluster_kmedians_unit_tests
 from pyclustering.cluster.tests.unit               import ut_kmedoids           as cluster_kmedoids_unit_tests
+from pyclustering.cluster.tests.unit               import ut_ksweep             as cluster_ksweep_unit_tests
 from pyclustering.cluster.tests.unit               import ut_mbsas              as cluster_mbsas_unit_tests
 from pyclustering.cluster.tests.unit               import ut_optics             as cluster_optics_unit_tests
 from pyclustering.cluster.tests.unit               import ut_rock               as cluster_rock_unit_tests
@@ -61,6 +63,7 @@ class clustering_unit_tests(suite_holder):
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_birch_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_bsas_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_center_initializer_unit_tests))
+        unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_clara_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_clarans_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_clique_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_cure_unit_tests))
@@ -77,6 +80,7 @@ class clustering_unit_tests(suite_holder):
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_kmeans_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_kmedians_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_kmedoids_unit_tests))
+        unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_ksweep_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_mbsas_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_optics_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_rock_unit_tests))
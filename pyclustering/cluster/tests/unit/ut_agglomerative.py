@@ -16,7 +16,7 @@ matplotlib.use('Agg')
 
 from pyclustering.cluster.tests.agglomerative_templates import AgglomerativeTestTemplates
 
-from pyclustering.samples.definitions import SIMPLE_SAMPLES
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
 from pyclustering.cluster.agglomerative import agglomerative, type_link
 
 
@@ -176,6 +176,35 @@ class AgglomerativeUnitTests(unittest.TestCase):
     def testTwoClusterAllocationTheSameObjectLinkSingle(self):
         AgglomerativeTestTemplates.templateClusterAllocationTheSameObjects(10, 2, type_link.SINGLE_LINK, False)
 
+    def testTwoClusterAllocationTheSameObjectLinkWard(self):
+        AgglomerativeTestTemplates.templateClusterAllocationTheSameObjects(10, 2, type_link.WARD_LINK, False)
+
+
+    def testClusteringSampleSimple3LinkWard(self):
+        AgglomerativeTestTemplates.templateClusteringResults(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, type_link.WARD_LINK, [10, 10, 10, 30], False)
+
+    def testClusteringSampleHeptaLinkWard(self):
+        AgglomerativeTestTemplates.templateClusteringResults(FCPS_SAMPLES.SAMPLE_HEPTA, 7, type_link.WARD_LINK, [30, 30, 30, 30, 30, 30, 32], False)
+
+    def testClusterAllocationOneDimensionDataLinkWard(self):
+        AgglomerativeTestTemplates.templateClusterAllocationOneDimensionData(type_link.WARD_LINK, False)
+
+
+    def testLinkageCutLinkAverage(self):
+        AgglomerativeTestTemplates.templateLinkageCut(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, type_link.AVERAGE_LINK, [1, 2, 4, 10, 60])
+
+    def testLinkageCutLinkCentroid(self):
+        AgglomerativeTestTemplates.templateLinkageCut(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, type_link.CENTROID_LINK, [1, 2, 4, 10, 60])
+
+    def testLinkageCutLinkComplete(self):
+        AgglomerativeTestTemplates.templateLinkageCut(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, type_link.COMPLETE_LINK, [1, 2, 4, 10, 60])
+
+    def testLinkageCutLinkSingle(self):
+        AgglomerativeTestTemplates.templateLinkageCut(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, type_link.SINGLE_LINK, [1, 2, 4, 10, 60])
+
+    def testLinkageCutLinkWard(self):
+        AgglomerativeTestTemplates.templateLinkageCut(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, type_link.WARD_LINK, [1, 2, 4, 10, 60])
+
 
     def test_incorrect_data(self):
         self.assertRaises(ValueError, agglomerative, [], 1)
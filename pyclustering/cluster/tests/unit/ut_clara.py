@@ -0,0 +1,100 @@
+"""!
+
+@brief Unit-tests for CLARA algorithm.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2020
+@copyright BSD-3-Clause
+
+"""
+
+
+import unittest
+
+import matplotlib
+matplotlib.use('Agg')
+
+import numpy
+
+from pyclustering.cluster.clara import clara
+from pyclustering.cluster.kmedoids import kmedoids_swap_type
+from pyclustering.cluster.tests.clara_templates import clara_test_template
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
+
+from pyclustering.utils.metric import distance_metric, type_metric
+
+
+class ClaraUnitTest(unittest.TestCase):
+    def testClusterAllocationSampleSimple1(self):
+        clara_test_template.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 2, [5, 5], False)
+
+    def testClusterAllocationSampleSimple3(self):
+        clara_test_template.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, [10, 10, 10, 30], False, sample_size=30)
+
+    def testClusterAllocationSampleSimple4(self):
+        clara_test_template.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, 5, [15, 15, 15, 15, 15], False, sample_size=40)
+
+    def testClusterAllocationSampleSimple4SmallChunks(self):
+        clara_test_template.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, 5, [15, 15, 15, 15, 15], False, sample_size=40, chunk_size=4)
+
+    def testClusterAllocationSampleSimple4FasterPam(self):
+        clara_test_template.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, 5, [15, 15, 15, 15, 15], False, sample_size=40, swap=kmedoids_swap_type.FASTERPAM)
+
+    def testClusterAllocationSampleSimple4Manhattan(self):
+        metric = distance_metric(type_metric.MANHATTAN)
+        clara_test_template.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, 5, [15, 15, 15, 15, 15], False, sample_size=40, metric=metric)
+
+    def testClusterAllocationSampleSimple4UserDefined(self):
+        metric = distance_metric(type_metric.USER_DEFINED, func=distance_metric(type_metric.EUCLIDEAN))
+        clara_test_template.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, 5, [15, 15, 15, 15, 15], False, sample_size=40, metric=metric)
+
+    def testClusterAllocationSampleSimple4UserDefinedNumpy(self):
+        metric = distance_metric(type_metric.USER_DEFINED, numpy_usage=True,
+                                 func=lambda point1, point2: numpy.sum(numpy.abs(numpy.subtract(point1, point2)), axis=-1))
+        clara_test_template.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, 5, [15, 15, 15, 15, 15], False, sample_size=40, metric=metric)
+
+    def testClusterAllocationTetra(self):
+        clara_test_template.templateClusterAllocation(FCPS_SAMPLES.SAMPLE_TETRA, 4, [100, 100, 100, 100], False, sample_size=120)
+
+    def testClusterAllocationOneDimensional(self):
+        clara_test_template.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE9, 2, [10, 20], False, sample_size=15)
+
+    def testClusterAllocationOneCluster(self):
+        clara_test_template.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, 1, [23], False, sample_size=10)
+
+    def testWholeDataSampleSimple3(self):
+        clara_test_template.templateWholeDataSample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, False)
+
+    def testWholeDataSampleSimple4(self):
+        clara_test_template.templateWholeDataSample(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, 5, False)
+
+    def testSampleContainsMedoids(self):
+        clara_instance = clara(numpy.arange(20.0).reshape(-1, 1), 3, sample_size=18)
+        medoids = [19, 0, 7]
+
+        for _ in range(20):
+            sample_indexes = clara_instance._clara__draw_sample(medoids)
+
+            self.assertEqual(18, len(sample_indexes))
+            self.assertEqual(18, len(numpy.unique(sample_indexes)))
+            self.assertTrue(set(medoids).issubset(sample_indexes.tolist()))
+            self.assertTrue(numpy.all((sample_indexes >= 0) & (sample_indexes < 20)))
+
+
+    def testIncorrectData(self):
+        self.assertRaises(ValueError, clara, [], 1)
+
+    def testIncorrectAmountClusters(self):
+        self.assertRaises(ValueError, clara, [[0], [1], [2]], 0)
+        self.assertRaises(ValueError, clara, [[0], [1], [2]], 4)
+
+    def testIncorrectSamples(self):
+        self.assertRaises(ValueError, clara, [[0], [1], [2]], 1, samples=0)
+        self.assertRaises(ValueError, clara, [[0], [1], [2]], 2, sample_size=1)
+
+    def testIncorrectChunkSize(self):
+        self.assertRaises(ValueError, clara, [[0], [1], [2]], 1, chunk_size=0)
+
+    def testIncorrectItermax(self):
+        self.assertRaises(ValueError, clara, [[0], [1], [2]], 1, itermax=-1)
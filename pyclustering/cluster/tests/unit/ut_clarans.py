@@ -14,7 +14,7 @@ import unittest
 import matplotlib
 matplotlib.use('Agg')
 
-from pyclustering.samples.definitions import SIMPLE_SAMPLES
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
 
 from pyclustering.utils import read_sample
 
@@ -22,14 +22,14 @@ from pyclustering.cluster.clarans import clarans
 
 
 class ClaransUnitTest(unittest.TestCase):
-    def templateClusterAllocation(self, path, cluster_sizes, number_clusters, iterations, maxneighbors):
+    def templateClusterAllocation(self, path, cluster_sizes, number_clusters, iterations, maxneighbors, **kwargs):
         result_testing = False
         
         # it's randomized algorithm therefore attempts are required
         for _ in range(0, 5, 1):
             sample = read_sample(path)
             
-            clarans_instance = clarans(sample, number_clusters, iterations, maxneighbors)
+            clarans_instance = clarans(sample, number_clusters, iterations, maxneighbors, **kwargs)
             clarans_instance.process()
             clusters = clarans_instance.get_clusters()
     
@@ -50,6 +50,18 @@ class ClaransUnitTest(unittest.TestCase):
         assert result_testing == True
 
 
+    def templateReproducibility(self, path, number_clusters, iterations, maxneighbors, random_state):
+        sample = read_sample(path)
+
+        expected = clarans(sample, number_clusters, iterations, maxneighbors, random_state=random_state).process()
+        for processes in [1, 2, 3]:
+            actual = clarans(sample, number_clusters, iterations, maxneighbors, random_state=random_state,
+                             processes=processes).process()
+
+            self.assertEqual(expected.get_medoids(), actual.get_medoids())
+            self.assertEqual(expected.get_clusters(), actual.get_clusters())
+
+
     def testClusterAllocationSampleSimple1(self):
         self.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [5, 5], 2, 10, 3)
 
@@ -76,14 +88,43 @@ class ClaransUnitTest(unittest.TestCase):
         self.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE12, [5, 10], 2, 15, 5)
 
 
+    def testClusterAllocationSampleSimple3Parallel(self):
+        self.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [10, 10, 10, 30], 4, 10, 3, processes=2)
+
+    def testClusterAllocationSampleSimple8Parallel(self):
+        self.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE8, [15, 30, 20, 80], 4, 15, 5, processes=4)
+
+    def testClusterAllocationTetra(self):
+        self.templateClusterAllocation(FCPS_SAMPLES.SAMPLE_TETRA, [100, 100, 100, 100], 4, 5, 100)
+
+    def testClusterAllocationAllPointsAreMedoids(self):
+        self.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [1] * 10, 10, 2, 5)
+
+    def testClusterAllocationNoLocalMinima(self):
+        clarans_instance = clarans(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1), 2, 0, 5).process()
+        self.assertEqual([], clarans_instance.get_clusters())
+        self.assertEqual([], clarans_instance.get_medoids())
+
+
+    def testReproducibilitySampleSimple3(self):
+        self.templateReproducibility(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 5, 10, 1000)
+
+    def testReproducibilitySampleSimple8(self):
+        self.templateReproducibility(SIMPLE_SAMPLES.SAMPLE_SIMPLE8, 4, 6, 5, 500)
+
+
     def test_incorrect_data(self):
         self.assertRaises(ValueError, clarans, [], 1, 0, 0)
 
     def test_incorrect_amount_clusters(self):
         self.assertRaises(ValueError, clarans, [[0], [1], [2]], 0, 0, 0)
+        self.assertRaises(ValueError, clarans, [[0], [1], [2]], 4, 0, 0)
 
     def test_incorrect_local_minima(self):
         self.assertRaises(ValueError, clarans, [[0], [1], [2]], 1, -1, 0)
 
     def test_incorrect_max_neighbors(self):
         self.assertRaises(ValueError, clarans, [[0], [1], [2]], 1, 0, -1)
+
+    def test_incorrect_processes(self):
+        self.assertRaises(ValueError, clarans, [[0], [1], [2]], 1, 1, 1, processes=0)
@@ -17,8 +17,11 @@ matplotlib.use('Agg')
 
 from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
 
+from pyclustering.cluster.cure import cure
 from pyclustering.cluster.tests.cure_templates import CureTestTemplates
 
+from pyclustering.utils import read_sample
+
 
 class CureUnitTest(unittest.TestCase):
     def testClusterAllocationSampleSimple1(self):
@@ -98,6 +101,47 @@ class CureUnitTest(unittest.TestCase):
         CureTestTemplates.templateEncoderProcedures(False)
 
 
+    def testClusterAllocationRandomBlobs(self):
+        CureTestTemplates.template_random_blobs(4, 250, 2, 1000)
+
+    def testClusterAllocationRandomBlobsHighDimension(self):
+        CureTestTemplates.template_random_blobs(3, 100, 10, 1000)
+
+
+    def testSamplingSampleLsun(self):
+        CureTestTemplates.template_sampling(FCPS_SAMPLES.SAMPLE_LSUN, [100, 101, 202], 3, 300, 3, False, random_state=1)
+
+    def testSamplingWholeDataSampleLsun(self):
+        CureTestTemplates.template_sampling(FCPS_SAMPLES.SAMPLE_LSUN, [100, 101, 202], 3, 1000, 1, False, random_state=1)
+
+    def testSamplingSmallChunks(self):
+        CureTestTemplates.template_sampling(FCPS_SAMPLES.SAMPLE_LSUN, [100, 101, 202], 3, 300, 3, False, random_state=1, chunk_size=7)
+
+    def testSamplingRandomBlobs(self):
+        CureTestTemplates.template_random_blobs(4, 1000, 2, 1000, sample_size=400, partitions=4, random_state=1)
+
+    def testSamplingRandomBlobsParallel(self):
+        CureTestTemplates.template_random_blobs(4, 1000, 2, 1000, sample_size=400, partitions=4, processes=2, random_state=1)
+
+
+    def testDendrogramCutSampleSimple3(self):
+        CureTestTemplates.template_dendrogram_cut(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [1, 2, 4, 10, 60], 5, 0.5)
+
+    def testDendrogramCutSampleLsun(self):
+        CureTestTemplates.template_dendrogram_cut(FCPS_SAMPLES.SAMPLE_LSUN, [1, 3, 7, 50], 5, 0.5)
+
+    def testDendrogramIsNotCreatedBySampling(self):
+        sample = read_sample(FCPS_SAMPLES.SAMPLE_LSUN)
+        self.assertIsNone(cure(sample, 3, ccore=False, sample_size=300, random_state=1).process().get_dendrogram())
+
+    def testDendrogramIsNotCreatedWithoutHistory(self):
+        sample = read_sample(FCPS_SAMPLES.SAMPLE_LSUN)
+        cure_instance = cure(sample, 3, ccore=False, merge_history=False).process()
+
+        self.assertIsNone(cure_instance.get_dendrogram())
+        self.assertEqual([100, 101, 202], sorted(len(cluster) for cluster in cure_instance.get_clusters()))
+
+
     def test_argument_invalid_amount_clusters(self):
         CureTestTemplates.exception(ValueError, SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 0, 5, 0.3, False)
         CureTestTemplates.exception(ValueError, SIMPLE_SAMPLES.SAMPLE_SIMPLE2, -1, 5, 0.3, False)
@@ -113,3 +157,19 @@ class CureUnitTest(unittest.TestCase):
 
     def test_argument_empty_data(self):
         CureTestTemplates.exception(ValueError, [], 3, 5, 0.3, False)
+
+    def test_argument_invalid_sample_size(self):
+        CureTestTemplates.exception(ValueError, SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 3, 5, 0.3, False, sample_size=2)
+
+    def test_argument_invalid_partitions(self):
+        CureTestTemplates.exception(ValueError, SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 2, 5, 0.3, False, sample_size=5, partitions=0)
+        CureTestTemplates.exception(ValueError, SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 2, 5, 0.3, False, sample_size=5, partitions=6)
+
+    def test_argument_invalid_reduction(self):
+        CureTestTemplates.exception(ValueError, SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 2, 5, 0.3, False, sample_size=5, reduction=0.5)
+
+    def test_argument_invalid_processes(self):
+        CureTestTemplates.exception(ValueError, SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 2, 5, 0.3, False, sample_size=5, processes=0)
+
+    def test_argument_invalid_chunk_size(self):
+        CureTestTemplates.exception(ValueError, SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 2, 5, 0.3, False, sample_size=5, chunk_size=0)
@@ -21,6 +21,10 @@ from pyclustering.cluster.dbscan import dbscan
 from pyclustering.samples.definitions import SIMPLE_SAMPLES, SIMPLE_ANSWERS
 from pyclustering.samples.definitions import FCPS_SAMPLES
 
+from pyclustering.container.neighborhood import neighborhood_index
+
+from pyclustering.utils import read_sample
+
 
 class DbscsanUnitTest(unittest.TestCase):
     def testClusteringSampleSimple1(self):
@@ -146,10 +150,40 @@ class DbscsanUnitTest(unittest.TestCase):
         DbscanTestTemplates.templateClusterAllocationOneDimensionDistanceMatrix(False)
 
 
+    def testPointsAgainstDistanceMatrixHighDimension(self):
+        sample = [[(i * 7 + j * 3) % 5 * 0.1 + (i // 20) * 2.0 for j in range(6)] for i in range(60)]
+        DbscanTestTemplates.templateClusteringPointsAgainstDistanceMatrix(sample, 0.3, 3, False)
+
+    def testPointsAgainstDistanceMatrixDuplicates(self):
+        sample = [[1.0, 1.0]] * 5 + [[1.0, 1.5]] * 3 + [[5.0, 5.0]] * 2
+        DbscanTestTemplates.templateClusteringPointsAgainstDistanceMatrix(sample, 0.0, 2, False)
+        DbscanTestTemplates.templateClusteringPointsAgainstDistanceMatrix(sample, 0.5, 4, False)
+
+    def testPointsAgainstDistanceMatrixSimple3(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+        DbscanTestTemplates.templateClusteringPointsAgainstDistanceMatrix(sample, 0.7, 3, False)
+        DbscanTestTemplates.templateClusteringPointsAgainstDistanceMatrix(sample, 0.2, 2, False)
+
+
+    def testNeighborhoodIndexSampleSimple3(self):
+        DbscanTestTemplates.templateClusteringNeighborhoodIndex(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 0.7, 0.7, range(1, 8), False)
+        DbscanTestTemplates.templateClusteringNeighborhoodIndex(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 2.0, 0.7, range(1, 8), False)
+
+    def testNeighborhoodIndexLsun(self):
+        DbscanTestTemplates.templateClusteringNeighborhoodIndex(FCPS_SAMPLES.SAMPLE_LSUN, 0.5, 0.3, [3, 5, 10], False)
+
+    def test_incorrect_eps_neighborhood_index(self):
+        self.assertRaises(ValueError, dbscan, neighborhood_index([[0], [1], [2]], 0.5), 1.0, 1)
+
+
     def test_pickle_dump_load(self):
         DbscanTestTemplates.pickle_dump_load(False)
 
 
+    def testProcessAsyncSampleSimple3(self):
+        DbscanTestTemplates.templateProcessAsync(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 0.7, 3, 4, False)
+
+
     def test_incorrect_data(self):
         self.assertRaises(ValueError, dbscan, [], 0.1, 1)
 
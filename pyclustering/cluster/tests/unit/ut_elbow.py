@@ -84,6 +84,21 @@ class elbow_unit_test(unittest.TestCase):
     def test_elbow_three_dimensional_simple_11(self):
         elbow_test_template.calculate_elbow(SIMPLE_SAMPLES.SAMPLE_SIMPLE11, SIMPLE_ANSWERS.ANSWER_SIMPLE11, 1, 10, False)
 
+    def test_elbow_simple_03_warm_start(self):
+        elbow_test_template.calculate_elbow(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, SIMPLE_ANSWERS.ANSWER_SIMPLE3, 1, 10, False, warm_start=True)
+
+    def test_elbow_simple_03_workers(self):
+        elbow_test_template.calculate_elbow(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, SIMPLE_ANSWERS.ANSWER_SIMPLE3, 1, 10, False, workers=3)
+
+    def test_elbow_simple_15_warm_start_step_2(self):
+        elbow_test_template.calculate_elbow(SIMPLE_SAMPLES.SAMPLE_SIMPLE15, 5, 1, 20, False, kstep=2, warm_start=True, workers=2)
+
+    def test_elbow_times(self):
+        elbow_test_template.calculate_times(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 1, 10, False, workers=2)
+
+    def test_elbow_random_state_workers(self):
+        elbow_test_template.random_state_fixed(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 1, 10, False, random_state=5, workers=4)
+
     def test_elbow_random_state(self):
         elbow_test_template.random_state_fixed(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 1, 10, False, random_state=5)
 
@@ -121,3 +136,6 @@ class elbow_unit_test(unittest.TestCase):
 
     def test_incorrect_kstep(self):
         self.assertRaises(ValueError, elbow, [[0], [1], [2]], 1, 3, kstep=0)
+
+    def test_incorrect_workers(self):
+        self.assertRaises(ValueError, elbow, [[0], [1], [2], [3]], 1, 3, workers=0)
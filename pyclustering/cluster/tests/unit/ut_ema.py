@@ -9,12 +9,13 @@
 """
 
 import unittest
+import numpy
 
 # Generate images without having a window appear.
 import matplotlib
 matplotlib.use('Agg')
 
-from pyclustering.cluster.ema import ema, ema_observer, ema_initializer, ema_init_type, ema_visualizer
+from pyclustering.cluster.ema import ema, ema_observer, ema_initializer, ema_init_type, ema_visualizer, ema_covariance_type
 from pyclustering.utils import read_sample
 
 from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES, FAMOUS_SAMPLES
@@ -24,7 +25,8 @@ class EmaUnitTest(unittest.TestCase):
     def templateDataClustering(self, sample_path, 
                                amount_clusters, 
                                expected_clusters_sizes, 
-                               init_type = ema_init_type.KMEANS_INITIALIZATION):
+                               init_type = ema_init_type.KMEANS_INITIALIZATION,
+                               covariance_type = ema_covariance_type.FULL):
         testing_result = False
         attempts = 10
         
@@ -35,7 +37,7 @@ class EmaUnitTest(unittest.TestCase):
             if init_type is not ema_init_type.KMEANS_INITIALIZATION:
                 means, variances = ema_initializer(sample, amount_clusters).initialize(init_type)
             
-            ema_instance = ema(sample, amount_clusters, means, variances)
+            ema_instance = ema(sample, amount_clusters, means, variances, covariance_type=covariance_type)
             ema_instance.process()
             
             clusters = ema_instance.get_clusters()
@@ -154,6 +156,62 @@ class EmaUnitTest(unittest.TestCase):
     def testClusteringTotallySimilarObjectsFiveClustersRandomInit(self):
         self.templateDataClustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE12, 5, None, ema_init_type.RANDOM_INITIALIZATION)
 
+    def testClusteringDiagonalCovarianceSimple03(self):
+        self.templateDataClustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, [10, 10, 10, 30], covariance_type=ema_covariance_type.DIAGONAL)
+
+    def testClusteringDiagonalCovarianceOldFaithful(self):
+        self.templateDataClustering(FAMOUS_SAMPLES.SAMPLE_OLD_FAITHFUL, 2, [97, 175], covariance_type=ema_covariance_type.DIAGONAL)
+
+    def testClusteringDiagonalCovarianceOneDimensionalData(self):
+        self.templateDataClustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE7, 2, [10, 10], covariance_type=ema_covariance_type.DIAGONAL)
+
+    def testClusteringSphericalCovarianceSimple03(self):
+        self.templateDataClustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, [10, 10, 10, 30], covariance_type=ema_covariance_type.SPHERICAL)
+
+    def testClusteringSphericalCovarianceHepta(self):
+        self.templateDataClustering(FCPS_SAMPLES.SAMPLE_HEPTA, 7, [30, 30, 30, 30, 30, 30, 32], covariance_type=ema_covariance_type.SPHERICAL)
+
+    def testClusteringSphericalCovarianceTotallySimilarObjects(self):
+        self.templateDataClustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE12, 2, None, covariance_type=ema_covariance_type.SPHERICAL)
+
+    def testCovarianceTypeStructure(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE11)
+
+        for covariance_type in ema_covariance_type:
+            covariances = ema(sample, 2, covariance_type=covariance_type).process().get_covariances()
+
+            for covariance in covariances:
+                self.assertEqual((3, 3), numpy.shape(covariance))
+                if covariance_type != ema_covariance_type.FULL:
+                    self.assertTrue(numpy.array_equal(numpy.diag(numpy.diag(covariance)), covariance))
+
+                if covariance_type == ema_covariance_type.SPHERICAL:
+                    self.assertTrue(numpy.allclose(covariance[0][0], numpy.diag(covariance)))
+
+    def testOneDimensionalResultTypes(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE9)
+
+        observer_instance = ema_observer()
+        ema_instance = ema(sample, 2, observer=observer_instance).process()
+
+        probabilities = ema_instance.get_probabilities()
+        self.assertIsInstance(probabilities, list)
+        self.assertTrue(all(isinstance(cluster_probability, list) for cluster_probability in probabilities))
+
+        for covariances in [ema_instance.get_covariances()] + observer_instance.get_evolution_covariances():
+            self.assertTrue(all(isinstance(covariance, float) for covariance in covariances))
+
+    def testClusteringHighDimensionalData(self):
+        random_state = numpy.random.RandomState(1000)
+        sample = numpy.vstack([random_state.normal(0.0, 1.0, (100, 200)), random_state.normal(5.0, 1.0, (100, 200))])
+
+        for covariance_type in ema_covariance_type:
+            ema_instance = ema(sample.tolist(), 2, covariance_type=covariance_type).process()
+
+            self.assertEqual([100, 100], sorted(len(cluster) for cluster in ema_instance.get_clusters()))
+            self.assertTrue(numpy.all(numpy.isfinite(ema_instance.get_probabilities())))
+            self.assertTrue(numpy.allclose(1.0, numpy.sum(ema_instance.get_probabilities(), axis=0)))
+
 
     def testObserver(self):
         sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE2)
@@ -195,3 +253,6 @@ class EmaUnitTest(unittest.TestCase):
 
     def test_incorrect_amount_clusters(self):
         self.assertRaises(ValueError, ema, [[0], [1], [2]], 0)
+
+    def test_incorrect_covariance_type(self):
+        self.assertRaises(ValueError, ema, [[0], [1], [2]], 2, covariance_type=5)
@@ -10,6 +10,7 @@
 
 
 import unittest
+import numpy
 
 # Generate images without having a window appear.
 import matplotlib
@@ -105,3 +106,39 @@ class fcm_unit_tests(unittest.TestCase):
 
     def test_incorrect_centers(self):
         self.assertRaises(ValueError, fcm, [[0], [1], [2]], [])
+
+
+    def test_chunk_size_simple01(self):
+        fcm_test_template.chunk_size(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], 2.0, 1)
+
+    def test_chunk_size_simple03(self):
+        fcm_test_template.chunk_size(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], 2.0, 7)
+
+    def test_chunk_size_fcps_hepta(self):
+        fcm_test_template.chunk_size(FCPS_SAMPLES.SAMPLE_HEPTA,
+                                     [[-0.06,0.02, 0.02], [2.41, 0.49, 0.03], [-2.69, 0.34, 0.29], [0.49, 2.89, 0.78], [-0.60, -2.31, 0.05], [-0.15, 0.77, 3.23], [-0.50, 0.43, -2.60]],
+                                     2.0, 50)
+
+    def test_single_precision_simple01(self):
+        fcm_test_template.single_precision(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], 2.0)
+
+    def test_single_precision_simple03(self):
+        fcm_test_template.single_precision(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], 2.0)
+
+    def test_top_membership_simple01(self):
+        fcm_test_template.top_membership(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], 2.0, 1)
+
+    def test_top_membership_simple03(self):
+        fcm_test_template.top_membership(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], 2.0, 2)
+
+    def test_top_membership_bigger_than_clusters(self):
+        fcm_test_template.top_membership(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], 2.0, 5)
+
+    def test_incorrect_chunk_size(self):
+        self.assertRaises(ValueError, fcm, [[0], [1], [2]], [[1]], chunk_size=0)
+
+    def test_incorrect_dtype(self):
+        self.assertRaises(ValueError, fcm, [[0], [1], [2]], [[1]], dtype=numpy.int32)
+
+    def test_incorrect_top_m(self):
+        self.assertRaises(ValueError, fcm, [[0], [1], [2]], [[1]], top_m=0)
@@ -24,10 +24,18 @@ from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES, SIMPL
 
 
 class testable_gmeans(gmeans):
+    def __init__(self, data, k_init=1, ccore=True, **kwargs):
+        super().__init__(data, k_init, ccore, **kwargs)
+        self.tested_clusters = []
+
     @staticmethod
     def get_data_projection(data, vector):
         return gmeans._project_data(data, vector)
 
+    def _split_and_search_optimal(self, cluster):
+        self.tested_clusters.append(list(cluster))
+        return super()._split_and_search_optimal(cluster)
+
 
 class gmeans_unit_test(unittest.TestCase):
     def test_data_projection(self):
@@ -38,6 +46,16 @@ class gmeans_unit_test(unittest.TestCase):
         projection = testable_gmeans.get_data_projection(data, [1, 1])
         self.assertEqual([1.0, 2.0, 3.0], projection.tolist())
 
+    def test_clusters_are_tested_once(self):
+        data = read_sample(FCPS_SAMPLES.SAMPLE_HEPTA)
+        gmeans_instance = testable_gmeans(data, 1, False, random_state=1000).process()
+
+        self.assertEqual(7, len(gmeans_instance.get_clusters()))
+
+        unique_clusters = set(tuple(cluster) for cluster in gmeans_instance.tested_clusters)
+        self.assertEqual(len(unique_clusters), len(gmeans_instance.tested_clusters))
+        self.assertGreater(len(gmeans_instance.tested_clusters), 0)
+
 
     def test_clustering_sample_01(self):
         gmeans_test_template().clustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, SIMPLE_ANSWERS.ANSWER_SIMPLE1, 1, False)
@@ -129,6 +147,21 @@ class gmeans_unit_test(unittest.TestCase):
     def test_clustering_hepta_kmax_10(self):
         gmeans_test_template().clustering(FCPS_SAMPLES.SAMPLE_HEPTA, 7, 1, False, k_max=10, random_state=1000)
 
+    def test_clustering_sample_03_processes(self):
+        gmeans_test_template().clustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, SIMPLE_ANSWERS.ANSWER_SIMPLE3, 1, False, random_state=1000, processes=2)
+
+    def test_clustering_hepta_processes(self):
+        gmeans_test_template().clustering(FCPS_SAMPLES.SAMPLE_HEPTA, 7, 1, False, random_state=1000, processes=3)
+
+    def test_processes_hepta(self):
+        gmeans_test_template().processes(FCPS_SAMPLES.SAMPLE_HEPTA, 1, 2, random_state=1000)
+
+    def test_processes_tetra_kmax(self):
+        gmeans_test_template().processes(FCPS_SAMPLES.SAMPLE_TETRA, 2, 4, random_state=1000, k_max=3)
+
+    def test_processes_target(self):
+        gmeans_test_template().processes(FCPS_SAMPLES.SAMPLE_TARGET, 1, 2, random_state=1000)
+
 
     def test_incorrect_data(self):
         self.assertRaises(ValueError, gmeans, [], 1, False, tolerance=0.05, repeat=3)
@@ -149,6 +182,9 @@ class gmeans_unit_test(unittest.TestCase):
     def test_incorrect_kmax_negative(self):
         self.assertRaises(ValueError, gmeans, [[0], [1], [2]], 3, False, tolerance=1, repeat=0, kmax=-2)
 
+    def test_incorrect_processes(self):
+        self.assertRaises(ValueError, gmeans, [[0], [1], [2]], 1, False, processes=0)
+
     def test_kmax_less_than_kinit(self):
         self.assertRaises(ValueError, gmeans, [[0], [1], [2]], 3, False, tolerance=1, repeat=0, kmax=2)
 
@@ -9,9 +9,11 @@
 """
 
 
+import os
 import unittest
 import math
 import numpy
+import tempfile
 
 # Generate images without having a window appear.
 import matplotlib
@@ -19,7 +21,7 @@ matplotlib.use('Agg')
 
 from pyclustering.cluster.tests.kmeans_templates import KmeansTestTemplates
 
-from pyclustering.cluster.kmeans import kmeans
+from pyclustering.cluster.kmeans import kmeans, kmeans_observer, minibatch_kmeans, kmeans_algorithm_type
 
 from pyclustering.samples.definitions import SIMPLE_SAMPLES
 
@@ -133,10 +135,23 @@ class KmeansUnitTest(unittest.TestCase):
     def testClusterAllocationSampleSimple3(self):
         KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], [10, 10, 10, 30], False)
 
+    def testClusterAllocationSampleSimple3LargeOffset(self):
+        KmeansTestTemplates.templateLengthProcessDataWithOffset(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], [10, 10, 10, 30], 1e8)
+
     def testClusterAllocationSampleSimple3UserDefinedInfitityProcessing(self):
         metric = distance_metric(type_metric.USER_DEFINED, func=lambda p1, p2: p1[0] + p2[0] + 2)
         KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], [60], False, metric=metric)
 
+    def testClusterAllocationSampleSimple3ChunkSize1(self):
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], [10, 10, 10, 30], False, chunk_size=1)
+
+    def testClusterAllocationSampleSimple3ChunkSize7(self):
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], [10, 10, 10, 30], False, chunk_size=7)
+
+    def testClusterAllocationSampleSimple3ManhattanChunkSize7(self):
+        metric = distance_metric(type_metric.MANHATTAN)
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], [10, 10, 10, 30], False, metric=metric, chunk_size=7)
+
     def testClusterOneAllocationSampleSimple3(self):
         KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1]], [60], False)
 
@@ -329,6 +344,55 @@ class KmeansUnitTest(unittest.TestCase):
         KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, [[3.5, 4.8], [6.9, 7], [7.5, 0.5]], [10, 5, 8], False, itermax=10)
 
 
+    def testElkanClusterAllocationSampleSimple1(self):
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], False, algorithm=kmeans_algorithm_type.ELKAN)
+
+    def testElkanClusterAllocationSampleSimple1Euclidean(self):
+        metric = distance_metric(type_metric.EUCLIDEAN)
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], False, metric=metric, algorithm=kmeans_algorithm_type.ELKAN)
+
+    def testElkanClusterAllocationSampleSimple3(self):
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], [10, 10, 10, 30], False, algorithm=kmeans_algorithm_type.ELKAN)
+
+    def testElkanClusterAllocationSampleSimple3LargeOffset(self):
+        KmeansTestTemplates.templateLengthProcessDataWithOffset(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], [10, 10, 10, 30], 1e8, algorithm=kmeans_algorithm_type.ELKAN)
+
+    def testElkanWrongNumberOfCentersSimpleSample2(self):
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, [[3.5, 4.8], [6.9, 7], [7.5, 0.5], [7.3, 4.5], [3.1, 5.4]], None, False, algorithm=kmeans_algorithm_type.ELKAN)
+
+    def testElkanEquivalenceSampleSimple3(self):
+        KmeansTestTemplates.templateAlgorithmEquivalence(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], kmeans_algorithm_type.ELKAN, False)
+
+    def testElkanEquivalenceRandomData(self):
+        numpy.random.seed(1000)
+        data = numpy.random.rand(500, 3).tolist()
+        KmeansTestTemplates.templateAlgorithmEquivalence(data, data[:12], kmeans_algorithm_type.ELKAN, False)
+
+    def testHamerlyClusterAllocationSampleSimple1(self):
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], False, algorithm=kmeans_algorithm_type.HAMERLY)
+
+    def testHamerlyClusterAllocationSampleSimple1Euclidean(self):
+        metric = distance_metric(type_metric.EUCLIDEAN)
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], False, metric=metric, algorithm=kmeans_algorithm_type.HAMERLY)
+
+    def testHamerlyClusterAllocationSampleSimple3(self):
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], [10, 10, 10, 30], False, algorithm=kmeans_algorithm_type.HAMERLY)
+
+    def testHamerlyClusterAllocationSampleSimple3LargeOffset(self):
+        KmeansTestTemplates.templateLengthProcessDataWithOffset(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], [10, 10, 10, 30], 1e8, algorithm=kmeans_algorithm_type.HAMERLY)
+
+    def testHamerlyWrongNumberOfCentersSimpleSample2(self):
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, [[3.5, 4.8], [6.9, 7], [7.5, 0.5], [7.3, 4.5], [3.1, 5.4]], None, False, algorithm=kmeans_algorithm_type.HAMERLY)
+
+    def testHamerlyEquivalenceSampleSimple3(self):
+        KmeansTestTemplates.templateAlgorithmEquivalence(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], kmeans_algorithm_type.HAMERLY, False)
+
+    def testHamerlyEquivalenceRandomData(self):
+        numpy.random.seed(1000)
+        data = numpy.random.rand(500, 3).tolist()
+        KmeansTestTemplates.templateAlgorithmEquivalence(data, data[:12], kmeans_algorithm_type.HAMERLY, False)
+
+
     def testEncoderProcedureSampleSimple4(self):
         KmeansTestTemplates.templateEncoderProcedures(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, [[1.5, 0.0], [1.5, 2.0], [1.5, 4.0], [1.5, 6.0], [1.5, 8.0]], 5, False)
 
@@ -359,6 +423,28 @@ class KmeansUnitTest(unittest.TestCase):
         KmeansTestTemplates.templateAnimateClusteringResultNoFailure(SIMPLE_SAMPLES.SAMPLE_SIMPLE11, [[1.0, 0.6, 0.8], [4.1, 4.2, 4.3]], False)
 
 
+    def testProcessAsyncSampleSimple1(self):
+        KmeansTestTemplates.templateProcessAsync(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], 1, False)
+
+    def testProcessAsyncSeveralInstancesSampleSimple3(self):
+        KmeansTestTemplates.templateProcessAsync(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], 4, False)
+
+
+    def testRestartsSampleSimple3(self):
+        KmeansTestTemplates.templateRestarts(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], 5, False)
+
+    def testRestartsSampleSimple5(self):
+        KmeansTestTemplates.templateRestarts(SIMPLE_SAMPLES.SAMPLE_SIMPLE5, [[0.0, 1.0], [0.0, 0.0], [1.0, 1.0], [1.0, 0.0]], 3, False)
+
+    def testRestartsManhattanSampleSimple3(self):
+        metric = distance_metric(type_metric.MANHATTAN)
+        KmeansTestTemplates.templateRestarts(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], 4, False, metric=metric)
+
+    def testRestartsOneRestart(self):
+        kmeans_instance = kmeans([[0.0], [0.1], [5.0], [5.1]], [[0.0], [5.0]], ccore=False).process()
+        self.assertEqual([kmeans_instance.get_total_wce()], kmeans_instance.get_restarts_wce())
+
+
     def test_incorrect_data(self):
         self.assertRaises(ValueError, kmeans, [], [[1]])
 
@@ -370,3 +456,93 @@ class KmeansUnitTest(unittest.TestCase):
 
     def test_incorrect_itermax(self):
         self.assertRaises(ValueError, kmeans, [[0], [1], [2]], [[1]], itermax=-5)
+
+    def test_incorrect_chunk_size(self):
+        self.assertRaises(ValueError, kmeans, [[0], [1], [2]], [[1]], chunk_size=0)
+
+    def test_incorrect_n_init(self):
+        self.assertRaises(ValueError, kmeans, [[0], [1], [2]], [[1]], n_init=0)
+
+    def test_observer_with_restarts(self):
+        self.assertRaises(ValueError, kmeans, [[0], [1], [2]], [[1]], n_init=2, observer=kmeans_observer())
+
+    def test_incorrect_algorithm(self):
+        self.assertRaises(ValueError, kmeans, [[0], [1], [2]], [[1]], algorithm=5)
+
+    def test_incorrect_metric_for_algorithm(self):
+        metric = distance_metric(type_metric.MANHATTAN)
+        self.assertRaises(ValueError, kmeans, [[0], [1], [2]], [[1]], metric=metric, algorithm=kmeans_algorithm_type.ELKAN)
+        self.assertRaises(ValueError, kmeans, [[0], [1], [2]], [[1]], metric=metric, algorithm=kmeans_algorithm_type.HAMERLY)
+
+
+    def testMinibatchClusterAllocationSampleSimple1(self):
+        KmeansTestTemplates.templateMinibatchLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], 4)
+
+    def testMinibatchClusterAllocationSampleSimple1Manhattan(self):
+        metric = distance_metric(type_metric.MANHATTAN)
+        KmeansTestTemplates.templateMinibatchLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], 4, metric=metric)
+
+    def testMinibatchClusterAllocationSampleSimple3(self):
+        KmeansTestTemplates.templateMinibatchLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], [10, 10, 10, 30], 16)
+
+    def testMinibatchClusterAllocationSampleSimple4(self):
+        KmeansTestTemplates.templateMinibatchLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, [[1.5, 0.0], [1.5, 2.0], [1.5, 4.0], [1.5, 6.0], [1.5, 8.0]], [15, 15, 15, 15, 15], 20)
+
+    def testMinibatchItermax0(self):
+        KmeansTestTemplates.templateMinibatchLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [], 4, itermax=0)
+
+    def testMinibatchStreamSampleSimple3(self):
+        KmeansTestTemplates.templateMinibatchStreamProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], 32, 7)
+
+    def testMinibatchStreamObserveSampleSimple3(self):
+        observer = kmeans_observer()
+        KmeansTestTemplates.templateMinibatchStreamProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], 32, 50, observer=observer)
+
+    def testMinibatchMemoryMappedData(self):
+        sample = numpy.array(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3))
+        with tempfile.TemporaryDirectory() as directory:
+            data = numpy.memmap(os.path.join(directory, 'data.dat'), dtype=numpy.float64, mode='w+', shape=sample.shape)
+            data[:] = sample[:]
+
+            instance = minibatch_kmeans(data, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], 16, random_state=1000).process()
+            self.assertEqual([10, 10, 10, 30], sorted([len(cluster) for cluster in instance.get_clusters()]))
+            del data
+
+    def testMinibatchLargeOffset(self):
+        sample = numpy.array(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)) + 1e8
+        initial_centers = numpy.array([[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]]) + 1e8
+
+        instance = minibatch_kmeans(sample, initial_centers, 16, random_state=1000).process()
+        self.assertEqual([10, 10, 10, 30], sorted([len(cluster) for cluster in instance.get_clusters()]))
+
+    def testMinibatchTupleData(self):
+        sample = tuple(tuple(point) for point in read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3))
+
+        instance = minibatch_kmeans(sample, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], 16, random_state=1000).process()
+        self.assertEqual([10, 10, 10, 30], sorted([len(cluster) for cluster in instance.get_clusters()]))
+
+    def testMinibatchIteratorIsStream(self):
+        sample = numpy.array(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3))
+
+        instance = minibatch_kmeans(iter([sample]), [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], 16, random_state=1000).process()
+        self.assertEqual([], instance.get_clusters())
+        self.assertEqual(4, len(instance.get_centers()))
+
+    def testMinibatchPredictBeforeProcess(self):
+        instance = minibatch_kmeans([[0], [1], [2]], [[1]])
+        self.assertEqual([], instance.predict([[1]]))
+
+    def test_minibatch_incorrect_data(self):
+        self.assertRaises(ValueError, minibatch_kmeans, [], [[1]])
+
+    def test_minibatch_incorrect_centers(self):
+        self.assertRaises(ValueError, minibatch_kmeans, [[0], [1], [2]], [])
+
+    def test_minibatch_incorrect_batch_size(self):
+        self.assertRaises(ValueError, minibatch_kmeans, [[0], [1], [2]], [[1]], 0)
+
+    def test_minibatch_incorrect_tolerance(self):
+        self.assertRaises(ValueError, minibatch_kmeans, [[0], [1], [2]], [[1]], 2, -1.0)
+
+    def test_minibatch_incorrect_itermax(self):
+        self.assertRaises(ValueError, minibatch_kmeans, [[0], [1], [2]], [[1]], itermax=-5)
@@ -188,6 +188,47 @@ class KmediansUnitTest(unittest.TestCase):
         KmediansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, [[3.5, 4.8], [6.9, 7], [7.5, 0.5]], [10, 5, 8], False, itermax=10)
 
 
+    def testChunkSizeSimple3(self):
+        KmediansTestTemplates.templateChunkSize(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], [1, 7, 60, 1000])
+
+    def testChunkSizeSimple3Manhattan(self):
+        metric = distance_metric(type_metric.MANHATTAN)
+        KmediansTestTemplates.templateChunkSize(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], [1, 7, 60, 1000], metric=metric)
+
+    def testChunkSizeSimple3UserMetric(self):
+        metric = distance_metric(type_metric.USER_DEFINED, func=distance_metric(type_metric.EUCLIDEAN))
+        KmediansTestTemplates.templateChunkSize(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], [1, 16], metric=metric)
+
+
+    def testWeightedMedian(self):
+        data = [[1.0, 4.0], [2.0, 3.0], [3.0, 2.0], [10.0, 1.0]]
+        kmedians_instance = kmedians(data, [[0.0, 0.0]], ccore=False, weights=[1, 1, 1, 5]).process()
+        self.assertEqual([[10.0, 1.0]], kmedians_instance.get_medians())
+
+    def testWeightedMedianHalfWeight(self):
+        data = [[1.0], [2.0], [3.0], [10.0]]
+        kmedians_instance = kmedians(data, [[0.0]], ccore=False, weights=[1, 2, 1, 2]).process()
+        self.assertEqual([[2.5]], kmedians_instance.get_medians())
+
+    def testEqualWeightsSimple3(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+        initial_medians = [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]]
+
+        expected = kmedians(sample, initial_medians, ccore=False).process()
+        actual = kmedians(sample, initial_medians, ccore=False, weights=[1.0] * len(sample)).process()
+
+        self.assertEqual(expected.get_clusters(), actual.get_clusters())
+        self.assertEqual(expected.get_medians(), actual.get_medians())
+        self.assertAlmostEqual(expected.get_total_wce(), actual.get_total_wce())
+
+    def testWeightsAsDuplicatesSimple3(self):
+        KmediansTestTemplates.templateWeightsAsDuplicates(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]])
+
+    def testWeightsAsDuplicatesSimple3Manhattan(self):
+        metric = distance_metric(type_metric.MANHATTAN)
+        KmediansTestTemplates.templateWeightsAsDuplicates(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], metric=metric)
+
+
     def test_incorrect_data(self):
         self.assertRaises(ValueError, kmedians, [], [[1]])
 
@@ -199,3 +240,10 @@ class KmediansUnitTest(unittest.TestCase):
 
     def test_incorrect_itermax(self):
         self.assertRaises(ValueError, kmedians, [[0], [1], [2]], [[1]], itermax=-5)
+
+    def test_incorrect_chunk_size(self):
+        self.assertRaises(ValueError, kmedians, [[0], [1], [2]], [[1]], chunk_size=0)
+
+    def test_incorrect_weights(self):
+        self.assertRaises(ValueError, kmedians, [[0], [1], [2]], [[1]], weights=[1, 1])
+        self.assertRaises(ValueError, kmedians, [[0], [1], [2]], [[1]], weights=[1, -1, 1])
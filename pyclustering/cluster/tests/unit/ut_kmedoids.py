@@ -15,7 +15,7 @@ import unittest
 import matplotlib
 matplotlib.use('Agg')
 
-from pyclustering.cluster.kmedoids import kmedoids, build, pam
+from pyclustering.cluster.kmedoids import kmedoids, kmedoids_swap_type, build, pam
 from pyclustering.cluster.tests.kmedoids_templates import kmedoids_test_template
 
 from pyclustering.samples.definitions import SIMPLE_SAMPLES, SIMPLE_ANSWERS
@@ -268,6 +268,38 @@ class KmedoidsUnitTest(unittest.TestCase):
         kmedoids_test_template.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, [3, 12, 20], [10, 5, 8], False, itermax=10)
 
 
+    def testSwapStrategiesSimple01(self):
+        kmedoids_test_template.templateSwapStrategies(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [1, 2, 3, 4], False)
+
+    def testSwapStrategiesSimple03(self):
+        kmedoids_test_template.templateSwapStrategies(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [4, 7, 12, 20], False)
+
+    def testSwapStrategiesSimple03DistanceMatrix(self):
+        kmedoids_test_template.templateSwapStrategies(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [4, 7, 12, 20], False, data_type='distance_matrix')
+
+    def testSwapStrategiesSimple03Manhattan(self):
+        kmedoids_test_template.templateSwapStrategies(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [4, 7, 12, 20], False, metric=distance_metric(type_metric.MANHATTAN))
+
+    def testSwapStrategiesSimple04UserDefined(self):
+        metric = distance_metric(type_metric.USER_DEFINED, func=distance_metric(type_metric.EUCLIDEAN))
+        kmedoids_test_template.templateSwapStrategies(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, [2, 7, 15, 22, 30], False, metric=metric)
+
+    def testSwapStrategiesOneCluster(self):
+        kmedoids_test_template.templateSwapStrategies(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, [0], False)
+
+    def testClusterAllocationFasterPamSimple04(self):
+        kmedoids_test_template.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, [2, 7, 15, 22, 30], [15, 15, 15, 15, 15], False, swap=kmedoids_swap_type.FASTERPAM)
+
+    def testClusterAllocationFasterPamSimple04DistanceMatrix(self):
+        kmedoids_test_template.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, [2, 7, 15, 22, 30], [15, 15, 15, 15, 15], False, swap=kmedoids_swap_type.FASTERPAM, data_type='distance_matrix')
+
+    def testSwapDoesNotIncreaseDeviation(self):
+        for swap in kmedoids_swap_type:
+            kmedoids_instance = kmedoids([[1], [2], [3], [10], [11], [12]], [0, 1], ccore=False, swap=swap).process()
+            self.assertEqual([1, 4], sorted(kmedoids_instance.get_medoids()))
+            self.assertAlmostEqual(4.0, kmedoids_instance.get_total_deviation())
+
+
     def testSimple01AnswerByCore(self):
         kmedoids_test_template.clustering_with_answer(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, SIMPLE_ANSWERS.ANSWER_SIMPLE1, False, random_state=1000)
 
@@ -359,6 +391,9 @@ class KmedoidsUnitTest(unittest.TestCase):
     def test_incorrect_itermax(self):
         self.assertRaises(ValueError, kmedoids, [[0], [1], [2]], [1], itermax=-5)
 
+    def test_incorrect_swap(self):
+        self.assertRaises(ValueError, kmedoids, [[0], [1], [2]], [1], swap=5)
+
 
     def test_pam_alias(self):
         self.assertRaises(ValueError, pam, [], [1])
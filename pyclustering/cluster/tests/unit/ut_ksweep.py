@@ -0,0 +1,84 @@
+"""!
+
+@brief Unit-tests for sweep over amount of clusters.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2020
+@copyright BSD-3-Clause
+
+"""
+
+
+import unittest
+
+import matplotlib
+matplotlib.use('Agg')
+
+from pyclustering.cluster.kmeans import kmeans
+from pyclustering.cluster.kmedians import kmedians
+from pyclustering.cluster.kmedoids import kmedoids
+from pyclustering.cluster.ksweep import ksweep
+from pyclustering.cluster.tests.ksweep_templates import ksweep_test_template
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES
+
+
+class ksweep_unit_tests(unittest.TestCase):
+    def test_process_kmeans_simple03(self):
+        ksweep_test_template.process(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, range(1, 8), kmeans, False)
+
+    def test_process_kmedians_simple03(self):
+        ksweep_test_template.process(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, range(1, 8), kmedians, False)
+
+    def test_process_kmedoids_simple03(self):
+        ksweep_test_template.process(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, range(1, 8), kmedoids, False)
+
+    def test_process_kstep_simple03(self):
+        ksweep_test_template.process(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, range(1, 10, 3), kmeans, False)
+
+
+    def test_warm_start_kmeans_simple03(self):
+        ksweep_test_template.warm_start(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, range(1, 8), kmeans, False)
+
+    def test_warm_start_kmeans_kstep_simple03(self):
+        ksweep_test_template.warm_start(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, range(2, 11, 4), kmeans, False)
+
+    def test_warm_start_kmedians_simple04(self):
+        ksweep_test_template.warm_start(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, range(2, 7), kmedians, False)
+
+    def test_warm_start_kmedoids_simple04(self):
+        ksweep_test_template.warm_start(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, range(2, 7), kmedoids, False)
+
+    def test_warm_start_one_dimensional_simple07(self):
+        ksweep_test_template.warm_start(SIMPLE_SAMPLES.SAMPLE_SIMPLE7, range(1, 5), kmeans, False)
+
+    def test_warm_start_workers_simple03(self):
+        ksweep_test_template.warm_start(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, range(1, 8), kmeans, False, workers=3)
+
+
+    def test_workers_kmeans_simple03(self):
+        ksweep_test_template.workers(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, range(1, 8), kmeans, False, 4)
+
+    def test_workers_kmedoids_simple03(self):
+        ksweep_test_template.workers(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, range(2, 6), kmedoids, False, 2)
+
+
+    def test_evaluator_simple03(self):
+        ksweep_test_template.evaluator(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, range(1, 8), kmeans, False)
+
+    def test_evaluator_warm_start_simple03(self):
+        ksweep_test_template.evaluator(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, range(1, 8), kmeans, False, warm_start=True)
+
+
+    def test_incorrect_data(self):
+        self.assertRaises(ValueError, ksweep, [], range(1, 3), kmeans)
+
+    def test_incorrect_kvalues(self):
+        self.assertRaises(ValueError, ksweep, [[0], [1], [2]], range(0, 3), kmeans)
+        self.assertRaises(ValueError, ksweep, [[0], [1], [2]], range(1, 5), kmeans)
+
+    def test_incorrect_algorithm(self):
+        self.assertRaises(TypeError, ksweep, [[0], [1], [2]], range(1, 3), list)
+
+    def test_incorrect_workers(self):
+        self.assertRaises(ValueError, ksweep, [[0], [1], [2]], range(1, 3), kmeans, workers=0)
@@ -16,7 +16,9 @@ import matplotlib
 matplotlib.use('Agg')
 
 from pyclustering.cluster.tests.optics_templates import OpticsTestTemplates
-from pyclustering.cluster.optics import optics, ordering_analyser, ordering_visualizer
+from pyclustering.cluster.optics import optics, ordering_analyser, ordering_visualizer, optics_descriptor, optics_order_seed
+
+from pyclustering.container.neighborhood import neighborhood_index
 
 from pyclustering.utils import read_sample
 
@@ -155,6 +157,71 @@ class OpticsUnitTest(unittest.TestCase):
         assert 0 == len(borders)
 
 
+    def testClusteringNeighborhoodIndexSampleSimple3(self):
+        OpticsTestTemplates.templateClusteringResultsNeighborhoodIndex(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 0.7, 0.7, 3, None, [10, 10, 10, 30])
+        OpticsTestTemplates.templateClusteringResultsNeighborhoodIndex(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 2.0, 0.7, 3, None, [10, 10, 10, 30])
+
+    def testClusteringNeighborhoodIndexLsunAmountClusters(self):
+        OpticsTestTemplates.templateClusteringResultsNeighborhoodIndex(FCPS_SAMPLES.SAMPLE_LSUN, 1.0, 1.0, 3, 3, [99, 100, 202])
+
+    def testOrderingAnalyserNeighborhoodIndex(self):
+        for minpts in [2, 3, 5]:
+            OpticsTestTemplates.templateOrderingAnalyserNeighborhoodIndex(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 0.7, minpts)
+
+    def test_incorrect_eps_neighborhood_index(self):
+        self.assertRaises(ValueError, optics, neighborhood_index([[0], [1], [2]], 0.5), 1.0, 1)
+
+
+    def testOrderSeedExtractionOrder(self):
+        objects = [optics_descriptor(i, reachability_distance=distance) for i, distance in enumerate([3.0, 1.0, 2.0, 1.0, 0.5])]
+
+        order_seed = optics_order_seed()
+        for optics_object in objects:
+            order_seed.push(optics_object)
+
+        self.assertEqual(len(objects), len(order_seed))
+        self.assertEqual([4, 1, 3, 2, 0], [order_seed.pop().index_object for _ in range(len(objects))])
+        self.assertEqual(0, len(order_seed))
+
+    def testOrderSeedDecrease(self):
+        objects = [optics_descriptor(i, reachability_distance=distance) for i, distance in enumerate([3.0, 1.0, 2.0, 4.0])]
+
+        order_seed = optics_order_seed()
+        for optics_object in objects:
+            order_seed.push(optics_object)
+
+        objects[3].reachability_distance = 1.0
+        order_seed.decrease(objects[3])
+
+        objects[0].reachability_distance = 0.5
+        order_seed.decrease(objects[0])
+
+        self.assertEqual(len(objects), len(order_seed))
+        self.assertEqual([0, 1, 3, 2], [order_seed.pop().index_object for _ in range(len(objects))])
+        self.assertEqual(0, len(order_seed))
+
+
+    def testExtractClustersSampleSimple3(self):
+        OpticsTestTemplates.templateExtractClusters(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 1.0, 3, False)
+
+    def testExtractClustersLsun(self):
+        OpticsTestTemplates.templateExtractClusters(FCPS_SAMPLES.SAMPLE_LSUN, 0.5, 5, False)
+
+    def testExtractClustersGreaterRadius(self):
+        optics_instance = optics(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3), 0.5, 3, ccore=False).process()
+        self.assertRaises(ValueError, optics_instance.extract_clusters, 1.0)
+        self.assertRaises(ValueError, optics_instance.extract_cluster_amount, 1.0)
+
+    def testExtractClusterAmountOrderingDiagram(self):
+        analyser = ordering_analyser([0.5, 3.0, 2.0, 2.5, 1.0, 4.0, 4.0, 1.5, 3.5, 0.5])
+
+        self.assertEqual((5, [3, 5, 8]), analyser.extract_cluster_amount(0.4))
+        self.assertEqual((5, [1, 3, 5, 8]), analyser.extract_cluster_amount(1.0))
+        self.assertEqual((5, [1, 3, 5, 8]), analyser.extract_cluster_amount(2.2))
+        self.assertEqual((4, [1, 5, 8]), analyser.extract_cluster_amount(3.0))
+        self.assertEqual((2, [5]), analyser.extract_cluster_amount(3.8))
+
+
     def test_incorrect_data(self):
         self.assertRaises(ValueError, optics, [], 0.1, 1)
 
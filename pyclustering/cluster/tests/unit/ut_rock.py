@@ -15,10 +15,10 @@ import unittest
 import matplotlib
 matplotlib.use('Agg')
 
-from pyclustering.cluster.rock import rock
+from pyclustering.cluster.rock import rock, rock_link_type
 from pyclustering.cluster.tests.rock_templates import RockTestTemplates
 
-from pyclustering.samples.definitions import SIMPLE_SAMPLES
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
 
 
 class RockUnitTest(unittest.TestCase):  
@@ -56,6 +56,36 @@ class RockUnitTest(unittest.TestCase):
         RockTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, 1, 4, 0.5, [15, 15, 15, 15, 15], False)
 
 
+    def testClusterAllocationSampleLsun(self):
+        RockTestTemplates.templateLengthProcessData(FCPS_SAMPLES.SAMPLE_LSUN, 0.5, 3, 0.5, [100, 101, 202], False)
+
+    def testClusterAllocationRandomBlobs(self):
+        RockTestTemplates.templateClusterAllocationRandomBlobs(3, 1000, 0.1, False)
+
+
+    def testCommonNeighborsSampleSimple3(self):
+        RockTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 1, 4, 0.5, [10, 10, 10, 30], False, link_type=rock_link_type.COMMON_NEIGHBORS)
+
+    def testCommonNeighborsSampleSimple4(self):
+        RockTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, 1, 5, 0.5, [15, 15, 15, 15, 15], False, link_type=rock_link_type.COMMON_NEIGHBORS)
+
+    def testCommonNeighborsSampleLsun(self):
+        RockTestTemplates.templateLengthProcessData(FCPS_SAMPLES.SAMPLE_LSUN, 0.5, 3, 0.5, [100, 101, 202], False, link_type=rock_link_type.COMMON_NEIGHBORS)
+
+    def testCommonNeighborsRandomBlobs(self):
+        RockTestTemplates.templateClusterAllocationRandomBlobs(3, 1000, 0.1, False, link_type=rock_link_type.COMMON_NEIGHBORS)
+
+
+    def testDendrogramCutSampleSimple3(self):
+        RockTestTemplates.templateDendrogramCut(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 1, 0.5, [1, 2, 4, 10, 60])
+
+    def testDendrogramCutSampleLsun(self):
+        RockTestTemplates.templateDendrogramCut(FCPS_SAMPLES.SAMPLE_LSUN, 0.5, 0.5, [1, 3, 7, 50])
+
+    def testDendrogramCutCommonNeighbors(self):
+        RockTestTemplates.templateDendrogramCut(FCPS_SAMPLES.SAMPLE_LSUN, 0.5, 0.5, [1, 3, 7, 50], link_type=rock_link_type.COMMON_NEIGHBORS)
+
+
     def test_incorrect_data(self):
         self.assertRaises(ValueError, rock, [], 0.1, 2)
 
@@ -68,3 +98,6 @@ class RockUnitTest(unittest.TestCase):
     def test_incorrect_amount_clusters(self):
         self.assertRaises(ValueError, rock, [[0], [1], [2]], 0.5, 1, -0.1)
         self.assertRaises(ValueError, rock, [[0], [1], [2]], 0.5, 1, 1.1)
+
+    def test_incorrect_link_type(self):
+        self.assertRaises(ValueError, rock, [[0], [1], [2]], 0.5, 1, link_type=5)
@@ -15,11 +15,15 @@ import unittest
 import matplotlib
 matplotlib.use('Agg')
 
-from pyclustering.cluster.silhouette import silhouette, silhouette_ksearch_type
-from pyclustering.cluster.tests.silhouette_templates import silhouette_test_template
+from pyclustering.cluster.silhouette import silhouette, silhouette_ksearch, silhouette_ksearch_type
+from pyclustering.cluster.tests.silhouette_templates import silhouette_test_template, manhattan_distance
 
+from pyclustering.samples import answer_reader
 from pyclustering.samples.definitions import SIMPLE_SAMPLES, SIMPLE_ANSWERS
 
+from pyclustering.utils import read_sample
+from pyclustering.utils.metric import distance_metric, type_metric
+
 
 class silhouette_unit_tests(unittest.TestCase):
     def test_correct_score_simple01(self):
@@ -75,6 +79,26 @@ class silhouette_unit_tests(unittest.TestCase):
         silhouette_test_template.correct_ksearch(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, SIMPLE_ANSWERS.ANSWER_SIMPLE3, 2, 10,
                                                  silhouette_ksearch_type.KMEANS, False)
 
+    def test_correct_ksearch_simple03_warm_start(self):
+        silhouette_test_template.correct_ksearch(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, SIMPLE_ANSWERS.ANSWER_SIMPLE3, 2, 10,
+                                                 silhouette_ksearch_type.KMEANS, False, warm_start=True)
+
+    def test_correct_ksearch_simple03_kmedoids_warm_start(self):
+        silhouette_test_template.correct_ksearch(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, SIMPLE_ANSWERS.ANSWER_SIMPLE3, 2, 10,
+                                                 silhouette_ksearch_type.KMEDOIDS, False, warm_start=True)
+
+    def test_correct_ksearch_simple03_workers(self):
+        silhouette_test_template.correct_ksearch(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, SIMPLE_ANSWERS.ANSWER_SIMPLE3, 2, 10,
+                                                 silhouette_ksearch_type.KMEANS, False, workers=3)
+
+    def test_random_state_workers_kmeans(self):
+        silhouette_test_template.random_state(2, 10, silhouette_ksearch_type.KMEANS, 1000, False, workers=4)
+
+    def test_ksearch_times(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+        times = silhouette_ksearch(sample, 2, 10, ccore=False, workers=2).process().get_times()
+        self.assertEqual(list(range(2, 10)), sorted(times.keys()))
+
     def test_correct_ksearch_simple03_kmedoids(self):
         silhouette_test_template.correct_ksearch(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, SIMPLE_ANSWERS.ANSWER_SIMPLE3, 2, 10,
                                                  silhouette_ksearch_type.KMEDOIDS, False)
@@ -199,8 +223,66 @@ class silhouette_unit_tests(unittest.TestCase):
         silhouette_test_template.random_state(2, 10, silhouette_ksearch_type.KMEDIANS, 1024, False)
 
 
+    def test_parallel_scores_simple03(self):
+        silhouette_test_template.correct_parallel_scores(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, SIMPLE_ANSWERS.ANSWER_SIMPLE3, 2, False)
+
+    def test_parallel_scores_simple04(self):
+        silhouette_test_template.correct_parallel_scores(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, SIMPLE_ANSWERS.ANSWER_SIMPLE4, 3, False)
+
+    def test_parallel_scores_manhattan(self):
+        silhouette_test_template.correct_parallel_scores(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, SIMPLE_ANSWERS.ANSWER_SIMPLE3, 2, False,
+                                                         metric=distance_metric(type_metric.MANHATTAN))
+
+    def test_parallel_scores_user_defined(self):
+        metric = distance_metric(type_metric.USER_DEFINED, func=manhattan_distance)
+        silhouette_test_template.correct_parallel_scores(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, SIMPLE_ANSWERS.ANSWER_SIMPLE3, 2, False,
+                                                         metric=metric)
+
+    def test_parallel_scores_distance_matrix(self):
+        silhouette_test_template.correct_parallel_scores(SIMPLE_SAMPLES.SAMPLE_SIMPLE5, SIMPLE_ANSWERS.ANSWER_SIMPLE5, 2, False,
+                                                         data_type='distance_matrix')
+
+
+    def test_sampled_scores_simple03(self):
+        silhouette_test_template.correct_sampled_scores(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, SIMPLE_ANSWERS.ANSWER_SIMPLE3, 20, 1000, False)
+
+    def test_sampled_scores_simple04(self):
+        silhouette_test_template.correct_sampled_scores(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, SIMPLE_ANSWERS.ANSWER_SIMPLE4, 30, 5, False)
+
+    def test_sampled_scores_single_object(self):
+        silhouette_test_template.correct_sampled_scores(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, SIMPLE_ANSWERS.ANSWER_SIMPLE3, 1, 10, False)
+
+    def test_sampled_scores_whole_data(self):
+        silhouette_test_template.correct_sampled_scores(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, SIMPLE_ANSWERS.ANSWER_SIMPLE1, 100, 1, False)
+
+
+    def test_mean_score_exact(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+        clusters = answer_reader(SIMPLE_ANSWERS.ANSWER_SIMPLE3).get_clusters()
+
+        silhouette_instance = silhouette(sample, clusters, ccore=False).process()
+        scores = silhouette_instance.get_score()
+
+        self.assertAlmostEqual(sum(scores) / len(scores), silhouette_instance.get_mean_score())
+        self.assertEqual((silhouette_instance.get_mean_score(), silhouette_instance.get_mean_score()),
+                         silhouette_instance.get_confidence_interval())
+
+
     def test_incorrect_data(self):
         self.assertRaises(ValueError, silhouette, [], [[1, 2], [3, 4]])
 
     def test_incorrect_clusters(self):
         self.assertRaises(ValueError, silhouette, [[1], [2], [3], [4]], [])
+
+    def test_incorrect_processes(self):
+        self.assertRaises(ValueError, silhouette, [[1], [2], [3], [4]], [[0, 1], [2, 3]], processes=0)
+
+    def test_incorrect_sample_size(self):
+        self.assertRaises(ValueError, silhouette, [[1], [2], [3], [4]], [[0, 1], [2, 3]], sample_size=0)
+
+    def test_incorrect_confidence(self):
+        self.assertRaises(ValueError, silhouette, [[1], [2], [3], [4]], [[0, 1], [2, 3]], confidence=0.0)
+        self.assertRaises(ValueError, silhouette, [[1], [2], [3], [4]], [[0, 1], [2, 3]], confidence=1.0)
+
+    def test_incorrect_ksearch_workers(self):
+        self.assertRaises(ValueError, silhouette_ksearch, [[1], [2], [3], [4]], 2, 3, workers=0)
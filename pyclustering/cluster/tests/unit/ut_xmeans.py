@@ -145,6 +145,12 @@ class XmeansUnitTest(unittest.TestCase):
     def testBicClusterAllocationSampleSimple3(self):
         XmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], [10, 10, 10, 30], splitting_type.BAYESIAN_INFORMATION_CRITERION, 20, False)
 
+    def testBicClusterAllocationSampleSimple3LargeOffset(self):
+        XmeansTestTemplates.templateLengthProcessDataWithOffset(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [5.9, 5.9]], [10, 10, 10, 30], splitting_type.BAYESIAN_INFORMATION_CRITERION, 20, 1e8, random_state=1000)
+
+    def testBicClusterAllocationSampleTetraLargeOffset(self):
+        XmeansTestTemplates.templateLengthProcessDataWithOffset(FCPS_SAMPLES.SAMPLE_TETRA, [[1.295428, 0.050829, -0.385217], [0.749291, -0.447840, 0.863555]], [100, 100, 100, 100], splitting_type.BAYESIAN_INFORMATION_CRITERION, 20, 1e8, random_state=1000)
+
     def testBicClusterAllocationSampleSimple3Repeat(self):
         XmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], [10, 10, 10, 30], splitting_type.BAYESIAN_INFORMATION_CRITERION, 20, False, repeat=5)
 
@@ -325,6 +331,23 @@ class XmeansUnitTest(unittest.TestCase):
         XmeansTestTemplates.random_state(False, 2, 10, 65536)
 
 
+    def test_processes_bic_simple3(self):
+        XmeansTestTemplates.processes(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, splitting_type.BAYESIAN_INFORMATION_CRITERION, 20, 1000, 2)
+
+    def test_processes_mndl_simple3(self):
+        XmeansTestTemplates.processes(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, splitting_type.MINIMUM_NOISELESS_DESCRIPTION_LENGTH, 20, 1000, 2)
+
+    def test_processes_bic_hepta(self):
+        XmeansTestTemplates.processes(FCPS_SAMPLES.SAMPLE_HEPTA, splitting_type.BAYESIAN_INFORMATION_CRITERION, 20, 1000, 3)
+
+    def test_processes_bic_manhattan_lsun(self):
+        metric = distance_metric(type_metric.MANHATTAN)
+        XmeansTestTemplates.processes(FCPS_SAMPLES.SAMPLE_LSUN, splitting_type.BAYESIAN_INFORMATION_CRITERION, 20, 1000, 2, metric=metric)
+
+    def test_processes_kmax_limit(self):
+        XmeansTestTemplates.processes(FCPS_SAMPLES.SAMPLE_TETRA, splitting_type.BAYESIAN_INFORMATION_CRITERION, 3, 1000, 4)
+
+
     def test_incorrect_data(self):
         self.assertRaises(ValueError, xmeans, [])
 
@@ -336,3 +359,6 @@ class XmeansUnitTest(unittest.TestCase):
 
     def test_incorrect_repeat(self):
         self.assertRaises(ValueError, xmeans, [[0], [1], [2]], repeat=0)
+
+    def test_incorrect_processes(self):
+        self.assertRaises(ValueError, xmeans, [[0], [1], [2]], processes=0)
@@ -20,6 +20,13 @@ from pyclustering.tests.assertion import assertion
 
 
 class XmeansTestTemplates:
+    @staticmethod
+    def templateLengthProcessDataWithOffset(path, start_centers, expected_cluster_length, type_splitting, kmax, offset, **kwargs):
+        sample = (numpy.array(read_sample(path)) + offset).tolist()
+        start_centers = (numpy.array(start_centers) + offset).tolist()
+
+        XmeansTestTemplates.templateLengthProcessData(sample, start_centers, expected_cluster_length, type_splitting, kmax, False, **kwargs)
+
     @staticmethod
     def templateLengthProcessData(input_sample, start_centers, expected_cluster_length, type_splitting, kmax, ccore, **kwargs):
         if isinstance(input_sample, str):
@@ -124,3 +131,16 @@ class XmeansTestTemplates:
         assertion.eq(xmeans_instance1.get_total_wce(), xmeans_instance2.get_total_wce())
         assertion.eq(xmeans_instance1.get_centers(), xmeans_instance2.get_centers())
         assertion.eq(xmeans_instance1.get_clusters(), xmeans_instance2.get_clusters())
+
+
+    @staticmethod
+    def processes(path_to_file, criterion, kmax, random_state, processes, **kwargs):
+        data = read_sample(path_to_file)
+
+        xmeans_instance1 = xmeans(data, None, kmax, 0.025, criterion, False, random_state=random_state, **kwargs).process()
+        xmeans_instance2 = xmeans(data, None, kmax, 0.025, criterion, False, random_state=random_state,
+                                  processes=processes, **kwargs).process()
+
+        assertion.eq(xmeans_instance1.get_total_wce(), xmeans_instance2.get_total_wce())
+        assertion.eq(xmeans_instance1.get_centers(), xmeans_instance2.get_centers())
+        assertion.eq(xmeans_instance1.get_clusters(), xmeans_instance2.get_clusters())
@@ -10,6 +10,7 @@
 """
 
 
+import concurrent.futures
 import copy
 import numpy
 
@@ -21,7 +22,7 @@ from pyclustering.cluster.kmeans import kmeans
 from pyclustering.cluster.center_initializer import kmeans_plusplus_initializer
 
 from pyclustering.core.metric_wrapper import metric_wrapper
-from pyclustering.core.wrapper import ccore_library
+from pyclustering.core.wrapper import ccore_library, ccore_async_processing
 
 import pyclustering.core.xmeans_wrapper as wrapper
 
@@ -60,14 +61,243 @@ class splitting_type(IntEnum):
     MINIMUM_NOISELESS_DESCRIPTION_LENGTH = 1
 
 
-class xmeans:
+class xmeans_split_search:
+    """!
+    @brief Split trial of X-Means algorithm: a parent cluster is split into two children by K-Means and the splitting
+            criterion decides whether the children represent the data better than the parent.
+    @details Points of the parent are selected from the input data by indexes, clusters of children are indexes of the
+              input data. The instance is independent from the algorithm and can be sent to another process.
+
+    """
+
+    def __init__(self, data, tolerance, criterion, repeat, random_state, metric, alpha, beta):
+        """!
+        @brief Constructor of split trial of X-Means algorithm.
+
+        @param[in] data (numpy.ndarray): Input data that is presented as two-dimensional array of points.
+        @param[in] tolerance (double): Stop condition for K-Means that splits the parent.
+        @param[in] criterion (splitting_type): Type of splitting criterion.
+        @param[in] repeat (uint): How many times K-Means should be run to split the parent.
+        @param[in] random_state (int): Seed for random state.
+        @param[in] metric (distance_metric): Metric that is used for distance calculation between two points.
+        @param[in] alpha (double): Parameter for alpha probabilistic bound (MNDL criterion).
+        @param[in] beta (double): Parameter for beta probabilistic bound (MNDL criterion).
+
+        """
+        self.__pointer_data = data
+        self.__tolerance = tolerance
+        self.__criterion = criterion
+        self.__repeat = repeat
+        self.__random_state = random_state
+        self.__metric = copy.copy(metric)
+        self.__alpha = alpha
+        self.__beta = beta
+
+        if self.__metric.get_type() != type_metric.USER_DEFINED:
+            self.__metric.enable_numpy_usage()
+
+
+    def process(self, cluster, center):
+        """!
+        @brief Splits the parent cluster into two children and checks whether the split is required.
+
+        @param[in] cluster (array_like): Indexes of points of the parent cluster.
+        @param[in] center (array_like): Center of the parent cluster.
+
+        @return (list) Centers of children if the split is required, otherwise `None`.
+
+        """
+        cluster = numpy.asarray(cluster, dtype=numpy.int64)
+        if len(cluster) < 2:
+            return None
+
+        local_data = self.__pointer_data[cluster]
+        local_clusters, local_centers = self.__search_optimal_parameters(local_data)
+        if len(local_clusters) < 2:
+            return None
+
+        child_points = [local_data[numpy.asarray(local_cluster, dtype=numpy.int64)] for local_cluster in local_clusters[:2]]
+
+        parent_errors = [self.__calculate_error(local_data, center)]
+        child_errors = [self.__calculate_error(points, local_center) for points, local_center in zip(child_points, local_centers)]
+
+        parent_sizes = [len(local_data)]
+        child_sizes = [len(points) for points in child_points]
+
+        if self.__criterion == splitting_type.BAYESIAN_INFORMATION_CRITERION:
+            dimension = self.__pointer_data.shape[1]
+            parent_scores = self.__bayesian_information_criterion(parent_sizes, parent_errors, dimension)
+            child_scores = self.__bayesian_information_criterion(child_sizes, child_errors, dimension)
+            split_require = parent_scores < child_scores
+
+        elif self.__criterion == splitting_type.MINIMUM_NOISELESS_DESCRIPTION_LENGTH:
+            # If its score for the split structure with two children is smaller than that for the parent structure,
+            # then representing the data samples with two clusters is more accurate in comparison to a single parent cluster.
+            parent_scores = self.__minimum_noiseless_description_length(parent_sizes, parent_errors)
+            child_scores = self.__minimum_noiseless_description_length(child_sizes, child_errors)
+            split_require = parent_scores > child_scores
+
+        else:
+            assert 0
+
+        if split_require:
+            return local_centers[:2]
+
+        return None
+
+
+    def __search_optimal_parameters(self, local_data):
+        """!
+        @brief Split data of the region into two cluster and tries to find global optimum by running k-means clustering
+                several times (defined by 'repeat' argument).
+
+        @param[in] local_data (numpy.ndarray): Points of a region that should be split into two clusters.
+
+        @return (tuple) List of allocated clusters and list of centers (clusters, centers).
+
+        """
+        optimal_wce, optimal_centers, optimal_clusters = float('+inf'), None, None
+
+        for _ in range(self.__repeat):
+            candidates = 5
+            if len(local_data) < candidates:
+                candidates = len(local_data)
+
+            local_centers = kmeans_plusplus_initializer(local_data, 2, candidates, random_state=self.__random_state).initialize()
+
+            kmeans_instance = kmeans(local_data, local_centers, tolerance=self.__tolerance, ccore=False, metric=self.__metric)
+            kmeans_instance.process()
+
+            local_wce = kmeans_instance.get_total_wce()
+            if local_wce < optimal_wce:
+                optimal_centers = kmeans_instance.get_centers()
+                optimal_clusters = kmeans_instance.get_clusters()
+                optimal_wce = local_wce
+
+        return optimal_clusters, optimal_centers
+
+
+    def __calculate_error(self, points, center):
+        """!
+        @brief Calculates sum of distances from points of a cluster to its center.
+
+        @param[in] points (numpy.ndarray): Points of the cluster.
+        @param[in] center (array_like): Center of the cluster.
+
+        @return (double) Sum of distances from points to the center.
+
+        """
+        center = numpy.asarray(center, dtype=numpy.float64)
+
+        if self.__metric.get_type() == type_metric.USER_DEFINED:
+            return float(sum(self.__metric(point, center) for point in points))
+
+        return float(numpy.sum(self.__metric(points, center)))
+
+
+    def __minimum_noiseless_description_length(self, sizes, errors):
+        """!
+        @brief Calculates splitting criterion for input clusters using minimum noiseless description length criterion.
+        
+        @param[in] sizes (list): Amount of points in each cluster.
+        @param[in] errors (list): Sum of distances from points to center of each cluster.
+        
+        @return (double) Returns splitting criterion in line with bayesian information criterion. 
+                Low value of splitting cretion means that current structure is much better.
+        
+        @see __bayesian_information_criterion(sizes, errors, dimension)
+        
+        """
+        
+        score = float('inf')
+        
+        W = 0.0
+        K = len(sizes)
+        N = 0.0
+
+        sigma_square = 0.0
+        
+        alpha = self.__alpha
+        alpha_square = alpha * alpha
+        beta = self.__beta
+
+        for Ni, Wi in zip(sizes, errors):
+            if Ni == 0:
+                return float('inf')
+
+            sigma_square += Wi
+            W += Wi / Ni
+            N += Ni
+        
+        if N - K > 0:
+            sigma_square /= (N - K)
+            sigma = sigma_square ** 0.5
+            
+            Kw = (1.0 - K / N) * sigma_square
+            Ksa = (2.0 * alpha * sigma / (N ** 0.5)) * (alpha_square * sigma_square / N + W - Kw / 2.0) ** 0.5
+            UQa = W - Kw + 2.0 * alpha_square * sigma_square / N + Ksa
+
+            score = sigma_square * K / N + UQa + sigma_square * beta * ((2.0 * K) ** 0.5) / N
+        
+        return score
+
+
+    @staticmethod
+    def __bayesian_information_criterion(sizes, errors, dimension):
+        """!
+        @brief Calculates splitting criterion for input clusters using bayesian information criterion.
+        
+        @param[in] sizes (list): Amount of points in each cluster.
+        @param[in] errors (list): Sum of distances from points to center of each cluster.
+        @param[in] dimension (uint): Dimension of input data.
+        
+        @return (double) Splitting criterion in line with bayesian information criterion.
+                High value of splitting criterion means that current structure is much better.
+                
+        @see __minimum_noiseless_description_length(sizes, errors)
+        
+        """
+
+        scores = [float('inf')] * len(sizes)     # splitting criterion
+
+        # estimation of the noise variance in the data set
+        K = len(sizes)
+        N = float(sum(sizes))
+        sigma_sqrt = sum(errors)
+
+        if N - K > 0:
+            sigma_sqrt /= (N - K)
+            p = (K - 1) + dimension * K + 1
+
+            # in case of the same points, sigma_sqrt can be zero (issue: #407)
+            sigma_multiplier = 0.0
+            if sigma_sqrt <= 0.0:
+                sigma_multiplier = float('-inf')
+            else:
+                sigma_multiplier = dimension * 0.5 * log(sigma_sqrt)
+            
+            # splitting criterion    
+            for index_cluster in range(0, len(sizes), 1):
+                n = sizes[index_cluster]
+
+                L = n * log(n) - n * log(N) - n * 0.5 * log(2.0 * numpy.pi) - n * sigma_multiplier - (n - K) * 0.5
+                
+                # BIC calculation
+                scores[index_cluster] = L - p * 0.5 * log(N)
+                
+        return sum(scores)
+
+
+
+class xmeans(ccore_async_processing):
     """!
     @brief Class represents clustering algorithm X-Means.
     @details X-means clustering method starts with the assumption of having a minimum number of clusters, 
              and then dynamically increases them. X-means uses specified splitting criterion to control 
              the process of splitting clusters. Method K-Means++ can be used for calculation of initial centers.
              
-             CCORE implementation of the algorithm uses thread pool to parallelize the clustering process.
+             CCORE implementation of the algorithm uses thread pool to parallelize the clustering process. Python
+             implementation might perform split trials of clusters in parallel processes (see argument `processes`).
     
     Here example how to perform cluster analysis using X-Means algorithm:
     @code
@@ -163,7 +393,8 @@ class xmeans:
         @param[in] tolerance (double): Stop condition for each iteration: if maximum value of change of centers of clusters is less than tolerance than algorithm will stop processing.
         @param[in] criterion (splitting_type): Type of splitting creation (by default `splitting_type.BAYESIAN_INFORMATION_CRITERION`).
         @param[in] ccore (bool): Defines if C++ pyclustering library should be used instead of Python implementation.
-        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: `repeat`, `random_state`, `metric`, `alpha`, `beta`).
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: `repeat`, `random_state`, `metric`, `alpha`, `beta`,
+                    `processes`).
 
         <b>Keyword Args:</b><br>
             - repeat (unit): How many times K-Means should be run to improve parameters (by default is `1`).
@@ -175,6 +406,9 @@ class xmeans:
                The parameter is used only in case of MNDL splitting criterion, in all other cases this value is ignored.
             - beta (double): Parameter distributed [0.0, 1.0] for beta probabilistic bound \f$Q\left(\beta\right)\f$.
                The parameter is used only in case of MNDL splitting criterion, in all other cases this value is ignored.
+            - processes (uint): Amount of processes that are used by Python implementation to perform split trials of
+               clusters (by default 1, split trials are performed in the current process). Results do not depend on
+               amount of processes. In case of user-defined metric its function should support pickling.
 
         """
         
@@ -195,6 +429,7 @@ class xmeans:
         self.__repeat = kwargs.get('repeat', 1)
         self.__alpha = kwargs.get('alpha', 0.9)
         self.__beta = kwargs.get('beta', 0.9)
+        self.__processes = kwargs.get('processes', 1)
 
         self.__ccore = ccore and self.__metric.get_type() != type_metric.USER_DEFINED
         if self.__ccore is True:
@@ -368,97 +603,26 @@ class xmeans:
         return self.__total_wce
 
 
-    def __search_optimial_parameters(self, local_data):
-        """!
-        @brief Split data of the region into two cluster and tries to find global optimum by running k-means clustering
-                several times (defined by 'repeat' argument).
-
-        @param[in] local_data (list): Points of a region that should be split into two clusters.
-
-        @return (tuple) List of allocated clusters, list of centers and total WCE (clusters, centers, wce).
-
-        """
-        optimal_wce, optimal_centers, optimal_clusters = float('+inf'), None, None
-
-        for _ in range(self.__repeat):
-            candidates = 5
-            if len(local_data) < candidates:
-                candidates = len(local_data)
-
-            local_centers = kmeans_plusplus_initializer(local_data, 2, candidates, random_state=self.__random_state).initialize()
-
-            kmeans_instance = kmeans(local_data, local_centers, tolerance=self.__tolerance, ccore=False, metric=self.__metric)
-            kmeans_instance.process()
-
-            local_wce = kmeans_instance.get_total_wce()
-            if local_wce < optimal_wce:
-                optimal_centers = kmeans_instance.get_centers()
-                optimal_clusters = kmeans_instance.get_clusters()
-                optimal_wce = local_wce
-
-        return optimal_clusters, optimal_centers, optimal_wce
-
-
-    def __improve_parameters(self, centers, available_indexes=None):
+    def __improve_parameters(self, centers):
         """!
-        @brief Performs k-means clustering in the specified region.
+        @brief Performs k-means clustering of the input data.
         
-        @param[in] centers (list): Cluster centers, if None then automatically generated two centers using center initialization method.
-        @param[in] available_indexes (list): Indexes that defines which points can be used for k-means clustering, if None then all points are used.
+        @param[in] centers (list): Initial cluster centers.
         
         @return (tuple) List of allocated clusters, list of centers and total WCE (clusters, centers, wce).
         
         """
 
-        if available_indexes and len(available_indexes) == 1:
-            index_center = available_indexes[0]
-            return [available_indexes], self.__pointer_data[index_center], 0.0
-
-        local_data = self.__pointer_data
-        if available_indexes:
-            local_data = [self.__pointer_data[i] for i in available_indexes]
-
-        local_centers = centers
-        if centers is None:
-            clusters, local_centers, local_wce = self.__search_optimial_parameters(local_data)
-        else:
-            kmeans_instance = kmeans(local_data, local_centers, tolerance=self.__tolerance, ccore=False, metric=self.__metric).process()
-
-            local_wce = kmeans_instance.get_total_wce()
-            local_centers = kmeans_instance.get_centers()
-            clusters = kmeans_instance.get_clusters()
-
-        if available_indexes:
-            clusters = self.__local_to_global_clusters(clusters, available_indexes)
-        
-        return clusters, local_centers, local_wce
-
-
-    def __local_to_global_clusters(self, local_clusters, available_indexes):
-        """!
-        @brief Converts clusters in local region define by 'available_indexes' to global clusters.
-
-        @param[in] local_clusters (list): Local clusters in specific region.
-        @param[in] available_indexes (list): Map between local and global point's indexes.
-
-        @return Global clusters.
-
-        """
-
-        clusters = []
-        for local_cluster in local_clusters:
-            current_cluster = []
-            for index_point in local_cluster:
-                current_cluster.append(available_indexes[index_point])
-
-            clusters.append(current_cluster)
-
-        return clusters
+        kmeans_instance = kmeans(self.__pointer_data, centers, tolerance=self.__tolerance, ccore=False, metric=self.__metric).process()
+        return kmeans_instance.get_clusters(), kmeans_instance.get_centers(), kmeans_instance.get_total_wce()
 
     
     def __improve_structure(self, clusters, centers):
         """!
         @brief Check for best structure: divides each cluster into two and checks for best results using splitting criterion.
+        @details Split trials of clusters are independent, they are performed in parallel processes if argument
+                  `processes` is greater than 1. Clusters are distributed between processes by chunks, therefore input
+                  data is sent to each process once.
         
         @param[in] clusters (list): Clusters that have been allocated (each cluster contains indexes of points from data).
         @param[in] centers (list): Centers of clusters.
@@ -467,172 +631,31 @@ class xmeans:
         
         """
 
-        allocated_centers = []
-        amount_free_centers = self.__kmax - len(centers)
-
-        for index_cluster in range(len(clusters)):
-            # solve k-means problem for children where data of parent are used.
-            (parent_child_clusters, parent_child_centers, _) = self.__improve_parameters(None, clusters[index_cluster])
-
-            # If it's possible to split current data
-            if len(parent_child_clusters) > 1:
-                # Calculate splitting criterion
-                parent_scores = self.__splitting_criterion([clusters[index_cluster]], [centers[index_cluster]])
-                child_scores = self.__splitting_criterion([parent_child_clusters[0], parent_child_clusters[1]], parent_child_centers)
-              
-                split_require = False
-                
-                # Reallocate number of centers (clusters) in line with scores
-                if self.__criterion == splitting_type.BAYESIAN_INFORMATION_CRITERION:
-                    if parent_scores < child_scores:
-                        split_require = True
-                    
-                elif self.__criterion == splitting_type.MINIMUM_NOISELESS_DESCRIPTION_LENGTH:
-                    # If its score for the split structure with two children is smaller than that for the parent structure, 
-                    # then representing the data samples with two clusters is more accurate in comparison to a single parent cluster.
-                    if parent_scores > child_scores:
-                        split_require = True
-                
-                if (split_require is True) and (amount_free_centers > 0):
-                    allocated_centers.append(parent_child_centers[0])
-                    allocated_centers.append(parent_child_centers[1])
-                    
-                    amount_free_centers -= 1
-                else:
-                    allocated_centers.append(centers[index_cluster])
-
-            else:
-                allocated_centers.append(centers[index_cluster])
-          
-        return allocated_centers
-     
-     
-    def __splitting_criterion(self, clusters, centers):
-        """!
-        @brief Calculates splitting criterion for input clusters.
-        
-        @param[in] clusters (list): Clusters for which splitting criterion should be calculated.
-        @param[in] centers (list): Centers of the clusters.
-        
-        @return (double) Returns splitting criterion. High value of splitting criterion means that current structure is
-                 much better.
-
-        @see __bayesian_information_criterion(clusters, centers)
-        @see __minimum_noiseless_description_length(clusters, centers)
-        
-        """
-        
-        if self.__criterion == splitting_type.BAYESIAN_INFORMATION_CRITERION:
-            return self.__bayesian_information_criterion(clusters, centers)
-        
-        elif self.__criterion == splitting_type.MINIMUM_NOISELESS_DESCRIPTION_LENGTH:
-            return self.__minimum_noiseless_description_length(clusters, centers)
+        split_search = xmeans_split_search(self.__pointer_data, self.__tolerance, self.__criterion, self.__repeat,
+                                           self.__random_state, self.__metric, self.__alpha, self.__beta)
 
+        if (self.__processes > 1) and (len(clusters) > 1):
+            processes = min(self.__processes, len(clusters))
+            chunk_size = -(-len(clusters) // processes)
+            with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as executor:
+                children = list(executor.map(split_search.process, clusters, centers, chunksize=chunk_size))
         else:
-            assert 0
-
-
-    def __minimum_noiseless_description_length(self, clusters, centers):
-        """!
-        @brief Calculates splitting criterion for input clusters using minimum noiseless description length criterion.
-        
-        @param[in] clusters (list): Clusters for which splitting criterion should be calculated.
-        @param[in] centers (list): Centers of the clusters.
-        
-        @return (double) Returns splitting criterion in line with bayesian information criterion. 
-                Low value of splitting cretion means that current structure is much better.
-        
-        @see __bayesian_information_criterion(clusters, centers)
-        
-        """
-        
-        score = float('inf')
-        
-        W = 0.0
-        K = len(clusters)
-        N = 0.0
-
-        sigma_square = 0.0
-        
-        alpha = self.__alpha
-        alpha_square = alpha * alpha
-        beta = self.__beta
+            children = [split_search.process(cluster, center) for cluster, center in zip(clusters, centers)]
 
-        for index_cluster in range(0, len(clusters), 1):
-            Ni = len(clusters[index_cluster])
-            if Ni == 0:
-                return float('inf')
-            
-            Wi = 0.0
-            for index_object in clusters[index_cluster]:
-                Wi += self.__metric(self.__pointer_data[index_object], centers[index_cluster])
-            
-            sigma_square += Wi
-            W += Wi / Ni
-            N += Ni
-        
-        if N - K > 0:
-            sigma_square /= (N - K)
-            sigma = sigma_square ** 0.5
-            
-            Kw = (1.0 - K / N) * sigma_square
-            Ksa = (2.0 * alpha * sigma / (N ** 0.5)) * (alpha_square * sigma_square / N + W - Kw / 2.0) ** 0.5
-            UQa = W - Kw + 2.0 * alpha_square * sigma_square / N + Ksa
-
-            score = sigma_square * K / N + UQa + sigma_square * beta * ((2.0 * K) ** 0.5) / N
-        
-        return score
-
-
-    def __bayesian_information_criterion(self, clusters, centers):
-        """!
-        @brief Calculates splitting criterion for input clusters using bayesian information criterion.
-        
-        @param[in] clusters (list): Clusters for which splitting criterion should be calculated.
-        @param[in] centers (list): Centers of the clusters.
-        
-        @return (double) Splitting criterion in line with bayesian information criterion.
-                High value of splitting criterion means that current structure is much better.
-                
-        @see __minimum_noiseless_description_length(clusters, centers)
-        
-        """
+        # Reallocate number of centers (clusters) in line with results of split trials
+        allocated_centers = []
+        amount_free_centers = self.__kmax - len(centers)
 
-        scores = [float('inf')] * len(clusters)     # splitting criterion
-        dimension = len(self.__pointer_data[0])
-          
-        # estimation of the noise variance in the data set
-        sigma_sqrt = 0.0
-        K = len(clusters)
-        N = 0.0
-          
-        for index_cluster in range(0, len(clusters), 1):
-            for index_object in clusters[index_cluster]:
-                sigma_sqrt += self.__metric(self.__pointer_data[index_object], centers[index_cluster])
+        for center, child_centers in zip(centers, children):
+            if (child_centers is not None) and (amount_free_centers > 0):
+                allocated_centers.append(child_centers[0])
+                allocated_centers.append(child_centers[1])
 
-            N += len(clusters[index_cluster])
-      
-        if N - K > 0:
-            sigma_sqrt /= (N - K)
-            p = (K - 1) + dimension * K + 1
-
-            # in case of the same points, sigma_sqrt can be zero (issue: #407)
-            sigma_multiplier = 0.0
-            if sigma_sqrt <= 0.0:
-                sigma_multiplier = float('-inf')
+                amount_free_centers -= 1
             else:
-                sigma_multiplier = dimension * 0.5 * log(sigma_sqrt)
-            
-            # splitting criterion    
-            for index_cluster in range(0, len(clusters), 1):
-                n = len(clusters[index_cluster])
+                allocated_centers.append(center)
 
-                L = n * log(n) - n * log(N) - n * 0.5 * log(2.0 * numpy.pi) - n * sigma_multiplier - (n - K) * 0.5
-                
-                # BIC calculation
-                scores[index_cluster] = L - p * 0.5 * log(N)
-                
-        return sum(scores)
+        return allocated_centers
 
 
     def __verify_arguments(self):
@@ -654,6 +677,10 @@ class xmeans:
             raise ValueError("Repeat (current value: '%d') should be greater than 0." %
                              self.__repeat)
 
+        if self.__processes <= 0:
+            raise ValueError("Amount of processes (current value: '%d') should be greater than 0." %
+                             self.__processes)
+
         if self.__alpha < 0.0 or self.__alpha > 1.0:
             raise ValueError("Parameter for the probabilistic bound Q(alpha) should in the following range [0, 1] "
                              "(current value: '%f')." % self.__alpha)
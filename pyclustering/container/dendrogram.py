@@ -0,0 +1,286 @@
+"""!
+
+@brief Data Structure: Dendrogram
+@details Dendrogram stores full merge history of hierarchical algorithms (agglomerative, ROCK, CURE) as a linkage
+          matrix, the history is built once and might be cut to obtain any amount of clusters without recalculation.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2020
+@copyright BSD-3-Clause
+
+"""
+
+
+import numpy
+
+
+class dendrogram:
+    """!
+    @brief Dendrogram that is represented by linkage matrix where each row describes one merge.
+    @details Each row of linkage matrix is [left, right, height, size], where `left` and `right` are identifiers of
+              merged clusters, `height` is a link between them and `size` is amount of points in the new cluster.
+              Identifiers that are less than amount of points are points themselves, the cluster that is created by
+              merge `i` has identifier `amount_points + i`. The format is the same as the format of linkage matrix of
+              `scipy.cluster.hierarchy`. The history might be incomplete (forest), for example, if an algorithm
+              cannot merge clusters that are not linked, in this case the smallest amount of clusters that can be
+              obtained is `amount_points - len(linkage)`.
+
+              Points are ordered once in line with the tree (left subtree first), therefore points of each cluster
+              of any cut are located one after another in this order (see `get_order()`). A cut is defined by amount
+              of the first merges that are applied, thus each cut takes O(n) and labels are obtained by vectorized
+              operations. Cut by height applies merges until the first merge whose height is greater than the
+              specified height, therefore it is consistent with cut by amount of clusters even if heights are not
+              monotonic.
+
+              Clusters of a cut are sorted by their smallest indexes of points, points of each cluster are in the
+              order of the tree.
+
+    Example where clusters are obtained for various amounts of clusters and the dendrogram is stored to file:
+    @code
+        from pyclustering.cluster.agglomerative import agglomerative, type_link
+        from pyclustering.container.dendrogram import dendrogram
+        from pyclustering.utils import read_sample
+        from pyclustering.samples.definitions import FCPS_SAMPLES
+
+        sample = read_sample(FCPS_SAMPLES.SAMPLE_LSUN)
+        tree = agglomerative(sample, 3, type_link.WARD_LINK, ccore=False).process().get_dendrogram()
+
+        for number_clusters in range(2, 51):
+            labels = tree.get_labels(number_clusters=number_clusters)
+
+        tree.save('lsun_ward.npz')
+        tree = dendrogram.load('lsun_ward.npz')
+        clusters = tree.get_clusters(height=10.0)
+    @endcode
+
+    """
+
+    def __init__(self, linkage, amount_points=None):
+        """!
+        @brief Creates dendrogram from linkage matrix.
+
+        @param[in] linkage (array_like): Linkage matrix where each row is [left, right, height, size].
+        @param[in] amount_points (uint): Amount of points (leaves), by default `len(linkage) + 1`.
+
+        """
+        self.__linkage = numpy.array(linkage, dtype=numpy.float64).reshape(-1, 4)
+        self.__size = int(amount_points) if amount_points is not None else len(self.__linkage) + 1
+
+        self.__verify_arguments()
+
+        amount_merges = len(self.__linkage)
+        children = self.__linkage[:, :2].astype(numpy.int64)
+
+        # index of merge where each cluster is merged, clusters that are not merged get amount of merges
+        self.__merge_indexes = numpy.full(self.__size + amount_merges, amount_merges, dtype=numpy.int64)
+        self.__merge_indexes[children[:, 0]] = numpy.arange(amount_merges)
+        self.__merge_indexes[children[:, 1]] = numpy.arange(amount_merges)
+
+        self.__heights = numpy.maximum.accumulate(self.__linkage[:, 2])
+
+        self.__cluster_sizes, self.__begins, self.__order = self.__create_order(children)
+
+
+    def __len__(self):
+        """!
+        @brief Returns amount of points (leaves) of the dendrogram.
+
+        """
+        return self.__size
+
+
+    def __getstate__(self):
+        """!
+        @brief Returns state for serialization, only linkage matrix and amount of points are stored.
+
+        """
+        return {'linkage': self.__linkage, 'amount_points': self.__size}
+
+
+    def __setstate__(self, state):
+        """!
+        @brief Restores dendrogram from serialized state.
+
+        """
+        self.__init__(state['linkage'], state['amount_points'])
+
+
+    def get_linkage(self):
+        """!
+        @brief Returns linkage matrix where each row is [left, right, height, size].
+
+        @return (numpy.ndarray) Linkage matrix.
+
+        """
+        return self.__linkage
+
+
+    def get_order(self):
+        """!
+        @brief Returns points in order of the tree, points of each cluster of any cut are located one after another.
+
+        @return (numpy.ndarray) Indexes of points.
+
+        """
+        return self.__order
+
+
+    def get_clusters(self, number_clusters=None, height=None):
+        """!
+        @brief Returns clusters that are obtained by cut of the dendrogram by amount of clusters or by height.
+
+        @param[in] number_clusters (uint): Amount of clusters that should be obtained, if the dendrogram is
+                    incomplete then the amount might be bigger.
+        @param[in] height (double): Maximum height of merges that are applied.
+
+        @return (list) List of clusters, each cluster contains indexes of objects in list of data.
+
+        """
+        begins, sizes = self.__cut(number_clusters, height)
+        return [self.__order[begin:begin + size].tolist() for begin, size in zip(begins.tolist(), sizes.tolist())]
+
+
+    def get_labels(self, number_clusters=None, height=None):
+        """!
+        @brief Returns labels of points that are obtained by cut of the dendrogram by amount of clusters or by height,
+                labels are indexes of clusters that are returned by `get_clusters()`.
+
+        @param[in] number_clusters (uint): Amount of clusters that should be obtained, if the dendrogram is
+                    incomplete then the amount might be bigger.
+        @param[in] height (double): Maximum height of merges that are applied.
+
+        @return (numpy.ndarray) Label of each point.
+
+        """
+        begins, sizes = self.__cut(number_clusters, height)
+
+        # clusters in order of their positions, each position gets index of its cluster
+        order_clusters = numpy.argsort(begins)
+
+        labels = numpy.empty(self.__size, dtype=numpy.int64)
+        labels[self.__order] = numpy.repeat(order_clusters, sizes[order_clusters])
+        return labels
+
+
+    def save(self, file):
+        """!
+        @brief Stores the dendrogram to numpy `.npz` file.
+
+        @param[in] file (string|file): File name or file object, extension `.npz` is appended to file name if it
+                    does not have it.
+
+        @see load()
+
+        """
+        numpy.savez(file, linkage=self.__linkage, amount_points=self.__size)
+
+
+    @staticmethod
+    def load(file):
+        """!
+        @brief Loads dendrogram from numpy `.npz` file that is created by `save()`.
+
+        @param[in] file (string|file): File name or file object.
+
+        @return (dendrogram) Loaded dendrogram.
+
+        @see save()
+
+        """
+        with numpy.load(file) as content:
+            return dendrogram(content['linkage'], int(content['amount_points']))
+
+
+    def __cut(self, number_clusters, height):
+        """!
+        @brief Finds clusters that are obtained by cut of the dendrogram.
+
+        @param[in] number_clusters (uint): Amount of clusters that should be obtained.
+        @param[in] height (double): Maximum height of merges that are applied.
+
+        @return (tuple) Positions of clusters in order of points and their sizes, clusters are sorted by their
+                 smallest indexes of points: (begins, sizes).
+
+        """
+        if (number_clusters is None) == (height is None):
+            raise ValueError("Either amount of clusters or height should be specified.")
+
+        if number_clusters is not None:
+            if number_clusters <= 0:
+                raise ValueError("Amount of clusters (current value: '%d') should be greater than 0." %
+                                 number_clusters)
+
+            amount_merges = min(len(self.__linkage), max(0, self.__size - number_clusters))
+        else:
+            amount_merges = int(numpy.searchsorted(self.__heights, height, side='right'))
+
+        roots = numpy.flatnonzero(self.__merge_indexes[:self.__size + amount_merges] >= amount_merges)
+        roots = roots[numpy.argsort(self.__begins[roots])]
+
+        begins, sizes = self.__begins[roots], self.__cluster_sizes[roots]
+        order_clusters = numpy.argsort(numpy.minimum.reduceat(self.__order, begins), kind='stable')
+
+        return begins[order_clusters], sizes[order_clusters]
+
+
+    def __create_order(self, children):
+        """!
+        @brief Orders points in line with the tree, subtrees are placed one after another, left subtree is first.
+
+        @param[in] children (numpy.ndarray): Identifiers of merged clusters of each merge.
+
+        @return (tuple) Sizes of clusters, positions of clusters in order of points and the order of points:
+                 (sizes, begins, order).
+
+        """
+        amount_merges = len(children)
+        children = children.tolist()
+
+        sizes = [1] * self.__size
+        for left, right in children:
+            sizes.append(sizes[left] + sizes[right])
+
+        if sizes[self.__size:] != self.__linkage[:, 3].astype(numpy.int64).tolist():
+            raise ValueError("Sizes of clusters in linkage matrix do not correspond to merged clusters.")
+
+        sizes = numpy.array(sizes, dtype=numpy.int64)
+
+        # trees of the forest are placed one after another, each cluster is placed from the top to the bottom
+        roots = numpy.flatnonzero(self.__merge_indexes == amount_merges)
+        begins = numpy.zeros(len(sizes), dtype=numpy.int64)
+        begins[roots[1:]] = numpy.cumsum(sizes[roots])[:-1]
+
+        begins = begins.tolist()
+        for index_merge in range(amount_merges - 1, -1, -1):
+            left, right = children[index_merge]
+            begins[left] = begins[self.__size + index_merge]
+            begins[right] = begins[left] + sizes[left]
+
+        begins = numpy.array(begins, dtype=numpy.int64)
+
+        order = numpy.empty(self.__size, dtype=numpy.int64)
+        order[begins[:self.__size]] = numpy.arange(self.__size)
+
+        return sizes, begins, order
+
+
+    def __verify_arguments(self):
+        """!
+        @brief Verify input parameters for the dendrogram and throw exception in case of incorrectness.
+
+        """
+        if self.__size <= 0:
+            raise ValueError("Amount of points (current value: '%d') should be greater than 0." % self.__size)
+
+        if len(self.__linkage) >= self.__size:
+            raise ValueError("Amount of merges (current value: '%d') should be less than amount of points "
+                             "(current value: '%d')." % (len(self.__linkage), self.__size))
+
+        children = self.__linkage[:, :2]
+        limits = self.__size + numpy.arange(len(self.__linkage))
+        if numpy.any(children != numpy.floor(children)) or numpy.any(children < 0) or \
+                numpy.any(children >= limits[:, numpy.newaxis]):
+            raise ValueError("Merged clusters should be points or clusters that are created by previous merges.")
+
+        if numpy.any(numpy.bincount(children.astype(numpy.int64).reshape(-1), minlength=1) > 1):
+            raise ValueError("Each cluster should be merged only once.")
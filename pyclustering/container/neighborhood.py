@@ -0,0 +1,314 @@
+"""!
+
+@brief Data Structure: Neighborhood Index
+@details Neighborhood index stores neighbors of each object of a dataset in line with connectivity radius, the index
+          is built once and might be shared between density-based algorithms (DBSCAN, OPTICS) and their runs with
+          different parameters.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2020
+@copyright BSD-3-Clause
+
+"""
+
+
+import itertools
+
+import numpy
+
+from pyclustering.container.kdtree import kdtree_balanced
+
+
+class neighborhood_index:
+    """!
+    @brief Neighborhood index that stores neighbors of each object within the maximum connectivity radius in CSR
+            format (Compressed Sparse Row).
+    @details Neighbors of object `i` are located in `get_indexes()[p[i]:p[i + 1]]` and distances to them in
+              `get_distances()[p[i]:p[i + 1]]`, where `p` is an array returned by `get_index_pointer()`. Neighbors of
+              each object are sorted by distance, the object itself is not considered as its own neighbor.
+              Neighbors with equal distances are ordered by their indexes. Optionally (see argument `kdtree_order`)
+              in case of points they are ordered in the same way as they are found by balanced KD-tree, therefore
+              algorithms that depend on order of neighbors (OPTICS) produce the same results as C++ implementation,
+              the KD-tree is built only for that and it is not required for DBSCAN whose result does not depend on
+              the order.
+
+              In case of points neighbors are searched using uniform grid whose cell size is equal to the radius,
+              therefore each point is compared only with points from its own and adjacent cells. In case of
+              high-dimensional data the grid is built using up to three dimensions with the largest spread and
+              candidates are verified using full Euclidean distance.
+
+              The index can be passed directly to `dbscan`, `optics` and `ordering_analyser` instead of input data,
+              any connectivity radius that is less or equal to the radius of the index can be used by them. Here is
+              an example of sweep over `minpts` where neighbors are searched only once:
+    @code
+        from pyclustering.cluster.dbscan import dbscan
+        from pyclustering.container.neighborhood import neighborhood_index
+        from pyclustering.utils import read_sample
+        from pyclustering.samples.definitions import FCPS_SAMPLES
+
+        sample = read_sample(FCPS_SAMPLES.SAMPLE_CHAINLINK)
+        index = neighborhood_index(sample, 0.7)
+
+        for neighbors in range(2, 10):
+            dbscan_instance = dbscan(index, 0.7, neighbors).process()
+            print(neighbors, len(dbscan_instance.get_clusters()), len(dbscan_instance.get_noise()))
+    @endcode
+
+    """
+
+    def __init__(self, data, radius, data_type='points', kdtree_order=False):
+        """!
+        @brief Builds neighborhood index for the specified data.
+
+        @param[in] data (array_like): Input data that is presented as list of points or distance matrix (defined by
+                    parameter 'data_type').
+        @param[in] radius (double): Maximum connectivity radius, objects are neighbors if distance between them is
+                    less or equal to the radius.
+        @param[in] data_type (string): Data type of input data 'data' ('points', 'distance_matrix').
+        @param[in] kdtree_order (bool): If `True` then neighbors with equal distances are ordered in the same way as
+                    range search of balanced KD-tree returns them (right subtree, left subtree, node), otherwise by
+                    their indexes. It is used only in case of points.
+
+        """
+        self.__radius = radius
+        self.__data_type = data_type
+        self.__size = len(data)
+
+        self.__verify_arguments()
+
+        if data_type == 'points':
+            sources, targets, distances = self.__search_points(data)
+            ties = self.__traverse_tree(data)[targets] if kdtree_order else targets
+        elif data_type == 'distance_matrix':
+            sources, targets, distances = self.__search_distance_matrix(data)
+            ties = targets
+        else:
+            raise TypeError("Unknown type of data is specified '%s'" % data_type)
+
+        order = numpy.lexsort((ties, distances, sources))
+
+        self.__index_pointer = numpy.zeros(self.__size + 1, dtype=numpy.int64)
+        numpy.cumsum(numpy.bincount(sources, minlength=self.__size), out=self.__index_pointer[1:])
+
+        self.__indexes = numpy.asarray(targets, dtype=numpy.int64)[order]
+        self.__distances = numpy.asarray(distances, dtype=numpy.float64)[order]
+
+
+    def __len__(self):
+        """!
+        @brief Returns amount of objects in the index.
+
+        """
+        return self.__size
+
+
+    @property
+    def radius(self):
+        """!
+        @brief (double) Returns maximum connectivity radius that was used to build the index.
+
+        """
+        return self.__radius
+
+
+    @property
+    def data_type(self):
+        """!
+        @brief (string) Returns type of data that was used to build the index ('points', 'distance_matrix').
+
+        """
+        return self.__data_type
+
+
+    def get_index_pointer(self):
+        """!
+        @brief Returns offsets of neighbors of each object in arrays of indexes and distances.
+
+        @return (numpy.ndarray) Array of offsets whose size is equal to amount of objects plus one.
+
+        """
+        return self.__index_pointer
+
+
+    def get_indexes(self):
+        """!
+        @brief Returns concatenated indexes of neighbors of each object.
+
+        @return (numpy.ndarray) Indexes of neighbors.
+
+        """
+        return self.__indexes
+
+
+    def get_distances(self):
+        """!
+        @brief Returns concatenated distances to neighbors of each object.
+
+        @return (numpy.ndarray) Distances to neighbors.
+
+        """
+        return self.__distances
+
+
+    def neighbors(self, index_object, radius=None):
+        """!
+        @brief Returns neighbors of the specified object that are sorted by distance.
+
+        @param[in] index_object (uint): Index of object whose neighbors should be returned.
+        @param[in] radius (double): Connectivity radius that should be used, if it is not specified then radius of
+                    the index is used.
+
+        @return (tuple) Indexes of neighbors and distances to them: (indexes, distances).
+
+        """
+        begin, end = self.__index_pointer[index_object], self.__index_pointer[index_object + 1]
+        if (radius is not None) and (radius < self.__radius):
+            end = begin + numpy.searchsorted(self.__distances[begin:end], radius, side='right')
+
+        return self.__indexes[begin:end], self.__distances[begin:end]
+
+
+    def restrict(self, radius):
+        """!
+        @brief Returns neighbors of each object in line with smaller connectivity radius in CSR format.
+
+        @param[in] radius (double): Connectivity radius that should be less or equal to radius of the index.
+
+        @return (tuple) Neighbors in CSR format: (index_pointer, indexes, distances).
+
+        """
+        if radius > self.__radius:
+            raise ValueError("Connectivity radius (current value: '%f') should be less or equal to radius of the "
+                             "neighborhood index (current value: '%f')." % (radius, self.__radius))
+
+        if radius == self.__radius:
+            return self.__index_pointer, self.__indexes, self.__distances
+
+        mask = self.__distances <= radius
+        sources = numpy.repeat(numpy.arange(self.__size), numpy.diff(self.__index_pointer))
+
+        index_pointer = numpy.zeros(self.__size + 1, dtype=numpy.int64)
+        numpy.cumsum(numpy.bincount(sources[mask], minlength=self.__size), out=index_pointer[1:])
+
+        return index_pointer, self.__indexes[mask], self.__distances[mask]
+
+
+    def __search_points(self, data):
+        """!
+        @brief Finds neighbors of each point using uniform grid.
+
+        @param[in] data (array_like): Input data that is presented as list of points.
+
+        @return (tuple) Connections between points: (sources, targets, distances).
+
+        """
+        data = numpy.asarray(data, dtype=numpy.float64)
+        if data.ndim == 1:
+            data = data.reshape(-1, 1)
+
+        spread = data.max(axis=0) - data.min(axis=0)
+        grid_dimensions = numpy.sort(numpy.argsort(spread, kind='stable')[-3:])
+        cell_size = self.__radius if self.__radius > 0 else 1.0
+        squared_radius = self.__radius * self.__radius
+
+        grid_data = data[:, grid_dimensions]
+        cells = numpy.floor((grid_data - grid_data.min(axis=0)) / cell_size).astype(numpy.int64)
+        unique_cells, cell_indexes = numpy.unique(cells, axis=0, return_inverse=True)
+        cell_indexes = cell_indexes.reshape(-1)
+
+        order = numpy.argsort(cell_indexes, kind='stable')
+        cell_borders = numpy.concatenate(([0], numpy.cumsum(numpy.bincount(cell_indexes, minlength=len(unique_cells)))))
+        unique_cells = list(map(tuple, unique_cells.tolist()))
+        cell_map = {cell: index_cell for index_cell, cell in enumerate(unique_cells)}
+
+        offsets = list(itertools.product((-1, 0, 1), repeat=len(grid_dimensions)))
+
+        sources, targets, distances = [], [], []
+        for index_cell, cell in enumerate(unique_cells):
+            members = order[cell_borders[index_cell]:cell_borders[index_cell + 1]]
+
+            candidates = []
+            for offset in offsets:
+                index_neighbor_cell = cell_map.get(tuple(c + o for c, o in zip(cell, offset)))
+                if index_neighbor_cell is not None:
+                    candidates.append(order[cell_borders[index_neighbor_cell]:cell_borders[index_neighbor_cell + 1]])
+
+            candidates = numpy.concatenate(candidates)
+            candidate_points = data[candidates]
+
+            block_size = max(1, 2 ** 22 // (len(candidates) * data.shape[1]))
+            for block_start in range(0, len(members), block_size):
+                block = members[block_start:block_start + block_size]
+                differences = data[block][:, numpy.newaxis, :] - candidate_points[numpy.newaxis, :, :]
+                block_distances = numpy.einsum('ijk,ijk->ij', differences, differences)
+
+                rows, columns = numpy.nonzero(block_distances <= squared_radius)
+                block_distances = block_distances[rows, columns]
+                rows, columns = block[rows], candidates[columns]
+
+                mask = rows != columns
+                sources.append(rows[mask])
+                targets.append(columns[mask])
+                distances.append(numpy.sqrt(block_distances[mask]))
+
+        return numpy.concatenate(sources), numpy.concatenate(targets), numpy.concatenate(distances)
+
+
+    def __traverse_tree(self, data):
+        """!
+        @brief Returns position of each point in traversal of balanced KD-tree (right subtree, left subtree, node),
+                the position is used to order neighbors with equal distances in the same way as range search of
+                KD-tree returns them.
+
+        @param[in] data (array_like): Input data that is presented as list of points.
+
+        @return (numpy.ndarray) Position of each point in the traversal.
+
+        """
+        points = numpy.asarray(data, dtype=numpy.float64).reshape(self.__size, -1).tolist()
+        tree = kdtree_balanced(points, range(self.__size))
+
+        positions = numpy.empty(len(data), dtype=numpy.int64)
+        position = 0
+
+        stack = [(tree.get_root(), False)]
+        while len(stack) > 0:
+            node, visited = stack.pop()
+            if visited:
+                positions[node.payload] = position
+                position += 1
+            elif node is not None:
+                stack.extend(((node, True), (node.left, False), (node.right, False)))
+
+        return positions
+
+
+    def __search_distance_matrix(self, matrix):
+        """!
+        @brief Finds neighbors of each object using distance matrix.
+
+        @param[in] matrix (array_like): Distance matrix.
+
+        @return (tuple) Connections between objects: (sources, targets, distances).
+
+        """
+        matrix = numpy.asarray(matrix, dtype=numpy.float64)
+
+        connections = matrix <= self.__radius
+        numpy.fill_diagonal(connections, False)
+
+        sources, targets = numpy.nonzero(connections)
+        return sources, targets, matrix[sources, targets]
+
+
+    def __verify_arguments(self):
+        """!
+        @brief Verify input parameters for the index and throw exception in case of incorrectness.
+
+        """
+        if self.__size == 0:
+            raise ValueError("Input data is empty (size: '%d')." % self.__size)
+
+        if self.__radius < 0:
+            raise ValueError("Connectivity radius (current value: '%f') should be greater or equal to 0." %
+                             self.__radius)
@@ -12,7 +12,9 @@ import unittest
 from pyclustering.tests.suite_holder import suite_holder
 
 from pyclustering.container.tests.unit import ut_cftree as container_cftree_unit_tests
+from pyclustering.container.tests.unit import ut_dendrogram as container_dendrogram_unit_tests
 from pyclustering.container.tests.unit import ut_kdtree as container_kdtree_unit_tests
+from pyclustering.container.tests.unit import ut_neighborhood as container_neighborhood_unit_tests
 
 
 class container_unit_tests(suite_holder):
@@ -23,4 +25,6 @@ class container_unit_tests(suite_holder):
     @staticmethod
     def fill_suite(unit_container_suite):
         unit_container_suite.addTests(unittest.TestLoader().loadTestsFromModule(container_cftree_unit_tests))
+        unit_container_suite.addTests(unittest.TestLoader().loadTestsFromModule(container_dendrogram_unit_tests))
         unit_container_suite.addTests(unittest.TestLoader().loadTestsFromModule(container_kdtree_unit_tests))
+        unit_container_suite.addTests(unittest.TestLoader().loadTestsFromModule(container_neighborhood_unit_tests))
@@ -0,0 +1,132 @@
+"""!
+
+@brief Unit-tests for dendrogram container.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2020
+@copyright BSD-3-Clause
+
+"""
+
+
+import io
+import pickle
+import unittest
+
+import numpy
+
+from scipy.cluster import hierarchy
+
+from pyclustering.container.dendrogram import dendrogram
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
+
+from pyclustering.utils import read_sample
+
+
+class DendrogramUnitTest(unittest.TestCase):
+    def templateAgreementWithScipy(self, sample, method):
+        linkage = hierarchy.linkage(numpy.array(sample), method=method)
+        tree = dendrogram(linkage)
+
+        self.assertEqual(len(sample), len(tree))
+        self.assertEqual(sorted(tree.get_order().tolist()), list(range(len(sample))))
+
+        for number_clusters in range(1, min(len(sample), 30) + 1):
+            expected_labels = hierarchy.fcluster(linkage, number_clusters, 'maxclust')
+            self.assertClusters(expected_labels, tree.get_clusters(number_clusters))
+            self.assertLabels(tree.get_clusters(number_clusters), tree.get_labels(number_clusters))
+
+        for height in numpy.linspace(0.0, linkage[-1][2], 20):
+            expected_labels = hierarchy.fcluster(linkage, height, 'distance')
+            self.assertClusters(expected_labels, tree.get_clusters(height=height))
+            self.assertLabels(tree.get_clusters(height=height), tree.get_labels(height=height))
+
+    def assertClusters(self, expected_labels, clusters):
+        expected_clusters = [numpy.flatnonzero(expected_labels == label).tolist() for label in numpy.unique(expected_labels)]
+        self.assertEqual(sorted(expected_clusters), sorted(sorted(cluster) for cluster in clusters))
+        self.assertEqual(sorted(min(cluster) for cluster in clusters), [min(cluster) for cluster in clusters])
+
+    def assertLabels(self, clusters, labels):
+        expected_labels = numpy.empty(len(labels), dtype=numpy.int64)
+        for index_cluster, cluster in enumerate(clusters):
+            expected_labels[cluster] = index_cluster
+
+        self.assertEqual(expected_labels.tolist(), labels.tolist())
+
+    def testAgreementWithScipySampleSimple3Single(self):
+        self.templateAgreementWithScipy(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3), 'single')
+
+    def testAgreementWithScipySampleSimple3Complete(self):
+        self.templateAgreementWithScipy(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3), 'complete')
+
+    def testAgreementWithScipySampleLsunWard(self):
+        self.templateAgreementWithScipy(read_sample(FCPS_SAMPLES.SAMPLE_LSUN), 'ward')
+
+    def testAgreementWithScipySampleHeptaAverage(self):
+        self.templateAgreementWithScipy(read_sample(FCPS_SAMPLES.SAMPLE_HEPTA), 'average')
+
+    def testClustersInOrderOfTree(self):
+        tree = dendrogram([[3, 1, 0.5, 2], [2, 0, 1.0, 2], [4, 5, 2.0, 4]])
+
+        self.assertEqual([[2, 0], [3, 1]], tree.get_clusters(2))
+        self.assertEqual([[3, 1, 2, 0]], tree.get_clusters(1))
+        self.assertEqual([[0], [1], [2], [3]], tree.get_clusters(4))
+        self.assertEqual([[0], [3, 1], [2]], tree.get_clusters(height=0.7))
+        self.assertEqual([0, 1, 0, 1], tree.get_labels(2).tolist())
+        self.assertEqual([3, 1, 2, 0], tree.get_order().tolist())
+
+    def testIncompleteDendrogram(self):
+        tree = dendrogram([[0, 1, 1.0, 2], [3, 4, 0.5, 2]], 5)
+
+        self.assertEqual([[0, 1], [2], [3, 4]], tree.get_clusters(1))
+        self.assertEqual([[0, 1], [2], [3, 4]], tree.get_clusters(3))
+        self.assertEqual([[0, 1], [2], [3], [4]], tree.get_clusters(4))
+        self.assertEqual([0, 0, 1, 2, 2], tree.get_labels(height=1.0).tolist())
+
+    def testNonMonotonicHeights(self):
+        tree = dendrogram([[0, 1, 2.0, 2], [3, 2, 1.0, 3]])
+
+        self.assertEqual([[0], [1], [2]], tree.get_clusters(height=1.5))
+        self.assertEqual([[0, 1, 2]], tree.get_clusters(height=2.0))
+
+    def testSinglePoint(self):
+        tree = dendrogram(numpy.empty((0, 4)))
+
+        self.assertEqual(1, len(tree))
+        self.assertEqual([[0]], tree.get_clusters(1))
+        self.assertEqual([[0]], tree.get_clusters(height=0.0))
+
+    def testSaveLoad(self):
+        tree = dendrogram(hierarchy.linkage(numpy.array(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)), 'single'))
+
+        stream = io.BytesIO()
+        tree.save(stream)
+        stream.seek(0)
+
+        loaded_tree = dendrogram.load(stream)
+        numpy.testing.assert_array_equal(tree.get_linkage(), loaded_tree.get_linkage())
+        self.assertEqual(tree.get_clusters(4), loaded_tree.get_clusters(4))
+
+    def testPickle(self):
+        tree = dendrogram([[0, 1, 1.0, 2], [3, 4, 0.5, 2]], 5)
+        loaded_tree = pickle.loads(pickle.dumps(tree))
+
+        self.assertEqual(5, len(loaded_tree))
+        self.assertEqual(tree.get_clusters(1), loaded_tree.get_clusters(1))
+
+    def testIncorrectCut(self):
+        tree = dendrogram([[0, 1, 1.0, 2]])
+
+        self.assertRaises(ValueError, tree.get_clusters)
+        self.assertRaises(ValueError, tree.get_clusters, 1, 1.0)
+        self.assertRaises(ValueError, tree.get_labels, 0)
+
+    def testIncorrectLinkage(self):
+        self.assertRaises(ValueError, dendrogram, [[0, 1, 1.0, 2]], 0)
+        self.assertRaises(ValueError, dendrogram, [[0, 1, 1.0, 2], [0, 1, 1.0, 2]], 2)
+        self.assertRaises(ValueError, dendrogram, [[0, 0, 1.0, 2]], 3)
+        self.assertRaises(ValueError, dendrogram, [[0, 3, 1.0, 2]], 3)
+        self.assertRaises(ValueError, dendrogram, [[0, -1, 1.0, 2]], 3)
+        self.assertRaises(ValueError, dendrogram, [[0, 1.5, 1.0, 2]], 3)
+        self.assertRaises(ValueError, dendrogram, [[0, 1, 1.0, 3]], 3)
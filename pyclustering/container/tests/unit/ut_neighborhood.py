@@ -0,0 +1,120 @@
+"""!
+
+@brief Unit-tests for neighborhood index container.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2020
+@copyright BSD-3-Clause
+
+"""
+
+
+import unittest
+import numpy
+
+from pyclustering.container.kdtree import kdtree_balanced
+from pyclustering.container.neighborhood import neighborhood_index
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES, FAMOUS_SAMPLES
+
+from pyclustering.utils import read_sample, calculate_distance_matrix
+
+
+class NeighborhoodIndexUnitTest(unittest.TestCase):
+    def templateNeighborsAgainstBruteForce(self, sample, radius):
+        index = neighborhood_index(sample, radius)
+        matrix_index = neighborhood_index(calculate_distance_matrix(sample), radius, data_type='distance_matrix')
+
+        self.assertEqual(len(sample), len(index))
+        self.assertEqual(radius, index.radius)
+        self.assertEqual('points', index.data_type)
+        self.assertEqual('distance_matrix', matrix_index.data_type)
+
+        data = numpy.array(sample, dtype=float)
+        for i in range(len(sample)):
+            distances = numpy.sqrt(numpy.sum(numpy.square(data - data[i]), axis=1))
+            expected = sorted(j for j in range(len(sample)) if j != i and distances[j] <= radius)
+
+            indexes, neighbor_distances = index.neighbors(i)
+            self.assertEqual(expected, sorted(indexes.tolist()))
+            self.assertTrue(numpy.all(numpy.diff(neighbor_distances) >= 0.0))
+            numpy.testing.assert_allclose(distances[indexes], neighbor_distances)
+
+            matrix_indexes, _ = matrix_index.neighbors(i)
+            self.assertEqual(expected, sorted(matrix_indexes.tolist()))
+
+    def testNeighborsSampleSimple1(self):
+        self.templateNeighborsAgainstBruteForce(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1), 0.5)
+
+    def testNeighborsSampleSimple3(self):
+        self.templateNeighborsAgainstBruteForce(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3), 0.7)
+
+    def testNeighborsSampleLsun(self):
+        self.templateNeighborsAgainstBruteForce(read_sample(FCPS_SAMPLES.SAMPLE_LSUN), 0.3)
+
+    def testNeighborsSampleHepta(self):
+        self.templateNeighborsAgainstBruteForce(read_sample(FCPS_SAMPLES.SAMPLE_HEPTA), 1.0)
+
+    def testNeighborsOneDimension(self):
+        self.templateNeighborsAgainstBruteForce([[0.0], [0.1], [0.2], [1.0], [1.05], [3.0]], 0.15)
+
+    def testNeighborsHighDimension(self):
+        sample = numpy.random.RandomState(1000).rand(100, 7).tolist()
+        self.templateNeighborsAgainstBruteForce(sample, 0.6)
+
+    def testNeighborsZeroRadius(self):
+        sample = [[1.0, 2.0], [1.0, 2.0], [1.0, 2.5], [1.0, 2.0]]
+        index = neighborhood_index(sample, 0.0)
+
+        self.assertEqual([1, 3], sorted(index.neighbors(0)[0].tolist()))
+        self.assertEqual([], index.neighbors(2)[0].tolist())
+
+    def testNeighborsSmallerRadius(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+        index = neighborhood_index(sample, 1.0)
+        expected_index = neighborhood_index(sample, 0.4)
+
+        for i in range(len(sample)):
+            self.assertEqual(expected_index.neighbors(i)[0].tolist(), index.neighbors(i, 0.4)[0].tolist())
+
+    def testTiesOrder(self):
+        sample = read_sample(FAMOUS_SAMPLES.SAMPLE_OLD_FAITHFUL)
+        index = neighborhood_index(sample, 1.0)
+        kdtree_index = neighborhood_index(sample, 1.0, kdtree_order=True)
+        tree = kdtree_balanced(sample, range(len(sample)))
+
+        for i in range(len(sample)):
+            indexes, distances = index.neighbors(i)
+            self.assertEqual(numpy.lexsort((indexes, distances)).tolist(), list(range(len(indexes))))
+
+            nodes = sorted(tree.find_nearest_dist_nodes(sample[i], 1.0), key=lambda node: node[0])
+            expected = [node.payload for _, node in nodes if node.payload != i]
+            self.assertEqual(expected, kdtree_index.neighbors(i)[0].tolist())
+
+    def testRestrict(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+        index = neighborhood_index(sample, 1.0)
+        expected_index = neighborhood_index(sample, 0.4)
+
+        index_pointer, indexes, distances = index.restrict(0.4)
+        self.assertEqual(expected_index.get_index_pointer().tolist(), index_pointer.tolist())
+        self.assertEqual(expected_index.get_indexes().tolist(), indexes.tolist())
+        self.assertEqual(expected_index.get_distances().tolist(), distances.tolist())
+
+        index_pointer, indexes, distances = index.restrict(1.0)
+        self.assertIs(index.get_index_pointer(), index_pointer)
+        self.assertIs(index.get_indexes(), indexes)
+        self.assertIs(index.get_distances(), distances)
+
+    def testRestrictGreaterRadius(self):
+        index = neighborhood_index([[0.0], [1.0]], 1.0)
+        self.assertRaises(ValueError, index.restrict, 2.0)
+
+    def testIncorrectData(self):
+        self.assertRaises(ValueError, neighborhood_index, [], 1.0)
+
+    def testIncorrectRadius(self):
+        self.assertRaises(ValueError, neighborhood_index, [[0.0], [1.0]], -1.0)
+
+    def testIncorrectDataType(self):
+        self.assertRaises(TypeError, neighborhood_index, [[0.0], [1.0]], 1.0, 'unknown')
@@ -15,7 +15,7 @@ from pyclustering.core.wrapper import ccore_library
 from pyclustering.core.pyclustering_package import pyclustering_package, package_extractor, package_builder
 
 
-def kmeans(sample, centers, tolerance, itermax, observe, metric_pointer):
+def kmeans(sample, centers, tolerance, itermax, observe, metric_pointer, algorithm):
     pointer_data = package_builder(sample, c_double).create()
     pointer_centers = package_builder(centers, c_double).create()
     
@@ -23,9 +23,25 @@ def kmeans(sample, centers, tolerance, itermax, observe, metric_pointer):
     
     ccore.kmeans_algorithm.restype = POINTER(pyclustering_package)
     package = ccore.kmeans_algorithm(pointer_data, pointer_centers, c_double(tolerance), c_size_t(itermax),
-                                     c_bool(observe), metric_pointer)
+                                     c_bool(observe), metric_pointer, c_size_t(algorithm))
     
     result = package_extractor(package).extract()
     ccore.free_pyclustering_package(package)
     
+    return result
+
+
+def kmeans_restarts(sample, initial_centers, tolerance, itermax, metric_pointer, algorithm):
+    pointer_data = package_builder(sample, c_double).create()
+    pointer_centers = package_builder(initial_centers, c_double).create()
+
+    ccore = ccore_library.get()
+
+    ccore.kmeans_restarts_algorithm.restype = POINTER(pyclustering_package)
+    package = ccore.kmeans_restarts_algorithm(pointer_data, pointer_centers, c_double(tolerance), c_size_t(itermax),
+                                              metric_pointer, c_size_t(algorithm))
+
+    result = package_extractor(package).extract()
+    ccore.free_pyclustering_package(package)
+
     return result
\ No newline at end of file
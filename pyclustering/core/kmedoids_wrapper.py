@@ -16,7 +16,7 @@ from pyclustering.core.converter import convert_data_type
 from pyclustering.core.pyclustering_package import pyclustering_package, package_extractor, package_builder
 
 
-def kmedoids(sample, medoids, tolerance, itermax, metric_pointer, data_type):
+def kmedoids(sample, medoids, tolerance, itermax, metric_pointer, data_type, swap):
     pointer_data = package_builder(sample, c_double).create()
     medoids_package = package_builder(medoids, c_size_t).create()
     c_data_type = convert_data_type(data_type)
@@ -24,7 +24,8 @@ def kmedoids(sample, medoids, tolerance, itermax, metric_pointer, data_type):
     ccore = ccore_library.get()
     
     ccore.kmedoids_algorithm.restype = POINTER(pyclustering_package)
-    package = ccore.kmedoids_algorithm(pointer_data, medoids_package, c_double(tolerance), c_size_t(itermax), metric_pointer, c_data_type)
+    package = ccore.kmedoids_algorithm(pointer_data, medoids_package, c_double(tolerance), c_size_t(itermax),
+                                       metric_pointer, c_data_type, c_size_t(swap))
     
     result = package_extractor(package).extract()
     ccore.free_pyclustering_package(package)
@@ -23,6 +23,7 @@ class optics_package_indexer:
     OPTICS_PACKAGE_INDEX_OPTICS_OBJECTS_INDEX = 4
     OPTICS_PACKAGE_INDEX_OPTICS_OBJECTS_CORE_DISTANCE = 5
     OPTICS_PACKAGE_INDEX_OPTICS_OBJECTS_REACHABILITY_DISTANCE = 6
+    OPTICS_PACKAGE_INDEX_ORDERED_INDEXES = 7
 
 
 def optics(sample, radius, minimum_neighbors, amount_clusters, data_type):
@@ -47,4 +48,5 @@ def optics(sample, radius, minimum_neighbors, amount_clusters, data_type):
             results[optics_package_indexer.OPTICS_PACKAGE_INDEX_RADIUS][0],
             results[optics_package_indexer.OPTICS_PACKAGE_INDEX_OPTICS_OBJECTS_INDEX],
             results[optics_package_indexer.OPTICS_PACKAGE_INDEX_OPTICS_OBJECTS_CORE_DISTANCE],
-            results[optics_package_indexer.OPTICS_PACKAGE_INDEX_OPTICS_OBJECTS_REACHABILITY_DISTANCE])
\ No newline at end of file
+            results[optics_package_indexer.OPTICS_PACKAGE_INDEX_OPTICS_OBJECTS_REACHABILITY_DISTANCE],
+            results[optics_package_indexer.OPTICS_PACKAGE_INDEX_ORDERED_INDEXES])
\ No newline at end of file
@@ -78,6 +78,8 @@ class pyclustering_type_data:
         PYCLUSTERING_TYPE_UNDEFINED: None
     }
 
+    __NUMERIC_CTYPES = [c_double, c_float, c_long, c_int, c_uint, c_size_t]
+
     @staticmethod
     def get_ctype(pyclustering_package_type):
         """!
@@ -94,10 +96,51 @@ class pyclustering_type_data:
         """
         return pyclustering_type_data.__CTYPE_PYCLUSTERING_MAP[data_ctype]
 
+    @staticmethod
+    def get_numeric_ctype(numpy_dtype):
+        """!
+        @return (ctype) Return numeric ctype that corresponds to numpy data type, `None` if there is no such ctype.
+
+        """
+        for data_ctype in pyclustering_type_data.__NUMERIC_CTYPES:
+            if numpy.dtype(data_ctype) == numpy_dtype:
+                return data_ctype
+
+        return None
+
+    @staticmethod
+    def is_numeric_ctype(data_ctype):
+        """!
+        @return (bool) Return `True` if ctype is a numeric type that can be represented by numpy data type.
+
+        """
+        return data_ctype in pyclustering_type_data.__NUMERIC_CTYPES
+
+
+
+class pyclustering_row_layout:
+    """!
+    @brief Describes memory layout of 'pyclustering_package' as a numpy structured data type.
+    @details The layout is used to create row packages for two-dimensional numpy arrays in vectorized way: each row
+              package points to the corresponding row of the array, therefore values are not copied.
+
+    """
+
+    dtype = numpy.dtype({'names': ['size', 'type', 'data'],
+                         'formats': [numpy.uintp, numpy.uintc, numpy.uintp],
+                         'offsets': [pyclustering_package.size.offset,
+                                     pyclustering_package.type.offset,
+                                     pyclustering_package.data.offset],
+                         'itemsize': sizeof(pyclustering_package)})
+
 
 class package_builder:
     """!
     @brief Package builder provides service to create 'pyclustering_package' from data that is stored in 'list' container.
+    @details One and two-dimensional `numpy.ndarray` of numeric types are packed without copying values: packages
+              point directly to the C-contiguous buffer of the array (the array is converted only if it is not
+              C-contiguous or its data type differs from the requested C-type). Lists of real numbers that are
+              packed to `c_double` or `c_float` are converted to such array by numpy at first.
 
     """
     def __init__(self, dataset, c_data_type=None):
@@ -145,8 +188,9 @@ class package_builder:
         if isinstance(dataset, str):
             return self.__create_package_string(dataset_package, dataset)
 
-        if isinstance(dataset, numpy.matrix):
-            return self.__create_package_numpy_matrix(dataset_package, dataset)
+        array, c_data_type = self.__get_numeric_array(dataset)
+        if array is not None:
+            return self.__create_package_numpy_array(dataset_package, array, c_data_type)
         
         dataset_package.size = len(dataset)
     
@@ -206,26 +250,57 @@ class package_builder:
             dataset_package.data = cast(array_object, POINTER(c_void_p))
 
 
-    def __create_package_numpy_matrix(self, dataset_package, dataset):
-        (rows, cols) = dataset.shape
-        
+    def __get_numeric_array(self, dataset):
+        if isinstance(dataset, numpy.ndarray):
+            if dataset.ndim not in (1, 2) or dataset.size == 0 or dataset.dtype.kind not in 'biuf':
+                return None, None
+
+            c_data_type = self.__c_data_type
+            if c_data_type is None:
+                c_data_type = pyclustering_type_data.get_numeric_ctype(dataset.dtype)
+
+            if not pyclustering_type_data.is_numeric_ctype(c_data_type):
+                return None, None
+
+            return numpy.ascontiguousarray(dataset, dtype=numpy.dtype(c_data_type)), c_data_type
+
+        if self.__c_data_type not in (c_double, c_float) or not isinstance(dataset, (list, tuple)) or len(dataset) == 0:
+            return None, None
+
+        try:
+            array = numpy.asarray(dataset, dtype=numpy.dtype(self.__c_data_type))
+        except (ValueError, TypeError):
+            return None, None   # irregular container that should be packed element by element
+
+        if array.ndim not in (1, 2) or array.size == 0:
+            return None, None
+
+        return array, self.__c_data_type
+
+
+    def __create_package_numpy_array(self, dataset_package, array, c_data_type):
+        if array.ndim == 1:
+            dataset_package.size = array.shape[0]
+            dataset_package.type = pyclustering_type_data.get_pyclustering_type(c_data_type)
+            dataset_package.data = cast(c_void_p(array.ctypes.data), POINTER(c_void_p))
+            dataset_package._buffers = (array,)
+            return pointer(dataset_package)
+
+        (rows, cols) = array.shape
+
+        row_packages = numpy.zeros(rows, dtype=pyclustering_row_layout.dtype)
+        row_packages['size'] = cols
+        row_packages['type'] = pyclustering_type_data.get_pyclustering_type(c_data_type)
+        row_packages['data'] = array.ctypes.data + numpy.arange(rows, dtype=numpy.uintp) * array.strides[0]
+
+        row_pointers = row_packages.ctypes.data + numpy.arange(rows, dtype=numpy.uintp) * row_packages.itemsize
+
         dataset_package.size = rows
         dataset_package.type = pyclustering_type_data.PYCLUSTERING_TYPE_LIST
-        
-        package_data = (POINTER(pyclustering_package) * rows)()
-        for row_index in range(rows):
-            array_package = pyclustering_package()
-            array_package.size = cols
-            array_package.type = pyclustering_type_data.get_pyclustering_type(self.__c_data_type)
-            
-            array_object = (self.__c_data_type * cols)()
-            for col_index in range(cols):
-                array_object[col_index] = self.__c_data_type(dataset[row_index, col_index])
-        
-            array_package.data = cast(array_object, POINTER(c_void_p))
-            package_data[row_index] = pointer(array_package)
-            
-        dataset_package.data = cast(package_data, POINTER(c_void_p))
+        dataset_package.data = cast(c_void_p(row_pointers.ctypes.data), POINTER(c_void_p))
+
+        # package keeps buffers alive while it is used by the C++ library.
+        dataset_package._buffers = (array, row_packages, row_pointers)
         return pointer(dataset_package)
 
 
@@ -240,6 +315,9 @@ class package_builder:
 class package_extractor:
     """!
     @brief Package extractor provides servies to unpack pyclustering package.
+    @details Packages with numeric values are unpacked by numpy from the package buffer at once instead of reading
+              values one by one, list of numeric packages with the same size and type is gathered to a
+              two-dimensional array by copying buffer of each package.
     
     """
     def __init__(self, package_pointer):
@@ -278,20 +356,38 @@ class package_extractor:
         elif type_package == pyclustering_type_data.PYCLUSTERING_TYPE_WCHAR_T:
             raise NotImplementedError("Data type 'wchar_t' is not supported.")
 
+        elif type_package != pyclustering_type_data.PYCLUSTERING_TYPE_LIST:
+            return numpy.ctypeslib.as_array(pointer_data, shape=(pointer_package[0].size,)).tolist()
+
         result = []
-        append_element = lambda container, item: container.append(item)
-        
         for index in range(0, pointer_package[0].size):
-            if type_package == pyclustering_type_data.PYCLUSTERING_TYPE_LIST:
-                pointer_package = cast(pointer_data[index], (POINTER(pyclustering_package)))
-                append_element(result, self.__extract_data(pointer_package))
-
-            else:
-                append_element(result, pointer_data[index])
+            pointer_package = cast(pointer_data[index], (POINTER(pyclustering_package)))
+            result.append(self.__extract_data(pointer_package))
         
         return result
 
 
+    def __unpack_numeric_matrix(self, package):
+        addresses = numpy.ctypeslib.as_array(cast(package.data, POINTER(c_size_t)), shape=(package.size,))
+        rows = [pyclustering_package.from_address(address) for address in addresses.tolist()]
+
+        row_type, row_size = rows[0].type, rows[0].size
+        if row_size == 0 or not pyclustering_type_data.is_numeric_ctype(pyclustering_type_data.get_ctype(row_type)):
+            return None
+
+        for row in rows:
+            if row.type != row_type or row.size != row_size:
+                return None
+
+        matrix = numpy.empty((len(rows), row_size), dtype=numpy.dtype(pyclustering_type_data.get_ctype(row_type)))
+        row_address, row_length = matrix.ctypes.data, matrix.strides[0]
+        for row in rows:
+            memmove(row_address, row.data, row_length)
+            row_address += row_length
+
+        return matrix
+
+
     def __unpack_pointer_data(self, pointer_package):
         current_package = pointer_package[0]
         type_package = current_package.type
@@ -299,5 +395,10 @@ class package_extractor:
         if current_package.size == 0:
             return []
 
+        if type_package == pyclustering_type_data.PYCLUSTERING_TYPE_LIST:
+            matrix = self.__unpack_numeric_matrix(current_package)
+            if matrix is not None:
+                return matrix.tolist()
+
         pointer_data = cast(current_package.data, POINTER(pyclustering_type_data.get_ctype(type_package)))
         return self.__unpack_data(pointer_package, pointer_data, type_package)
@@ -17,6 +17,7 @@ matplotlib.use('Agg')
 
 
 from pyclustering.core.tests import ut_package as core_package_unit_tests
+from pyclustering.core.tests import ut_executor as core_executor_unit_tests
 
 import os
 import warnings
@@ -103,3 +104,4 @@ class core_tests(suite_holder):
     @staticmethod
     def fill_suite(core_suite):
         core_suite.addTests(unittest.TestLoader().loadTestsFromModule(core_package_unit_tests))
+        core_suite.addTests(unittest.TestLoader().loadTestsFromModule(core_executor_unit_tests))
@@ -0,0 +1,67 @@
+"""!
+
+@brief Unit-tests for thread pool that is used to perform cluster analysis in background threads.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2020
+@copyright BSD-3-Clause
+
+"""
+
+
+import unittest
+
+from concurrent.futures import Future
+
+from pyclustering.core.wrapper import ccore_executor, ccore_async_processing
+
+
+class ExecutorUnitTest(unittest.TestCase):
+    def tearDown(self):
+        ccore_executor.set_max_workers(None)
+
+    def testSubmitTask(self):
+        future = ccore_executor.submit(sum, [1, 2, 3])
+        self.assertIsInstance(future, Future)
+        self.assertEqual(6, future.result())
+
+    def testSubmitTaskWithArguments(self):
+        future = ccore_executor.submit(sorted, [3, 1, 2], reverse=True)
+        self.assertEqual([3, 2, 1], future.result())
+
+    def testSubmitSeveralTasks(self):
+        futures = [ccore_executor.submit(pow, value, 2) for value in range(10)]
+        self.assertEqual([value ** 2 for value in range(10)], [future.result() for future in futures])
+
+    def testSubmitTaskException(self):
+        future = ccore_executor.submit(int, "not a number")
+        self.assertRaises(ValueError, future.result)
+
+    def testSetMaxWorkers(self):
+        ccore_executor.set_max_workers(1)
+        self.assertEqual(3, ccore_executor.submit(len, [1, 2, 3]).result())
+
+        ccore_executor.set_max_workers(4)
+        self.assertEqual(2, ccore_executor.submit(len, [1, 2]).result())
+
+    def testShutdown(self):
+        self.assertEqual(1, ccore_executor.submit(len, [1]).result())
+        ccore_executor.shutdown()
+        self.assertEqual(2, ccore_executor.submit(len, [1, 2]).result())
+
+    def testAsyncProcessingMixin(self):
+        class algorithm(ccore_async_processing):
+            def __init__(self):
+                self.processed = False
+
+            def process(self):
+                self.processed = True
+                return self
+
+        instance = algorithm()
+        self.assertIs(instance, instance.process_async().result())
+        self.assertTrue(instance.processed)
+
+    def testIncorrectMaxWorkers(self):
+        self.assertRaises(ValueError, ccore_executor.set_max_workers, 0)
+        self.assertRaises(ValueError, ccore_executor.set_max_workers, -1)
@@ -129,6 +129,46 @@ class Test(unittest.TestCase):
     def testNumpyMatrixThreeColumns(self):
         self.templatePackUnpack(numpy.array([[1.1, 2.2, 3.3], [2.2, 3.3, 4.4], [3.3, 4.4, 5.5]]), c_double)
 
+    def testNumpyArrayFloat32(self):
+        self.templatePackUnpack(numpy.array([[1.5, 2.5], [3.5, 4.5]], dtype=numpy.float32), c_float)
+
+    def testNumpyArrayNonContiguous(self):
+        dataset = numpy.arange(12, dtype=numpy.float64).reshape(3, 4)[:, ::2]
+        package_pointer = package_builder(dataset, c_double).create()
+        self.assertEqual(dataset.tolist(), package_extractor(package_pointer).extract())
+
+    def testNumpyArrayConversionToDouble(self):
+        dataset = numpy.array([[1, 2, 3], [4, 5, 6]], dtype=numpy.int32)
+        package_pointer = package_builder(dataset, c_double).create()
+        self.assertEqual([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], package_extractor(package_pointer).extract())
+
+    def testNumpyArrayOneDimensionInferType(self):
+        dataset = numpy.array([1, 2, 3, 4], dtype=numpy.int64)
+        package_pointer = package_builder(dataset).create()
+        self.assertEqual([1, 2, 3, 4], package_extractor(package_pointer).extract())
+
+    def testNumpyArrayZeroCopy(self):
+        dataset = numpy.array([[1.0, 2.0], [3.0, 4.0]])
+        package_pointer = package_builder(dataset, c_double).create()
+
+        dataset[1][0] = 10.0
+        self.assertEqual([[1.0, 2.0], [10.0, 4.0]], package_extractor(package_pointer).extract())
+
+    def testNumpyArrayPackageLifetime(self):
+        package_pointer = package_builder(numpy.array([[1.0, 2.0], [3.0, 4.0]]), c_double).create()
+        numpy.zeros((100, 100))     # memory of the temporary array should not be reused
+        self.assertEqual([[1.0, 2.0], [3.0, 4.0]], package_extractor(package_pointer).extract())
+
+    def testListOfListDoubleVectorized(self):
+        dataset = [[1.0, 2.0, 3.0], [4, 5, 6]]
+        package_pointer = package_builder(dataset, c_double).create()
+        self.assertEqual([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], package_extractor(package_pointer).extract())
+
+    def testListOfListDoubleIrregular(self):
+        dataset = [[1.0, 2.0, 3.0], [4.0], []]
+        package_pointer = package_builder(dataset, c_double).create()
+        self.assertEqual(dataset, package_extractor(package_pointer).extract())
+
     def testString(self):
         self.templatePackUnpack("Test message number one".encode('utf-8'))
 
@@ -10,8 +10,10 @@
 
 
 import sys
+import threading
 import warnings
 
+from concurrent.futures import ThreadPoolExecutor
 from ctypes import *
 
 from pyclustering.core.definitions import *
@@ -25,11 +27,14 @@ class ccore_library:
     __library = None
     __workable = False
     __initialized = False
+    __lock = threading.Lock()
 
     @staticmethod
     def get():
         if not ccore_library.__library:
-            ccore_library.initialize()
+            with ccore_library.__lock:
+                if not ccore_library.__library:
+                    ccore_library.initialize()
 
         return ccore_library.__library
 
@@ -112,3 +117,112 @@ class ccore_library:
             ccore_library.__workable = False
 
         return ccore_library.__workable, version
+
+
+
+class ccore_executor:
+    """!
+    @brief Thread pool that is used by algorithms to perform cluster analysis in background threads.
+    @details Functions of the C/C++ pyclustering library are called using `ctypes.cdll` that releases GIL during
+              the call, therefore several algorithms that use CCORE are processed in parallel in one Python process.
+              Python implementations of algorithms are also processed in background, but they are limited by GIL.
+
+    Example of cluster analysis in several threads:
+    @code
+        from pyclustering.cluster.kmeans import kmeans
+        from pyclustering.cluster.dbscan import dbscan
+
+        kmeans_future = kmeans(sample, initial_centers).process_async()
+        dbscan_future = dbscan(sample, 0.7, 3).process_async()
+
+        kmeans_clusters = kmeans_future.result().get_clusters()
+        dbscan_clusters = dbscan_future.result().get_clusters()
+    @endcode
+
+    Futures are converted to awaitable objects for asyncio using `asyncio.wrap_future()`:
+    @code
+        kmeans_instance = await asyncio.wrap_future(kmeans(sample, initial_centers).process_async())
+    @endcode
+
+    """
+
+    __executor = None
+    __max_workers = None
+    __lock = threading.Lock()
+
+    @staticmethod
+    def submit(task, *args, **kwargs):
+        """!
+        @brief Schedules the task to be executed by the thread pool.
+
+        @param[in] task (callable): Task that should be executed, for example, `process` method of an algorithm.
+        @param[in] *args: Positional arguments for the task.
+        @param[in] **kwargs: Keyword arguments for the task.
+
+        @return (concurrent.futures.Future) Future that represents execution of the task.
+
+        """
+        with ccore_executor.__lock:
+            if ccore_executor.__executor is None:
+                ccore_executor.__executor = ThreadPoolExecutor(max_workers=ccore_executor.__max_workers,
+                                                               thread_name_prefix="pyclustering")
+
+            return ccore_executor.__executor.submit(task, *args, **kwargs)
+
+
+    @staticmethod
+    def set_max_workers(max_workers):
+        """!
+        @brief Sets maximum amount of threads that are used to process tasks.
+        @details Current thread pool is shut down without waiting for scheduled tasks, they are finished by it,
+                  new tasks are executed by a new thread pool.
+
+        @param[in] max_workers (uint): Maximum amount of threads, if `None` then default amount of
+                    `concurrent.futures.ThreadPoolExecutor` is used.
+
+        """
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError("Amount of workers (current value: '%d') should be greater than 0." % max_workers)
+
+        with ccore_executor.__lock:
+            ccore_executor.__max_workers = max_workers
+            if ccore_executor.__executor is not None:
+                ccore_executor.__executor.shutdown(wait=False)
+                ccore_executor.__executor = None
+
+
+    @staticmethod
+    def shutdown(wait=True):
+        """!
+        @brief Shuts down the thread pool, it is created again when a new task is submitted.
+
+        @param[in] wait (bool): If `True` then waits until all scheduled tasks are done.
+
+        """
+        with ccore_executor.__lock:
+            executor, ccore_executor.__executor = ccore_executor.__executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+
+class ccore_async_processing:
+    """!
+    @brief Mixin that provides background processing for algorithms, method `process()` of an algorithm is scheduled
+            to the common thread pool `ccore_executor`.
+    @details CCORE releases GIL during the processing, therefore several instances may be processed in parallel
+              threads.
+
+    @see ccore_executor
+
+    """
+
+    def process_async(self):
+        """!
+        @brief Performs processing (method `process()`) in a background thread.
+
+        @return (concurrent.futures.Future) Future whose result is the instance itself.
+
+        """
+        return ccore_executor.submit(self.process)
@@ -132,6 +132,28 @@ class distance_metric:
         return self.__calculator(point1, point2)
 
 
+    def __getstate__(self):
+        """!
+        @brief Returns state of the metric, calculator is not included because it might be a local function.
+
+        @return (tuple) State of the metric: (type, arguments, numpy usage).
+
+        """
+        return self.__type, self.__args, self.__numpy
+
+
+    def __setstate__(self, state):
+        """!
+        @brief Sets state of the metric and creates calculator in line with it.
+
+        @param[in] state (tuple): State of the metric: (type, arguments, numpy usage).
+
+        """
+        self.__type, self.__args, self.__numpy = state
+        self.__func = self.__args.get('func', None)
+        self.__calculator = self.__create_distance_calculator()
+
+
     def get_type(self):
         """!
         @brief Return type of distance metric that is used.
@@ -373,6 +395,30 @@ def euclidean_distance_square_numpy(object1, object2):
         return numpy.sum(numpy.square(object1 - object2))
 
 
+def euclidean_distance_square_matrix(points, centers):
+    """!
+    @brief Calculate square Euclidean distance between each point and each center using matrix product.
+    @details Points and centers are shifted by the mean of centers before expansion
+              \f$\left \| x - c \right \|^{2} = \left \| x \right \|^{2} - 2xc + \left \| c \right \|^{2}\f$,
+              otherwise terms of the expansion are large in case of data with large offset and their difference
+              loses precision.
+
+    @param[in] points (numpy.ndarray): Points that are represented by two-dimensional array.
+    @param[in] centers (numpy.ndarray): Centers that are represented by two-dimensional array.
+
+    @return (numpy.ndarray) Distance matrix where rows correspond to points and columns to centers.
+
+    """
+    reference = numpy.mean(centers, axis=0)
+    points = points - reference
+    centers = centers - reference
+
+    distances = numpy.dot(points, centers.T) * -2.0
+    distances += numpy.einsum('ij,ij->i', points, points)[:, numpy.newaxis]
+    distances += numpy.einsum('ij,ij->i', centers, centers)
+    return numpy.maximum(distances, 0.0, out=distances)
+
+
 def manhattan_distance(point1, point2):
     """!
     @brief Calculate Manhattan distance between between two vectors.
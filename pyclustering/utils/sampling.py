@@ -9,6 +9,7 @@
 """
 
 
+import math
 import random
 
 
@@ -61,7 +62,11 @@ def reservoir_x(data, n):
               number of uniform random variates:
               \f[\approx 2n\ln \left (\frac{N}{n} \right)\f]
 
-    @param[in] data (list): Input data for sampling.
+              Each skip value is calculated in constant time using logarithm, therefore processing time mostly depends
+              on sample size rather than on data size. Input data might be any sequence that supports slices, for
+              example, `range`, in this case the data is not created in memory.
+
+    @param[in] data (list|range): Input data for sampling.
     @param[in] n (uint): Size of sample that should be extracted from 'data'.
 
     @return (list) Sample with size 'n' from 'data'.
@@ -79,20 +84,22 @@ def reservoir_x(data, n):
     @endcode
 
     """
-    def calculate_skip_value(t, size, skip):
-        return pow(t + 1 - size, skip + 1) / pow(t + 1, skip + 1)
-
     def generate_skip_value(t, size):
-        threshold, skip = random.random(), 0
-        while calculate_skip_value(t, size, skip) > threshold:
-            skip += 1
-        return skip
+        # The smallest skip value when (1 - size / (t + 1)) ^ (skip + 1) is less or equal to the threshold.
+        threshold = random.random()
+        if threshold == 0.0:
+            return len(data)
+
+        skip = math.ceil(math.log(threshold) / math.log((t + 1 - size) / (t + 1))) - 1
+        return max(0, skip)
 
     if n > len(data):
         raise ValueError("Incorrect sampling value 'n' (%d) that should be bigger then data size (%d).")
 
     random.seed()
-    reservoir = data[0:n]
+    reservoir = list(data[0:n])
+    if n == 0:
+        return reservoir
 
     i = n
     while i < len(data):
@@ -9,6 +9,7 @@ Unit-tests for metric functions.
 """
 
 
+import pickle
 import unittest
 
 # Generate images without having a window appear.
@@ -150,3 +151,16 @@ class MetricUnitTest(unittest.TestCase):
         gower = metric.distance_metric(metric.type_metric.GOWER, data=[a, b], numpy_usage=False)
         gower_numpy = metric.distance_metric(metric.type_metric.GOWER, data=[a, b], numpy_usage=True)
         assertion.eq(gower(a, b), gower_numpy(npa, npb))
+
+
+    def testPickleMetric(self):
+        a, b = [1.2, 3.4], [5.4, -7.1]
+        for metric_type, kwargs in [(metric.type_metric.EUCLIDEAN, {}), (metric.type_metric.MINKOWSKI, {'degree': 4}),
+                                    (metric.type_metric.GOWER, {'data': [a, b]}),
+                                    (metric.type_metric.USER_DEFINED, {'func': metric.manhattan_distance})]:
+            for numpy_usage in [False, True]:
+                instance = metric.distance_metric(metric_type, numpy_usage=numpy_usage, **kwargs)
+                restored = pickle.loads(pickle.dumps(instance))
+
+                assertion.eq(instance.get_type(), restored.get_type())
+                assertion.eq(instance(numpy.array(a), numpy.array(b)), restored(numpy.array(a), numpy.array(b)))
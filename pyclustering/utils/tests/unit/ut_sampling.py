@@ -52,3 +52,12 @@ class sampling_unit_test(unittest.TestCase):
     def testUniformDistributionReservoirX(self):
         sample = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20]
         sampling_test_template.uniform_distribution(sample, 1, reservoir_x, 2500, 0.3)
+
+    def testRangeReservoirX(self):
+        for _ in range(10):
+            sample = reservoir_x(range(1000000), 10)
+
+            self.assertIsInstance(sample, list)
+            self.assertEqual(10, len(sample))
+            self.assertEqual(10, len(set(sample)))
+            self.assertTrue(all(0 <= value < 1000000 for value in sample))